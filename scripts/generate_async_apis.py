@@ -0,0 +1,82 @@
+import argparse
+import pathlib
+import re
+
+# Rewrites applied to every generated sync API module to produce its asyncio
+# counterpart. The operations are described by the same table
+# (`tl_ninjarmm.api.operation_table`), only `invoke` is awaited.
+MODULE_REPLACEMENTS = [
+    (
+        "from tl_ninjarmm.api_client import ApiClient\n",
+        "from tl_ninjarmm.aio.api_client import AsyncApiClient\n",
+    ),
+    (
+        "from tl_ninjarmm.rest import RESTResponseType\n",
+        "from tl_ninjarmm.aio.rest import RESTResponseType\n",
+    ),
+    (
+        "api_client = ApiClient.get_default()",
+        "api_client = AsyncApiClient.get_default()",
+    ),
+    (
+        "return self.api_client.invoke(",
+        "return await self.api_client.invoke(",
+    ),
+]
+
+PUBLIC_METHOD_RE = re.compile(r"(    @validate_call\n)    def ")
+CLASS_RE = re.compile(r"^class (\w+Api):", re.MULTILINE)
+
+
+def convert_module(source: str) -> str:
+    """
+    Convert the source of a generated sync API module to its asyncio variant
+
+    Args:
+        source: Source code of a module from `tl_ninjarmm/api`
+
+    Returns:
+        str: Source code of the matching `tl_ninjarmm/aio/api` module
+    """
+    for old, new in MODULE_REPLACEMENTS:
+        if old not in source:
+            raise ValueError(f"Expected to find {old!r} in generated API module")
+        source = source.replace(old, new)
+
+    source = PUBLIC_METHOD_RE.sub(r"\1    async def ", source)
+    source = CLASS_RE.sub(r"class Async\1:", source)
+    return source
+
+
+def main(src: pathlib.Path, dest: pathlib.Path):
+    dest.mkdir(parents=True, exist_ok=True)
+
+    class_names = []
+    for module in sorted(src.glob("*_api.py")):
+        converted = convert_module(module.read_text())
+        (dest / module.name).write_text(converted)
+        class_names.extend((module.stem, name) for name in CLASS_RE.findall(converted))
+
+    init_lines = ["# flake8: noqa", "", "# import async apis into aio api package"]
+    for module_name, class_name in class_names:
+        init_lines.append(f"from tl_ninjarmm.aio.api.{module_name} import {class_name}")
+    (dest / "__init__.py").write_text("\n".join(init_lines) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--src",
+        help="The package directory holding the generated sync APIs",
+        default="src/tl_ninjarmm/api",
+        type=pathlib.Path,
+    )
+    parser.add_argument(
+        "--dest",
+        help="The package directory to write the async APIs to",
+        default="src/tl_ninjarmm/aio/api",
+        type=pathlib.Path,
+    )
+    args = parser.parse_args()
+
+    main(args.src, args.dest)
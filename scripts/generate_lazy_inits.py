@@ -0,0 +1,99 @@
+import argparse
+import ast
+import pathlib
+
+# Package `__init__` modules whose imports are made lazy
+PACKAGES = [
+    "src/tl_ninjarmm/__init__.py",
+    "src/tl_ninjarmm/api/__init__.py",
+    "src/tl_ninjarmm/models/__init__.py",
+    "src/tl_ninjarmm/aio/__init__.py",
+    "src/tl_ninjarmm/aio/api/__init__.py",
+]
+
+MARKER = "from tl_ninjarmm._lazy import lazy_exports"
+
+
+def convert_init(source: str) -> str:
+    """
+    Convert the eager imports of a package `__init__` module to lazy ones
+
+    The `from tl_ninjarmm... import ...` statements at the end of the module
+    are replaced by a name to module mapping resolved by a PEP 562 module
+    `__getattr__`. They are kept under `TYPE_CHECKING` for type checkers and
+    IDEs.
+
+    Args:
+        source: Source code of a generated package `__init__` module
+
+    Returns:
+        str: Source code of the lazy `__init__` module
+    """
+    if MARKER in source:
+        return source
+
+    tree = ast.parse(source)
+    imports = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom)
+        and node.module is not None
+        and node.module.startswith("tl_ninjarmm")
+    ]
+    if not imports:
+        raise ValueError("Expected to find tl_ninjarmm imports in __init__ module")
+    first = imports[0].lineno
+    for node in tree.body:
+        if node.lineno >= first and node not in imports:
+            raise ValueError(
+                f"Unexpected statement after the imports: line {node.lineno}"
+            )
+
+    lines = source.splitlines()
+    # Drop the imports along with the comments introducing them
+    head = lines[: first - 1]
+    while head and (not head[-1].strip() or head[-1].startswith("#")):
+        head.pop()
+
+    exports = []
+    for node in imports:
+        for alias in node.names:
+            if alias.asname not in (None, alias.name):
+                raise ValueError(f"Renamed import of {alias.name} is not supported")
+            exports.append((alias.name, node.module))
+
+    body = [
+        "",
+        "from typing import TYPE_CHECKING",
+        "",
+        MARKER,
+        "",
+        "# Exported names are imported on first access (PEP 562)",
+        "__getattr__, __dir__ = lazy_exports(",
+        "    __name__,",
+        "    {",
+    ]
+    body.extend(f'        "{name}": "{module}",' for name, module in exports)
+    body.extend(["    },", ")", "", "if TYPE_CHECKING:"])
+    body.extend(
+        f"    from {module} import {name} as {name}" for name, module in exports
+    )
+    return "\n".join(head + body) + "\n"
+
+
+def main(paths: list[str]):
+    for path in map(pathlib.Path, paths):
+        path.write_text(convert_init(path.read_text()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "paths",
+        help="The package __init__ modules to convert",
+        nargs="*",
+        default=PACKAGES,
+    )
+    args = parser.parse_args()
+
+    main(args.paths)
@@ -0,0 +1,321 @@
+import argparse
+import ast
+import pathlib
+
+# Header of the generated operation table
+TABLE_HEADER = '''# coding: utf-8
+
+# flake8: noqa
+"""
+Operations of the generated APIs, see `tl_ninjarmm.operations`.
+
+Generated by scripts/generate_operation_table.py, do not edit manually.
+"""
+
+from typing import Dict
+
+from tl_ninjarmm.operations import Operation
+
+OPERATIONS: Dict[str, Operation] = {
+'''
+
+# Rewrites of a converted API module
+MODULE_REPLACEMENTS = [
+    (
+        "from tl_ninjarmm.api_client import ApiClient, RequestSerialized\n",
+        "from tl_ninjarmm.api.operation_table import OPERATIONS\n"
+        "from tl_ninjarmm.api_client import ApiClient\n",
+    ),
+    (
+        "from tl_ninjarmm.api_response import ApiResponse\n",
+        "from tl_ninjarmm.api_response import ApiResponse\n"
+        "from tl_ninjarmm.operations import bind_unvalidated\n",
+    ),
+    (
+        "        self.api_client = api_client\n",
+        "        self.api_client = api_client\n"
+        "        if not api_client.client_side_validation:\n"
+        "            bind_unvalidated(self)\n",
+    ),
+]
+
+# What `ApiClient.invoke` returns for each of the generated methods
+RESULTS = {
+    "_with_http_info": "http_info",
+    "_without_preload_content": "response",
+}
+
+OPTIONS = [
+    "_request_timeout",
+    "_request_auth",
+    "_content_type",
+    "_headers",
+]
+
+
+def is_not_none_test(test: ast.expr) -> str:
+    """Returns the argument tested by `if <argument> is not None:`"""
+    if (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name)
+        and isinstance(test.ops[0], ast.IsNot)
+        and isinstance(test.comparators[0], ast.Constant)
+        and test.comparators[0].value is None
+    ):
+        return test.left.id
+    raise ValueError(f"Unexpected condition: {ast.unparse(test)}")
+
+
+def find_call(node: ast.AST, name: str) -> ast.Call:
+    for child in ast.walk(node):
+        if (
+            isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Attribute)
+            and child.func.attr == name
+        ):
+            return child
+    raise ValueError(f"Expected to find a call to {name}")
+
+
+def parse_serialize(function: ast.FunctionDef) -> dict:
+    """
+    Extract the operation metadata from a generated `_*_serialize` method
+
+    Args:
+        function: The `_*_serialize` method
+
+    Returns:
+        dict: The keyword arguments of its `Operation`
+    """
+    fields = {
+        "method": None,
+        "path": None,
+        "path_params": [],
+        "query_params": [],
+        "body_param": None,
+        "collection_formats": {},
+        "accept": [],
+        "content_types": None,
+        "auth_settings": [],
+        "response_types": {},
+    }
+    for statement in function.body:
+        if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            target = getattr(statement, "target", None) or statement.targets[0]
+            if target.id == "_collection_formats":
+                fields["collection_formats"] = ast.literal_eval(statement.value)
+            elif target.id == "_auth_settings":
+                fields["auth_settings"] = ast.literal_eval(statement.value)
+            elif target.id not in (
+                "_host",
+                "_path_params",
+                "_query_params",
+                "_header_params",
+                "_form_params",
+                "_files",
+                "_body_params",
+            ):
+                raise ValueError(f"Unexpected assignment: {ast.unparse(statement)}")
+        elif isinstance(statement, ast.If):
+            source = ast.unparse(statement)
+            if source.startswith("if 'Accept' not in _header_params:"):
+                call = find_call(statement, "select_header_accept")
+                fields["accept"] = ast.literal_eval(call.args[0])
+            elif source.startswith("if _content_type:"):
+                call = find_call(statement, "select_header_content_type")
+                fields["content_types"] = ast.literal_eval(call.args[0])
+            else:
+                argument = is_not_none_test(statement.test)
+                (body,) = statement.body
+                body_source = ast.unparse(body)
+                if body_source.startswith("_path_params["):
+                    name = ast.literal_eval(body.targets[0].slice)
+                    fields["path_params"].append((name, argument))
+                elif body_source.startswith("_query_params.append("):
+                    name = ast.literal_eval(body.value.args[0].elts[0])
+                    fields["query_params"].append((name, argument))
+                elif body_source == f"_body_params = {argument}":
+                    fields["body_param"] = argument
+                else:
+                    raise ValueError(f"Unsupported parameter: {body_source}")
+        elif isinstance(statement, ast.Return):
+            call = find_call(statement, "param_serialize")
+            for keyword in call.keywords:
+                if keyword.arg == "method":
+                    fields["method"] = ast.literal_eval(keyword.value)
+                elif keyword.arg == "resource_path":
+                    fields["path"] = ast.literal_eval(keyword.value)
+        else:
+            raise ValueError(f"Unexpected statement: {ast.unparse(statement)}")
+    return fields
+
+
+def parse_response_types(function: ast.FunctionDef) -> dict:
+    """Returns the `_response_types_map` of a generated public method"""
+    for statement in function.body:
+        if (
+            isinstance(statement, ast.AnnAssign)
+            and statement.target.id == "_response_types_map"
+        ):
+            return ast.literal_eval(statement.value)
+    raise ValueError(f"Expected to find the response types of {function.name}")
+
+
+def format_operation(name: str, fields: dict) -> str:
+    """Returns the table entry of an operation, leaving out default values"""
+    lines = [f"    {name!r}: Operation(", f"        name={name!r},"]
+    for key, value in fields.items():
+        if isinstance(value, list):
+            value = tuple(value)
+        if value or (key == "content_types" and value is not None):
+            lines.append(f"        {key}={value!r},")
+    lines.append("    ),")
+    return "\n".join(lines)
+
+
+def invoke_body(name: str, result: str, arguments: list[str]) -> list[str]:
+    """Returns the body of a public method calling `ApiClient.invoke`"""
+    params = ", ".join(f'"{argument}": {argument}' for argument in arguments)
+    lines = [
+        "        return self.api_client.invoke(",
+        f'            OPERATIONS["{name}"],',
+        f"            {{{params}}},",
+        f'            "{result}",',
+    ]
+    lines.extend(f"            {option}={option}," for option in OPTIONS)
+    lines.append("        )")
+    return lines
+
+
+def drop_unused_imports(source: str) -> str:
+    """
+    Remove the names imported by a module that it no longer uses
+
+    The converted methods no longer reference some of the types that the
+    generated `_*_serialize` methods needed.
+
+    Args:
+        source: Source code of a module
+
+    Returns:
+        str: Source code of the module without its unused imports
+    """
+    tree = ast.parse(source)
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+    lines = source.splitlines()
+    edits = []
+    for statement in tree.body:
+        if not isinstance(statement, ast.ImportFrom):
+            continue
+        names = [
+            alias for alias in statement.names if (alias.asname or alias.name) in used
+        ]
+        if len(names) == len(statement.names):
+            continue
+        replacement = []
+        if names:
+            statement.names = names
+            replacement = [ast.unparse(statement)]
+        edits.append((statement.lineno, statement.end_lineno, replacement))
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        lines[start - 1 : end] = replacement
+    return "\n".join(lines) + "\n"
+
+
+def convert_module(source: str, operations: dict) -> str:
+    """
+    Convert a generated API module to call its operations through the table
+
+    The body of every public method is replaced by a call to
+    `ApiClient.invoke` and the `_*_serialize` methods are removed, their
+    metadata is added to `operations`.
+
+    Args:
+        source: Source code of a module from `tl_ninjarmm/api`
+        operations: The operations found so far, by name
+
+    Raises:
+        ValueError: If an operation has the name of one found so far, the
+            table holds the operations of every API by name
+
+    Returns:
+        str: Source code of the converted module
+    """
+    for old, new in MODULE_REPLACEMENTS:
+        if old not in source:
+            raise ValueError(f"Expected to find {old!r} in generated API module")
+        source = source.replace(old, new)
+
+    tree = ast.parse(source)
+    (api_class,) = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    methods = {
+        node.name: node for node in api_class.body if isinstance(node, ast.FunctionDef)
+    }
+
+    lines = source.splitlines()
+    edits = []
+    for method in methods.values():
+        if method.name.startswith("_") and method.name.endswith("_serialize"):
+            name = method.name[1 : -len("_serialize")]
+            if name in operations:
+                raise ValueError(
+                    f"Operation {name} of {api_class.name} is already defined by "
+                    f"{operations[name]['api']}, operation names must be unique"
+                )
+            fields = parse_serialize(method)
+            fields["response_types"] = parse_response_types(methods[name])
+            operations[name] = {"api": api_class.name, **fields}
+            edits.append((method.lineno, method.end_lineno + 1, []))
+        elif not method.name.startswith("_"):
+            name, result = method.name, "data"
+            for suffix, suffix_result in RESULTS.items():
+                if method.name.endswith(suffix):
+                    name, result = method.name[: -len(suffix)], suffix_result
+            arguments = [
+                arg.arg
+                for arg in method.args.args
+                if arg.arg != "self" and not arg.arg.startswith("_")
+            ]
+            edits.append(
+                (
+                    method.body[1].lineno,
+                    method.end_lineno,
+                    invoke_body(name, result, arguments),
+                )
+            )
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        lines[start - 1 : end] = replacement
+    # The last method of the class was a `_*_serialize` one
+    while not lines[-1].strip():
+        lines.pop()
+    return drop_unused_imports("\n".join(lines) + "\n")
+
+
+def main(src: pathlib.Path):
+    modules = sorted(src.glob("*_api.py"))
+    sources = {module: module.read_text() for module in modules}
+    if all("OPERATIONS[" in source for source in sources.values()):
+        return
+
+    operations = {}
+    for module, source in sources.items():
+        module.write_text(convert_module(source, operations))
+
+    entries = [format_operation(name, operations[name]) for name in sorted(operations)]
+    (src / "operation_table.py").write_text(TABLE_HEADER + "\n".join(entries) + "\n}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--src",
+        help="The package directory holding the generated APIs",
+        default="src/tl_ninjarmm/api",
+        type=pathlib.Path,
+    )
+    args = parser.parse_args()
+
+    main(args.src)
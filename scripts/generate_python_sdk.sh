@@ -14,3 +14,15 @@ generate -i openapi_spec.yaml \
 -o src \
 --skip-validate-spec \
 --global-property supportingFiles,apis=system:management:devices:queries,models=$MODELS
+
+# Moves the request building of the APIs to a table of their operations
+python scripts/generate_operation_table.py
+
+# Generates the asyncio variants of the APIs from the sync ones
+python scripts/generate_async_apis.py
+
+# Makes the package __init__ modules import their exports on first access
+python scripts/generate_lazy_inits.py
+
+# Makes the models encode and decode JSON with the configured codec
+python scripts/use_json_codec.py
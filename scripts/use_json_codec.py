@@ -0,0 +1,59 @@
+import argparse
+import pathlib
+
+# Rewrites of a generated model module
+MODEL_REPLACEMENTS = [
+    (
+        "import json\n",
+        "from tl_ninjarmm.codec import json_dumps, json_loads\n",
+    ),
+    (
+        "        return json.dumps(self.to_dict())\n",
+        "        return json_dumps(self.to_dict())\n",
+    ),
+    (
+        "        return cls.from_dict(json.loads(json_str))\n",
+        "        return cls.from_dict(json_loads(json_str))\n",
+    ),
+]
+
+MARKER = "from tl_ninjarmm.codec import json_dumps, json_loads"
+
+
+def convert_model(source: str) -> str:
+    """
+    Convert a generated model to encode and decode JSON with the configured codec
+
+    Args:
+        source: Source code of a module from `tl_ninjarmm/models`
+
+    Returns:
+        str: Source code of the converted module
+    """
+    if MARKER in source:
+        return source
+    for old, new in MODEL_REPLACEMENTS:
+        if source.count(old) != 1:
+            raise ValueError(f"Expected to find {old!r} once in generated model")
+        source = source.replace(old, new)
+    return source
+
+
+def main(src: pathlib.Path):
+    for module in sorted(src.glob("*.py")):
+        if module.name == "__init__.py":
+            continue
+        module.write_text(convert_model(module.read_text()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--src",
+        help="The package directory holding the generated models",
+        default="src/tl_ninjarmm/models",
+        type=pathlib.Path,
+    )
+    args = parser.parse_args()
+
+    main(args.src)
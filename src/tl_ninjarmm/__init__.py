@@ -170,306 +170,479 @@ __all__ = [
     "WindowsServiceReport",
 ]
 
-# import apis into sdk package
-from tl_ninjarmm.api.devices_api import DevicesApi as DevicesApi
-from tl_ninjarmm.api.management_api import ManagementApi as ManagementApi
-from tl_ninjarmm.api.queries_api import QueriesApi as QueriesApi
-from tl_ninjarmm.api.system_api import SystemApi as SystemApi
+from typing import TYPE_CHECKING
 
-# import ApiClient
-from tl_ninjarmm.api_response import ApiResponse as ApiResponse
-from tl_ninjarmm.api_client import ApiClient as ApiClient
-from tl_ninjarmm.configuration import Configuration as Configuration
-from tl_ninjarmm.exceptions import OpenApiException as OpenApiException
-from tl_ninjarmm.exceptions import ApiTypeError as ApiTypeError
-from tl_ninjarmm.exceptions import ApiValueError as ApiValueError
-from tl_ninjarmm.exceptions import ApiKeyError as ApiKeyError
-from tl_ninjarmm.exceptions import ApiAttributeError as ApiAttributeError
-from tl_ninjarmm.exceptions import ApiException as ApiException
+from tl_ninjarmm._lazy import lazy_exports
 
-# import models into sdk package
-from tl_ninjarmm.models.activities_response import (
-    ActivitiesResponse as ActivitiesResponse,
-)
-from tl_ninjarmm.models.activity import Activity as Activity
-from tl_ninjarmm.models.alert import Alert as Alert
-from tl_ninjarmm.models.antivirus_status_report import (
-    AntivirusStatusReport as AntivirusStatusReport,
-)
-from tl_ninjarmm.models.antivirus_threats_report import (
-    AntivirusThreatsReport as AntivirusThreatsReport,
-)
-from tl_ninjarmm.models.application import Application as Application
-from tl_ninjarmm.models.attribute_content import AttributeContent as AttributeContent
-from tl_ninjarmm.models.attribute_content_advanced_settings import (
-    AttributeContentAdvancedSettings as AttributeContentAdvancedSettings,
-)
-from tl_ninjarmm.models.attribute_content_advanced_settings_complexity_rules import (
-    AttributeContentAdvancedSettingsComplexityRules as AttributeContentAdvancedSettingsComplexityRules,
-)
-from tl_ninjarmm.models.attribute_content_advanced_settings_date_filters import (
-    AttributeContentAdvancedSettingsDateFilters as AttributeContentAdvancedSettingsDateFilters,
-)
-from tl_ninjarmm.models.attribute_content_advanced_settings_numeric_range import (
-    AttributeContentAdvancedSettingsNumericRange as AttributeContentAdvancedSettingsNumericRange,
-)
-from tl_ninjarmm.models.attribute_content_value import (
-    AttributeContentValue as AttributeContentValue,
-)
-from tl_ninjarmm.models.attribute_public_api_dto import (
-    AttributePublicApiDTO as AttributePublicApiDTO,
-)
-from tl_ninjarmm.models.attribute_value_updated_by_info import (
-    AttributeValueUpdatedByInfo as AttributeValueUpdatedByInfo,
-)
-from tl_ninjarmm.models.automation_script import AutomationScript as AutomationScript
-from tl_ninjarmm.models.backup_usage import BackupUsage as BackupUsage
-from tl_ninjarmm.models.computer_systems_report import (
-    ComputerSystemsReport as ComputerSystemsReport,
-)
-from tl_ninjarmm.models.contact import Contact as Contact
-from tl_ninjarmm.models.contact_patch_request import (
-    ContactPatchRequest as ContactPatchRequest,
-)
-from tl_ninjarmm.models.create_contact_request import (
-    CreateContactRequest as CreateContactRequest,
-)
-from tl_ninjarmm.models.create_end_user_request import (
-    CreateEndUserRequest as CreateEndUserRequest,
-)
-from tl_ninjarmm.models.create_technician_request import (
-    CreateTechnicianRequest as CreateTechnicianRequest,
-)
-from tl_ninjarmm.models.credential_reference import (
-    CredentialReference as CredentialReference,
-)
-from tl_ninjarmm.models.cursor import Cursor as Cursor
-from tl_ninjarmm.models.custom_field_policy_condition_response import (
-    CustomFieldPolicyConditionResponse as CustomFieldPolicyConditionResponse,
-)
-from tl_ninjarmm.models.custom_fields_policy_condition_create_request import (
-    CustomFieldsPolicyConditionCreateRequest as CustomFieldsPolicyConditionCreateRequest,
-)
-from tl_ninjarmm.models.device import Device as Device
-from tl_ninjarmm.models.device_antivirus_status import (
-    DeviceAntivirusStatus as DeviceAntivirusStatus,
-)
-from tl_ninjarmm.models.device_antivirus_threat import (
-    DeviceAntivirusThreat as DeviceAntivirusThreat,
-)
-from tl_ninjarmm.models.device_application import DeviceApplication as DeviceApplication
-from tl_ninjarmm.models.device_computer_system import (
-    DeviceComputerSystem as DeviceComputerSystem,
-)
-from tl_ninjarmm.models.device_credential_options import (
-    DeviceCredentialOptions as DeviceCredentialOptions,
-)
-from tl_ninjarmm.models.device_disk_drive import DeviceDiskDrive as DeviceDiskDrive
-from tl_ninjarmm.models.device_health_report import (
-    DeviceHealthReport as DeviceHealthReport,
-)
-from tl_ninjarmm.models.device_health_summary import (
-    DeviceHealthSummary as DeviceHealthSummary,
-)
-from tl_ninjarmm.models.device_id_list import DeviceIDList as DeviceIDList
-from tl_ninjarmm.models.device_link import DeviceLink as DeviceLink
-from tl_ninjarmm.models.device_logged_on_user import (
-    DeviceLoggedOnUser as DeviceLoggedOnUser,
-)
-from tl_ninjarmm.models.device_mutable_properties import (
-    DeviceMutableProperties as DeviceMutableProperties,
-)
-from tl_ninjarmm.models.device_network_interfaces import (
-    DeviceNetworkInterfaces as DeviceNetworkInterfaces,
-)
-from tl_ninjarmm.models.device_os_patch import DeviceOSPatch as DeviceOSPatch
-from tl_ninjarmm.models.device_operating_system import (
-    DeviceOperatingSystem as DeviceOperatingSystem,
-)
-from tl_ninjarmm.models.device_policy_overrides import (
-    DevicePolicyOverrides as DevicePolicyOverrides,
-)
-from tl_ninjarmm.models.device_processor import DeviceProcessor as DeviceProcessor
-from tl_ninjarmm.models.device_raid_controller import (
-    DeviceRAIDController as DeviceRAIDController,
-)
-from tl_ninjarmm.models.device_raid_drive import DeviceRAIDDrive as DeviceRAIDDrive
-from tl_ninjarmm.models.device_scripting_options import (
-    DeviceScriptingOptions as DeviceScriptingOptions,
-)
-from tl_ninjarmm.models.device_search_match import (
-    DeviceSearchMatch as DeviceSearchMatch,
-)
-from tl_ninjarmm.models.device_search_results import (
-    DeviceSearchResults as DeviceSearchResults,
-)
-from tl_ninjarmm.models.device_software_patch import (
-    DeviceSoftwarePatch as DeviceSoftwarePatch,
-)
-from tl_ninjarmm.models.device_usage_report import (
-    DeviceUsageReport as DeviceUsageReport,
-)
-from tl_ninjarmm.models.device_volume import DeviceVolume as DeviceVolume
-from tl_ninjarmm.models.device_windows_service import (
-    DeviceWindowsService as DeviceWindowsService,
-)
-from tl_ninjarmm.models.disk_drive import DiskDrive as DiskDrive
-from tl_ninjarmm.models.disk_drive_report import DiskDriveReport as DiskDriveReport
-from tl_ninjarmm.models.end_user import EndUser as EndUser
-from tl_ninjarmm.models.end_user_customization import (
-    EndUserCustomization as EndUserCustomization,
-)
-from tl_ninjarmm.models.end_user_patch_request import (
-    EndUserPatchRequest as EndUserPatchRequest,
-)
-from tl_ninjarmm.models.feature_settings import FeatureSettings as FeatureSettings
-from tl_ninjarmm.models.generate_installer_request_dto import (
-    GenerateInstallerRequestDto as GenerateInstallerRequestDto,
-)
-from tl_ninjarmm.models.group import Group as Group
-from tl_ninjarmm.models.installer_content import InstallerContent as InstallerContent
-from tl_ninjarmm.models.job import Job as Job
-from tl_ninjarmm.models.link import Link as Link
-from tl_ninjarmm.models.location import Location as Location
-from tl_ninjarmm.models.location_model import LocationModel as LocationModel
-from tl_ninjarmm.models.location_with_organization_ref import (
-    LocationWithOrganizationRef as LocationWithOrganizationRef,
-)
-from tl_ninjarmm.models.logged_on_user import LoggedOnUser as LoggedOnUser
-from tl_ninjarmm.models.logged_on_users_report import (
-    LoggedOnUsersReport as LoggedOnUsersReport,
-)
-from tl_ninjarmm.models.maintenance import Maintenance as Maintenance
-from tl_ninjarmm.models.maintenance_settings import (
-    MaintenanceSettings as MaintenanceSettings,
-)
-from tl_ninjarmm.models.network_interface import NetworkInterface as NetworkInterface
-from tl_ninjarmm.models.network_interfaces_report import (
-    NetworkInterfacesReport as NetworkInterfacesReport,
-)
-from tl_ninjarmm.models.node_activities_response import (
-    NodeActivitiesResponse as NodeActivitiesResponse,
-)
-from tl_ninjarmm.models.node_attribute_info import (
-    NodeAttributeInfo as NodeAttributeInfo,
-)
-from tl_ninjarmm.models.node_attributes import NodeAttributes as NodeAttributes
-from tl_ninjarmm.models.node_attributes_detailed import (
-    NodeAttributesDetailed as NodeAttributesDetailed,
-)
-from tl_ninjarmm.models.node_attributes_detailed_report import (
-    NodeAttributesDetailedReport as NodeAttributesDetailedReport,
-)
-from tl_ninjarmm.models.node_attributes_report import (
-    NodeAttributesReport as NodeAttributesReport,
-)
-from tl_ninjarmm.models.node_references import NodeReferences as NodeReferences
-from tl_ninjarmm.models.node_role import NodeRole as NodeRole
-from tl_ninjarmm.models.node_role_policy_assignment import (
-    NodeRolePolicyAssignment as NodeRolePolicyAssignment,
-)
-from tl_ninjarmm.models.node_with_detailed_references import (
-    NodeWithDetailedReferences as NodeWithDetailedReferences,
-)
-from tl_ninjarmm.models.note import Note as Note
-from tl_ninjarmm.models.notification_channel import (
-    NotificationChannel as NotificationChannel,
-)
-from tl_ninjarmm.models.os_patch import OSPatch as OSPatch
-from tl_ninjarmm.models.os_patch_report import OSPatchReport as OSPatchReport
-from tl_ninjarmm.models.operating_systems_report import (
-    OperatingSystemsReport as OperatingSystemsReport,
-)
-from tl_ninjarmm.models.organization import Organization as Organization
-from tl_ninjarmm.models.organization_detailed import (
-    OrganizationDetailed as OrganizationDetailed,
-)
-from tl_ninjarmm.models.organization_model import OrganizationModel as OrganizationModel
-from tl_ninjarmm.models.organization_settings import (
-    OrganizationSettings as OrganizationSettings,
-)
-from tl_ninjarmm.models.organization_with_locations_and_policy_assignments_model import (
-    OrganizationWithLocationsAndPolicyAssignmentsModel as OrganizationWithLocationsAndPolicyAssignmentsModel,
-)
-from tl_ninjarmm.models.policy import Policy as Policy
-from tl_ninjarmm.models.policy_condition_custom_field import (
-    PolicyConditionCustomField as PolicyConditionCustomField,
-)
-from tl_ninjarmm.models.policy_condition_inheritance_status import (
-    PolicyConditionInheritanceStatus as PolicyConditionInheritanceStatus,
-)
-from tl_ninjarmm.models.policy_condition_script import (
-    PolicyConditionScript as PolicyConditionScript,
-)
-from tl_ninjarmm.models.policy_condition_script_variable import (
-    PolicyConditionScriptVariable as PolicyConditionScriptVariable,
-)
-from tl_ninjarmm.models.policy_info import PolicyInfo as PolicyInfo
-from tl_ninjarmm.models.policy_overrides import PolicyOverrides as PolicyOverrides
-from tl_ninjarmm.models.policy_overrides_report import (
-    PolicyOverridesReport as PolicyOverridesReport,
-)
-from tl_ninjarmm.models.processor import Processor as Processor
-from tl_ninjarmm.models.processor_report import ProcessorReport as ProcessorReport
-from tl_ninjarmm.models.raid_controller_report import (
-    RAIDControllerReport as RAIDControllerReport,
-)
-from tl_ninjarmm.models.raid_drive_report import RAIDDriveReport as RAIDDriveReport
-from tl_ninjarmm.models.reboot_request import RebootRequest as RebootRequest
-from tl_ninjarmm.models.role_member import RoleMember as RoleMember
-from tl_ninjarmm.models.run_script_request import RunScriptRequest as RunScriptRequest
-from tl_ninjarmm.models.scheduled_task import ScheduledTask as ScheduledTask
-from tl_ninjarmm.models.scoped_attributes import ScopedAttributes as ScopedAttributes
-from tl_ninjarmm.models.scoped_attributes_detailed import (
-    ScopedAttributesDetailed as ScopedAttributesDetailed,
-)
-from tl_ninjarmm.models.scoped_attributes_detailed_report import (
-    ScopedAttributesDetailedReport as ScopedAttributesDetailedReport,
-)
-from tl_ninjarmm.models.scoped_attributes_report import (
-    ScopedAttributesReport as ScopedAttributesReport,
-)
-from tl_ninjarmm.models.script import Script as Script
-from tl_ninjarmm.models.script_category import ScriptCategory as ScriptCategory
-from tl_ninjarmm.models.script_variable import ScriptVariable as ScriptVariable
-from tl_ninjarmm.models.software_patch import SoftwarePatch as SoftwarePatch
-from tl_ninjarmm.models.software_patch_report import (
-    SoftwarePatchReport as SoftwarePatchReport,
-)
-from tl_ninjarmm.models.software_product import SoftwareProduct as SoftwareProduct
-from tl_ninjarmm.models.software_report import SoftwareReport as SoftwareReport
-from tl_ninjarmm.models.technician import Technician as Technician
-from tl_ninjarmm.models.update_technician_request import (
-    UpdateTechnicianRequest as UpdateTechnicianRequest,
-)
-from tl_ninjarmm.models.user import User as User
-from tl_ninjarmm.models.user_basic_info import UserBasicInfo as UserBasicInfo
-from tl_ninjarmm.models.user_role import UserRole as UserRole
-from tl_ninjarmm.models.volume import Volume as Volume
-from tl_ninjarmm.models.volume_bit_locker_status import (
-    VolumeBitLockerStatus as VolumeBitLockerStatus,
-)
-from tl_ninjarmm.models.volumes_report import VolumesReport as VolumesReport
-from tl_ninjarmm.models.warranty_dates import WarrantyDates as WarrantyDates
-from tl_ninjarmm.models.windows_event_policy_condition_create_request import (
-    WindowsEventPolicyConditionCreateRequest as WindowsEventPolicyConditionCreateRequest,
-)
-from tl_ninjarmm.models.windows_event_policy_condition_occurrence import (
-    WindowsEventPolicyConditionOccurrence as WindowsEventPolicyConditionOccurrence,
-)
-from tl_ninjarmm.models.windows_event_policy_condition_response import (
-    WindowsEventPolicyConditionResponse as WindowsEventPolicyConditionResponse,
-)
-from tl_ninjarmm.models.windows_event_policy_condition_text import (
-    WindowsEventPolicyConditionText as WindowsEventPolicyConditionText,
-)
-from tl_ninjarmm.models.windows_service import WindowsService as WindowsService
-from tl_ninjarmm.models.windows_service_configuration import (
-    WindowsServiceConfiguration as WindowsServiceConfiguration,
-)
-from tl_ninjarmm.models.windows_service_control_request import (
-    WindowsServiceControlRequest as WindowsServiceControlRequest,
-)
-from tl_ninjarmm.models.windows_service_report import (
-    WindowsServiceReport as WindowsServiceReport,
+# Exported names are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DevicesApi": "tl_ninjarmm.api.devices_api",
+        "ManagementApi": "tl_ninjarmm.api.management_api",
+        "QueriesApi": "tl_ninjarmm.api.queries_api",
+        "SystemApi": "tl_ninjarmm.api.system_api",
+        "ApiResponse": "tl_ninjarmm.api_response",
+        "ApiClient": "tl_ninjarmm.api_client",
+        "Configuration": "tl_ninjarmm.configuration",
+        "OpenApiException": "tl_ninjarmm.exceptions",
+        "ApiTypeError": "tl_ninjarmm.exceptions",
+        "ApiValueError": "tl_ninjarmm.exceptions",
+        "ApiKeyError": "tl_ninjarmm.exceptions",
+        "ApiAttributeError": "tl_ninjarmm.exceptions",
+        "ApiException": "tl_ninjarmm.exceptions",
+        "ActivitiesResponse": "tl_ninjarmm.models.activities_response",
+        "Activity": "tl_ninjarmm.models.activity",
+        "Alert": "tl_ninjarmm.models.alert",
+        "AntivirusStatusReport": "tl_ninjarmm.models.antivirus_status_report",
+        "AntivirusThreatsReport": "tl_ninjarmm.models.antivirus_threats_report",
+        "Application": "tl_ninjarmm.models.application",
+        "AttributeContent": "tl_ninjarmm.models.attribute_content",
+        "AttributeContentAdvancedSettings": "tl_ninjarmm.models.attribute_content_advanced_settings",
+        "AttributeContentAdvancedSettingsComplexityRules": "tl_ninjarmm.models.attribute_content_advanced_settings_complexity_rules",
+        "AttributeContentAdvancedSettingsDateFilters": "tl_ninjarmm.models.attribute_content_advanced_settings_date_filters",
+        "AttributeContentAdvancedSettingsNumericRange": "tl_ninjarmm.models.attribute_content_advanced_settings_numeric_range",
+        "AttributeContentValue": "tl_ninjarmm.models.attribute_content_value",
+        "AttributePublicApiDTO": "tl_ninjarmm.models.attribute_public_api_dto",
+        "AttributeValueUpdatedByInfo": "tl_ninjarmm.models.attribute_value_updated_by_info",
+        "AutomationScript": "tl_ninjarmm.models.automation_script",
+        "BackupUsage": "tl_ninjarmm.models.backup_usage",
+        "ComputerSystemsReport": "tl_ninjarmm.models.computer_systems_report",
+        "Contact": "tl_ninjarmm.models.contact",
+        "ContactPatchRequest": "tl_ninjarmm.models.contact_patch_request",
+        "CreateContactRequest": "tl_ninjarmm.models.create_contact_request",
+        "CreateEndUserRequest": "tl_ninjarmm.models.create_end_user_request",
+        "CreateTechnicianRequest": "tl_ninjarmm.models.create_technician_request",
+        "CredentialReference": "tl_ninjarmm.models.credential_reference",
+        "Cursor": "tl_ninjarmm.models.cursor",
+        "CustomFieldPolicyConditionResponse": "tl_ninjarmm.models.custom_field_policy_condition_response",
+        "CustomFieldsPolicyConditionCreateRequest": "tl_ninjarmm.models.custom_fields_policy_condition_create_request",
+        "Device": "tl_ninjarmm.models.device",
+        "DeviceAntivirusStatus": "tl_ninjarmm.models.device_antivirus_status",
+        "DeviceAntivirusThreat": "tl_ninjarmm.models.device_antivirus_threat",
+        "DeviceApplication": "tl_ninjarmm.models.device_application",
+        "DeviceComputerSystem": "tl_ninjarmm.models.device_computer_system",
+        "DeviceCredentialOptions": "tl_ninjarmm.models.device_credential_options",
+        "DeviceDiskDrive": "tl_ninjarmm.models.device_disk_drive",
+        "DeviceHealthReport": "tl_ninjarmm.models.device_health_report",
+        "DeviceHealthSummary": "tl_ninjarmm.models.device_health_summary",
+        "DeviceIDList": "tl_ninjarmm.models.device_id_list",
+        "DeviceLink": "tl_ninjarmm.models.device_link",
+        "DeviceLoggedOnUser": "tl_ninjarmm.models.device_logged_on_user",
+        "DeviceMutableProperties": "tl_ninjarmm.models.device_mutable_properties",
+        "DeviceNetworkInterfaces": "tl_ninjarmm.models.device_network_interfaces",
+        "DeviceOSPatch": "tl_ninjarmm.models.device_os_patch",
+        "DeviceOperatingSystem": "tl_ninjarmm.models.device_operating_system",
+        "DevicePolicyOverrides": "tl_ninjarmm.models.device_policy_overrides",
+        "DeviceProcessor": "tl_ninjarmm.models.device_processor",
+        "DeviceRAIDController": "tl_ninjarmm.models.device_raid_controller",
+        "DeviceRAIDDrive": "tl_ninjarmm.models.device_raid_drive",
+        "DeviceScriptingOptions": "tl_ninjarmm.models.device_scripting_options",
+        "DeviceSearchMatch": "tl_ninjarmm.models.device_search_match",
+        "DeviceSearchResults": "tl_ninjarmm.models.device_search_results",
+        "DeviceSoftwarePatch": "tl_ninjarmm.models.device_software_patch",
+        "DeviceUsageReport": "tl_ninjarmm.models.device_usage_report",
+        "DeviceVolume": "tl_ninjarmm.models.device_volume",
+        "DeviceWindowsService": "tl_ninjarmm.models.device_windows_service",
+        "DiskDrive": "tl_ninjarmm.models.disk_drive",
+        "DiskDriveReport": "tl_ninjarmm.models.disk_drive_report",
+        "EndUser": "tl_ninjarmm.models.end_user",
+        "EndUserCustomization": "tl_ninjarmm.models.end_user_customization",
+        "EndUserPatchRequest": "tl_ninjarmm.models.end_user_patch_request",
+        "FeatureSettings": "tl_ninjarmm.models.feature_settings",
+        "GenerateInstallerRequestDto": "tl_ninjarmm.models.generate_installer_request_dto",
+        "Group": "tl_ninjarmm.models.group",
+        "InstallerContent": "tl_ninjarmm.models.installer_content",
+        "Job": "tl_ninjarmm.models.job",
+        "Link": "tl_ninjarmm.models.link",
+        "Location": "tl_ninjarmm.models.location",
+        "LocationModel": "tl_ninjarmm.models.location_model",
+        "LocationWithOrganizationRef": "tl_ninjarmm.models.location_with_organization_ref",
+        "LoggedOnUser": "tl_ninjarmm.models.logged_on_user",
+        "LoggedOnUsersReport": "tl_ninjarmm.models.logged_on_users_report",
+        "Maintenance": "tl_ninjarmm.models.maintenance",
+        "MaintenanceSettings": "tl_ninjarmm.models.maintenance_settings",
+        "NetworkInterface": "tl_ninjarmm.models.network_interface",
+        "NetworkInterfacesReport": "tl_ninjarmm.models.network_interfaces_report",
+        "NodeActivitiesResponse": "tl_ninjarmm.models.node_activities_response",
+        "NodeAttributeInfo": "tl_ninjarmm.models.node_attribute_info",
+        "NodeAttributes": "tl_ninjarmm.models.node_attributes",
+        "NodeAttributesDetailed": "tl_ninjarmm.models.node_attributes_detailed",
+        "NodeAttributesDetailedReport": "tl_ninjarmm.models.node_attributes_detailed_report",
+        "NodeAttributesReport": "tl_ninjarmm.models.node_attributes_report",
+        "NodeReferences": "tl_ninjarmm.models.node_references",
+        "NodeRole": "tl_ninjarmm.models.node_role",
+        "NodeRolePolicyAssignment": "tl_ninjarmm.models.node_role_policy_assignment",
+        "NodeWithDetailedReferences": "tl_ninjarmm.models.node_with_detailed_references",
+        "Note": "tl_ninjarmm.models.note",
+        "NotificationChannel": "tl_ninjarmm.models.notification_channel",
+        "OSPatch": "tl_ninjarmm.models.os_patch",
+        "OSPatchReport": "tl_ninjarmm.models.os_patch_report",
+        "OperatingSystemsReport": "tl_ninjarmm.models.operating_systems_report",
+        "Organization": "tl_ninjarmm.models.organization",
+        "OrganizationDetailed": "tl_ninjarmm.models.organization_detailed",
+        "OrganizationModel": "tl_ninjarmm.models.organization_model",
+        "OrganizationSettings": "tl_ninjarmm.models.organization_settings",
+        "OrganizationWithLocationsAndPolicyAssignmentsModel": "tl_ninjarmm.models.organization_with_locations_and_policy_assignments_model",
+        "Policy": "tl_ninjarmm.models.policy",
+        "PolicyConditionCustomField": "tl_ninjarmm.models.policy_condition_custom_field",
+        "PolicyConditionInheritanceStatus": "tl_ninjarmm.models.policy_condition_inheritance_status",
+        "PolicyConditionScript": "tl_ninjarmm.models.policy_condition_script",
+        "PolicyConditionScriptVariable": "tl_ninjarmm.models.policy_condition_script_variable",
+        "PolicyInfo": "tl_ninjarmm.models.policy_info",
+        "PolicyOverrides": "tl_ninjarmm.models.policy_overrides",
+        "PolicyOverridesReport": "tl_ninjarmm.models.policy_overrides_report",
+        "Processor": "tl_ninjarmm.models.processor",
+        "ProcessorReport": "tl_ninjarmm.models.processor_report",
+        "RAIDControllerReport": "tl_ninjarmm.models.raid_controller_report",
+        "RAIDDriveReport": "tl_ninjarmm.models.raid_drive_report",
+        "RebootRequest": "tl_ninjarmm.models.reboot_request",
+        "RoleMember": "tl_ninjarmm.models.role_member",
+        "RunScriptRequest": "tl_ninjarmm.models.run_script_request",
+        "ScheduledTask": "tl_ninjarmm.models.scheduled_task",
+        "ScopedAttributes": "tl_ninjarmm.models.scoped_attributes",
+        "ScopedAttributesDetailed": "tl_ninjarmm.models.scoped_attributes_detailed",
+        "ScopedAttributesDetailedReport": "tl_ninjarmm.models.scoped_attributes_detailed_report",
+        "ScopedAttributesReport": "tl_ninjarmm.models.scoped_attributes_report",
+        "Script": "tl_ninjarmm.models.script",
+        "ScriptCategory": "tl_ninjarmm.models.script_category",
+        "ScriptVariable": "tl_ninjarmm.models.script_variable",
+        "SoftwarePatch": "tl_ninjarmm.models.software_patch",
+        "SoftwarePatchReport": "tl_ninjarmm.models.software_patch_report",
+        "SoftwareProduct": "tl_ninjarmm.models.software_product",
+        "SoftwareReport": "tl_ninjarmm.models.software_report",
+        "Technician": "tl_ninjarmm.models.technician",
+        "UpdateTechnicianRequest": "tl_ninjarmm.models.update_technician_request",
+        "User": "tl_ninjarmm.models.user",
+        "UserBasicInfo": "tl_ninjarmm.models.user_basic_info",
+        "UserRole": "tl_ninjarmm.models.user_role",
+        "Volume": "tl_ninjarmm.models.volume",
+        "VolumeBitLockerStatus": "tl_ninjarmm.models.volume_bit_locker_status",
+        "VolumesReport": "tl_ninjarmm.models.volumes_report",
+        "WarrantyDates": "tl_ninjarmm.models.warranty_dates",
+        "WindowsEventPolicyConditionCreateRequest": "tl_ninjarmm.models.windows_event_policy_condition_create_request",
+        "WindowsEventPolicyConditionOccurrence": "tl_ninjarmm.models.windows_event_policy_condition_occurrence",
+        "WindowsEventPolicyConditionResponse": "tl_ninjarmm.models.windows_event_policy_condition_response",
+        "WindowsEventPolicyConditionText": "tl_ninjarmm.models.windows_event_policy_condition_text",
+        "WindowsService": "tl_ninjarmm.models.windows_service",
+        "WindowsServiceConfiguration": "tl_ninjarmm.models.windows_service_configuration",
+        "WindowsServiceControlRequest": "tl_ninjarmm.models.windows_service_control_request",
+        "WindowsServiceReport": "tl_ninjarmm.models.windows_service_report",
+    },
 )
+
+if TYPE_CHECKING:
+    from tl_ninjarmm.api.devices_api import DevicesApi as DevicesApi
+    from tl_ninjarmm.api.management_api import ManagementApi as ManagementApi
+    from tl_ninjarmm.api.queries_api import QueriesApi as QueriesApi
+    from tl_ninjarmm.api.system_api import SystemApi as SystemApi
+    from tl_ninjarmm.api_response import ApiResponse as ApiResponse
+    from tl_ninjarmm.api_client import ApiClient as ApiClient
+    from tl_ninjarmm.configuration import Configuration as Configuration
+    from tl_ninjarmm.exceptions import OpenApiException as OpenApiException
+    from tl_ninjarmm.exceptions import ApiTypeError as ApiTypeError
+    from tl_ninjarmm.exceptions import ApiValueError as ApiValueError
+    from tl_ninjarmm.exceptions import ApiKeyError as ApiKeyError
+    from tl_ninjarmm.exceptions import ApiAttributeError as ApiAttributeError
+    from tl_ninjarmm.exceptions import ApiException as ApiException
+    from tl_ninjarmm.models.activities_response import (
+        ActivitiesResponse as ActivitiesResponse,
+    )
+    from tl_ninjarmm.models.activity import Activity as Activity
+    from tl_ninjarmm.models.alert import Alert as Alert
+    from tl_ninjarmm.models.antivirus_status_report import (
+        AntivirusStatusReport as AntivirusStatusReport,
+    )
+    from tl_ninjarmm.models.antivirus_threats_report import (
+        AntivirusThreatsReport as AntivirusThreatsReport,
+    )
+    from tl_ninjarmm.models.application import Application as Application
+    from tl_ninjarmm.models.attribute_content import (
+        AttributeContent as AttributeContent,
+    )
+    from tl_ninjarmm.models.attribute_content_advanced_settings import (
+        AttributeContentAdvancedSettings as AttributeContentAdvancedSettings,
+    )
+    from tl_ninjarmm.models.attribute_content_advanced_settings_complexity_rules import (
+        AttributeContentAdvancedSettingsComplexityRules as AttributeContentAdvancedSettingsComplexityRules,
+    )
+    from tl_ninjarmm.models.attribute_content_advanced_settings_date_filters import (
+        AttributeContentAdvancedSettingsDateFilters as AttributeContentAdvancedSettingsDateFilters,
+    )
+    from tl_ninjarmm.models.attribute_content_advanced_settings_numeric_range import (
+        AttributeContentAdvancedSettingsNumericRange as AttributeContentAdvancedSettingsNumericRange,
+    )
+    from tl_ninjarmm.models.attribute_content_value import (
+        AttributeContentValue as AttributeContentValue,
+    )
+    from tl_ninjarmm.models.attribute_public_api_dto import (
+        AttributePublicApiDTO as AttributePublicApiDTO,
+    )
+    from tl_ninjarmm.models.attribute_value_updated_by_info import (
+        AttributeValueUpdatedByInfo as AttributeValueUpdatedByInfo,
+    )
+    from tl_ninjarmm.models.automation_script import (
+        AutomationScript as AutomationScript,
+    )
+    from tl_ninjarmm.models.backup_usage import BackupUsage as BackupUsage
+    from tl_ninjarmm.models.computer_systems_report import (
+        ComputerSystemsReport as ComputerSystemsReport,
+    )
+    from tl_ninjarmm.models.contact import Contact as Contact
+    from tl_ninjarmm.models.contact_patch_request import (
+        ContactPatchRequest as ContactPatchRequest,
+    )
+    from tl_ninjarmm.models.create_contact_request import (
+        CreateContactRequest as CreateContactRequest,
+    )
+    from tl_ninjarmm.models.create_end_user_request import (
+        CreateEndUserRequest as CreateEndUserRequest,
+    )
+    from tl_ninjarmm.models.create_technician_request import (
+        CreateTechnicianRequest as CreateTechnicianRequest,
+    )
+    from tl_ninjarmm.models.credential_reference import (
+        CredentialReference as CredentialReference,
+    )
+    from tl_ninjarmm.models.cursor import Cursor as Cursor
+    from tl_ninjarmm.models.custom_field_policy_condition_response import (
+        CustomFieldPolicyConditionResponse as CustomFieldPolicyConditionResponse,
+    )
+    from tl_ninjarmm.models.custom_fields_policy_condition_create_request import (
+        CustomFieldsPolicyConditionCreateRequest as CustomFieldsPolicyConditionCreateRequest,
+    )
+    from tl_ninjarmm.models.device import Device as Device
+    from tl_ninjarmm.models.device_antivirus_status import (
+        DeviceAntivirusStatus as DeviceAntivirusStatus,
+    )
+    from tl_ninjarmm.models.device_antivirus_threat import (
+        DeviceAntivirusThreat as DeviceAntivirusThreat,
+    )
+    from tl_ninjarmm.models.device_application import (
+        DeviceApplication as DeviceApplication,
+    )
+    from tl_ninjarmm.models.device_computer_system import (
+        DeviceComputerSystem as DeviceComputerSystem,
+    )
+    from tl_ninjarmm.models.device_credential_options import (
+        DeviceCredentialOptions as DeviceCredentialOptions,
+    )
+    from tl_ninjarmm.models.device_disk_drive import DeviceDiskDrive as DeviceDiskDrive
+    from tl_ninjarmm.models.device_health_report import (
+        DeviceHealthReport as DeviceHealthReport,
+    )
+    from tl_ninjarmm.models.device_health_summary import (
+        DeviceHealthSummary as DeviceHealthSummary,
+    )
+    from tl_ninjarmm.models.device_id_list import DeviceIDList as DeviceIDList
+    from tl_ninjarmm.models.device_link import DeviceLink as DeviceLink
+    from tl_ninjarmm.models.device_logged_on_user import (
+        DeviceLoggedOnUser as DeviceLoggedOnUser,
+    )
+    from tl_ninjarmm.models.device_mutable_properties import (
+        DeviceMutableProperties as DeviceMutableProperties,
+    )
+    from tl_ninjarmm.models.device_network_interfaces import (
+        DeviceNetworkInterfaces as DeviceNetworkInterfaces,
+    )
+    from tl_ninjarmm.models.device_os_patch import DeviceOSPatch as DeviceOSPatch
+    from tl_ninjarmm.models.device_operating_system import (
+        DeviceOperatingSystem as DeviceOperatingSystem,
+    )
+    from tl_ninjarmm.models.device_policy_overrides import (
+        DevicePolicyOverrides as DevicePolicyOverrides,
+    )
+    from tl_ninjarmm.models.device_processor import DeviceProcessor as DeviceProcessor
+    from tl_ninjarmm.models.device_raid_controller import (
+        DeviceRAIDController as DeviceRAIDController,
+    )
+    from tl_ninjarmm.models.device_raid_drive import DeviceRAIDDrive as DeviceRAIDDrive
+    from tl_ninjarmm.models.device_scripting_options import (
+        DeviceScriptingOptions as DeviceScriptingOptions,
+    )
+    from tl_ninjarmm.models.device_search_match import (
+        DeviceSearchMatch as DeviceSearchMatch,
+    )
+    from tl_ninjarmm.models.device_search_results import (
+        DeviceSearchResults as DeviceSearchResults,
+    )
+    from tl_ninjarmm.models.device_software_patch import (
+        DeviceSoftwarePatch as DeviceSoftwarePatch,
+    )
+    from tl_ninjarmm.models.device_usage_report import (
+        DeviceUsageReport as DeviceUsageReport,
+    )
+    from tl_ninjarmm.models.device_volume import DeviceVolume as DeviceVolume
+    from tl_ninjarmm.models.device_windows_service import (
+        DeviceWindowsService as DeviceWindowsService,
+    )
+    from tl_ninjarmm.models.disk_drive import DiskDrive as DiskDrive
+    from tl_ninjarmm.models.disk_drive_report import DiskDriveReport as DiskDriveReport
+    from tl_ninjarmm.models.end_user import EndUser as EndUser
+    from tl_ninjarmm.models.end_user_customization import (
+        EndUserCustomization as EndUserCustomization,
+    )
+    from tl_ninjarmm.models.end_user_patch_request import (
+        EndUserPatchRequest as EndUserPatchRequest,
+    )
+    from tl_ninjarmm.models.feature_settings import FeatureSettings as FeatureSettings
+    from tl_ninjarmm.models.generate_installer_request_dto import (
+        GenerateInstallerRequestDto as GenerateInstallerRequestDto,
+    )
+    from tl_ninjarmm.models.group import Group as Group
+    from tl_ninjarmm.models.installer_content import (
+        InstallerContent as InstallerContent,
+    )
+    from tl_ninjarmm.models.job import Job as Job
+    from tl_ninjarmm.models.link import Link as Link
+    from tl_ninjarmm.models.location import Location as Location
+    from tl_ninjarmm.models.location_model import LocationModel as LocationModel
+    from tl_ninjarmm.models.location_with_organization_ref import (
+        LocationWithOrganizationRef as LocationWithOrganizationRef,
+    )
+    from tl_ninjarmm.models.logged_on_user import LoggedOnUser as LoggedOnUser
+    from tl_ninjarmm.models.logged_on_users_report import (
+        LoggedOnUsersReport as LoggedOnUsersReport,
+    )
+    from tl_ninjarmm.models.maintenance import Maintenance as Maintenance
+    from tl_ninjarmm.models.maintenance_settings import (
+        MaintenanceSettings as MaintenanceSettings,
+    )
+    from tl_ninjarmm.models.network_interface import (
+        NetworkInterface as NetworkInterface,
+    )
+    from tl_ninjarmm.models.network_interfaces_report import (
+        NetworkInterfacesReport as NetworkInterfacesReport,
+    )
+    from tl_ninjarmm.models.node_activities_response import (
+        NodeActivitiesResponse as NodeActivitiesResponse,
+    )
+    from tl_ninjarmm.models.node_attribute_info import (
+        NodeAttributeInfo as NodeAttributeInfo,
+    )
+    from tl_ninjarmm.models.node_attributes import NodeAttributes as NodeAttributes
+    from tl_ninjarmm.models.node_attributes_detailed import (
+        NodeAttributesDetailed as NodeAttributesDetailed,
+    )
+    from tl_ninjarmm.models.node_attributes_detailed_report import (
+        NodeAttributesDetailedReport as NodeAttributesDetailedReport,
+    )
+    from tl_ninjarmm.models.node_attributes_report import (
+        NodeAttributesReport as NodeAttributesReport,
+    )
+    from tl_ninjarmm.models.node_references import NodeReferences as NodeReferences
+    from tl_ninjarmm.models.node_role import NodeRole as NodeRole
+    from tl_ninjarmm.models.node_role_policy_assignment import (
+        NodeRolePolicyAssignment as NodeRolePolicyAssignment,
+    )
+    from tl_ninjarmm.models.node_with_detailed_references import (
+        NodeWithDetailedReferences as NodeWithDetailedReferences,
+    )
+    from tl_ninjarmm.models.note import Note as Note
+    from tl_ninjarmm.models.notification_channel import (
+        NotificationChannel as NotificationChannel,
+    )
+    from tl_ninjarmm.models.os_patch import OSPatch as OSPatch
+    from tl_ninjarmm.models.os_patch_report import OSPatchReport as OSPatchReport
+    from tl_ninjarmm.models.operating_systems_report import (
+        OperatingSystemsReport as OperatingSystemsReport,
+    )
+    from tl_ninjarmm.models.organization import Organization as Organization
+    from tl_ninjarmm.models.organization_detailed import (
+        OrganizationDetailed as OrganizationDetailed,
+    )
+    from tl_ninjarmm.models.organization_model import (
+        OrganizationModel as OrganizationModel,
+    )
+    from tl_ninjarmm.models.organization_settings import (
+        OrganizationSettings as OrganizationSettings,
+    )
+    from tl_ninjarmm.models.organization_with_locations_and_policy_assignments_model import (
+        OrganizationWithLocationsAndPolicyAssignmentsModel as OrganizationWithLocationsAndPolicyAssignmentsModel,
+    )
+    from tl_ninjarmm.models.policy import Policy as Policy
+    from tl_ninjarmm.models.policy_condition_custom_field import (
+        PolicyConditionCustomField as PolicyConditionCustomField,
+    )
+    from tl_ninjarmm.models.policy_condition_inheritance_status import (
+        PolicyConditionInheritanceStatus as PolicyConditionInheritanceStatus,
+    )
+    from tl_ninjarmm.models.policy_condition_script import (
+        PolicyConditionScript as PolicyConditionScript,
+    )
+    from tl_ninjarmm.models.policy_condition_script_variable import (
+        PolicyConditionScriptVariable as PolicyConditionScriptVariable,
+    )
+    from tl_ninjarmm.models.policy_info import PolicyInfo as PolicyInfo
+    from tl_ninjarmm.models.policy_overrides import PolicyOverrides as PolicyOverrides
+    from tl_ninjarmm.models.policy_overrides_report import (
+        PolicyOverridesReport as PolicyOverridesReport,
+    )
+    from tl_ninjarmm.models.processor import Processor as Processor
+    from tl_ninjarmm.models.processor_report import ProcessorReport as ProcessorReport
+    from tl_ninjarmm.models.raid_controller_report import (
+        RAIDControllerReport as RAIDControllerReport,
+    )
+    from tl_ninjarmm.models.raid_drive_report import RAIDDriveReport as RAIDDriveReport
+    from tl_ninjarmm.models.reboot_request import RebootRequest as RebootRequest
+    from tl_ninjarmm.models.role_member import RoleMember as RoleMember
+    from tl_ninjarmm.models.run_script_request import (
+        RunScriptRequest as RunScriptRequest,
+    )
+    from tl_ninjarmm.models.scheduled_task import ScheduledTask as ScheduledTask
+    from tl_ninjarmm.models.scoped_attributes import (
+        ScopedAttributes as ScopedAttributes,
+    )
+    from tl_ninjarmm.models.scoped_attributes_detailed import (
+        ScopedAttributesDetailed as ScopedAttributesDetailed,
+    )
+    from tl_ninjarmm.models.scoped_attributes_detailed_report import (
+        ScopedAttributesDetailedReport as ScopedAttributesDetailedReport,
+    )
+    from tl_ninjarmm.models.scoped_attributes_report import (
+        ScopedAttributesReport as ScopedAttributesReport,
+    )
+    from tl_ninjarmm.models.script import Script as Script
+    from tl_ninjarmm.models.script_category import ScriptCategory as ScriptCategory
+    from tl_ninjarmm.models.script_variable import ScriptVariable as ScriptVariable
+    from tl_ninjarmm.models.software_patch import SoftwarePatch as SoftwarePatch
+    from tl_ninjarmm.models.software_patch_report import (
+        SoftwarePatchReport as SoftwarePatchReport,
+    )
+    from tl_ninjarmm.models.software_product import SoftwareProduct as SoftwareProduct
+    from tl_ninjarmm.models.software_report import SoftwareReport as SoftwareReport
+    from tl_ninjarmm.models.technician import Technician as Technician
+    from tl_ninjarmm.models.update_technician_request import (
+        UpdateTechnicianRequest as UpdateTechnicianRequest,
+    )
+    from tl_ninjarmm.models.user import User as User
+    from tl_ninjarmm.models.user_basic_info import UserBasicInfo as UserBasicInfo
+    from tl_ninjarmm.models.user_role import UserRole as UserRole
+    from tl_ninjarmm.models.volume import Volume as Volume
+    from tl_ninjarmm.models.volume_bit_locker_status import (
+        VolumeBitLockerStatus as VolumeBitLockerStatus,
+    )
+    from tl_ninjarmm.models.volumes_report import VolumesReport as VolumesReport
+    from tl_ninjarmm.models.warranty_dates import WarrantyDates as WarrantyDates
+    from tl_ninjarmm.models.windows_event_policy_condition_create_request import (
+        WindowsEventPolicyConditionCreateRequest as WindowsEventPolicyConditionCreateRequest,
+    )
+    from tl_ninjarmm.models.windows_event_policy_condition_occurrence import (
+        WindowsEventPolicyConditionOccurrence as WindowsEventPolicyConditionOccurrence,
+    )
+    from tl_ninjarmm.models.windows_event_policy_condition_response import (
+        WindowsEventPolicyConditionResponse as WindowsEventPolicyConditionResponse,
+    )
+    from tl_ninjarmm.models.windows_event_policy_condition_text import (
+        WindowsEventPolicyConditionText as WindowsEventPolicyConditionText,
+    )
+    from tl_ninjarmm.models.windows_service import WindowsService as WindowsService
+    from tl_ninjarmm.models.windows_service_configuration import (
+        WindowsServiceConfiguration as WindowsServiceConfiguration,
+    )
+    from tl_ninjarmm.models.windows_service_control_request import (
+        WindowsServiceControlRequest as WindowsServiceControlRequest,
+    )
+    from tl_ninjarmm.models.windows_service_report import (
+        WindowsServiceReport as WindowsServiceReport,
+    )
@@ -0,0 +1,35 @@
+"""Lazy exports of the package `__init__` modules (PEP 562).
+
+Importing every API module and pydantic model up front makes
+`import tl_ninjarmm` take seconds. The package `__init__` modules instead map
+each exported name to the module defining it, and `lazy_exports` builds the
+module level `__getattr__` importing that module on first access.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+
+
+def lazy_exports(
+    package: str, imports: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Returns the `__getattr__` and `__dir__` of a package with lazy exports.
+
+    :param package: the `__name__` of the package.
+    :param imports: the module defining every exported name.
+    """
+
+    def __getattr__(name: str) -> object:
+        module = imports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Later lookups find the attribute without calling `__getattr__`
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,43 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+asyncio flavour of the NinjaOne client.
+
+Requires the optional `aiohttp` dependency (`tl-ninjarmm[asyncio]`).
+"""
+
+# Define package exports
+__all__ = [
+    "AsyncDevicesApi",
+    "AsyncManagementApi",
+    "AsyncQueriesApi",
+    "AsyncSystemApi",
+    "AsyncApiClient",
+]
+
+from typing import TYPE_CHECKING
+
+from tl_ninjarmm._lazy import lazy_exports
+
+# Exported names are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncDevicesApi": "tl_ninjarmm.aio.api.devices_api",
+        "AsyncManagementApi": "tl_ninjarmm.aio.api.management_api",
+        "AsyncQueriesApi": "tl_ninjarmm.aio.api.queries_api",
+        "AsyncSystemApi": "tl_ninjarmm.aio.api.system_api",
+        "AsyncApiClient": "tl_ninjarmm.aio.api_client",
+    },
+)
+
+if TYPE_CHECKING:
+    from tl_ninjarmm.aio.api.devices_api import AsyncDevicesApi as AsyncDevicesApi
+    from tl_ninjarmm.aio.api.management_api import (
+        AsyncManagementApi as AsyncManagementApi,
+    )
+    from tl_ninjarmm.aio.api.queries_api import AsyncQueriesApi as AsyncQueriesApi
+    from tl_ninjarmm.aio.api.system_api import AsyncSystemApi as AsyncSystemApi
+    from tl_ninjarmm.aio.api_client import AsyncApiClient as AsyncApiClient
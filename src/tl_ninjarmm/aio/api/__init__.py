@@ -0,0 +1,22 @@
+from typing import TYPE_CHECKING
+
+from tl_ninjarmm._lazy import lazy_exports
+
+# Exported names are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncDevicesApi": "tl_ninjarmm.aio.api.devices_api",
+        "AsyncManagementApi": "tl_ninjarmm.aio.api.management_api",
+        "AsyncQueriesApi": "tl_ninjarmm.aio.api.queries_api",
+        "AsyncSystemApi": "tl_ninjarmm.aio.api.system_api",
+    },
+)
+
+if TYPE_CHECKING:
+    from tl_ninjarmm.aio.api.devices_api import AsyncDevicesApi as AsyncDevicesApi
+    from tl_ninjarmm.aio.api.management_api import (
+        AsyncManagementApi as AsyncManagementApi,
+    )
+    from tl_ninjarmm.aio.api.queries_api import AsyncQueriesApi as AsyncQueriesApi
+    from tl_ninjarmm.aio.api.system_api import AsyncSystemApi as AsyncSystemApi
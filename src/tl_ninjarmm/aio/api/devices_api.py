@@ -0,0 +1,3555 @@
+# coding: utf-8
+
+"""
+NinjaOne Public API 2.0
+
+NinjaOne Public API documentation.
+
+The version of the OpenAPI document: 2.0.9-draft
+Contact: api@ninjarmm.com
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import StrictBool
+from tl_ninjarmm.models.alert import Alert
+from tl_ninjarmm.models.application import Application
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.disk_drive import DiskDrive
+from tl_ninjarmm.models.job import Job
+from tl_ninjarmm.models.logged_on_user import LoggedOnUser
+from tl_ninjarmm.models.network_interface import NetworkInterface
+from tl_ninjarmm.models.node_activities_response import NodeActivitiesResponse
+from tl_ninjarmm.models.os_patch import OSPatch
+from tl_ninjarmm.models.policy_overrides import PolicyOverrides
+from tl_ninjarmm.models.processor import Processor
+from tl_ninjarmm.models.software_patch import SoftwarePatch
+from tl_ninjarmm.models.volume import Volume
+from tl_ninjarmm.models.windows_service import WindowsService
+
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.aio.api_client import AsyncApiClient
+from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
+from tl_ninjarmm.aio.rest import RESTResponseType
+
+
+class AsyncDevicesApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
+
+    @validate_call
+    async def get_device(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Device:
+        """Device details
+
+        Returns device details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[Device]:
+        """Device details
+
+        Returns device details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device details
+
+        Returns device details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_active_jobs(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Job]:
+        """Device currently running (active) jobs
+
+        Returns currently running jobs for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_active_jobs_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Job]]:
+        """Device currently running (active) jobs
+
+        Returns currently running jobs for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_active_jobs_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device currently running (active) jobs
+
+        Returns currently running jobs for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_activities(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        older_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are newer than specified activity ID"
+            ),
+        ] = None,
+        newer_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are older than specified activity ID"
+            ),
+        ] = None,
+        activity_type: Annotated[
+            Optional[StrictStr], Field(description="Return activities of type")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Return activities with status(es)")
+        ] = None,
+        series_uid: Annotated[
+            Optional[StrictStr],
+            Field(description="Return activities related to alert (series)"),
+        ] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=1000, strict=True, ge=10)]],
+            Field(description="Limit number of activities to return"),
+        ] = None,
+        lang: Annotated[Optional[StrictStr], Field(description="Language tag")] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> NodeActivitiesResponse:
+        """Device activities
+
+        Returns activity log for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param older_than: Return activities recorded that are newer than specified activity ID
+        :type older_than: int
+        :param newer_than: Return activities recorded that are older than specified activity ID
+        :type newer_than: int
+        :param activity_type: Return activities of type
+        :type activity_type: str
+        :param status: Return activities with status(es)
+        :type status: str
+        :param series_uid: Return activities related to alert (series)
+        :type series_uid: str
+        :param page_size: Limit number of activities to return
+        :type page_size: int
+        :param lang: Language tag
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_activities_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        older_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are newer than specified activity ID"
+            ),
+        ] = None,
+        newer_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are older than specified activity ID"
+            ),
+        ] = None,
+        activity_type: Annotated[
+            Optional[StrictStr], Field(description="Return activities of type")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Return activities with status(es)")
+        ] = None,
+        series_uid: Annotated[
+            Optional[StrictStr],
+            Field(description="Return activities related to alert (series)"),
+        ] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=1000, strict=True, ge=10)]],
+            Field(description="Limit number of activities to return"),
+        ] = None,
+        lang: Annotated[Optional[StrictStr], Field(description="Language tag")] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[NodeActivitiesResponse]:
+        """Device activities
+
+        Returns activity log for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param older_than: Return activities recorded that are newer than specified activity ID
+        :type older_than: int
+        :param newer_than: Return activities recorded that are older than specified activity ID
+        :type newer_than: int
+        :param activity_type: Return activities of type
+        :type activity_type: str
+        :param status: Return activities with status(es)
+        :type status: str
+        :param series_uid: Return activities related to alert (series)
+        :type series_uid: str
+        :param page_size: Limit number of activities to return
+        :type page_size: int
+        :param lang: Language tag
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_activities_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        older_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are newer than specified activity ID"
+            ),
+        ] = None,
+        newer_than: Annotated[
+            Optional[StrictInt],
+            Field(
+                description="Return activities recorded that are older than specified activity ID"
+            ),
+        ] = None,
+        activity_type: Annotated[
+            Optional[StrictStr], Field(description="Return activities of type")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Return activities with status(es)")
+        ] = None,
+        series_uid: Annotated[
+            Optional[StrictStr],
+            Field(description="Return activities related to alert (series)"),
+        ] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=1000, strict=True, ge=10)]],
+            Field(description="Limit number of activities to return"),
+        ] = None,
+        lang: Annotated[Optional[StrictStr], Field(description="Language tag")] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device activities
+
+        Returns activity log for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param older_than: Return activities recorded that are newer than specified activity ID
+        :type older_than: int
+        :param newer_than: Return activities recorded that are older than specified activity ID
+        :type newer_than: int
+        :param activity_type: Return activities of type
+        :type activity_type: str
+        :param status: Return activities with status(es)
+        :type status: str
+        :param series_uid: Return activities related to alert (series)
+        :type series_uid: str
+        :param page_size: Limit number of activities to return
+        :type page_size: int
+        :param lang: Language tag
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_alerts(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Alert]:
+        """Device alerts (triggered conditions)
+
+        Returns list of active alerts (triggered conditions) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_alerts_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Alert]]:
+        """Device alerts (triggered conditions)
+
+        Returns list of active alerts (triggered conditions) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_alerts_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        lang: Optional[StrictStr] = None,
+        tz: Annotated[Optional[StrictStr], Field(description="Time Zone")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device alerts (triggered conditions)
+
+        Returns list of active alerts (triggered conditions) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param lang:
+        :type lang: str
+        :param tz: Time Zone
+        :type tz: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_disk_drives(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[DiskDrive]:
+        """Device disk drives
+
+        Returns device disks' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_disk_drives_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[DiskDrive]]:
+        """Device disk drives
+
+        Returns device disks' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_disk_drives_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device disk drives
+
+        Returns device disks' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_os_patches(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[OSPatch]:
+        """OS Patch installation report for device
+
+        Returns patch installation history records (successful and failed) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_os_patches_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[OSPatch]]:
+        """OS Patch installation report for device
+
+        Returns patch installation history records (successful and failed) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_os_patches_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """OS Patch installation report for device
+
+        Returns patch installation history records (successful and failed) for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_software_patches(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[SoftwarePatch]:
+        """Software Patch history for device
+
+        Returns 3rd party software patch installation history records for device (successful and failed)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_software_patches_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[SoftwarePatch]]:
+        """Software Patch history for device
+
+        Returns 3rd party software patch installation history records for device (successful and failed)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_installed_software_patches_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Software Patch history for device
+
+        Returns 3rd party software patch installation history records for device (successful and failed)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_last_logged_on_user(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> LoggedOnUser:
+        """Last logged-on user information
+
+        Returns username that was last to login to device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_last_logged_on_user_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[LoggedOnUser]:
+        """Last logged-on user information
+
+        Returns username that was last to login to device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_last_logged_on_user_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Last logged-on user information
+
+        Returns username that was last to login to device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_network_interfaces(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[NetworkInterface]:
+        """Device network interfaces
+
+        Returns device network interfaces' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_network_interfaces_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[NetworkInterface]]:
+        """Device network interfaces
+
+        Returns device network interfaces' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_network_interfaces_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device network interfaces
+
+        Returns device network interfaces' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_os_patches(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[OSPatch]:
+        """OS Patches
+
+        Returns list of pending/rejected/approved OS patches for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_os_patches_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[OSPatch]]:
+        """OS Patches
+
+        Returns list of pending/rejected/approved OS patches for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_os_patches_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """OS Patches
+
+        Returns list of pending/rejected/approved OS patches for device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_software_patches(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[SoftwarePatch]:
+        """Pending, Failed and Rejected Software patches for device
+
+        Returns list of 3rd party Software patches for a device (for which there were no installation attempts)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_software_patches_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[SoftwarePatch]]:
+        """Pending, Failed and Rejected Software patches for device
+
+        Returns list of 3rd party Software patches for a device (for which there were no installation attempts)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_pending_failed_rejected_software_patches_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Pending, Failed and Rejected Software patches for device
+
+        Returns list of 3rd party Software patches for a device (for which there were no installation attempts)
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_processors(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Processor]:
+        """Device processors
+
+        Returns list of device Processor details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_processors_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Processor]]:
+        """Device processors
+
+        Returns list of device Processor details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_processors_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device processors
+
+        Returns list of device Processor details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_services(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[WindowsService]:
+        """Windows services
+
+        Returns list of Windows Services and their statuses
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_services_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[WindowsService]]:
+        """Windows services
+
+        Returns list of Windows Services and their statuses
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_services_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Windows services
+
+        Returns list of Windows Services and their statuses
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_software(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Application]:
+        """Device software inventory
+
+        Returns list of software installed on device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_software_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Application]]:
+        """Device software inventory
+
+        Returns list of software installed on device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_software_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device software inventory
+
+        Returns list of software installed on device
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_volumes(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Volume]:
+        """Device storage volumes
+
+        Returns device volumes' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_volumes_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Volume]]:
+        """Device storage volumes
+
+        Returns device volumes' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_volumes_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device storage volumes
+
+        Returns device volumes' details
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_node_custom_fields(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        with_inheritance: Annotated[
+            Optional[StrictBool],
+            Field(description="Retrieve values using definition scope hierarchy"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Dict[str, object]:
+        """Device custom fields
+
+        Returns list of device custom fields
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param with_inheritance: Retrieve values using definition scope hierarchy
+        :type with_inheritance: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_node_custom_fields_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        with_inheritance: Annotated[
+            Optional[StrictBool],
+            Field(description="Retrieve values using definition scope hierarchy"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[Dict[str, object]]:
+        """Device custom fields
+
+        Returns list of device custom fields
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param with_inheritance: Retrieve values using definition scope hierarchy
+        :type with_inheritance: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_node_custom_fields_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        with_inheritance: Annotated[
+            Optional[StrictBool],
+            Field(description="Retrieve values using definition scope hierarchy"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device custom fields
+
+        Returns list of device custom fields
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param with_inheritance: Retrieve values using definition scope hierarchy
+        :type with_inheritance: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> PolicyOverrides:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[PolicyOverrides]:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def update_node_attribute_values(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        request_body: Optional[Dict[str, Dict[str, Any]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> None:
+        """Update Field Values
+
+        Update device custom field values
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param request_body:
+        :type request_body: Dict[str, object]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def update_node_attribute_values_with_http_info(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        request_body: Optional[Dict[str, Dict[str, Any]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[None]:
+        """Update Field Values
+
+        Update device custom field values
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param request_body:
+        :type request_body: Dict[str, object]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def update_node_attribute_values_without_preload_content(
+        self,
+        id: Annotated[StrictInt, Field(description="Device identifier")],
+        request_body: Optional[Dict[str, Dict[str, Any]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Update Field Values
+
+        Update device custom field values
+
+        :param id: Device identifier (required)
+        :type id: int
+        :param request_body:
+        :type request_body: Dict[str, object]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
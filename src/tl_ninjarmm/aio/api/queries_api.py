@@ -0,0 +1,5616 @@
+# coding: utf-8
+
+"""
+NinjaOne Public API 2.0
+
+NinjaOne Public API documentation.
+
+The version of the OpenAPI document: 2.0.9-draft
+Contact: api@ninjarmm.com
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import StrictBool
+from tl_ninjarmm.models.antivirus_status_report import AntivirusStatusReport
+from tl_ninjarmm.models.antivirus_threats_report import AntivirusThreatsReport
+from tl_ninjarmm.models.computer_systems_report import ComputerSystemsReport
+from tl_ninjarmm.models.device_health_report import DeviceHealthReport
+from tl_ninjarmm.models.device_usage_report import DeviceUsageReport
+from tl_ninjarmm.models.disk_drive_report import DiskDriveReport
+from tl_ninjarmm.models.logged_on_users_report import LoggedOnUsersReport
+from tl_ninjarmm.models.network_interfaces_report import NetworkInterfacesReport
+from tl_ninjarmm.models.node_attributes_detailed_report import (
+    NodeAttributesDetailedReport,
+)
+from tl_ninjarmm.models.node_attributes_report import NodeAttributesReport
+from tl_ninjarmm.models.os_patch_report import OSPatchReport
+from tl_ninjarmm.models.operating_systems_report import OperatingSystemsReport
+from tl_ninjarmm.models.policy_overrides_report import PolicyOverridesReport
+from tl_ninjarmm.models.processor_report import ProcessorReport
+from tl_ninjarmm.models.raid_controller_report import RAIDControllerReport
+from tl_ninjarmm.models.raid_drive_report import RAIDDriveReport
+from tl_ninjarmm.models.scoped_attributes_detailed_report import (
+    ScopedAttributesDetailedReport,
+)
+from tl_ninjarmm.models.scoped_attributes_report import ScopedAttributesReport
+from tl_ninjarmm.models.software_patch_report import SoftwarePatchReport
+from tl_ninjarmm.models.software_report import SoftwareReport
+from tl_ninjarmm.models.volumes_report import VolumesReport
+from tl_ninjarmm.models.windows_service_report import WindowsServiceReport
+
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.aio.api_client import AsyncApiClient
+from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
+from tl_ninjarmm.aio.rest import RESTResponseType
+
+
+class AsyncQueriesApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
+
+    @validate_call
+    async def get_antivirus_status_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        product_state: Annotated[
+            Optional[StrictStr], Field(description="Product State filter")
+        ] = None,
+        product_name: Annotated[
+            Optional[StrictStr], Field(description="Product Name filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> AntivirusStatusReport:
+        """Antivirus status report
+
+        Returns list of statues of antivirus software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param product_state: Product State filter
+        :type product_state: str
+        :param product_name: Product Name filter
+        :type product_name: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_antivirus_status_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        product_state: Annotated[
+            Optional[StrictStr], Field(description="Product State filter")
+        ] = None,
+        product_name: Annotated[
+            Optional[StrictStr], Field(description="Product Name filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[AntivirusStatusReport]:
+        """Antivirus status report
+
+        Returns list of statues of antivirus software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param product_state: Product State filter
+        :type product_state: str
+        :param product_name: Product Name filter
+        :type product_name: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_antivirus_status_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        product_state: Annotated[
+            Optional[StrictStr], Field(description="Product State filter")
+        ] = None,
+        product_name: Annotated[
+            Optional[StrictStr], Field(description="Product Name filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Antivirus status report
+
+        Returns list of statues of antivirus software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param product_state: Product State filter
+        :type product_state: str
+        :param product_name: Product Name filter
+        :type product_name: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_antivirus_threats(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> AntivirusThreatsReport:
+        """Antivirus threats report
+
+        Returns list of antivirus threats
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_antivirus_threats_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[AntivirusThreatsReport]:
+        """Antivirus threats report
+
+        Returns list of antivirus threats
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_antivirus_threats_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Antivirus threats report
+
+        Returns list of antivirus threats
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_computer_systems(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ComputerSystemsReport:
+        """Computer systems report
+
+        Returns computer systems information for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_computer_systems_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ComputerSystemsReport]:
+        """Computer systems report
+
+        Returns computer systems information for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_computer_systems_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Computer systems report
+
+        Returns computer systems information for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_detailed_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> NodeAttributesDetailedReport:
+        """Custom fields detailed report
+
+        Returns Custom Fields report with additional information about each field
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_detailed_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[NodeAttributesDetailedReport]:
+        """Custom fields detailed report
+
+        Returns Custom Fields report with additional information about each field
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_detailed_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Custom fields detailed report
+
+        Returns Custom Fields report with additional information about each field
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> NodeAttributesReport:
+        """Custom fields report
+
+        Returns Custom Fields report
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[NodeAttributesReport]:
+        """Custom fields report
+
+        Returns Custom Fields report
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_custom_fields_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Custom fields report
+
+        Returns Custom Fields report
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_health_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        health: Annotated[
+            Optional[StrictStr], Field(description="Health status filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> DeviceHealthReport:
+        """Device health report
+
+        Returns list of device health summary records
+
+        :param df: Device filter
+        :type df: str
+        :param health: Health status filter
+        :type health: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_health_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        health: Annotated[
+            Optional[StrictStr], Field(description="Health status filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[DeviceHealthReport]:
+        """Device health report
+
+        Returns list of device health summary records
+
+        :param df: Device filter
+        :type df: str
+        :param health: Health status filter
+        :type health: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_health_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        health: Annotated[
+            Optional[StrictStr], Field(description="Health status filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device health report
+
+        Returns list of device health summary records
+
+        :param df: Device filter
+        :type df: str
+        :param health: Health status filter
+        :type health: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_usage(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include_deleted_devices: Annotated[
+            Optional[StrictBool],
+            Field(description="Whether or not include deleted devices"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> DeviceUsageReport:
+        """Device backup usage
+
+        Returns the backup usage by device
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include_deleted_devices: Whether or not include deleted devices
+        :type include_deleted_devices: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_usage_with_http_info(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include_deleted_devices: Annotated[
+            Optional[StrictBool],
+            Field(description="Whether or not include deleted devices"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[DeviceUsageReport]:
+        """Device backup usage
+
+        Returns the backup usage by device
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include_deleted_devices: Whether or not include deleted devices
+        :type include_deleted_devices: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_device_usage_without_preload_content(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include_deleted_devices: Annotated[
+            Optional[StrictBool],
+            Field(description="Whether or not include deleted devices"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Device backup usage
+
+        Returns the backup usage by device
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include_deleted_devices: Whether or not include deleted devices
+        :type include_deleted_devices: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_disk_drives(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> DiskDriveReport:
+        """Disk drives report
+
+        Returns list of physical disks
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_disk_drives_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[DiskDriveReport]:
+        """Disk drives report
+
+        Returns list of physical disks
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_disk_drives_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Disk drives report
+
+        Returns list of physical disks
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_os_patches(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> OSPatchReport:
+        """OS Patch installation report
+
+        Returns patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_os_patches_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[OSPatchReport]:
+        """OS Patch installation report
+
+        Returns patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_os_patches_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        status: Annotated[
+            Optional[StrictStr],
+            Field(description="Patch Status filter (FAILED, INSTALLED)"),
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """OS Patch installation report
+
+        Returns patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param status: Patch Status filter (FAILED, INSTALLED)
+        :type status: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_software_patches(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> SoftwarePatchReport:
+        """Software Patch history report
+
+        Returns 3rd party software patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_software_patches_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[SoftwarePatchReport]:
+        """Software Patch history report
+
+        Returns 3rd party software patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_installed_software_patches_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include patches installed after specified date"),
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Software Patch history report
+
+        Returns 3rd party software patch installation history records (successful and failed)
+
+        :param df: Device filter
+        :type df: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param installed_before: Include patches installed before specified date
+        :type installed_before: str
+        :param installed_after: Include patches installed after specified date
+        :type installed_after: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_last_logged_on_users_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> LoggedOnUsersReport:
+        """Last logged-on user report
+
+        Returns usernames and logon times
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_last_logged_on_users_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[LoggedOnUsersReport]:
+        """Last logged-on user report
+
+        Returns usernames and logon times
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_last_logged_on_users_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Last logged-on user report
+
+        Returns usernames and logon times
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_network_interfaces(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Optional[StrictInt] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> NetworkInterfacesReport:
+        """List Network Interfaces
+
+        Returns list of Network Interfaces for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size:
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_network_interfaces_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Optional[StrictInt] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[NetworkInterfacesReport]:
+        """List Network Interfaces
+
+        Returns list of Network Interfaces for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size:
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_network_interfaces_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Optional[StrictInt] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """List Network Interfaces
+
+        Returns list of Network Interfaces for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size:
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_operating_systems(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> OperatingSystemsReport:
+        """Operating systems report
+
+        Returns operating systems' for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_operating_systems_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[OperatingSystemsReport]:
+        """Operating systems report
+
+        Returns operating systems' for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_operating_systems_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Operating systems report
+
+        Returns operating systems' for devices
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_os_patches(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> OSPatchReport:
+        """Pending, Failed and Rejected OS patches report
+
+        Returns list of OS patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_os_patches_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[OSPatchReport]:
+        """Pending, Failed and Rejected OS patches report
+
+        Returns list of OS patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_os_patches_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        severity: Annotated[
+            Optional[StrictStr], Field(description="Patch Severity filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Pending, Failed and Rejected OS patches report
+
+        Returns list of OS patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param type: Patch Type filter
+        :type type: str
+        :param severity: Patch Severity filter
+        :type severity: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_software_patches(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> SoftwarePatchReport:
+        """Pending, Failed and Rejected Software patches report
+
+        Returns list of 3rd party Software patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_software_patches_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[SoftwarePatchReport]:
+        """Pending, Failed and Rejected Software patches report
+
+        Returns list of 3rd party Software patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_pending_failed_rejected_software_patches_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        status: Annotated[
+            Optional[StrictStr], Field(description="Patch Status filter")
+        ] = None,
+        product_identifier: Annotated[
+            Optional[StrictStr], Field(description="Product Identifier")
+        ] = None,
+        type: Annotated[
+            Optional[StrictStr], Field(description="Patch Type filter")
+        ] = None,
+        impact: Annotated[
+            Optional[StrictStr], Field(description="Patch Impact filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Pending, Failed and Rejected Software patches report
+
+        Returns list of 3rd party Software patches for which there were no installation attempts
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param status: Patch Status filter
+        :type status: str
+        :param product_identifier: Product Identifier
+        :type product_identifier: str
+        :param type: Patch Type filter
+        :type type: str
+        :param impact: Patch Impact filter
+        :type impact: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides1(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> PolicyOverridesReport:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides1_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[PolicyOverridesReport]:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_policy_overrides1_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get summary of device policy overrides
+
+        Returns list of overridden policy sections for each device
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_processors(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ProcessorReport:
+        """Processor report
+
+        Returns list of processors
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_processors_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ProcessorReport]:
+        """Processor report
+
+        Returns list of processors
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_processors_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Processor report
+
+        Returns list of processors
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_controller_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RAIDControllerReport:
+        """RAID controller report
+
+        Returns list of RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_controller_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[RAIDControllerReport]:
+        """RAID controller report
+
+        Returns list of RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_controller_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """RAID controller report
+
+        Returns list of RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_drive_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RAIDDriveReport:
+        """RAID drive report
+
+        Returns list of drives connected to RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_drive_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[RAIDDriveReport]:
+        """RAID drive report
+
+        Returns list of drives connected to RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_raid_drive_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """RAID drive report
+
+        Returns list of drives connected to RAID controllers
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_detailed_report(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ScopedAttributesDetailedReport:
+        """Scoped custom fields detailed report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization) with additional information about each field
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_detailed_report_with_http_info(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ScopedAttributesDetailedReport]:
+        """Scoped custom fields detailed report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization) with additional information about each field
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_detailed_report_without_preload_content(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Scoped custom fields detailed report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization) with additional information about each field
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_report(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ScopedAttributesReport:
+        """Scoped custom fields report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization)
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_report_with_http_info(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ScopedAttributesReport]:
+        """Scoped custom fields report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization)
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_scoped_custom_fields_report_without_preload_content(
+        self,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        updated_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Custom fields updated after specified date"),
+        ] = None,
+        fields: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of fields")
+        ] = None,
+        scopes: Annotated[
+            Optional[StrictStr], Field(description="Comma-separated list of scopes")
+        ] = None,
+        show_secure_values: Annotated[
+            Optional[StrictBool],
+            Field(
+                description="Flag to indicate if secure values should be returned as plain text without encryption"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Scoped custom fields report
+
+        Returns report for Custom Fields defined at different scopes (device, location, organization)
+
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param updated_after: Custom fields updated after specified date
+        :type updated_after: str
+        :param fields: Comma-separated list of fields
+        :type fields: str
+        :param scopes: Comma-separated list of scopes
+        :type scopes: str
+        :param show_secure_values: Flag to indicate if secure values should be returned as plain text without encryption
+        :type show_secure_values: bool
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_software(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> SoftwareReport:
+        """Software inventory
+
+        Returns list software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param installed_before: Include software installed before specified date
+        :type installed_before: str
+        :param installed_after: Include software installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_software_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[SoftwareReport]:
+        """Software inventory
+
+        Returns list software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param installed_before: Include software installed before specified date
+        :type installed_before: str
+        :param installed_after: Include software installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_software_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        installed_before: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed before specified date"),
+        ] = None,
+        installed_after: Annotated[
+            Optional[StrictStr],
+            Field(description="Include software installed after specified date"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Software inventory
+
+        Returns list software installed on devices
+
+        :param df: Device filter
+        :type df: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param installed_before: Include software installed before specified date
+        :type installed_before: str
+        :param installed_after: Include software installed after specified date
+        :type installed_after: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_volumes(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> VolumesReport:
+        """Disk volumes report
+
+        Returns list of disk volumes
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_volumes_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[VolumesReport]:
+        """Disk volumes report
+
+        Returns list of disk volumes
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_volumes_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        ts: Annotated[
+            Optional[StrictStr], Field(description="Monitoring timestamp filter")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[StrictInt], Field(description="Limit number of records per page")
+        ] = None,
+        include: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Additional information to include (bl - BitLocker status)"
+            ),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Disk volumes report
+
+        Returns list of disk volumes
+
+        :param df: Device filter
+        :type df: str
+        :param ts: Monitoring timestamp filter
+        :type ts: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param include: Additional information to include (bl - BitLocker status)
+        :type include: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_windows_services_report(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> WindowsServiceReport:
+        """Windows services report
+
+        Returns list of Windows Services and their statuses
+
+        :param df: Device filter
+        :type df: str
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_windows_services_report_with_http_info(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[WindowsServiceReport]:
+        """Windows services report
+
+        Returns list of Windows Services and their statuses
+
+        :param df: Device filter
+        :type df: str
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
+
+    @validate_call
+    async def get_windows_services_report_without_preload_content(
+        self,
+        df: Annotated[Optional[StrictStr], Field(description="Device filter")] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Service name")] = None,
+        state: Annotated[
+            Optional[StrictStr], Field(description="Service state")
+        ] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor name")] = None,
+        page_size: Annotated[
+            Optional[Annotated[int, Field(le=10000, strict=True, ge=10)]],
+            Field(description="Limit number of records per page"),
+        ] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+            ],
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Windows services report
+
+        Returns list of Windows Services and their statuses
+
+        :param df: Device filter
+        :type df: str
+        :param name: Service name
+        :type name: str
+        :param state: Service state
+        :type state: str
+        :param cursor: Cursor name
+        :type cursor: str
+        :param page_size: Limit number of records per page
+        :type page_size: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        return await self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+        )
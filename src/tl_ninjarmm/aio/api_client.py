@@ -0,0 +1,241 @@
+# coding: utf-8
+
+"""
+NinjaOne Public API 2.0
+
+NinjaOne Public API documentation.
+
+The version of the OpenAPI document: 2.0.9-draft
+Contact: api@ninjarmm.com
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import asyncio
+from typing import Any, Dict
+
+from tl_ninjarmm.api_client import ApiClient, GetTokenFunc
+from tl_ninjarmm.coalescing import (
+    COALESCED_METHODS,
+    AsyncSingleFlight,
+    request_key,
+)
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.aio import rest
+from tl_ninjarmm.decoders import current_decode_mode
+from tl_ninjarmm.exceptions import ApiException
+from tl_ninjarmm.middleware import (
+    make_call,
+    run_after_response,
+    run_before_request,
+    run_on_error,
+)
+from tl_ninjarmm.operations import Operation
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio variant of :class:`tl_ninjarmm.api_client.ApiClient`.
+
+    Request building (`operation_serialize`) and response handling
+    (`response_deserialize`) are shared with the sync client, only the
+    transport is replaced by an aiohttp session so that many requests can be
+    in flight on a single event loop. The number of concurrent connections is
+    bounded by `Configuration.connection_pool_maxsize`. Tokens are fetched on
+    a worker thread, so that the event loop keeps running while the token
+    endpoint or `get_token` answers.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _default = None
+    _TRANSIENT_ERRORS = (rest.aiohttp.ClientError, asyncio.TimeoutError)
+    _CONNECT_ERRORS = (rest.aiohttp.ClientConnectorError,)
+    _REST_CLIENT_CLASS = rest.RESTClientObject
+    _COALESCER_CLASS = AsyncSingleFlight
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        header_name: str | None = None,
+        header_value: str | None = None,
+        cookie: str | None = None,
+        get_token: GetTokenFunc | None = None,
+    ) -> None:
+        super().__init__(
+            configuration,
+            header_name=header_name,
+            header_value=header_value,
+            cookie=cookie,
+            get_token=get_token,
+        )
+        # Tasks seeing an expiring token wait on this lock, instead of each
+        # taking a worker thread blocked on `_token_lock`
+        self._async_token_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        self.stop_token_renewal()
+        await self.rest_client.close()
+
+    async def _arefresh_token_if_needed(self) -> None:
+        """asyncio variant of `ApiClient._refresh_token_if_needed`."""
+        if not self._needs_refresh():
+            return
+
+        async with self._async_token_lock:
+            if self._needs_refresh():
+                await asyncio.to_thread(self._refresh_token_if_needed)
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: RESTResponse
+        """
+
+        def send():
+            return self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+
+        if self.retry_engine is None:
+            return await send()
+        return await self.retry_engine.acall(method, url, send)
+
+    async def invoke(
+        self,
+        operation: Operation,
+        params: Dict[str, Any],
+        result: str = "data",
+        _request_timeout=None,
+        _request_auth=None,
+        _content_type=None,
+        _headers=None,
+    ) -> Any:
+        """Calls a generated operation (asynchronous), see `ApiClient.invoke`."""
+        timer = None if self.metrics is None else self.metrics.start(operation)
+        try:
+            await self._arefresh_token_if_needed()
+            if timer is not None:
+                timer.lap()
+            _param = self.operation_serialize(
+                operation, params, _request_auth, _content_type, _headers
+            )
+            if timer is not None:
+                timer.lap()
+                timer.sent(_param[3])
+            if result == "response":
+                if self.middlewares:
+                    response_data = await self._call_with_middlewares(
+                        operation, _param, _request_timeout, timer, preload=False
+                    )
+                else:
+                    response_data = await self.call_api(
+                        *_param, _request_timeout=_request_timeout
+                    )
+                if timer is not None:
+                    timer.status = response_data.status
+                return response_data.response
+            if self.coalescer is not None and operation.method in COALESCED_METHODS:
+                method, url, headers = _param[:3]
+                decode_mode = current_decode_mode(self.configuration.decode_mode)
+                api_response = await self.coalescer.do(
+                    request_key(method, url, headers, decode_mode),
+                    lambda: self._call_and_deserialize(
+                        operation, _param, _request_timeout, timer
+                    ),
+                )
+            else:
+                api_response = await self._call_and_deserialize(
+                    operation, _param, _request_timeout, timer
+                )
+            if timer is not None:
+                timer.status = api_response.status_code
+            return api_response.data if result == "data" else api_response
+        except ApiException as e:
+            if timer is not None:
+                timer.status = e.status
+            raise
+        finally:
+            if timer is not None:
+                timer.stop()
+
+    async def _call_and_deserialize(
+        self, operation, _param, _request_timeout, timer=None
+    ):
+        if self.middlewares:
+            return await self._call_with_middlewares(
+                operation, _param, _request_timeout, timer
+            )
+        response_data = await self.call_api(*_param, _request_timeout=_request_timeout)
+        await response_data.read()
+        if timer is not None:
+            timer.lap()
+            timer.received(response_data.status, response_data.data)
+        return self.response_deserialize(
+            response_data=response_data,
+            response_types_map=operation.response_types,
+        )
+
+    async def _call_with_middlewares(
+        self, operation, _param, _request_timeout, timer, preload=True
+    ):
+        """asyncio variant of `ApiClient._call_with_middlewares`."""
+        call = make_call(operation, _param)
+        try:
+            run_before_request(self.middlewares, call)
+            if call.response is None:
+                call.response = await self.call_api(
+                    call.method,
+                    call.url,
+                    call.headers,
+                    call.body,
+                    call.post_params,
+                    _request_timeout=_request_timeout,
+                )
+            if preload:
+                # Responses set by a `before_request` may be read already
+                if call.response.data is None:
+                    await call.response.read()
+                if timer is not None:
+                    timer.lap()
+                    timer.received(call.response.status, call.response.data)
+                call.api_response = self.response_deserialize(
+                    response_data=call.response,
+                    response_types_map=operation.response_types,
+                )
+        except Exception as e:
+            run_on_error(self.middlewares, call, e)
+            raise
+        run_after_response(self.middlewares, call)
+        return call.api_response if preload else call.response
@@ -0,0 +1,421 @@
+# coding: utf-8
+
+"""
+NinjaOne Public API 2.0
+
+NinjaOne Public API documentation.
+
+The version of the OpenAPI document: 2.0.9-draft
+Contact: api@ninjarmm.com
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import asyncio
+import http.client
+import io
+import logging
+import re
+import ssl
+from typing import Optional
+
+try:
+    import aiohttp
+    from multidict import CIMultiDict, CIMultiDictProxy
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "tl_ninjarmm.aio requires aiohttp, install it with `tl-ninjarmm[asyncio]`"
+    ) from e
+
+from tl_ninjarmm.codec import resolve_codec
+from tl_ninjarmm.exceptions import ApiException, ApiValueError
+from tl_ninjarmm.hedging import Hedger
+from tl_ninjarmm.http_cache import HttpCache
+from tl_ninjarmm.rate_limit import RateLimiter
+
+RESTResponseType = aiohttp.ClientResponse
+
+
+class RESTResponse(io.IOBase):
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = None
+
+    async def read(self):
+        if self.data is None:
+            self.data = await self.response.read()
+        return self.data
+
+    def release(self):
+        """Discards the unread body and returns the connection to the pool."""
+        self.response.release()
+
+    def getheaders(self):
+        """Returns a CIMultiDictProxy of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class _CachedContent:
+    """Body of a `CachedClientResponse`, as read by the callers."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def iter_chunked(self, n: int):
+        for start in range(0, len(self._body), n):
+            yield self._body[start : start + n]
+
+
+class CachedClientResponse:
+    """Stands for the `aiohttp.ClientResponse` of a response served by the
+    HTTP cache, see `tl_ninjarmm.http_cache`, or replayed from a cassette,
+    see `tl_ninjarmm.cassette`.
+    """
+
+    def __init__(
+        self, status: int, headers, body: bytes, reason: Optional[str] = "OK"
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = _CachedContent(body)
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _discard_attempt(attempt):
+    """Closes the response of an abandoned attempt of a hedged request."""
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().close()
+
+
+class RESTClientObject:
+    def __init__(self, configuration) -> None:
+        # maxsize is number of requests to host that are allowed in parallel,
+        # aiohttp's default of 100 when not configured
+        self.maxsize = configuration.connection_pool_maxsize or 100
+
+        self.ssl_context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert,
+            cadata=configuration.ca_cert_data,
+        )
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+        # The session must be created from within a running event loop, so it
+        # is built lazily on the first request.
+        self.pool_manager: Optional[aiohttp.ClientSession] = None
+
+        self.rate_limiter = RateLimiter.from_configuration(configuration)
+        self.json_codec = resolve_codec(configuration.json_codec)
+        self.cache = HttpCache.from_configuration(configuration)
+        self.hedger = Hedger.from_configuration(configuration)
+        self.cassette = configuration.cassette
+        # Strong references to the background revalidations
+        self._revalidations: set = set()
+
+    async def close(self) -> None:
+        for task in list(self._revalidations):
+            task.cancel()
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0], sock_read=_request_timeout[1]
+                )
+
+        if self.cache is not None:
+            ttl = self.cache.ttl(method, url)
+            if ttl is not None:
+                return RESTResponse(await self._cached_send(url, headers, ttl, timeout))
+
+        return RESTResponse(
+            await self._hedged_send(method, url, headers, body, post_params, timeout)
+        )
+
+    async def _hedged_send(self, method, url, headers, body, post_params, timeout):
+        """Sends a request, hedged if it is a read and hedging is enabled, see
+        `tl_ninjarmm.hedging`.
+        """
+        delay = None if self.hedger is None else self.hedger.delay(method, url)
+        if delay is None:
+            return await self._limited_send(
+                method, url, headers, body, post_params, timeout
+            )
+
+        args = (method, url, headers, body, post_params, timeout)
+        attempts = [asyncio.ensure_future(self._timed_send(*args))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self.hedger.try_hedge():
+                attempts.append(asyncio.ensure_future(self._timed_send(*args)))
+
+            pending = set(attempts)
+            winner = None
+            while winner is None and pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # The first attempt wins ties
+                for attempt in attempts:
+                    if attempt in done and attempt.exception() is None:
+                        winner = attempt
+                        break
+        except BaseException:
+            for attempt in attempts:
+                attempt.cancel()
+                attempt.add_done_callback(_discard_attempt)
+            raise
+        if winner is None:
+            # Every attempt failed, report the first one's error
+            return attempts[0].result()
+        if winner is not attempts[0]:
+            self.hedger.record_win()
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.cancel()
+                attempt.add_done_callback(_discard_attempt)
+        return winner.result()
+
+    async def _timed_send(self, method, url, headers, body, post_params, timeout):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        r = await self._limited_send(method, url, headers, body, post_params, timeout)
+        self.hedger.record(method, url, loop.time() - start)
+        return r
+
+    async def _limited_send(self, method, url, headers, body, post_params, timeout):
+        """Sends a request at the pace of the rate limiter, if any."""
+        if self.rate_limiter is None:
+            return await self._transmit(
+                method, url, dict(headers), body, post_params, timeout
+            )
+
+        # A throttled request was not processed by the server, so it is safe
+        # to send it again whatever its method.
+        for attempt in range(self.rate_limiter.max_retries + 1):
+            wait = self.rate_limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            r = await self._transmit(
+                method, url, dict(headers), body, post_params, timeout
+            )
+            self.rate_limiter.on_response(url, r.status, r.headers.get("Retry-After"))
+            if r.status != 429 or attempt == self.rate_limiter.max_retries:
+                break
+            r.release()
+        return r
+
+    async def _cached_send(self, url, headers, ttl, timeout):
+        """Serves a `GET` request from the HTTP cache, see `tl_ninjarmm.http_cache`."""
+        key = self.cache.key(url, headers)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if self.cache.is_fresh(cached):
+                return self._cached_response(cached)
+            if self.cache.can_serve_stale(cached):
+                if self.cache.claim_revalidation(key):
+                    task = asyncio.create_task(
+                        self._revalidate_in_background(
+                            key, ttl, cached, url, headers, timeout
+                        )
+                    )
+                    self._revalidations.add(task)
+                    task.add_done_callback(self._revalidations.discard)
+                return self._cached_response(cached)
+        return await self._revalidate(key, ttl, cached, url, headers, timeout)
+
+    async def _revalidate(self, key, ttl, cached, url, headers, timeout):
+        headers = self.cache.conditional_headers(headers, cached)
+        r = await self._hedged_send("GET", url, headers, None, {}, timeout)
+        if r.status not in (200, 304):
+            return r
+        body = await r.read() if r.status == 200 else b""
+        response = self.cache.store(key, ttl, cached, r.status, r.headers, body)
+        if response is None:
+            return r
+        r.release()
+        return self._cached_response(response)
+
+    async def _revalidate_in_background(self, key, ttl, cached, url, headers, timeout):
+        try:
+            await self._revalidate(key, ttl, cached, url, headers, timeout)
+        except Exception:
+            # The stale response is served until a request succeeds
+            logging.getLogger("tl_ninjarmm").warning(
+                "Revalidation of %s failed", url, exc_info=True
+            )
+        finally:
+            self.cache.release_revalidation(key)
+
+    def _cached_response(self, cached):
+        return CachedClientResponse(
+            cached.status, self.cache.served_headers(cached), cached.body
+        )
+
+    async def _transmit(self, method, url, headers, body, post_params, timeout):
+        """Sends a request, recording or replaying it with the cassette, if
+        any, see `tl_ninjarmm.cassette`.
+        """
+        if self.cassette is None:
+            return await self._send(method, url, headers, body, post_params, timeout)
+        if self.cassette.replaying:
+            exchange = self.cassette.replay(method, url)
+            delay = self.cassette.delay(exchange)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        else:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            r = await self._send(method, url, headers, body, post_params, timeout)
+            try:
+                data = await r.read()
+            finally:
+                r.release()
+            exchange = self.cassette.record(
+                method, url, headers, r.status, r.headers, data, loop.time() - start
+            )
+        return CachedClientResponse(
+            exchange.status,
+            exchange.headers,
+            exchange.body,
+            http.client.responses.get(exchange.status),
+        )
+
+    async def _send(self, method, url, headers, body, post_params, timeout):
+        """Sends a single request, returns the aiohttp response."""
+        args = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
+            # no content type provided or payload is json
+            content_type = headers.get("Content-Type")
+            if not content_type or re.search("json", content_type, re.IGNORECASE):
+                if isinstance(body, bytes):
+                    # Already encoded, see `tl_ninjarmm.codec.encode_body`
+                    args["data"] = body
+                elif body is not None:
+                    args["data"] = self.json_codec.dumps(body)
+            elif content_type == "application/x-www-form-urlencoded":
+                args["data"] = aiohttp.FormData(post_params)
+            elif content_type == "multipart/form-data":
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers["Content-Type"]
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple) and len(v) == 3:
+                        data.add_field(k, value=v[1], filename=v[0], content_type=v[2])
+                    else:
+                        # Ensures that dict objects are serialized
+                        if isinstance(v, dict):
+                            v = self.json_codec.dumps(v).decode()
+                        elif isinstance(v, int):
+                            v = str(v)
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than JSON when `body` argument is
+            # provided in serialized form.
+            elif isinstance(body, str) or isinstance(body, bytes):
+                args["data"] = body
+            elif content_type.startswith("text/") and isinstance(body, bool):
+                args["data"] = "true" if body else "false"
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize, ssl=self.ssl_context
+                ),
+                trust_env=True,
+            )
+
+        try:
+            return await self.pool_manager.request(**args)
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
@@ -1,7 +1,20 @@
-# flake8: noqa
+from typing import TYPE_CHECKING
 
-# import apis into api package
-from tl_ninjarmm.api.devices_api import DevicesApi
-from tl_ninjarmm.api.management_api import ManagementApi
-from tl_ninjarmm.api.queries_api import QueriesApi
-from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm._lazy import lazy_exports
+
+# Exported names are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DevicesApi": "tl_ninjarmm.api.devices_api",
+        "ManagementApi": "tl_ninjarmm.api.management_api",
+        "QueriesApi": "tl_ninjarmm.api.queries_api",
+        "SystemApi": "tl_ninjarmm.api.system_api",
+    },
+)
+
+if TYPE_CHECKING:
+    from tl_ninjarmm.api.devices_api import DevicesApi as DevicesApi
+    from tl_ninjarmm.api.management_api import ManagementApi as ManagementApi
+    from tl_ninjarmm.api.queries_api import QueriesApi as QueriesApi
+    from tl_ninjarmm.api.system_api import SystemApi as SystemApi
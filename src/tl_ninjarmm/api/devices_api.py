@@ -32,8 +32,10 @@ from tl_ninjarmm.models.software_patch import SoftwarePatch
 from tl_ninjarmm.models.volume import Volume
 from tl_ninjarmm.models.windows_service import WindowsService
 
-from tl_ninjarmm.api_client import ApiClient, RequestSerialized
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
 from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
 from tl_ninjarmm.rest import RESTResponseType
 
 
@@ -48,6 +50,8 @@ class DevicesApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
 
     @validate_call
     def get_device(
@@ -93,26 +97,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Device",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_with_http_info(
         self,
@@ -157,24 +151,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Device",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -221,73 +205,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Device",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -340,27 +265,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_active_jobs_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_active_jobs_with_http_info(
@@ -412,26 +325,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_active_jobs_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -484,83 +385,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_active_jobs_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_active_jobs"],
+            {"id": id, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_active_jobs_serialize(
-        self,
-        id,
-        lang,
-        tz,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/jobs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -651,34 +483,26 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_activities_serialize(
-            id=id,
-            older_than=older_than,
-            newer_than=newer_than,
-            activity_type=activity_type,
-            status=status,
-            series_uid=series_uid,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_activities_with_http_info(
         self,
@@ -767,32 +591,24 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_activities_serialize(
-            id=id,
-            older_than=older_than,
-            newer_than=newer_than,
-            activity_type=activity_type,
-            status=status,
-            series_uid=series_uid,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -883,113 +699,24 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_activities_serialize(
-            id=id,
-            older_than=older_than,
-            newer_than=newer_than,
-            activity_type=activity_type,
-            status=status,
-            series_uid=series_uid,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_activities"],
+            {
+                "id": id,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "activity_type": activity_type,
+                "status": status,
+                "series_uid": series_uid,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_activities_serialize(
-        self,
-        id,
-        older_than,
-        newer_than,
-        activity_type,
-        status,
-        series_uid,
-        page_size,
-        lang,
-        tz,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if older_than is not None:
-            _query_params.append(("olderThan", older_than))
-
-        if newer_than is not None:
-            _query_params.append(("newerThan", newer_than))
-
-        if activity_type is not None:
-            _query_params.append(("activityType", activity_type))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if series_uid is not None:
-            _query_params.append(("seriesUid", series_uid))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/activities",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1042,27 +769,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_alerts_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_alerts_with_http_info(
@@ -1114,26 +829,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_alerts_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1186,83 +889,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_alerts_serialize(
-            id=id,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_alerts"],
+            {"id": id, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_alerts_serialize(
-        self,
-        id,
-        lang,
-        tz,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/alerts",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1309,26 +943,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_disk_drives_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[DiskDrive]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_disk_drives_with_http_info(
         self,
@@ -1373,24 +997,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_disk_drives_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[DiskDrive]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1437,73 +1051,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_disk_drives_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_disk_drives"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[DiskDrive]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_disk_drives_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/disks",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1568,28 +1123,20 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_os_patches_serialize(
-            id=id,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_installed_os_patches_with_http_info(
@@ -1653,27 +1200,19 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_os_patches_serialize(
-            id=id,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1738,88 +1277,19 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_os_patches_serialize(
-            id=id,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_os_patches"],
+            {
+                "id": id,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_installed_os_patches_serialize(
-        self,
-        id,
-        status,
-        installed_before,
-        installed_after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if installed_before is not None:
-            _query_params.append(("installedBefore", installed_before))
-
-        if installed_after is not None:
-            _query_params.append(("installedAfter", installed_after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/os-patch-installs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1898,32 +1368,24 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_software_patches_serialize(
-            id=id,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_installed_software_patches_with_http_info(
         self,
@@ -2000,30 +1462,22 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_software_patches_serialize(
-            id=id,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2102,103 +1556,22 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_installed_software_patches_serialize(
-            id=id,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_installed_software_patches"],
+            {
+                "id": id,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_installed_software_patches_serialize(
-        self,
-        id,
-        type,
-        impact,
-        status,
-        product_identifier,
-        installed_before,
-        installed_after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if impact is not None:
-            _query_params.append(("impact", impact))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if product_identifier is not None:
-            _query_params.append(("productIdentifier", product_identifier))
-
-        if installed_before is not None:
-            _query_params.append(("installedBefore", installed_before))
-
-        if installed_after is not None:
-            _query_params.append(("installedAfter", installed_after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/software-patch-installs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2245,25 +1618,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_last_logged_on_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUser",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_last_logged_on_user_with_http_info(
@@ -2309,24 +1672,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_last_logged_on_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUser",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2373,73 +1726,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_last_logged_on_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_last_logged_on_user"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUser",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_last_logged_on_user_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/last-logged-on-user",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2486,25 +1780,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_network_interfaces_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NetworkInterface]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_network_interfaces_with_http_info(
@@ -2550,24 +1834,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_network_interfaces_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NetworkInterface]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2614,73 +1888,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_network_interfaces_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_network_interfaces"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NetworkInterface]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_network_interfaces_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/network-interfaces",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2742,29 +1957,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_os_patches_serialize(
-            id=id,
-            status=status,
-            type=type,
-            severity=severity,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_pending_failed_rejected_os_patches_with_http_info(
         self,
@@ -2824,27 +2026,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_os_patches_serialize(
-            id=id,
-            status=status,
-            type=type,
-            severity=severity,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2906,88 +2095,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_os_patches_serialize(
-            id=id,
-            status=status,
-            type=type,
-            severity=severity,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_os_patches"],
+            {"id": id, "status": status, "type": type, "severity": severity},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OSPatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_pending_failed_rejected_os_patches_serialize(
-        self,
-        id,
-        status,
-        type,
-        severity,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if severity is not None:
-            _query_params.append(("severity", severity))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/os-patches",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3054,29 +2169,21 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_software_patches_serialize(
-            id=id,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_pending_failed_rejected_software_patches_with_http_info(
@@ -3142,28 +2249,20 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_software_patches_serialize(
-            id=id,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3230,93 +2329,20 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_pending_failed_rejected_software_patches_serialize(
-            id=id,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_pending_failed_rejected_software_patches"],
+            {
+                "id": id,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwarePatch]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_pending_failed_rejected_software_patches_serialize(
-        self,
-        id,
-        status,
-        product_identifier,
-        type,
-        impact,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if product_identifier is not None:
-            _query_params.append(("productIdentifier", product_identifier))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if impact is not None:
-            _query_params.append(("impact", impact))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/software-patches",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3363,26 +2389,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_processors_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Processor]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_processors_with_http_info(
         self,
@@ -3427,24 +2443,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_processors_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Processor]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3491,73 +2497,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_processors_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_processors"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Processor]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_processors_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/processors",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3612,27 +2559,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_services_serialize(
-            id=id,
-            name=name,
-            state=state,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsService]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_services_with_http_info(
@@ -3686,26 +2621,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_services_serialize(
-            id=id,
-            name=name,
-            state=state,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsService]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3760,83 +2683,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_services_serialize(
-            id=id,
-            name=name,
-            state=state,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_services"],
+            {"id": id, "name": name, "state": state},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsService]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_services_serialize(
-        self,
-        id,
-        name,
-        state,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if name is not None:
-            _query_params.append(("name", name))
-
-        if state is not None:
-            _query_params.append(("state", state))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/windows-services",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3883,26 +2737,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_software_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Application]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_software_with_http_info(
         self,
@@ -3947,24 +2791,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_software_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Application]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4011,73 +2845,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_software_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_software"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Application]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_software_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/software",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4132,26 +2907,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_volumes_serialize(
-            id=id,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Volume]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_volumes_with_http_info(
@@ -4205,25 +2969,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_volumes_serialize(
-            id=id,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Volume]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4278,78 +3031,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_volumes_serialize(
-            id=id,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_volumes"],
+            {"id": id, "include": include},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Volume]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_volumes_serialize(
-        self,
-        id,
-        include,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if include is not None:
-            _query_params.append(("include", include))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/volumes",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4402,27 +3091,16 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_custom_fields_serialize(
-            id=id,
-            with_inheritance=with_inheritance,
+        return self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Dict[str, object]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_node_custom_fields_with_http_info(
         self,
@@ -4473,25 +3151,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_custom_fields_serialize(
-            id=id,
-            with_inheritance=with_inheritance,
+        return self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Dict[str, object]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4544,78 +3211,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_custom_fields_serialize(
-            id=id,
-            with_inheritance=with_inheritance,
+        return self.api_client.invoke(
+            OPERATIONS["get_node_custom_fields"],
+            {"id": id, "with_inheritance": with_inheritance},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Dict[str, object]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_node_custom_fields_serialize(
-        self,
-        id,
-        with_inheritance,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if with_inheritance is not None:
-            _query_params.append(("withInheritance", with_inheritance))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4662,25 +3265,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverrides",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_policy_overrides_with_http_info(
@@ -4726,24 +3319,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverrides",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4790,73 +3373,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverrides",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_policy_overrides_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/policy/overrides",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4906,26 +3430,15 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_attribute_values_serialize(
-            id=id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_node_attribute_values_with_http_info(
@@ -4974,25 +3487,14 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_attribute_values_serialize(
-            id=id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5042,83 +3544,12 @@ class DevicesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_attribute_values_serialize(
-            id=id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_attribute_values"],
+            {"id": id, "request_body": request_body},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_node_attribute_values_serialize(
-        self,
-        id,
-        request_body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if request_body is not None:
-            _body_params = request_body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/device/{id}/custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
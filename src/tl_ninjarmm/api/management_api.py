@@ -65,8 +65,10 @@ from tl_ninjarmm.models.windows_service_control_request import (
     WindowsServiceControlRequest,
 )
 
-from tl_ninjarmm.api_client import ApiClient, RequestSerialized
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
 from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
 from tl_ninjarmm.rest import RESTResponseType
 
 
@@ -81,6 +83,8 @@ class ManagementApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
 
     @validate_call
     def add_user_role_members(
@@ -129,31 +133,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._add_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["add_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def add_user_role_members_with_http_info(
         self,
@@ -201,29 +190,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._add_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["add_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -273,83 +247,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._add_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["add_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _add_user_role_members_serialize(
-        self,
-        role_id,
-        request_body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            "request_body": "",
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if role_id is not None:
-            _path_params["roleId"] = role_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if request_body is not None:
-            _body_params = request_body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/user/role/{roleId}/add-members",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -396,25 +301,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._cancel_device_maintenance_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["cancel_device_maintenance"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def cancel_device_maintenance_with_http_info(
@@ -460,24 +355,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._cancel_device_maintenance_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["cancel_device_maintenance"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -524,73 +409,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._cancel_device_maintenance_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["cancel_device_maintenance"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _cancel_device_maintenance_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/device/{id}/maintenance",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -643,27 +469,19 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._control_windows_service_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_control_request=windows_service_control_request,
+        return self.api_client.invoke(
+            OPERATIONS["control_windows_service"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_control_request": windows_service_control_request,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def control_windows_service_with_http_info(
@@ -715,26 +533,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._control_windows_service_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_control_request=windows_service_control_request,
+        return self.api_client.invoke(
+            OPERATIONS["control_windows_service"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_control_request": windows_service_control_request,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -787,89 +597,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._control_windows_service_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_control_request=windows_service_control_request,
+        return self.api_client.invoke(
+            OPERATIONS["control_windows_service"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_control_request": windows_service_control_request,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _control_windows_service_serialize(
-        self,
-        id,
-        service_id,
-        windows_service_control_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if service_id is not None:
-            _path_params["serviceId"] = service_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if windows_service_control_request is not None:
-            _body_params = windows_service_control_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/windows-service/{serviceId}/control",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -916,29 +655,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_contact_serialize(
-            create_contact_request=create_contact_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_contact"],
+            {"create_contact_request": create_contact_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def create_contact_with_http_info(
         self,
@@ -983,27 +709,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_contact_serialize(
-            create_contact_request=create_contact_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_contact"],
+            {"create_contact_request": create_contact_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1050,86 +763,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_contact_serialize(
-            create_contact_request=create_contact_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_contact"],
+            {"create_contact_request": create_contact_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_contact_serialize(
-        self,
-        create_contact_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if create_contact_request is not None:
-            _body_params = create_contact_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/contacts",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1181,26 +822,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            custom_fields_policy_condition_create_request=custom_fields_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_custom_fields_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "custom_fields_policy_condition_create_request": custom_fields_policy_condition_create_request,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def create_custom_fields_policy_condition_with_http_info(
@@ -1251,25 +884,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            custom_fields_policy_condition_create_request=custom_fields_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_custom_fields_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "custom_fields_policy_condition_create_request": custom_fields_policy_condition_create_request,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1321,87 +946,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            custom_fields_policy_condition_create_request=custom_fields_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_custom_fields_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "custom_fields_policy_condition_create_request": custom_fields_policy_condition_create_request,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_custom_fields_policy_condition_serialize(
-        self,
-        policy_id,
-        custom_fields_policy_condition_create_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if custom_fields_policy_condition_create_request is not None:
-            _body_params = custom_fields_policy_condition_create_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/policies/{policy_id}/condition/custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1454,30 +1009,19 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_end_user_serialize(
-            send_invitation=send_invitation,
-            create_end_user_request=create_end_user_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_end_user"],
+            {
+                "send_invitation": send_invitation,
+                "create_end_user_request": create_end_user_request,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def create_end_user_with_http_info(
         self,
@@ -1528,28 +1072,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_end_user_serialize(
-            send_invitation=send_invitation,
-            create_end_user_request=create_end_user_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_end_user"],
+            {
+                "send_invitation": send_invitation,
+                "create_end_user_request": create_end_user_request,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1602,91 +1135,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_end_user_serialize(
-            send_invitation=send_invitation,
-            create_end_user_request=create_end_user_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_end_user"],
+            {
+                "send_invitation": send_invitation,
+                "create_end_user_request": create_end_user_request,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_end_user_serialize(
-        self,
-        send_invitation,
-        create_end_user_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if send_invitation is not None:
-            _query_params.append(("sendInvitation", send_invitation))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if create_end_user_request is not None:
-            _body_params = create_end_user_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/user/end-users",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1736,26 +1195,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_location_for_organization_serialize(
-            id=id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_location_for_organization"],
+            {"id": id, "location_model": location_model},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def create_location_for_organization_with_http_info(
@@ -1804,25 +1252,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_location_for_organization_serialize(
-            id=id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_location_for_organization"],
+            {"id": id, "location_model": location_model},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1872,87 +1309,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_location_for_organization_serialize(
-            id=id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_location_for_organization"],
+            {"id": id, "location_model": location_model},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_location_for_organization_serialize(
-        self,
-        id,
-        location_model,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if location_model is not None:
-            _body_params = location_model
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/organization/{id}/locations",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2004,26 +1368,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_organization_serialize(
-            template_organization_id=template_organization_id,
-            organization_with_locations_and_policy_assignments_model=organization_with_locations_and_policy_assignments_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_organization"],
+            {
+                "template_organization_id": template_organization_id,
+                "organization_with_locations_and_policy_assignments_model": organization_with_locations_and_policy_assignments_model,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OrganizationDetailed",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def create_organization_with_http_info(
@@ -2074,25 +1430,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_organization_serialize(
-            template_organization_id=template_organization_id,
-            organization_with_locations_and_policy_assignments_model=organization_with_locations_and_policy_assignments_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_organization"],
+            {
+                "template_organization_id": template_organization_id,
+                "organization_with_locations_and_policy_assignments_model": organization_with_locations_and_policy_assignments_model,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OrganizationDetailed",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2144,88 +1492,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_organization_serialize(
-            template_organization_id=template_organization_id,
-            organization_with_locations_and_policy_assignments_model=organization_with_locations_and_policy_assignments_model,
+        return self.api_client.invoke(
+            OPERATIONS["create_organization"],
+            {
+                "template_organization_id": template_organization_id,
+                "organization_with_locations_and_policy_assignments_model": organization_with_locations_and_policy_assignments_model,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OrganizationDetailed",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_organization_serialize(
-        self,
-        template_organization_id,
-        organization_with_locations_and_policy_assignments_model,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if template_organization_id is not None:
-            _query_params.append(("templateOrganizationId", template_organization_id))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if organization_with_locations_and_policy_assignments_model is not None:
-            _body_params = organization_with_locations_and_policy_assignments_model
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/organizations",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2282,28 +1559,20 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_policy_serialize(
-            mode=mode,
-            template_policy_id=template_policy_id,
-            policy_info=policy_info,
+        return self.api_client.invoke(
+            OPERATIONS["create_policy"],
+            {
+                "mode": mode,
+                "template_policy_id": template_policy_id,
+                "policy_info": policy_info,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Policy",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def create_policy_with_http_info(
         self,
@@ -2358,26 +1627,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_policy_serialize(
-            mode=mode,
-            template_policy_id=template_policy_id,
-            policy_info=policy_info,
+        return self.api_client.invoke(
+            OPERATIONS["create_policy"],
+            {
+                "mode": mode,
+                "template_policy_id": template_policy_id,
+                "policy_info": policy_info,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Policy",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2434,93 +1695,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_policy_serialize(
-            mode=mode,
-            template_policy_id=template_policy_id,
-            policy_info=policy_info,
+        return self.api_client.invoke(
+            OPERATIONS["create_policy"],
+            {
+                "mode": mode,
+                "template_policy_id": template_policy_id,
+                "policy_info": policy_info,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Policy",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_policy_serialize(
-        self,
-        mode,
-        template_policy_id,
-        policy_info,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if mode is not None:
-            _query_params.append(("mode", mode))
-
-        if template_policy_id is not None:
-            _query_params.append(("templatePolicyId", template_policy_id))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if policy_info is not None:
-            _body_params = policy_info
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/policies",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2567,29 +1753,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_technician_serialize(
-            create_technician_request=create_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_technician"],
+            {"create_technician_request": create_technician_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Technician",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def create_technician_with_http_info(
         self,
@@ -2634,27 +1807,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_technician_serialize(
-            create_technician_request=create_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_technician"],
+            {"create_technician_request": create_technician_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Technician",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2701,86 +1861,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_technician_serialize(
-            create_technician_request=create_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_technician"],
+            {"create_technician_request": create_technician_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Technician",
-            "400": None,
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_technician_serialize(
-        self,
-        create_technician_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if create_technician_request is not None:
-            _body_params = create_technician_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/user/technicians",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2832,26 +1920,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            windows_event_policy_condition_create_request=windows_event_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_windows_event_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "windows_event_policy_condition_create_request": windows_event_policy_condition_create_request,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def create_windows_event_policy_condition_with_http_info(
@@ -2902,25 +1982,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            windows_event_policy_condition_create_request=windows_event_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_windows_event_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "windows_event_policy_condition_create_request": windows_event_policy_condition_create_request,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2972,87 +2044,17 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._create_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            windows_event_policy_condition_create_request=windows_event_policy_condition_create_request,
+        return self.api_client.invoke(
+            OPERATIONS["create_windows_event_policy_condition"],
+            {
+                "policy_id": policy_id,
+                "windows_event_policy_condition_create_request": windows_event_policy_condition_create_request,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _create_windows_event_policy_condition_serialize(
-        self,
-        policy_id,
-        windows_event_policy_condition_create_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if windows_event_policy_condition_create_request is not None:
-            _body_params = windows_event_policy_condition_create_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/policies/{policy_id}/condition/windows-event",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3099,30 +2101,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_contact_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_contact"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def delete_contact_with_http_info(
         self,
@@ -3167,28 +2155,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_contact_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_contact"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3235,71 +2209,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_contact_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_contact"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _delete_contact_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/contact/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3346,30 +2263,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_end_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_end_user"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def delete_end_user_with_http_info(
         self,
@@ -3414,28 +2317,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_end_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_end_user"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3482,71 +2371,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_end_user_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_end_user"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _delete_end_user_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/user/end-user/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3596,27 +2428,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def delete_policy_condition_with_http_info(
         self,
@@ -3664,25 +2485,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3732,75 +2542,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _delete_policy_condition_serialize(
-        self,
-        policy_id,
-        condition_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        if condition_id is not None:
-            _path_params["condition_id"] = condition_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/policies/{policy_id}/condition/{condition_id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3847,29 +2596,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_technician_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_technician"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def delete_technician_with_http_info(
@@ -3915,28 +2650,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_technician_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_technician"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3983,71 +2704,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._delete_technician_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["delete_technician"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _delete_technician_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/user/technician/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4097,26 +2761,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_custom_fields_policy_condition_with_http_info(
@@ -4165,25 +2818,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4233,77 +2875,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "CustomFieldPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_custom_fields_policy_condition_serialize(
-        self,
-        policy_id,
-        condition_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        if condition_id is not None:
-            _path_params["condition_id"] = condition_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/policies/{policy_id}/condition/custom-fields/{condition_id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4350,25 +2929,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_conditions"],
+            {"policy_id": policy_id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[CustomFieldPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_custom_fields_policy_conditions_with_http_info(
@@ -4414,24 +2983,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_conditions"],
+            {"policy_id": policy_id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[CustomFieldPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4478,73 +3037,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_policy_conditions"],
+            {"policy_id": policy_id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[CustomFieldPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_custom_fields_policy_conditions_serialize(
-        self,
-        policy_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/policies/{policy_id}/condition/custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4596,26 +3096,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_link_serialize(
-            id=id,
-            redirect=redirect,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_link"],
+            {"id": id, "redirect": redirect},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceLink",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_link_with_http_info(
@@ -4666,25 +3155,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_link_serialize(
-            id=id,
-            redirect=redirect,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_link"],
+            {"id": id, "redirect": redirect},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceLink",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4736,78 +3214,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_link_serialize(
-            id=id,
-            redirect=redirect,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_link"],
+            {"id": id, "redirect": redirect},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceLink",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_link_serialize(
-        self,
-        id,
-        redirect,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if redirect is not None:
-            _query_params.append(("redirect", redirect))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/dashboard-url",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4854,25 +3268,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_serialize(
-            generate_installer_request_dto=generate_installer_request_dto,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer"],
+            {"generate_installer_request_dto": generate_installer_request_dto},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_installer_with_http_info(
@@ -4918,24 +3322,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_serialize(
-            generate_installer_request_dto=generate_installer_request_dto,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer"],
+            {"generate_installer_request_dto": generate_installer_request_dto},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4982,83 +3376,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_serialize(
-            generate_installer_request_dto=generate_installer_request_dto,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer"],
+            {"generate_installer_request_dto": generate_installer_request_dto},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_installer_serialize(
-        self,
-        generate_installer_request_dto,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if generate_installer_request_dto is not None:
-            _body_params = generate_installer_request_dto
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/organization/generate-installer",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5111,27 +3436,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_for_location_serialize(
-            id=id,
-            location_id=location_id,
-            installer_type=installer_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer_for_location"],
+            {"id": id, "location_id": location_id, "installer_type": installer_type},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_installer_for_location_with_http_info(
@@ -5183,26 +3496,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_for_location_serialize(
-            id=id,
-            location_id=location_id,
-            installer_type=installer_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer_for_location"],
+            {"id": id, "location_id": location_id, "installer_type": installer_type},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5255,81 +3556,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installer_for_location_serialize(
-            id=id,
-            location_id=location_id,
-            installer_type=installer_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_installer_for_location"],
+            {"id": id, "location_id": location_id, "installer_type": installer_type},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Link",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_installer_for_location_serialize(
-        self,
-        id,
-        location_id,
-        installer_type,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if location_id is not None:
-            _path_params["location_id"] = location_id
-        if installer_type is not None:
-            _path_params["installer_type"] = installer_type
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/organization/{id}/location/{location_id}/installer/{installer_type}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5379,27 +3613,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_windows_event_policy_condition_with_http_info(
         self,
@@ -5447,25 +3670,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5515,77 +3727,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_condition_serialize(
-            policy_id=policy_id,
-            condition_id=condition_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_condition"],
+            {"policy_id": policy_id, "condition_id": condition_id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsEventPolicyConditionResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_windows_event_policy_condition_serialize(
-        self,
-        policy_id,
-        condition_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        if condition_id is not None:
-            _path_params["condition_id"] = condition_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/policies/{policy_id}/condition/windows-event/{condition_id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5632,25 +3781,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_conditions"],
+            {"policy_id": policy_id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsEventPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_windows_event_policy_conditions_with_http_info(
@@ -5696,24 +3835,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_conditions"],
+            {"policy_id": policy_id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsEventPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5760,73 +3889,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_event_policy_conditions_serialize(
-            policy_id=policy_id,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_event_policy_conditions"],
+            {"policy_id": policy_id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[WindowsEventPolicyConditionResponse]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_windows_event_policy_conditions_serialize(
-        self,
-        policy_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if policy_id is not None:
-            _path_params["policy_id"] = policy_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/policies/{policy_id}/condition/windows-event",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5876,26 +3946,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._node_approval_operation_serialize(
-            mode=mode,
-            device_id_list=device_id_list,
+        return self.api_client.invoke(
+            OPERATIONS["node_approval_operation"],
+            {"mode": mode, "device_id_list": device_id_list},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def node_approval_operation_with_http_info(
@@ -5944,25 +4003,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._node_approval_operation_serialize(
-            mode=mode,
-            device_id_list=device_id_list,
+        return self.api_client.invoke(
+            OPERATIONS["node_approval_operation"],
+            {"mode": mode, "device_id_list": device_id_list},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6012,85 +4060,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._node_approval_operation_serialize(
-            mode=mode,
-            device_id_list=device_id_list,
+        return self.api_client.invoke(
+            OPERATIONS["node_approval_operation"],
+            {"mode": mode, "device_id_list": device_id_list},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _node_approval_operation_serialize(
-        self,
-        mode,
-        device_id_list,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if mode is not None:
-            _path_params["mode"] = mode
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if device_id_list is not None:
-            _body_params = device_id_list
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/devices/approval/{mode}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6140,31 +4117,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._patch_end_user_serialize(
-            id=id,
-            end_user_patch_request=end_user_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["patch_end_user"],
+            {"id": id, "end_user_patch_request": end_user_patch_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def patch_end_user_with_http_info(
         self,
@@ -6212,29 +4174,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._patch_end_user_serialize(
-            id=id,
-            end_user_patch_request=end_user_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["patch_end_user"],
+            {"id": id, "end_user_patch_request": end_user_patch_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6284,91 +4231,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._patch_end_user_serialize(
-            id=id,
-            end_user_patch_request=end_user_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["patch_end_user"],
+            {"id": id, "end_user_patch_request": end_user_patch_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "EndUser",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _patch_end_user_serialize(
-        self,
-        id,
-        end_user_patch_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if end_user_patch_request is not None:
-            _body_params = end_user_patch_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/user/end-user/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6421,27 +4291,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reboot_devices_serialize(
-            id=id,
-            mode=mode,
-            reboot_request=reboot_request,
+        return self.api_client.invoke(
+            OPERATIONS["reboot_devices"],
+            {"id": id, "mode": mode, "reboot_request": reboot_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def reboot_devices_with_http_info(
@@ -6493,26 +4351,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reboot_devices_serialize(
-            id=id,
-            mode=mode,
-            reboot_request=reboot_request,
+        return self.api_client.invoke(
+            OPERATIONS["reboot_devices"],
+            {"id": id, "mode": mode, "reboot_request": reboot_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6565,89 +4411,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reboot_devices_serialize(
-            id=id,
-            mode=mode,
-            reboot_request=reboot_request,
+        return self.api_client.invoke(
+            OPERATIONS["reboot_devices"],
+            {"id": id, "mode": mode, "reboot_request": reboot_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _reboot_devices_serialize(
-        self,
-        id,
-        mode,
-        reboot_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if mode is not None:
-            _path_params["mode"] = mode
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if reboot_request is not None:
-            _body_params = reboot_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/reboot/{mode}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6694,26 +4465,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_device_owner_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["remove_device_owner"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def remove_device_owner_with_http_info(
         self,
@@ -6758,24 +4519,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_device_owner_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["remove_device_owner"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6822,71 +4573,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_device_owner_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["remove_device_owner"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _remove_device_owner_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/device/{id}/owner",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6936,30 +4630,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["remove_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def remove_user_role_members_with_http_info(
@@ -7008,29 +4687,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["remove_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7080,83 +4744,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._remove_user_role_members_serialize(
-            role_id=role_id,
-            request_body=request_body,
+        return self.api_client.invoke(
+            OPERATIONS["remove_user_role_members"],
+            {"role_id": role_id, "request_body": request_body},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "UserRole",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _remove_user_role_members_serialize(
-        self,
-        role_id,
-        request_body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            "request_body": "",
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if role_id is not None:
-            _path_params["roleId"] = role_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if request_body is not None:
-            _body_params = request_body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/user/role/{roleId}/remove-members",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7206,26 +4801,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._request_scripting_options_serialize(
-            id=id,
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["request_scripting_options"],
+            {"id": id, "lang": lang},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceScriptingOptions",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def request_scripting_options_with_http_info(
@@ -7274,25 +4858,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._request_scripting_options_serialize(
-            id=id,
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["request_scripting_options"],
+            {"id": id, "lang": lang},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceScriptingOptions",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7342,78 +4915,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._request_scripting_options_serialize(
-            id=id,
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["request_scripting_options"],
+            {"id": id, "lang": lang},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceScriptingOptions",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _request_scripting_options_serialize(
-        self,
-        id,
-        lang,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device/{id}/scripting/options",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7460,26 +4969,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_serialize(
-            uid=uid,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert"],
+            {"uid": uid},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def reset_alert_with_http_info(
         self,
@@ -7524,24 +5023,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_serialize(
-            uid=uid,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert"],
+            {"uid": uid},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7588,71 +5077,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_serialize(
-            uid=uid,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert"],
+            {"uid": uid},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _reset_alert_serialize(
-        self,
-        uid,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if uid is not None:
-            _path_params["uid"] = uid
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/alert/{uid}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7702,26 +5134,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_set_activity_data_serialize(
-            uid=uid,
-            body=body,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert_set_activity_data"],
+            {"uid": uid, "body": body},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def reset_alert_set_activity_data_with_http_info(
@@ -7770,25 +5191,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_set_activity_data_serialize(
-            uid=uid,
-            body=body,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert_set_activity_data"],
+            {"uid": uid, "body": body},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7838,85 +5248,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_alert_set_activity_data_serialize(
-            uid=uid,
-            body=body,
+        return self.api_client.invoke(
+            OPERATIONS["reset_alert_set_activity_data"],
+            {"uid": uid, "body": body},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _reset_alert_set_activity_data_serialize(
-        self,
-        uid,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if uid is not None:
-            _path_params["uid"] = uid
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/alert/{uid}/reset",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7963,25 +5302,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["reset_policy_overrides"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def reset_policy_overrides_with_http_info(
@@ -8027,24 +5356,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["reset_policy_overrides"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -8091,73 +5410,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._reset_policy_overrides_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["reset_policy_overrides"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _reset_policy_overrides_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/v2/device/{id}/policy/overrides",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -8207,26 +5467,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._run_script_on_device_serialize(
-            id=id,
-            run_script_request=run_script_request,
+        return self.api_client.invoke(
+            OPERATIONS["run_script_on_device"],
+            {"id": id, "run_script_request": run_script_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def run_script_on_device_with_http_info(
@@ -8275,25 +5524,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._run_script_on_device_serialize(
-            id=id,
-            run_script_request=run_script_request,
+        return self.api_client.invoke(
+            OPERATIONS["run_script_on_device"],
+            {"id": id, "run_script_request": run_script_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -8343,85 +5581,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._run_script_on_device_serialize(
-            id=id,
-            run_script_request=run_script_request,
+        return self.api_client.invoke(
+            OPERATIONS["run_script_on_device"],
+            {"id": id, "run_script_request": run_script_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _run_script_on_device_serialize(
-        self,
-        id,
-        run_script_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if run_script_request is not None:
-            _body_params = run_script_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/script/run",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -8471,26 +5638,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_device_owner_serialize(
-            id=id,
-            owner_uid=owner_uid,
+        return self.api_client.invoke(
+            OPERATIONS["set_device_owner"],
+            {"id": id, "owner_uid": owner_uid},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def set_device_owner_with_http_info(
@@ -8539,25 +5695,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_device_owner_serialize(
-            id=id,
-            owner_uid=owner_uid,
+        return self.api_client.invoke(
+            OPERATIONS["set_device_owner"],
+            {"id": id, "owner_uid": owner_uid},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -8607,75 +5752,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_device_owner_serialize(
-            id=id,
-            owner_uid=owner_uid,
+        return self.api_client.invoke(
+            OPERATIONS["set_device_owner"],
+            {"id": id, "owner_uid": owner_uid},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _set_device_owner_serialize(
-        self,
-        id,
-        owner_uid,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if owner_uid is not None:
-            _path_params["ownerUid"] = owner_uid
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/owner/{ownerUid}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -8728,27 +5812,19 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_windows_service_configuration_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_configuration=windows_service_configuration,
+        return self.api_client.invoke(
+            OPERATIONS["set_windows_service_configuration"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_configuration": windows_service_configuration,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def set_windows_service_configuration_with_http_info(
@@ -8800,26 +5876,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_windows_service_configuration_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_configuration=windows_service_configuration,
+        return self.api_client.invoke(
+            OPERATIONS["set_windows_service_configuration"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_configuration": windows_service_configuration,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -8872,89 +5940,18 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._set_windows_service_configuration_serialize(
-            id=id,
-            service_id=service_id,
-            windows_service_configuration=windows_service_configuration,
+        return self.api_client.invoke(
+            OPERATIONS["set_windows_service_configuration"],
+            {
+                "id": id,
+                "service_id": service_id,
+                "windows_service_configuration": windows_service_configuration,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _set_windows_service_configuration_serialize(
-        self,
-        id,
-        service_id,
-        windows_service_configuration,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if service_id is not None:
-            _path_params["serviceId"] = service_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if windows_service_configuration is not None:
-            _body_params = windows_service_configuration
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/windows-service/{serviceId}/configure",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -9001,26 +5998,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_apply"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def submit_os_patch_apply_with_http_info(
@@ -9066,25 +6052,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_apply"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -9131,68 +6106,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_apply"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _submit_os_patch_apply_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/patch/os/apply",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -9239,26 +6160,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_scan"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def submit_os_patch_scan_with_http_info(
@@ -9304,25 +6214,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_scan"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -9369,68 +6268,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_os_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_os_patch_scan"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _submit_os_patch_scan_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/patch/os/scan",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -9477,26 +6322,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_apply"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def submit_software_patch_apply_with_http_info(
@@ -9542,25 +6376,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_apply"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -9607,68 +6430,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_apply_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_apply"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _submit_software_patch_apply_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/patch/software/apply",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -9715,27 +6484,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_scan"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def submit_software_patch_scan_with_http_info(
         self,
@@ -9780,25 +6538,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_scan"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -9845,68 +6592,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._submit_software_patch_scan_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["submit_software_patch_scan"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "204": None,
-            "400": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _submit_software_patch_scan_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/v2/device/{id}/patch/software/scan",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -9958,30 +6651,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_contact_serialize(
-            id=id,
-            contact_patch_request=contact_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_contact"],
+            {"id": id, "contact_patch_request": contact_patch_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_contact_with_http_info(
@@ -10032,29 +6710,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_contact_serialize(
-            id=id,
-            contact_patch_request=contact_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_contact"],
+            {"id": id, "contact_patch_request": contact_patch_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -10106,91 +6769,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_contact_serialize(
-            id=id,
-            contact_patch_request=contact_patch_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_contact"],
+            {"id": id, "contact_patch_request": contact_patch_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_contact_serialize(
-        self,
-        id,
-        contact_patch_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if contact_patch_request is not None:
-            _body_params = contact_patch_request
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/contact/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -10240,26 +6826,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_serialize(
-            id=id,
-            device_mutable_properties=device_mutable_properties,
+        return self.api_client.invoke(
+            OPERATIONS["update_device"],
+            {"id": id, "device_mutable_properties": device_mutable_properties},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_device_with_http_info(
@@ -10308,25 +6883,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_serialize(
-            id=id,
-            device_mutable_properties=device_mutable_properties,
+        return self.api_client.invoke(
+            OPERATIONS["update_device"],
+            {"id": id, "device_mutable_properties": device_mutable_properties},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -10376,85 +6940,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_serialize(
-            id=id,
-            device_mutable_properties=device_mutable_properties,
+        return self.api_client.invoke(
+            OPERATIONS["update_device"],
+            {"id": id, "device_mutable_properties": device_mutable_properties},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_device_serialize(
-        self,
-        id,
-        device_mutable_properties,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if device_mutable_properties is not None:
-            _body_params = device_mutable_properties
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/device/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -10504,27 +6997,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_maintenance_serialize(
-            id=id,
-            maintenance_settings=maintenance_settings,
+        return self.api_client.invoke(
+            OPERATIONS["update_device_maintenance"],
+            {"id": id, "maintenance_settings": maintenance_settings},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def update_device_maintenance_with_http_info(
         self,
@@ -10572,25 +7054,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_maintenance_serialize(
-            id=id,
-            maintenance_settings=maintenance_settings,
+        return self.api_client.invoke(
+            OPERATIONS["update_device_maintenance"],
+            {"id": id, "maintenance_settings": maintenance_settings},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -10640,85 +7111,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_device_maintenance_serialize(
-            id=id,
-            maintenance_settings=maintenance_settings,
+        return self.api_client.invoke(
+            OPERATIONS["update_device_maintenance"],
+            {"id": id, "maintenance_settings": maintenance_settings},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_device_maintenance_serialize(
-        self,
-        id,
-        maintenance_settings,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if maintenance_settings is not None:
-            _body_params = maintenance_settings
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PUT",
-            resource_path="/v2/device/{id}/maintenance",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -10771,27 +7171,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_location_serialize(
-            id=id,
-            location_id=location_id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_location"],
+            {"id": id, "location_id": location_id, "location_model": location_model},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_location_with_http_info(
@@ -10843,26 +7231,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_location_serialize(
-            id=id,
-            location_id=location_id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_location"],
+            {"id": id, "location_id": location_id, "location_model": location_model},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -10915,91 +7291,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_location_serialize(
-            id=id,
-            location_id=location_id,
-            location_model=location_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_location"],
+            {"id": id, "location_id": location_id, "location_model": location_model},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Location",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_location_serialize(
-        self,
-        id,
-        location_id,
-        location_model,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        if location_id is not None:
-            _path_params["locationId"] = location_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if location_model is not None:
-            _body_params = location_model
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/organization/{id}/locations/{locationId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -11049,26 +7348,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_role_policy_assignment_for_organization_serialize(
-            id=id,
-            node_role_policy_assignment=node_role_policy_assignment,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_role_policy_assignment_for_organization"],
+            {"id": id, "node_role_policy_assignment": node_role_policy_assignment},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[int]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_node_role_policy_assignment_for_organization_with_http_info(
@@ -11117,25 +7405,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_role_policy_assignment_for_organization_serialize(
-            id=id,
-            node_role_policy_assignment=node_role_policy_assignment,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_role_policy_assignment_for_organization"],
+            {"id": id, "node_role_policy_assignment": node_role_policy_assignment},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[int]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -11185,87 +7462,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_node_role_policy_assignment_for_organization_serialize(
-            id=id,
-            node_role_policy_assignment=node_role_policy_assignment,
+        return self.api_client.invoke(
+            OPERATIONS["update_node_role_policy_assignment_for_organization"],
+            {"id": id, "node_role_policy_assignment": node_role_policy_assignment},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[int]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_node_role_policy_assignment_for_organization_serialize(
-        self,
-        id,
-        node_role_policy_assignment,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            "NodeRolePolicyAssignment": "",
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if node_role_policy_assignment is not None:
-            _body_params = node_role_policy_assignment
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PUT",
-            resource_path="/v2/organization/{id}/policies",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -11315,26 +7519,15 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_organization_serialize(
-            id=id,
-            organization_model=organization_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_organization"],
+            {"id": id, "organization_model": organization_model},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def update_organization_with_http_info(
@@ -11383,25 +7576,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_organization_serialize(
-            id=id,
-            organization_model=organization_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_organization"],
+            {"id": id, "organization_model": organization_model},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -11451,85 +7633,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_organization_serialize(
-            id=id,
-            organization_model=organization_model,
+        return self.api_client.invoke(
+            OPERATIONS["update_organization"],
+            {"id": id, "organization_model": organization_model},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_organization_serialize(
-        self,
-        id,
-        organization_model,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if organization_model is not None:
-            _body_params = organization_model
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["*/*"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/organization/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -11579,31 +7690,16 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_technician_serialize(
-            id=id,
-            update_technician_request=update_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_technician"],
+            {"id": id, "update_technician_request": update_technician_request},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def update_technician_with_http_info(
         self,
@@ -11651,29 +7747,14 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_technician_serialize(
-            id=id,
-            update_technician_request=update_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_technician"],
+            {"id": id, "update_technician_request": update_technician_request},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -11723,83 +7804,12 @@ class ManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._update_technician_serialize(
-            id=id,
-            update_technician_request=update_technician_request,
+        return self.api_client.invoke(
+            OPERATIONS["update_technician"],
+            {"id": id, "update_technician_request": update_technician_request},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": None,
-            "400": None,
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _update_technician_serialize(
-        self,
-        id,
-        update_technician_request,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if update_technician_request is not None:
-            _body_params = update_technician_request
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(
-                ["application/json"]
-            )
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/v2/user/technician/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
@@ -0,0 +1,1402 @@
+# coding: utf-8
+
+# flake8: noqa
+"""
+Operations of the generated APIs, see `tl_ninjarmm.operations`.
+
+Generated by scripts/generate_operation_table.py, do not edit manually.
+"""
+
+from typing import Dict
+
+from tl_ninjarmm.operations import Operation
+
+OPERATIONS: Dict[str, Operation] = {
+    "add_user_role_members": Operation(
+        name="add_user_role_members",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/user/role/{roleId}/add-members",
+        path_params=(("roleId", "role_id"),),
+        body_param="request_body",
+        collection_formats={"request_body": ""},
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "200": "UserRole",
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "cancel_device_maintenance": Operation(
+        name="cancel_device_maintenance",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/device/{id}/maintenance",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "control_windows_service": Operation(
+        name="control_windows_service",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/windows-service/{serviceId}/control",
+        path_params=(("id", "id"), ("serviceId", "service_id")),
+        body_param="windows_service_control_request",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "create_contact": Operation(
+        name="create_contact",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/contacts",
+        body_param="create_contact_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Contact", "400": None, "401": None, "403": None},
+    ),
+    "create_custom_fields_policy_condition": Operation(
+        name="create_custom_fields_policy_condition",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/policies/{policy_id}/condition/custom-fields",
+        path_params=(("policy_id", "policy_id"),),
+        body_param="custom_fields_policy_condition_create_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "CustomFieldPolicyConditionResponse"},
+    ),
+    "create_end_user": Operation(
+        name="create_end_user",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/user/end-users",
+        query_params=(("sendInvitation", "send_invitation"),),
+        body_param="create_end_user_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "EndUser", "400": None, "401": None, "403": None},
+    ),
+    "create_location_for_organization": Operation(
+        name="create_location_for_organization",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/organization/{id}/locations",
+        path_params=(("id", "id"),),
+        body_param="location_model",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Location"},
+    ),
+    "create_organization": Operation(
+        name="create_organization",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/organizations",
+        query_params=(("templateOrganizationId", "template_organization_id"),),
+        body_param="organization_with_locations_and_policy_assignments_model",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "OrganizationDetailed"},
+    ),
+    "create_policy": Operation(
+        name="create_policy",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/policies",
+        query_params=(("mode", "mode"), ("templatePolicyId", "template_policy_id")),
+        body_param="policy_info",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Policy"},
+    ),
+    "create_technician": Operation(
+        name="create_technician",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/user/technicians",
+        body_param="create_technician_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Technician", "400": None, "401": None, "403": None},
+    ),
+    "create_windows_event_policy_condition": Operation(
+        name="create_windows_event_policy_condition",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/policies/{policy_id}/condition/windows-event",
+        path_params=(("policy_id", "policy_id"),),
+        body_param="windows_event_policy_condition_create_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "WindowsEventPolicyConditionResponse"},
+    ),
+    "delete_contact": Operation(
+        name="delete_contact",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/contact/{id}",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "204": None,
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "delete_end_user": Operation(
+        name="delete_end_user",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/user/end-user/{id}",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "204": None,
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "delete_policy_condition": Operation(
+        name="delete_policy_condition",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/policies/{policy_id}/condition/{condition_id}",
+        path_params=(("policy_id", "policy_id"), ("condition_id", "condition_id")),
+        accept=("*/*",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "delete_technician": Operation(
+        name="delete_technician",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/user/technician/{id}",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "204": None,
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "get_active_jobs": Operation(
+        name="get_active_jobs",
+        api="SystemApi",
+        method="GET",
+        path="/v2/jobs",
+        query_params=(
+            ("jobType", "job_type"),
+            ("df", "df"),
+            ("lang", "lang"),
+            ("tz", "tz"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Job]"},
+    ),
+    "get_activities": Operation(
+        name="get_activities",
+        api="SystemApi",
+        method="GET",
+        path="/v2/activities",
+        query_params=(
+            ("class", "var_class"),
+            ("before", "before"),
+            ("after", "after"),
+            ("olderThan", "older_than"),
+            ("newerThan", "newer_than"),
+            ("type", "type"),
+            ("status", "status"),
+            ("user", "user"),
+            ("seriesUid", "series_uid"),
+            ("df", "df"),
+            ("pageSize", "page_size"),
+            ("lang", "lang"),
+            ("tz", "tz"),
+            ("sourceConfigUid", "source_config_uid"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "ActivitiesResponse"},
+    ),
+    "get_alerts": Operation(
+        name="get_alerts",
+        api="SystemApi",
+        method="GET",
+        path="/v2/alerts",
+        query_params=(
+            ("sourceType", "source_type"),
+            ("df", "df"),
+            ("lang", "lang"),
+            ("tz", "tz"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Alert]"},
+    ),
+    "get_antivirus_status_report": Operation(
+        name="get_antivirus_status_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/antivirus-status",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("productState", "product_state"),
+            ("productName", "product_name"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "AntivirusStatusReport"},
+    ),
+    "get_antivirus_threats": Operation(
+        name="get_antivirus_threats",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/antivirus-threats",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "AntivirusThreatsReport"},
+    ),
+    "get_automation_scripts": Operation(
+        name="get_automation_scripts",
+        api="SystemApi",
+        method="GET",
+        path="/v2/automation/scripts",
+        query_params=(("lang", "lang"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[AutomationScript]"},
+    ),
+    "get_computer_systems": Operation(
+        name="get_computer_systems",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/computer-systems",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "ComputerSystemsReport"},
+    ),
+    "get_contact_by_id": Operation(
+        name="get_contact_by_id",
+        api="SystemApi",
+        method="GET",
+        path="/v2/contact/{id}",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Contact", "401": None, "403": None, "404": None},
+    ),
+    "get_contacts": Operation(
+        name="get_contacts",
+        api="SystemApi",
+        method="GET",
+        path="/v2/contacts",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Contact]", "403": None},
+    ),
+    "get_custom_fields_detailed_report": Operation(
+        name="get_custom_fields_detailed_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/custom-fields-detailed",
+        query_params=(
+            ("df", "df"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("updatedAfter", "updated_after"),
+            ("fields", "fields"),
+            ("showSecureValues", "show_secure_values"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "NodeAttributesDetailedReport"},
+    ),
+    "get_custom_fields_policy_condition": Operation(
+        name="get_custom_fields_policy_condition",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/policies/{policy_id}/condition/custom-fields/{condition_id}",
+        path_params=(("policy_id", "policy_id"), ("condition_id", "condition_id")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "CustomFieldPolicyConditionResponse"},
+    ),
+    "get_custom_fields_policy_conditions": Operation(
+        name="get_custom_fields_policy_conditions",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/policies/{policy_id}/condition/custom-fields",
+        path_params=(("policy_id", "policy_id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[CustomFieldPolicyConditionResponse]"},
+    ),
+    "get_custom_fields_report": Operation(
+        name="get_custom_fields_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/custom-fields",
+        query_params=(
+            ("df", "df"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("updatedAfter", "updated_after"),
+            ("fields", "fields"),
+            ("showSecureValues", "show_secure_values"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "NodeAttributesReport"},
+    ),
+    "get_device": Operation(
+        name="get_device",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Device"},
+    ),
+    "get_device_active_jobs": Operation(
+        name="get_device_active_jobs",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/jobs",
+        path_params=(("id", "id"),),
+        query_params=(("lang", "lang"), ("tz", "tz")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Job]"},
+    ),
+    "get_device_activities": Operation(
+        name="get_device_activities",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/activities",
+        path_params=(("id", "id"),),
+        query_params=(
+            ("olderThan", "older_than"),
+            ("newerThan", "newer_than"),
+            ("activityType", "activity_type"),
+            ("status", "status"),
+            ("seriesUid", "series_uid"),
+            ("pageSize", "page_size"),
+            ("lang", "lang"),
+            ("tz", "tz"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "NodeActivitiesResponse"},
+    ),
+    "get_device_alerts": Operation(
+        name="get_device_alerts",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/alerts",
+        path_params=(("id", "id"),),
+        query_params=(("lang", "lang"), ("tz", "tz")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Alert]"},
+    ),
+    "get_device_disk_drives": Operation(
+        name="get_device_disk_drives",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/disks",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[DiskDrive]"},
+    ),
+    "get_device_global_custom_fields": Operation(
+        name="get_device_global_custom_fields",
+        api="SystemApi",
+        method="GET",
+        path="/v2/device-custom-fields",
+        query_params=(("scopes", "scopes"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[AttributePublicApiDTO]"},
+    ),
+    "get_device_health_report": Operation(
+        name="get_device_health_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/device-health",
+        query_params=(
+            ("df", "df"),
+            ("health", "health"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DeviceHealthReport"},
+    ),
+    "get_device_installed_os_patches": Operation(
+        name="get_device_installed_os_patches",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/os-patch-installs",
+        path_params=(("id", "id"),),
+        query_params=(
+            ("status", "status"),
+            ("installedBefore", "installed_before"),
+            ("installedAfter", "installed_after"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[OSPatch]"},
+    ),
+    "get_device_installed_software_patches": Operation(
+        name="get_device_installed_software_patches",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/software-patch-installs",
+        path_params=(("id", "id"),),
+        query_params=(
+            ("type", "type"),
+            ("impact", "impact"),
+            ("status", "status"),
+            ("productIdentifier", "product_identifier"),
+            ("installedBefore", "installed_before"),
+            ("installedAfter", "installed_after"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[SoftwarePatch]"},
+    ),
+    "get_device_last_logged_on_user": Operation(
+        name="get_device_last_logged_on_user",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/last-logged-on-user",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("oauth2",),
+        response_types={"200": "LoggedOnUser"},
+    ),
+    "get_device_link": Operation(
+        name="get_device_link",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/device/{id}/dashboard-url",
+        path_params=(("id", "id"),),
+        query_params=(("redirect", "redirect"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DeviceLink"},
+    ),
+    "get_device_network_interfaces": Operation(
+        name="get_device_network_interfaces",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/network-interfaces",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[NetworkInterface]"},
+    ),
+    "get_device_pending_failed_rejected_os_patches": Operation(
+        name="get_device_pending_failed_rejected_os_patches",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/os-patches",
+        path_params=(("id", "id"),),
+        query_params=(("status", "status"), ("type", "type"), ("severity", "severity")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[OSPatch]"},
+    ),
+    "get_device_pending_failed_rejected_software_patches": Operation(
+        name="get_device_pending_failed_rejected_software_patches",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/software-patches",
+        path_params=(("id", "id"),),
+        query_params=(
+            ("status", "status"),
+            ("productIdentifier", "product_identifier"),
+            ("type", "type"),
+            ("impact", "impact"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[SoftwarePatch]"},
+    ),
+    "get_device_processors": Operation(
+        name="get_device_processors",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/processors",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Processor]"},
+    ),
+    "get_device_services": Operation(
+        name="get_device_services",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/windows-services",
+        path_params=(("id", "id"),),
+        query_params=(("name", "name"), ("state", "state")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[WindowsService]"},
+    ),
+    "get_device_software": Operation(
+        name="get_device_software",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/software",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Application]"},
+    ),
+    "get_device_usage": Operation(
+        name="get_device_usage",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/backup/usage",
+        query_params=(
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("includeDeletedDevices", "include_deleted_devices"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DeviceUsageReport"},
+    ),
+    "get_device_volumes": Operation(
+        name="get_device_volumes",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/volumes",
+        path_params=(("id", "id"),),
+        query_params=(("include", "include"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Volume]"},
+    ),
+    "get_devices": Operation(
+        name="get_devices",
+        api="SystemApi",
+        method="GET",
+        path="/v2/devices",
+        query_params=(("df", "df"), ("pageSize", "page_size"), ("after", "after")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[NodeWithDetailedReferences]"},
+    ),
+    "get_devices_detailed": Operation(
+        name="get_devices_detailed",
+        api="SystemApi",
+        method="GET",
+        path="/v2/devices-detailed",
+        query_params=(("df", "df"), ("pageSize", "page_size"), ("after", "after")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Device]"},
+    ),
+    "get_disk_drives": Operation(
+        name="get_disk_drives",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/disks",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DiskDriveReport"},
+    ),
+    "get_enabled_notification_channels": Operation(
+        name="get_enabled_notification_channels",
+        api="SystemApi",
+        method="GET",
+        path="/v2/notification-channels/enabled",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[NotificationChannel]"},
+    ),
+    "get_end_users1": Operation(
+        name="get_end_users1",
+        api="SystemApi",
+        method="GET",
+        path="/v2/user/end-users",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[EndUser]", "401": None, "403": None},
+    ),
+    "get_groups": Operation(
+        name="get_groups",
+        api="SystemApi",
+        method="GET",
+        path="/v2/groups",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Group]"},
+    ),
+    "get_installed_os_patches": Operation(
+        name="get_installed_os_patches",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/os-patch-installs",
+        query_params=(
+            ("df", "df"),
+            ("status", "status"),
+            ("installedBefore", "installed_before"),
+            ("installedAfter", "installed_after"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "OSPatchReport"},
+    ),
+    "get_installed_software_patches": Operation(
+        name="get_installed_software_patches",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/software-patch-installs",
+        query_params=(
+            ("df", "df"),
+            ("type", "type"),
+            ("impact", "impact"),
+            ("status", "status"),
+            ("productIdentifier", "product_identifier"),
+            ("installedBefore", "installed_before"),
+            ("installedAfter", "installed_after"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "SoftwarePatchReport"},
+    ),
+    "get_installer": Operation(
+        name="get_installer",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/organization/generate-installer",
+        body_param="generate_installer_request_dto",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Link"},
+    ),
+    "get_installer_for_location": Operation(
+        name="get_installer_for_location",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/organization/{id}/location/{location_id}/installer/{installer_type}",
+        path_params=(
+            ("id", "id"),
+            ("location_id", "location_id"),
+            ("installer_type", "installer_type"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Link"},
+    ),
+    "get_last_logged_on_users_report": Operation(
+        name="get_last_logged_on_users_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/logged-on-users",
+        query_params=(("df", "df"), ("cursor", "cursor"), ("pageSize", "page_size")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "LoggedOnUsersReport"},
+    ),
+    "get_locations": Operation(
+        name="get_locations",
+        api="SystemApi",
+        method="GET",
+        path="/v2/locations",
+        query_params=(("pageSize", "page_size"), ("after", "after")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[LocationWithOrganizationRef]"},
+    ),
+    "get_network_interfaces": Operation(
+        name="get_network_interfaces",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/network-interfaces",
+        query_params=(("df", "df"), ("cursor", "cursor"), ("pageSize", "page_size")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "NetworkInterfacesReport"},
+    ),
+    "get_node_custom_fields": Operation(
+        name="get_node_custom_fields",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/custom-fields",
+        path_params=(("id", "id"),),
+        query_params=(("withInheritance", "with_inheritance"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Dict[str, object]"},
+    ),
+    "get_node_roles": Operation(
+        name="get_node_roles",
+        api="SystemApi",
+        method="GET",
+        path="/v2/roles",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[NodeRole]"},
+    ),
+    "get_notification_channels": Operation(
+        name="get_notification_channels",
+        api="SystemApi",
+        method="GET",
+        path="/v2/notification-channels",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[NotificationChannel]"},
+    ),
+    "get_operating_systems": Operation(
+        name="get_operating_systems",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/operating-systems",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "OperatingSystemsReport"},
+    ),
+    "get_organizations": Operation(
+        name="get_organizations",
+        api="SystemApi",
+        method="GET",
+        path="/v2/organizations",
+        query_params=(("pageSize", "page_size"), ("after", "after"), ("of", "of")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Organization]"},
+    ),
+    "get_organizations_detailed": Operation(
+        name="get_organizations_detailed",
+        api="SystemApi",
+        method="GET",
+        path="/v2/organizations-detailed",
+        query_params=(("pageSize", "page_size"), ("after", "after"), ("of", "of")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[OrganizationDetailed]"},
+    ),
+    "get_pending_failed_rejected_os_patches": Operation(
+        name="get_pending_failed_rejected_os_patches",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/os-patches",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("status", "status"),
+            ("type", "type"),
+            ("severity", "severity"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "OSPatchReport"},
+    ),
+    "get_pending_failed_rejected_software_patches": Operation(
+        name="get_pending_failed_rejected_software_patches",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/software-patches",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("status", "status"),
+            ("productIdentifier", "product_identifier"),
+            ("type", "type"),
+            ("impact", "impact"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "SoftwarePatchReport"},
+    ),
+    "get_policies": Operation(
+        name="get_policies",
+        api="SystemApi",
+        method="GET",
+        path="/v2/policies",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Policy]"},
+    ),
+    "get_policy_overrides": Operation(
+        name="get_policy_overrides",
+        api="DevicesApi",
+        method="GET",
+        path="/v2/device/{id}/policy/overrides",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "PolicyOverrides"},
+    ),
+    "get_policy_overrides1": Operation(
+        name="get_policy_overrides1",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/policy-overrides",
+        query_params=(("df", "df"), ("cursor", "cursor"), ("pageSize", "page_size")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "PolicyOverridesReport"},
+    ),
+    "get_processors": Operation(
+        name="get_processors",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/processors",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "ProcessorReport"},
+    ),
+    "get_raid_controller_report": Operation(
+        name="get_raid_controller_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/raid-controllers",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "RAIDControllerReport"},
+    ),
+    "get_raid_drive_report": Operation(
+        name="get_raid_drive_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/raid-drives",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "RAIDDriveReport"},
+    ),
+    "get_scheduled_tasks": Operation(
+        name="get_scheduled_tasks",
+        api="SystemApi",
+        method="GET",
+        path="/v2/tasks",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[ScheduledTask]"},
+    ),
+    "get_scoped_custom_fields_detailed_report": Operation(
+        name="get_scoped_custom_fields_detailed_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/scoped-custom-fields-detailed",
+        query_params=(
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("updatedAfter", "updated_after"),
+            ("fields", "fields"),
+            ("scopes", "scopes"),
+            ("showSecureValues", "show_secure_values"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "ScopedAttributesDetailedReport"},
+    ),
+    "get_scoped_custom_fields_report": Operation(
+        name="get_scoped_custom_fields_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/scoped-custom-fields",
+        query_params=(
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("updatedAfter", "updated_after"),
+            ("fields", "fields"),
+            ("scopes", "scopes"),
+            ("showSecureValues", "show_secure_values"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "ScopedAttributesReport"},
+    ),
+    "get_software": Operation(
+        name="get_software",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/software",
+        query_params=(
+            ("df", "df"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("installedBefore", "installed_before"),
+            ("installedAfter", "installed_after"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "SoftwareReport"},
+    ),
+    "get_software_products": Operation(
+        name="get_software_products",
+        api="SystemApi",
+        method="GET",
+        path="/v2/software-products",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[SoftwareProduct]"},
+    ),
+    "get_technicians": Operation(
+        name="get_technicians",
+        api="SystemApi",
+        method="GET",
+        path="/v2/user/technicians",
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[Technician]", "401": None, "403": None},
+    ),
+    "get_user_roles": Operation(
+        name="get_user_roles",
+        api="SystemApi",
+        method="GET",
+        path="/v2/user/roles",
+        query_params=(("roleType", "role_type"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[UserRole]", "401": None},
+    ),
+    "get_users": Operation(
+        name="get_users",
+        api="SystemApi",
+        method="GET",
+        path="/v2/users",
+        query_params=(("userType", "user_type"), ("includeRoles", "include_roles")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[User]"},
+    ),
+    "get_volumes": Operation(
+        name="get_volumes",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/volumes",
+        query_params=(
+            ("df", "df"),
+            ("ts", "ts"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+            ("include", "include"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "VolumesReport"},
+    ),
+    "get_windows_event_policy_condition": Operation(
+        name="get_windows_event_policy_condition",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/policies/{policy_id}/condition/windows-event/{condition_id}",
+        path_params=(("policy_id", "policy_id"), ("condition_id", "condition_id")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "WindowsEventPolicyConditionResponse"},
+    ),
+    "get_windows_event_policy_conditions": Operation(
+        name="get_windows_event_policy_conditions",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/policies/{policy_id}/condition/windows-event",
+        path_params=(("policy_id", "policy_id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[WindowsEventPolicyConditionResponse]"},
+    ),
+    "get_windows_services_report": Operation(
+        name="get_windows_services_report",
+        api="QueriesApi",
+        method="GET",
+        path="/v2/queries/windows-services",
+        query_params=(
+            ("df", "df"),
+            ("name", "name"),
+            ("state", "state"),
+            ("cursor", "cursor"),
+            ("pageSize", "page_size"),
+        ),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "WindowsServiceReport"},
+    ),
+    "node_approval_operation": Operation(
+        name="node_approval_operation",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/devices/approval/{mode}",
+        path_params=(("mode", "mode"),),
+        body_param="device_id_list",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "patch_end_user": Operation(
+        name="patch_end_user",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/user/end-user/{id}",
+        path_params=(("id", "id"),),
+        body_param="end_user_patch_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "200": "EndUser",
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "reboot_devices": Operation(
+        name="reboot_devices",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/reboot/{mode}",
+        path_params=(("id", "id"), ("mode", "mode")),
+        body_param="reboot_request",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "remove_device_owner": Operation(
+        name="remove_device_owner",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/device/{id}/owner",
+        path_params=(("id", "id"),),
+        accept=("*/*",),
+        auth_settings=("oauth2",),
+        response_types={"200": None},
+    ),
+    "remove_user_role_members": Operation(
+        name="remove_user_role_members",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/user/role/{roleId}/remove-members",
+        path_params=(("roleId", "role_id"),),
+        body_param="request_body",
+        collection_formats={"request_body": ""},
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "200": "UserRole",
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "request_scripting_options": Operation(
+        name="request_scripting_options",
+        api="ManagementApi",
+        method="GET",
+        path="/v2/device/{id}/scripting/options",
+        path_params=(("id", "id"),),
+        query_params=(("lang", "lang"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DeviceScriptingOptions"},
+    ),
+    "reset_alert": Operation(
+        name="reset_alert",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/alert/{uid}",
+        path_params=(("uid", "uid"),),
+        accept=("*/*",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "reset_alert_set_activity_data": Operation(
+        name="reset_alert_set_activity_data",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/alert/{uid}/reset",
+        path_params=(("uid", "uid"),),
+        body_param="body",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "reset_policy_overrides": Operation(
+        name="reset_policy_overrides",
+        api="ManagementApi",
+        method="DELETE",
+        path="/v2/device/{id}/policy/overrides",
+        path_params=(("id", "id"),),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "run_script_on_device": Operation(
+        name="run_script_on_device",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/script/run",
+        path_params=(("id", "id"),),
+        body_param="run_script_request",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "search": Operation(
+        name="search",
+        api="SystemApi",
+        method="GET",
+        path="/v2/devices/search",
+        query_params=(("q", "q"), ("limit", "limit")),
+        accept=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "DeviceSearchResults"},
+    ),
+    "set_device_owner": Operation(
+        name="set_device_owner",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/owner/{ownerUid}",
+        path_params=(("id", "id"), ("ownerUid", "owner_uid")),
+        accept=("*/*",),
+        auth_settings=("oauth2",),
+        response_types={"200": None},
+    ),
+    "set_windows_service_configuration": Operation(
+        name="set_windows_service_configuration",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/windows-service/{serviceId}/configure",
+        path_params=(("id", "id"), ("serviceId", "service_id")),
+        body_param="windows_service_configuration",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "submit_os_patch_apply": Operation(
+        name="submit_os_patch_apply",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/patch/os/apply",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"204": None, "400": None},
+    ),
+    "submit_os_patch_scan": Operation(
+        name="submit_os_patch_scan",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/patch/os/scan",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"204": None, "400": None},
+    ),
+    "submit_software_patch_apply": Operation(
+        name="submit_software_patch_apply",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/patch/software/apply",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"204": None, "400": None},
+    ),
+    "submit_software_patch_scan": Operation(
+        name="submit_software_patch_scan",
+        api="ManagementApi",
+        method="POST",
+        path="/v2/device/{id}/patch/software/scan",
+        path_params=(("id", "id"),),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"204": None, "400": None},
+    ),
+    "update_contact": Operation(
+        name="update_contact",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/contact/{id}",
+        path_params=(("id", "id"),),
+        body_param="contact_patch_request",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "200": "Contact",
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+    "update_device": Operation(
+        name="update_device",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/device/{id}",
+        path_params=(("id", "id"),),
+        body_param="device_mutable_properties",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("oauth2",),
+        response_types={"200": None},
+    ),
+    "update_device_maintenance": Operation(
+        name="update_device_maintenance",
+        api="ManagementApi",
+        method="PUT",
+        path="/v2/device/{id}/maintenance",
+        path_params=(("id", "id"),),
+        body_param="maintenance_settings",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "update_location": Operation(
+        name="update_location",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/organization/{id}/locations/{locationId}",
+        path_params=(("id", "id"), ("locationId", "location_id")),
+        body_param="location_model",
+        accept=("application/json",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "Location"},
+    ),
+    "update_node_attribute_values": Operation(
+        name="update_node_attribute_values",
+        api="DevicesApi",
+        method="PATCH",
+        path="/v2/device/{id}/custom-fields",
+        path_params=(("id", "id"),),
+        body_param="request_body",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "update_node_role_policy_assignment_for_organization": Operation(
+        name="update_node_role_policy_assignment_for_organization",
+        api="ManagementApi",
+        method="PUT",
+        path="/v2/organization/{id}/policies",
+        path_params=(("id", "id"),),
+        body_param="node_role_policy_assignment",
+        collection_formats={"NodeRolePolicyAssignment": ""},
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": "List[int]"},
+    ),
+    "update_organization": Operation(
+        name="update_organization",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/organization/{id}",
+        path_params=(("id", "id"),),
+        body_param="organization_model",
+        accept=("*/*",),
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={"200": None},
+    ),
+    "update_technician": Operation(
+        name="update_technician",
+        api="ManagementApi",
+        method="PATCH",
+        path="/v2/user/technician/{id}",
+        path_params=(("id", "id"),),
+        body_param="update_technician_request",
+        content_types=("application/json",),
+        auth_settings=("sessionKey", "oauth2"),
+        response_types={
+            "200": None,
+            "400": None,
+            "401": None,
+            "403": None,
+            "404": None,
+        },
+    ),
+}
@@ -13,7 +13,7 @@ Do not edit the class manually.
 """  # noqa: E501
 
 from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from pydantic import StrictBool
@@ -44,8 +44,10 @@ from tl_ninjarmm.models.software_report import SoftwareReport
 from tl_ninjarmm.models.volumes_report import VolumesReport
 from tl_ninjarmm.models.windows_service_report import WindowsServiceReport
 
-from tl_ninjarmm.api_client import ApiClient, RequestSerialized
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
 from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
 from tl_ninjarmm.rest import RESTResponseType
 
 
@@ -60,6 +62,8 @@ class QueriesApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
 
     @validate_call
     def get_antivirus_status_report(
@@ -128,31 +132,23 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_status_report_serialize(
-            df=df,
-            ts=ts,
-            product_state=product_state,
-            product_name=product_name,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusStatusReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_antivirus_status_report_with_http_info(
         self,
@@ -220,29 +216,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_status_report_serialize(
-            df=df,
-            ts=ts,
-            product_state=product_state,
-            product_name=product_name,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusStatusReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -312,99 +300,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_status_report_serialize(
-            df=df,
-            ts=ts,
-            product_state=product_state,
-            product_name=product_name,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_status_report"],
+            {
+                "df": df,
+                "ts": ts,
+                "product_state": product_state,
+                "product_name": product_name,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusStatusReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_antivirus_status_report_serialize(
-        self,
-        df,
-        ts,
-        product_state,
-        product_name,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if product_state is not None:
-            _query_params.append(("productState", product_state))
-
-        if product_name is not None:
-            _query_params.append(("productName", product_name))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/antivirus-status",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -464,28 +374,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_threats_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusThreatsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_antivirus_threats_with_http_info(
@@ -544,27 +441,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_threats_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusThreatsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -624,89 +508,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_antivirus_threats_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_antivirus_threats"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AntivirusThreatsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_antivirus_threats_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/antivirus-threats",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -766,28 +575,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_computer_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ComputerSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_computer_systems_with_http_info(
@@ -846,27 +642,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_computer_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ComputerSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -926,89 +709,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_computer_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_computer_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ComputerSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_computer_systems_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/computer-systems",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1083,31 +791,23 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_detailed_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_custom_fields_detailed_report_with_http_info(
         self,
@@ -1180,29 +880,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_detailed_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1277,99 +969,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_detailed_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_detailed_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_custom_fields_detailed_report_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        updated_after,
-        fields,
-        show_secure_values,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if updated_after is not None:
-            _query_params.append(("updatedAfter", updated_after))
-
-        if fields is not None:
-            _query_params.append(("fields", fields))
-
-        if show_secure_values is not None:
-            _query_params.append(("showSecureValues", show_secure_values))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/custom-fields-detailed",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1444,30 +1058,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_custom_fields_report_with_http_info(
@@ -1541,29 +1147,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1638,99 +1236,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_custom_fields_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_custom_fields_report"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NodeAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_custom_fields_report_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        updated_after,
-        fields,
-        show_secure_values,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if updated_after is not None:
-            _query_params.append(("updatedAfter", updated_after))
-
-        if fields is not None:
-            _query_params.append(("fields", fields))
-
-        if show_secure_values is not None:
-            _query_params.append(("showSecureValues", show_secure_values))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1790,28 +1310,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_health_report_serialize(
-            df=df,
-            health=health,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceHealthReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_device_health_report_with_http_info(
@@ -1870,27 +1377,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_health_report_serialize(
-            df=df,
-            health=health,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceHealthReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1950,89 +1444,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_health_report_serialize(
-            df=df,
-            health=health,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_health_report"],
+            {"df": df, "health": health, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceHealthReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_health_report_serialize(
-        self,
-        df,
-        health,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if health is not None:
-            _query_params.append(("health", health))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/device-health",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2090,28 +1509,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_usage_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            include_deleted_devices=include_deleted_devices,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceUsageReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_usage_with_http_info(
         self,
@@ -2167,26 +1578,18 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_usage_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            include_deleted_devices=include_deleted_devices,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceUsageReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2244,84 +1647,18 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_usage_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            include_deleted_devices=include_deleted_devices,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_usage"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "include_deleted_devices": include_deleted_devices,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceUsageReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_usage_serialize(
-        self,
-        cursor,
-        page_size,
-        include_deleted_devices,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if include_deleted_devices is not None:
-            _query_params.append(("includeDeletedDevices", include_deleted_devices))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/backup/usage",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2381,28 +1718,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_disk_drives_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DiskDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_disk_drives_with_http_info(
@@ -2461,27 +1785,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_disk_drives_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DiskDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2541,89 +1852,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_disk_drives_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_disk_drives"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DiskDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_disk_drives_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/disks",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2696,30 +1932,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_os_patches_serialize(
-            df=df,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_installed_os_patches_with_http_info(
@@ -2791,29 +2019,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_os_patches_serialize(
-            df=df,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2886,99 +2106,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_os_patches_serialize(
-            df=df,
-            status=status,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_os_patches"],
+            {
+                "df": df,
+                "status": status,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_installed_os_patches_serialize(
-        self,
-        df,
-        status,
-        installed_before,
-        installed_after,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if installed_before is not None:
-            _query_params.append(("installedBefore", installed_before))
-
-        if installed_after is not None:
-            _query_params.append(("installedAfter", installed_after))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/os-patch-installs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3065,34 +2207,26 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_software_patches_serialize(
-            df=df,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_installed_software_patches_with_http_info(
         self,
@@ -3177,32 +2311,24 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_software_patches_serialize(
-            df=df,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3289,114 +2415,24 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_installed_software_patches_serialize(
-            df=df,
-            type=type,
-            impact=impact,
-            status=status,
-            product_identifier=product_identifier,
-            installed_before=installed_before,
-            installed_after=installed_after,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_installed_software_patches"],
+            {
+                "df": df,
+                "type": type,
+                "impact": impact,
+                "status": status,
+                "product_identifier": product_identifier,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_installed_software_patches_serialize(
-        self,
-        df,
-        type,
-        impact,
-        status,
-        product_identifier,
-        installed_before,
-        installed_after,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if impact is not None:
-            _query_params.append(("impact", impact))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if product_identifier is not None:
-            _query_params.append(("productIdentifier", product_identifier))
-
-        if installed_before is not None:
-            _query_params.append(("installedBefore", installed_before))
-
-        if installed_after is not None:
-            _query_params.append(("installedAfter", installed_after))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/software-patch-installs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3452,27 +2488,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_last_logged_on_users_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUsersReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_last_logged_on_users_report_with_http_info(
@@ -3527,26 +2551,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_last_logged_on_users_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUsersReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3602,84 +2614,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_last_logged_on_users_report_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_last_logged_on_users_report"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "LoggedOnUsersReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_last_logged_on_users_report_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/logged-on-users",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3732,27 +2674,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_network_interfaces_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NetworkInterfacesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_network_interfaces_with_http_info(
@@ -3804,26 +2734,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_network_interfaces_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NetworkInterfacesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3876,84 +2794,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_network_interfaces_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_network_interfaces"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "NetworkInterfacesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_network_interfaces_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/network-interfaces",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4013,29 +2861,16 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_operating_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OperatingSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_operating_systems_with_http_info(
         self,
@@ -4093,27 +2928,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_operating_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OperatingSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4173,89 +2995,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_operating_systems_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_operating_systems"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OperatingSystemsReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_operating_systems_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/operating-systems",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4330,31 +3077,23 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_os_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            type=type,
-            severity=severity,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_pending_failed_rejected_os_patches_with_http_info(
@@ -4428,30 +3167,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_os_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            type=type,
-            severity=severity,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4526,104 +3257,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_os_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            type=type,
-            severity=severity,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_os_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "type": type,
+                "severity": severity,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "OSPatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_pending_failed_rejected_os_patches_serialize(
-        self,
-        df,
-        ts,
-        status,
-        type,
-        severity,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if severity is not None:
-            _query_params.append(("severity", severity))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/os-patches",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4703,32 +3352,24 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_software_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_pending_failed_rejected_software_patches_with_http_info(
@@ -4807,31 +3448,23 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_software_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4911,109 +3544,23 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_pending_failed_rejected_software_patches_serialize(
-            df=df,
-            ts=ts,
-            status=status,
-            product_identifier=product_identifier,
-            type=type,
-            impact=impact,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_pending_failed_rejected_software_patches"],
+            {
+                "df": df,
+                "ts": ts,
+                "status": status,
+                "product_identifier": product_identifier,
+                "type": type,
+                "impact": impact,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwarePatchReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_pending_failed_rejected_software_patches_serialize(
-        self,
-        df,
-        ts,
-        status,
-        product_identifier,
-        type,
-        impact,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if product_identifier is not None:
-            _query_params.append(("productIdentifier", product_identifier))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if impact is not None:
-            _query_params.append(("impact", impact))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/software-patches",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5069,28 +3616,16 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides1_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverridesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_policy_overrides1_with_http_info(
         self,
@@ -5144,26 +3679,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides1_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverridesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5219,84 +3742,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policy_overrides1_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_policy_overrides1"],
+            {"df": df, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "PolicyOverridesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_policy_overrides1_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/policy-overrides",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5356,28 +3809,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_processors_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ProcessorReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_processors_with_http_info(
@@ -5436,27 +3876,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_processors_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ProcessorReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5516,89 +3943,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_processors_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_processors"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ProcessorReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_processors_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/processors",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5658,28 +4010,15 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_controller_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDControllerReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_raid_controller_report_with_http_info(
@@ -5738,27 +4077,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_controller_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDControllerReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5818,89 +4144,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_controller_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_controller_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDControllerReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_raid_controller_report_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/raid-controllers",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5960,29 +4211,16 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_drive_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_raid_drive_report_with_http_info(
         self,
@@ -6040,27 +4278,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_drive_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6120,89 +4345,14 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_raid_drive_report_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_raid_drive_report"],
+            {"df": df, "ts": ts, "cursor": cursor, "page_size": page_size},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "RAIDDriveReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_raid_drive_report_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/raid-drives",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6279,30 +4429,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_detailed_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_scoped_custom_fields_detailed_report_with_http_info(
@@ -6378,29 +4520,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_detailed_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6477,99 +4611,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_detailed_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_detailed_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesDetailedReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_scoped_custom_fields_detailed_report_serialize(
-        self,
-        cursor,
-        page_size,
-        updated_after,
-        fields,
-        scopes,
-        show_secure_values,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if updated_after is not None:
-            _query_params.append(("updatedAfter", updated_after))
-
-        if fields is not None:
-            _query_params.append(("fields", fields))
-
-        if scopes is not None:
-            _query_params.append(("scopes", scopes))
-
-        if show_secure_values is not None:
-            _query_params.append(("showSecureValues", show_secure_values))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/scoped-custom-fields-detailed",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6646,30 +4702,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_scoped_custom_fields_report_with_http_info(
@@ -6745,29 +4793,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6844,99 +4884,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scoped_custom_fields_report_serialize(
-            cursor=cursor,
-            page_size=page_size,
-            updated_after=updated_after,
-            fields=fields,
-            scopes=scopes,
-            show_secure_values=show_secure_values,
+        return self.api_client.invoke(
+            OPERATIONS["get_scoped_custom_fields_report"],
+            {
+                "cursor": cursor,
+                "page_size": page_size,
+                "updated_after": updated_after,
+                "fields": fields,
+                "scopes": scopes,
+                "show_secure_values": show_secure_values,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ScopedAttributesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_scoped_custom_fields_report_serialize(
-        self,
-        cursor,
-        page_size,
-        updated_after,
-        fields,
-        scopes,
-        show_secure_values,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if updated_after is not None:
-            _query_params.append(("updatedAfter", updated_after))
-
-        if fields is not None:
-            _query_params.append(("fields", fields))
-
-        if scopes is not None:
-            _query_params.append(("scopes", scopes))
-
-        if show_secure_values is not None:
-            _query_params.append(("showSecureValues", show_secure_values))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/scoped-custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7003,30 +4965,22 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwareReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_software_with_http_info(
         self,
@@ -7091,28 +5045,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwareReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7179,94 +5125,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_serialize(
-            df=df,
-            cursor=cursor,
-            page_size=page_size,
-            installed_before=installed_before,
-            installed_after=installed_after,
+        return self.api_client.invoke(
+            OPERATIONS["get_software"],
+            {
+                "df": df,
+                "cursor": cursor,
+                "page_size": page_size,
+                "installed_before": installed_before,
+                "installed_after": installed_after,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "SoftwareReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_software_serialize(
-        self,
-        df,
-        cursor,
-        page_size,
-        installed_before,
-        installed_after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if installed_before is not None:
-            _query_params.append(("installedBefore", installed_before))
-
-        if installed_after is not None:
-            _query_params.append(("installedAfter", installed_after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/software",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7334,29 +5206,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_volumes_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "VolumesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_volumes_with_http_info(
@@ -7423,28 +5287,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_volumes_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "VolumesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7512,94 +5368,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_volumes_serialize(
-            df=df,
-            ts=ts,
-            cursor=cursor,
-            page_size=page_size,
-            include=include,
+        return self.api_client.invoke(
+            OPERATIONS["get_volumes"],
+            {
+                "df": df,
+                "ts": ts,
+                "cursor": cursor,
+                "page_size": page_size,
+                "include": include,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "VolumesReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_volumes_serialize(
-        self,
-        df,
-        ts,
-        cursor,
-        page_size,
-        include,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if ts is not None:
-            _query_params.append(("ts", ts))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if include is not None:
-            _query_params.append(("include", include))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/volumes",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -7663,29 +5445,21 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_services_report_serialize(
-            df=df,
-            name=name,
-            state=state,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsServiceReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_windows_services_report_with_http_info(
@@ -7748,28 +5522,20 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_services_report_serialize(
-            df=df,
-            name=name,
-            state=state,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsServiceReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -7833,92 +5599,18 @@ class QueriesApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_windows_services_report_serialize(
-            df=df,
-            name=name,
-            state=state,
-            cursor=cursor,
-            page_size=page_size,
+        return self.api_client.invoke(
+            OPERATIONS["get_windows_services_report"],
+            {
+                "df": df,
+                "name": name,
+                "state": state,
+                "cursor": cursor,
+                "page_size": page_size,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "WindowsServiceReport",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_windows_services_report_serialize(
-        self,
-        df,
-        name,
-        state,
-        cursor,
-        page_size,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if name is not None:
-            _query_params.append(("name", name))
-
-        if state is not None:
-            _query_params.append(("state", state))
-
-        if cursor is not None:
-            _query_params.append(("cursor", cursor))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/queries/windows-services",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
@@ -42,8 +42,10 @@ from tl_ninjarmm.models.technician import Technician
 from tl_ninjarmm.models.user import User
 from tl_ninjarmm.models.user_role import UserRole
 
-from tl_ninjarmm.api_client import ApiClient, RequestSerialized
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
 from tl_ninjarmm.api_response import ApiResponse
+from tl_ninjarmm.operations import bind_unvalidated
 from tl_ninjarmm.rest import RESTResponseType
 
 
@@ -58,6 +60,8 @@ class SystemApi:
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
+        if not api_client.client_side_validation:
+            bind_unvalidated(self)
 
     @validate_call
     def get_active_jobs(
@@ -114,29 +118,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_active_jobs_serialize(
-            job_type=job_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_active_jobs"],
+            {"job_type": job_type, "df": df, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_active_jobs_with_http_info(
         self,
@@ -192,27 +183,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_active_jobs_serialize(
-            job_type=job_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_active_jobs"],
+            {"job_type": job_type, "df": df, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -270,89 +248,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_active_jobs_serialize(
-            job_type=job_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_active_jobs"],
+            {"job_type": job_type, "df": df, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Job]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_active_jobs_serialize(
-        self,
-        job_type,
-        df,
-        lang,
-        tz,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if job_type is not None:
-            _query_params.append(("jobType", job_type))
-
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/jobs",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -474,38 +377,30 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_activities_serialize(
-            var_class=var_class,
-            before=before,
-            after=after,
-            older_than=older_than,
-            newer_than=newer_than,
-            type=type,
-            status=status,
-            user=user,
-            series_uid=series_uid,
-            df=df,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
-            source_config_uid=source_config_uid,
+        return self.api_client.invoke(
+            OPERATIONS["get_activities"],
+            {
+                "var_class": var_class,
+                "before": before,
+                "after": after,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "type": type,
+                "status": status,
+                "user": user,
+                "series_uid": series_uid,
+                "df": df,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+                "source_config_uid": source_config_uid,
+            },
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_activities_with_http_info(
@@ -626,37 +521,29 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_activities_serialize(
-            var_class=var_class,
-            before=before,
-            after=after,
-            older_than=older_than,
-            newer_than=newer_than,
-            type=type,
-            status=status,
-            user=user,
-            series_uid=series_uid,
-            df=df,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
-            source_config_uid=source_config_uid,
+        return self.api_client.invoke(
+            OPERATIONS["get_activities"],
+            {
+                "var_class": var_class,
+                "before": before,
+                "after": after,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "type": type,
+                "status": status,
+                "user": user,
+                "series_uid": series_uid,
+                "df": df,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+                "source_config_uid": source_config_uid,
+            },
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -778,139 +665,29 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_activities_serialize(
-            var_class=var_class,
-            before=before,
-            after=after,
-            older_than=older_than,
-            newer_than=newer_than,
-            type=type,
-            status=status,
-            user=user,
-            series_uid=series_uid,
-            df=df,
-            page_size=page_size,
-            lang=lang,
-            tz=tz,
-            source_config_uid=source_config_uid,
+        return self.api_client.invoke(
+            OPERATIONS["get_activities"],
+            {
+                "var_class": var_class,
+                "before": before,
+                "after": after,
+                "older_than": older_than,
+                "newer_than": newer_than,
+                "type": type,
+                "status": status,
+                "user": user,
+                "series_uid": series_uid,
+                "df": df,
+                "page_size": page_size,
+                "lang": lang,
+                "tz": tz,
+                "source_config_uid": source_config_uid,
+            },
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ActivitiesResponse",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_activities_serialize(
-        self,
-        var_class,
-        before,
-        after,
-        older_than,
-        newer_than,
-        type,
-        status,
-        user,
-        series_uid,
-        df,
-        page_size,
-        lang,
-        tz,
-        source_config_uid,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if var_class is not None:
-            _query_params.append(("class", var_class))
-
-        if before is not None:
-            _query_params.append(("before", before))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        if older_than is not None:
-            _query_params.append(("olderThan", older_than))
-
-        if newer_than is not None:
-            _query_params.append(("newerThan", newer_than))
-
-        if type is not None:
-            _query_params.append(("type", type))
-
-        if status is not None:
-            _query_params.append(("status", status))
-
-        if user is not None:
-            _query_params.append(("user", user))
-
-        if series_uid is not None:
-            _query_params.append(("seriesUid", series_uid))
-
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        if source_config_uid is not None:
-            _query_params.append(("sourceConfigUid", source_config_uid))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/activities",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -966,28 +743,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_alerts_serialize(
-            source_type=source_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_alerts"],
+            {"source_type": source_type, "df": df, "lang": lang, "tz": tz},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_alerts_with_http_info(
@@ -1042,27 +806,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_alerts_serialize(
-            source_type=source_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_alerts"],
+            {"source_type": source_type, "df": df, "lang": lang, "tz": tz},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1118,89 +869,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_alerts_serialize(
-            source_type=source_type,
-            df=df,
-            lang=lang,
-            tz=tz,
+        return self.api_client.invoke(
+            OPERATIONS["get_alerts"],
+            {"source_type": source_type, "df": df, "lang": lang, "tz": tz},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Alert]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_alerts_serialize(
-        self,
-        source_type,
-        df,
-        lang,
-        tz,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if source_type is not None:
-            _query_params.append(("sourceType", source_type))
-
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        if tz is not None:
-            _query_params.append(("tz", tz))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/alerts",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1247,26 +923,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_automation_scripts_serialize(
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["get_automation_scripts"],
+            {"lang": lang},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AutomationScript]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_automation_scripts_with_http_info(
         self,
@@ -1311,24 +977,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_automation_scripts_serialize(
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["get_automation_scripts"],
+            {"lang": lang},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AutomationScript]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1375,74 +1031,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_automation_scripts_serialize(
-            lang=lang,
+        return self.api_client.invoke(
+            OPERATIONS["get_automation_scripts"],
+            {"lang": lang},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AutomationScript]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_automation_scripts_serialize(
-        self,
-        lang,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if lang is not None:
-            _query_params.append(("lang", lang))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/automation/scripts",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1489,28 +1085,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contact_by_id_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_contact_by_id"],
+            {"id": id},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_contact_by_id_with_http_info(
@@ -1556,27 +1139,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contact_by_id_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_contact_by_id"],
+            {"id": id},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1623,76 +1193,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contact_by_id_serialize(
-            id=id,
+        return self.api_client.invoke(
+            OPERATIONS["get_contact_by_id"],
+            {"id": id},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Contact",
-            "401": None,
-            "403": None,
-            "404": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_contact_by_id_serialize(
-        self,
-        id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if id is not None:
-            _path_params["id"] = id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/contact/{id}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1736,25 +1244,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contacts_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_contacts"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Contact]",
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_contacts_with_http_info(
@@ -1797,24 +1295,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contacts_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_contacts"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Contact]",
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -1858,70 +1346,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_contacts_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_contacts"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Contact]",
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_contacts_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/contacts",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -1970,26 +1402,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_global_custom_fields_serialize(
-            scopes=scopes,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_global_custom_fields"],
+            {"scopes": scopes},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AttributePublicApiDTO]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_device_global_custom_fields_with_http_info(
         self,
@@ -2036,24 +1458,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_global_custom_fields_serialize(
-            scopes=scopes,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_global_custom_fields"],
+            {"scopes": scopes},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AttributePublicApiDTO]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2102,74 +1514,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_device_global_custom_fields_serialize(
-            scopes=scopes,
+        return self.api_client.invoke(
+            OPERATIONS["get_device_global_custom_fields"],
+            {"scopes": scopes},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[AttributePublicApiDTO]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_device_global_custom_fields_serialize(
-        self,
-        scopes,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if scopes is not None:
-            _query_params.append(("scopes", scopes))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/device-custom-fields",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2226,27 +1578,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices"],
+            {"df": df, "page_size": page_size, "after": after},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeWithDetailedReferences]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_devices_with_http_info(
@@ -2302,26 +1642,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices"],
+            {"df": df, "page_size": page_size, "after": after},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeWithDetailedReferences]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2378,84 +1706,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices"],
+            {"df": df, "page_size": page_size, "after": after},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeWithDetailedReferences]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_devices_serialize(
-        self,
-        df,
-        page_size,
-        after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/devices",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2508,27 +1766,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_detailed_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices_detailed"],
+            {"df": df, "page_size": page_size, "after": after},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Device]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_devices_detailed_with_http_info(
@@ -2580,26 +1826,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_detailed_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices_detailed"],
+            {"df": df, "page_size": page_size, "after": after},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Device]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2652,84 +1886,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_devices_detailed_serialize(
-            df=df,
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_devices_detailed"],
+            {"df": df, "page_size": page_size, "after": after},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Device]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_devices_detailed_serialize(
-        self,
-        df,
-        page_size,
-        after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if df is not None:
-            _query_params.append(("df", df))
-
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/devices-detailed",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2773,25 +1937,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_enabled_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_enabled_notification_channels"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_enabled_notification_channels_with_http_info(
         self,
@@ -2833,23 +1988,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_enabled_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_enabled_notification_channels"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -2893,69 +2039,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_enabled_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_enabled_notification_channels"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_enabled_notification_channels_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/notification-channels/enabled",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -2999,26 +2090,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_end_users1_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_end_users1"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[EndUser]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_end_users1_with_http_info(
@@ -3061,25 +2141,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_end_users1_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_end_users1"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[EndUser]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3123,71 +2192,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_end_users1_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_end_users1"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[EndUser]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_end_users1_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/user/end-users",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3231,24 +2243,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_groups_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_groups"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Group]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_groups_with_http_info(
@@ -3291,23 +2294,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_groups_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_groups"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Group]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3351,69 +2345,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_groups_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_groups"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Group]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_groups_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/groups",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3469,27 +2408,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_locations_serialize(
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_locations"],
+            {"page_size": page_size, "after": after},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[LocationWithOrganizationRef]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_locations_with_http_info(
         self,
@@ -3543,25 +2471,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_locations_serialize(
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_locations"],
+            {"page_size": page_size, "after": after},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[LocationWithOrganizationRef]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3617,79 +2534,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_locations_serialize(
-            page_size=page_size,
-            after=after,
+        return self.api_client.invoke(
+            OPERATIONS["get_locations"],
+            {"page_size": page_size, "after": after},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[LocationWithOrganizationRef]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_locations_serialize(
-        self,
-        page_size,
-        after,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/locations",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3733,24 +2585,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_roles_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_node_roles"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeRole]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_node_roles_with_http_info(
@@ -3793,23 +2636,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_roles_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_node_roles"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeRole]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -3853,69 +2687,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_node_roles_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_node_roles"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NodeRole]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_node_roles_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/roles",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -3959,24 +2738,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_notification_channels"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_notification_channels_with_http_info(
@@ -4019,23 +2789,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_notification_channels"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4079,69 +2840,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_notification_channels_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_notification_channels"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[NotificationChannel]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_notification_channels_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/notification-channels",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4202,28 +2908,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations"],
+            {"page_size": page_size, "after": after, "of": of},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Organization]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_organizations_with_http_info(
         self,
@@ -4282,26 +2976,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations"],
+            {"page_size": page_size, "after": after, "of": of},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Organization]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4362,84 +3044,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations"],
+            {"page_size": page_size, "after": after, "of": of},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Organization]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_organizations_serialize(
-        self,
-        page_size,
-        after,
-        of,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        if of is not None:
-            _query_params.append(("of", of))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/organizations",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4500,27 +3112,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_detailed_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations_detailed"],
+            {"page_size": page_size, "after": after, "of": of},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OrganizationDetailed]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_organizations_detailed_with_http_info(
@@ -4580,26 +3180,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_detailed_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations_detailed"],
+            {"page_size": page_size, "after": after, "of": of},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OrganizationDetailed]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4660,84 +3248,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_organizations_detailed_serialize(
-            page_size=page_size,
-            after=after,
-            of=of,
+        return self.api_client.invoke(
+            OPERATIONS["get_organizations_detailed"],
+            {"page_size": page_size, "after": after, "of": of},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[OrganizationDetailed]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_organizations_detailed_serialize(
-        self,
-        page_size,
-        after,
-        of,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if page_size is not None:
-            _query_params.append(("pageSize", page_size))
-
-        if after is not None:
-            _query_params.append(("after", after))
-
-        if of is not None:
-            _query_params.append(("of", of))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/organizations-detailed",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -4781,24 +3299,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policies_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_policies"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Policy]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_policies_with_http_info(
@@ -4841,23 +3350,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policies_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_policies"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Policy]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -4901,69 +3401,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_policies_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_policies"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Policy]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_policies_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/policies",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5007,25 +3452,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scheduled_tasks_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_scheduled_tasks"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[ScheduledTask]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_scheduled_tasks_with_http_info(
         self,
@@ -5067,23 +3503,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scheduled_tasks_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_scheduled_tasks"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[ScheduledTask]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5127,69 +3554,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_scheduled_tasks_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_scheduled_tasks"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[ScheduledTask]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_scheduled_tasks_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/tasks",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5233,24 +3605,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_products_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_software_products"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwareProduct]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_software_products_with_http_info(
@@ -5293,23 +3656,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_products_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_software_products"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwareProduct]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5353,69 +3707,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_software_products_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_software_products"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[SoftwareProduct]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_software_products_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/software-products",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5459,26 +3758,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_technicians_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_technicians"],
+            {},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Technician]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_technicians_with_http_info(
@@ -5521,25 +3809,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_technicians_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_technicians"],
+            {},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Technician]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5583,71 +3860,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_technicians_serialize(
+        return self.api_client.invoke(
+            OPERATIONS["get_technicians"],
+            {},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Technician]",
-            "401": None,
-            "403": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_technicians_serialize(
-        self,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/user/technicians",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5696,27 +3916,16 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_user_roles_serialize(
-            role_type=role_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_user_roles"],
+            {"role_type": role_type},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
         )
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[UserRole]",
-            "401": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
     @validate_call
     def get_user_roles_with_http_info(
         self,
@@ -5763,25 +3972,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_user_roles_serialize(
-            role_type=role_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_user_roles"],
+            {"role_type": role_type},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[UserRole]",
-            "401": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -5830,75 +4028,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_user_roles_serialize(
-            role_type=role_type,
+        return self.api_client.invoke(
+            OPERATIONS["get_user_roles"],
+            {"role_type": role_type},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[UserRole]",
-            "401": None,
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_user_roles_serialize(
-        self,
-        role_type,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if role_type is not None:
-            _query_params.append(("roleType", role_type))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/user/roles",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -5952,26 +4089,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_users_serialize(
-            user_type=user_type,
-            include_roles=include_roles,
+        return self.api_client.invoke(
+            OPERATIONS["get_users"],
+            {"user_type": user_type, "include_roles": include_roles},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[User]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def get_users_with_http_info(
@@ -6024,25 +4150,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_users_serialize(
-            user_type=user_type,
-            include_roles=include_roles,
+        return self.api_client.invoke(
+            OPERATIONS["get_users"],
+            {"user_type": user_type, "include_roles": include_roles},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[User]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6096,79 +4211,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._get_users_serialize(
-            user_type=user_type,
-            include_roles=include_roles,
+        return self.api_client.invoke(
+            OPERATIONS["get_users"],
+            {"user_type": user_type, "include_roles": include_roles},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[User]",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _get_users_serialize(
-        self,
-        user_type,
-        include_roles,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if user_type is not None:
-            _query_params.append(("userType", user_type))
-
-        if include_roles is not None:
-            _query_params.append(("includeRoles", include_roles))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/users",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
 
     @validate_call
@@ -6225,26 +4275,15 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._search_serialize(
-            q=q,
-            limit=limit,
+        return self.api_client.invoke(
+            OPERATIONS["search"],
+            {"q": q, "limit": limit},
+            "data",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceSearchResults",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
         )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
 
     @validate_call
     def search_with_http_info(
@@ -6300,25 +4339,14 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._search_serialize(
-            q=q,
-            limit=limit,
+        return self.api_client.invoke(
+            OPERATIONS["search"],
+            {"q": q, "limit": limit},
+            "http_info",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceSearchResults",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
         )
 
     @validate_call
@@ -6375,77 +4403,12 @@ class SystemApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._search_serialize(
-            q=q,
-            limit=limit,
+        return self.api_client.invoke(
+            OPERATIONS["search"],
+            {"q": q, "limit": limit},
+            "response",
+            _request_timeout=_request_timeout,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DeviceSearchResults",
-        }
-        response_data = self.api_client.call_api(
-            *_param, _request_timeout=_request_timeout
-        )
-        return response_data.response
-
-    def _search_serialize(
-        self,
-        q,
-        limit,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if q is not None:
-            _query_params.append(("q", q))
-
-        if limit is not None:
-            _query_params.append(("limit", limit))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(
-                ["application/json"]
-            )
-
-        # authentication setting
-        _auth_settings: List[str] = ["sessionKey", "oauth2"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/v2/devices/search",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
         )
@@ -16,35 +16,84 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
-import json
+import logging
 import mimetypes
 import os
 import re
 import tempfile
+import threading
 import time
 
 from collections.abc import Callable
 from urllib.parse import quote
 from typing import Any, Tuple, Optional, List, Dict, Union
 
+import urllib3
 from oauthlib.oauth2 import BackendApplicationClient
+import pydantic_core
 from pydantic import SecretStr
 from requests_oauthlib import OAuth2Session
 
 from tl_ninjarmm.configuration import Configuration
-from tl_ninjarmm.api_response import ApiResponse, T as ApiResponseT
+from tl_ninjarmm.api_response import ApiResponse, LeanApiResponse, T as ApiResponseT
 import tl_ninjarmm.models
 from tl_ninjarmm import rest
 from tl_ninjarmm.exceptions import (
     ApiValueError,
     ApiException,
 )
+from tl_ninjarmm.codec import encode_body, resolve_codec
+from tl_ninjarmm.coalescing import COALESCED_METHODS, SingleFlight, request_key
+from tl_ninjarmm.middleware import (
+    make_call,
+    run_after_response,
+    run_before_request,
+    run_on_error,
+)
+from tl_ninjarmm.operations import Operation
+from tl_ninjarmm.decoders import (
+    check_decode_mode,
+    current_decode_mode,
+    paused_gc,
+    response_decoder,
+    trusted_decoder,
+)
+from tl_ninjarmm.retry import RetryEngine
+
+_JSON_CONTENT_TYPE_RE = re.compile(
+    r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE
+)
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
 GetTokenFunc = Callable[[datetime.timedelta], Dict[str, Any]]
 
 
+class _RequestTemplate:
+    """Parts of the requests of an operation that are the same on every call."""
+
+    __slots__ = ("path", "path_params", "accept", "content_type", "has_content_type")
+
+    def __init__(self, client: "ApiClient", operation: Operation) -> None:
+        # "/v2/device/{id}/jobs" becomes "/v2/device/{0}/jobs"
+        path = operation.path.replace("{", "{{").replace("}", "}}")
+        for index, (name, _) in enumerate(operation.path_params):
+            path = path.replace("{{%s}}" % name, "{%d}" % index)
+        self.path = path
+        self.path_params = operation.path_params
+        self.accept = (
+            client.select_header_accept(list(operation.accept))
+            if operation.accept
+            else None
+        )
+        self.has_content_type = operation.content_types is not None
+        self.content_type = (
+            client.select_header_content_type(list(operation.content_types))
+            if operation.content_types is not None
+            else None
+        )
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -74,6 +123,21 @@ class ApiClient:
     }
     _pool = None
     _TOKEN_SKEW = 60  # Refresh token 60 seconds before expiry
+    _TOKEN_RENEWAL_LEAD = 60  # Background renewal starts 60 seconds earlier
+    _TOKEN_RENEWAL_RETRY = 5  # Seconds between failed background renewals
+    # Longest wait between renewals returning tokens already due for renewal
+    _TOKEN_RENEWAL_MAX_BACKOFF = 60
+    # Transport errors the retry policy may retry, and the subset raised
+    # before the request reached the server
+    _TRANSIENT_ERRORS = (urllib3.exceptions.HTTPError,)
+    _CONNECT_ERRORS = (
+        urllib3.exceptions.NewConnectionError,
+        urllib3.exceptions.ConnectTimeoutError,
+    )
+    # Transport and coalescer of the concurrent requests, replaced by the
+    # asyncio client
+    _REST_CLIENT_CLASS = rest.RESTClientObject
+    _COALESCER_CLASS = SingleFlight
 
     def __init__(
         self,
@@ -110,8 +174,28 @@ class ApiClient:
                 )
             )
         self._token = None
-
-        self.rest_client = rest.RESTClientObject(configuration)
+        # Serializes token fetches so that concurrent requests seeing an
+        # expiring token wait for a single refresh
+        self._token_lock = threading.Lock()
+        self._renewal_thread: threading.Thread | None = None
+        self._renewal_stop = threading.Event()
+
+        self.json_codec = resolve_codec(configuration.json_codec)
+        self.rest_client = self._REST_CLIENT_CLASS(configuration)
+        self.coalescer = (
+            self._COALESCER_CLASS() if configuration.coalesce_requests else None
+        )
+        self.metrics = configuration.metrics
+        self.middlewares = list(configuration.middlewares)
+        self.retry_engine = (
+            RetryEngine(
+                configuration.retry_policy,
+                transient_errors=self._TRANSIENT_ERRORS,
+                connect_errors=self._CONNECT_ERRORS,
+            )
+            if configuration.retry_policy is not None
+            else None
+        )
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -119,41 +203,133 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = "OpenAPI-Generator/1.0.0/python"
         self.client_side_validation = configuration.client_side_validation
+        self._request_templates: Dict[Operation, _RequestTemplate] = {}
 
-    def _needs_refresh(self) -> bool:
+    def _is_expiring(self, token, lead: float = 0.0) -> bool:
         return (
-            self._token is None
-            or time.time() > self._token.get("expires_at", 0) - self._TOKEN_SKEW
+            token is None
+            or time.time() > token.get("expires_at", 0) - self._TOKEN_SKEW - lead
         )
 
+    def _needs_refresh(self) -> bool:
+        return self._is_expiring(self._token)
+
     def _refresh_token_if_needed(self) -> None:
         """
         Refresh OAuth2 token if needed (lazy loading with expiry check).
+
+        Only one thread fetches a new token, the others wait for it and reuse
+        the result.
         """
         if not self._needs_refresh():
             return
 
-        if self.get_token is not None:
-            self._token = self.get_token(datetime.timedelta(seconds=self._TOKEN_SKEW))
+        with self._token_lock:
+            if self._needs_refresh():
+                self._fetch_token()
+
+    def _fetch_token(self, lead: float = 0.0) -> None:
+        """Fetches a new token, must be called with `_token_lock` held.
+
+        With a `Configuration.token_store`, the token saved by another process
+        is reused as long as it is valid for `lead` more seconds.
+        """
+        store = self.configuration.token_store
+        if store is None:
+            token = self._request_token()
         else:
-            self._token = self.oauth_session.fetch_token(
-                token_url=self.token_url,
-                client_id=self.configuration.client_id,
-                client_secret=self.configuration.client_secret,
-                scope=self.configuration.token_scope or "monitoring",
-            )
+            with store.lock():
+                token = store.load()
+                if self._is_expiring(token, lead):
+                    token = self._request_token()
+                    if isinstance(token, dict):
+                        store.save(token)
 
         self.configuration.access_token = (
-            self._token.get("access_token")
-            if self._token and isinstance(self._token, dict)
-            else None
+            token.get("access_token") if token and isinstance(token, dict) else None
+        )
+        self._token = token
+
+    def _request_token(self):
+        if self.get_token is not None:
+            return self.get_token(datetime.timedelta(seconds=self._TOKEN_SKEW))
+        return self.oauth_session.fetch_token(
+            token_url=self.token_url,
+            client_id=self.configuration.client_id,
+            client_secret=self.configuration.client_secret,
+            scope=self.configuration.token_scope or "monitoring",
         )
 
+    def start_token_renewal(self) -> None:
+        """Renews the token in a background thread before it expires.
+
+        The token is refreshed `_TOKEN_RENEWAL_LEAD` seconds before requests
+        would consider it expired, so requests never wait for the token
+        endpoint. Failed renewals are retried every `_TOKEN_RENEWAL_RETRY`
+        seconds, requests still refresh the token themselves if it expires.
+        Renewals returning a token already due for renewal are retried after
+        a delay doubling from `_TOKEN_RENEWAL_RETRY` up to
+        `_TOKEN_RENEWAL_MAX_BACKOFF` seconds.
+        """
+        if self._renewal_thread is not None and self._renewal_thread.is_alive():
+            return
+        self._renewal_stop.clear()
+        self._renewal_thread = threading.Thread(
+            target=self._renew_tokens, name="tl_ninjarmm-token-renewal", daemon=True
+        )
+        self._renewal_thread.start()
+
+    def stop_token_renewal(self) -> None:
+        """Stops the background renewal started by `start_token_renewal`."""
+        self._renewal_stop.set()
+        if self._renewal_thread is not None:
+            if self._renewal_thread is not threading.current_thread():
+                self._renewal_thread.join()
+            self._renewal_thread = None
+
+    def _renewal_delay(self) -> float:
+        if self._token is None:
+            return 0.0
+        renew_at = (
+            self._token.get("expires_at", 0)
+            - self._TOKEN_SKEW
+            - self._TOKEN_RENEWAL_LEAD
+        )
+        return max(0.0, renew_at - time.time())
+
+    def _renew_tokens(self) -> None:
+        logger = logging.getLogger("tl_ninjarmm")
+        backoff = self._TOKEN_RENEWAL_RETRY
+        delay = self._renewal_delay()
+        while not self._renewal_stop.wait(delay):
+            try:
+                with self._token_lock:
+                    if self._renewal_delay() == 0:
+                        self._fetch_token(self._TOKEN_RENEWAL_LEAD)
+            except Exception:
+                logger.exception("Background token renewal failed")
+                delay = self._TOKEN_RENEWAL_RETRY
+                continue
+            delay = self._renewal_delay()
+            if delay > 0:
+                backoff = self._TOKEN_RENEWAL_RETRY
+                continue
+            # The new token is already due, e.g. a cached token valid for less
+            # than the lead or one without `expires_at`: asking again at once
+            # would call the token endpoint in a loop
+            logger.warning(
+                "Renewed token is not valid past the renewal lead, "
+                "renewing again in %ss",
+                backoff,
+            )
+            delay = backoff
+            backoff = min(2 * backoff, self._TOKEN_RENEWAL_MAX_BACKOFF)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.stop_token_renewal()
 
     @property
     def user_agent(self):
@@ -195,6 +371,247 @@ class ApiClient:
         """
         cls._default = default
 
+    def invoke(
+        self,
+        operation: Operation,
+        params: Dict[str, Any],
+        result: str = "data",
+        _request_timeout=None,
+        _request_auth=None,
+        _content_type=None,
+        _headers=None,
+    ) -> Any:
+        """Calls a generated operation.
+
+        Every generated API method goes through here.
+
+        :param operation: the operation, from `OPERATIONS`.
+        :param params: the arguments of the operation.
+        :param result: `"data"` for the decoded response data, `"http_info"`
+            for the `ApiResponse` or `"response"` for the raw response.
+        :return: the result of the call.
+        """
+        timer = None if self.metrics is None else self.metrics.start(operation)
+        try:
+            if timer is not None:
+                self._refresh_token_if_needed()
+                timer.lap()
+            _param = self.operation_serialize(
+                operation, params, _request_auth, _content_type, _headers
+            )
+            if timer is not None:
+                timer.lap()
+                timer.sent(_param[3])
+            if result == "response":
+                if self.middlewares:
+                    response_data = self._call_with_middlewares(
+                        operation, _param, _request_timeout, timer, preload=False
+                    )
+                else:
+                    response_data = self.call_api(
+                        *_param, _request_timeout=_request_timeout
+                    )
+                if timer is not None:
+                    timer.status = response_data.status
+                return response_data.response
+            if self.coalescer is not None and operation.method in COALESCED_METHODS:
+                method, url, headers = _param[:3]
+                decode_mode = current_decode_mode(self.configuration.decode_mode)
+                api_response = self.coalescer.do(
+                    request_key(method, url, headers, decode_mode),
+                    lambda: self._call_and_deserialize(
+                        operation, _param, _request_timeout, timer
+                    ),
+                )
+            else:
+                api_response = self._call_and_deserialize(
+                    operation, _param, _request_timeout, timer
+                )
+            if timer is not None:
+                timer.status = api_response.status_code
+            return api_response.data if result == "data" else api_response
+        except ApiException as e:
+            if timer is not None:
+                timer.status = e.status
+            raise
+        finally:
+            if timer is not None:
+                # Coalesced calls record their wait as their network phase
+                timer.stop()
+
+    def _call_and_deserialize(self, operation, _param, _request_timeout, timer=None):
+        if self.middlewares:
+            return self._call_with_middlewares(
+                operation, _param, _request_timeout, timer
+            )
+        response_data = self.call_api(*_param, _request_timeout=_request_timeout)
+        response_data.read()
+        if timer is not None:
+            timer.lap()
+            timer.received(response_data.status, response_data.data)
+        return self.response_deserialize(
+            response_data=response_data,
+            response_types_map=operation.response_types,
+        )
+
+    def _call_with_middlewares(
+        self, operation, _param, _request_timeout, timer, preload=True
+    ):
+        """`_call_and_deserialize` through the hooks of `self.middlewares`.
+
+        Returns the undecoded `RESTResponse` when `preload` is off.
+        """
+        call = make_call(operation, _param)
+        try:
+            run_before_request(self.middlewares, call)
+            if call.response is None:
+                call.response = self.call_api(
+                    call.method,
+                    call.url,
+                    call.headers,
+                    call.body,
+                    call.post_params,
+                    _request_timeout=_request_timeout,
+                )
+            if preload:
+                call.response.read()
+                if timer is not None:
+                    timer.lap()
+                    timer.received(call.response.status, call.response.data)
+                call.api_response = self.response_deserialize(
+                    response_data=call.response,
+                    response_types_map=operation.response_types,
+                )
+        except Exception as e:
+            run_on_error(self.middlewares, call, e)
+            raise
+        run_after_response(self.middlewares, call)
+        return call.api_response if preload else call.response
+
+    def operation_serialize(
+        self,
+        operation: Operation,
+        params: Dict[str, Any],
+        _request_auth=None,
+        _content_type=None,
+        _headers=None,
+    ) -> RequestSerialized:
+        """Builds the HTTP request params of a generated operation.
+
+        Builds the same request as `param_serialize` does, from a template of
+        the operation compiled on its first call: the path is formatted in a
+        single pass and the arguments of the common types (`str`, `int`) skip
+        `sanitize_for_serialization`. The caller's `_headers` are not
+        modified.
+
+        :param operation: the operation, from `OPERATIONS`.
+        :param params: the arguments of the operation.
+        :return: the request params, see `param_serialize`.
+        """
+        # Treeline Change
+        self._refresh_token_if_needed()
+
+        template = self._request_templates.get(operation)
+        if template is None:
+            template = _RequestTemplate(self, operation)
+            self._request_templates[operation] = template
+        collection_formats = operation.collection_formats
+
+        # header parameters
+        header_params = dict(_headers) if _headers else {}
+        if template.accept is not None and "Accept" not in header_params:
+            header_params["Accept"] = template.accept
+        if _content_type and template.has_content_type:
+            header_params["Content-Type"] = _content_type
+        elif template.content_type is not None:
+            header_params["Content-Type"] = template.content_type
+        header_params.update(self.default_headers)
+        if self.cookie:
+            header_params["Cookie"] = self.cookie
+        if collection_formats or any(
+            type(value) is not str for value in header_params.values()
+        ):
+            header_params = dict(
+                self.parameters_to_tuples(
+                    self.sanitize_for_serialization(header_params),
+                    collection_formats,
+                )
+            )
+
+        # path parameters
+        resource_path = template.path
+        if template.path_params:
+            safe = self.configuration.safe_chars_for_path_param
+            values = []
+            for name, arg in template.path_params:
+                value = params[arg]
+                if value is None:
+                    values.append("{%s}" % name)
+                elif type(value) is int:
+                    values.append(str(value))
+                elif type(value) is str and name not in collection_formats:
+                    values.append(quote(value, safe=safe))
+                else:
+                    ((_, value),) = self.parameters_to_tuples(
+                        [(name, self.sanitize_for_serialization(value))],
+                        collection_formats,
+                    )
+                    values.append(quote(str(value), safe=safe))
+            resource_path = resource_path.format(*values)
+
+        # query parameters
+        query = []
+        for name, arg in operation.query_params:
+            value = params[arg]
+            if value is None:
+                continue
+            if type(value) is int and name not in collection_formats:
+                query.append(f"{name}={value}")
+            elif type(value) is str and name not in collection_formats:
+                query.append(f"{name}={quote(value)}")
+            else:
+                query.append(
+                    self.parameters_to_url_query(
+                        [(name, self.sanitize_for_serialization(value))],
+                        collection_formats,
+                    )
+                )
+
+        # body, JSON bodies are encoded right away
+        body = None
+        if operation.body_param is not None:
+            body = params[operation.body_param]
+            content_type = header_params.get("Content-Type")
+            if body is not None and (
+                not content_type or re.search("json", content_type, re.IGNORECASE)
+            ):
+                body = encode_body(body, self.json_codec)
+            elif body:
+                body = self.sanitize_for_serialization(body)
+
+        # auth setting
+        auth_queries: List[Tuple[str, str]] = []
+        self.update_params_for_auth(
+            header_params,
+            auth_queries,
+            operation.auth_settings,
+            resource_path,
+            operation.method,
+            body,
+            request_auth=_request_auth,
+        )
+        if auth_queries:
+            query.append(
+                self.parameters_to_url_query(
+                    self.sanitize_for_serialization(auth_queries), collection_formats
+                )
+            )
+
+        url = self.configuration.host + resource_path
+        if query:
+            url += "?" + "&".join(query)
+        return operation.method, url, header_params, body, []
+
     def param_serialize(
         self,
         method,
@@ -236,7 +653,7 @@ class ApiClient:
         self._refresh_token_if_needed()
 
         # header parameters
-        header_params = header_params or {}
+        header_params = dict(header_params) if header_params else {}
         header_params.update(self.default_headers)
         if self.cookie:
             header_params["Cookie"] = self.cookie
@@ -266,6 +683,7 @@ class ApiClient:
                 post_params.extend(self.files_parameters(files))
 
         # auth setting
+        query_params = list(query_params) if query_params else []
         self.update_params_for_auth(
             header_params,
             query_params,
@@ -316,9 +734,9 @@ class ApiClient:
         :return: RESTResponse
         """
 
-        try:
+        def send():
             # Use single transport (rest_client) for all requests
-            response_data = self.rest_client.request(
+            return self.rest_client.request(
                 method,
                 url,
                 headers=header_params,
@@ -326,7 +744,11 @@ class ApiClient:
                 post_params=post_params,
                 _request_timeout=_request_timeout,
             )
-            return response_data
+
+        try:
+            if self.retry_engine is None:
+                return send()
+            return self.retry_engine.call(method, url, send)
 
         except ApiException as e:
             raise e
@@ -335,11 +757,12 @@ class ApiClient:
         self,
         response_data: rest.RESTResponse,
         response_types_map: Optional[Dict[str, ApiResponseT]] = None,
-    ) -> ApiResponse[ApiResponseT]:
+    ) -> Union[ApiResponse[ApiResponseT], LeanApiResponse[ApiResponseT]]:
         """Deserializes response into an object.
         :param response_data: RESTResponse object to be deserialized.
         :param response_types_map: dict of response types.
-        :return: ApiResponse
+        :return: ApiResponse, or LeanApiResponse if
+            `Configuration.lean_responses` is on
         """
 
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
@@ -370,10 +793,34 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(
-                    response_text, response_type, content_type
-                )
+                decoder = None
+                if (
+                    200 <= response_data.status <= 299
+                    and response_data.data
+                    and encoding.lower() in ("utf-8", "utf8")
+                    and content_type is not None
+                    and _JSON_CONTENT_TYPE_RE.match(content_type)
+                ):
+                    decoder = response_decoder(response_type)
+                if decoder is not None:
+                    return_data = self._decode_json(
+                        response_data.data, response_type, decoder
+                    )
+                elif (
+                    200 <= response_data.status <= 299
+                    and encoding.lower() in ("utf-8", "utf8")
+                    and content_type is not None
+                    and _JSON_CONTENT_TYPE_RE.match(content_type)
+                ):
+                    # JSON codecs decode the bytes, no need for a text copy
+                    return_data = self.deserialize(
+                        response_data.data, response_type, content_type
+                    )
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(
+                        response_text, response_type, content_type
+                    )
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -382,6 +829,13 @@ class ApiClient:
                     data=return_data,
                 )
 
+        if self.configuration.lean_responses:
+            return LeanApiResponse(
+                status_code=response_data.status,
+                headers=response_data.getheaders(),
+                data=return_data,
+                raw_data=return_data if response_type == "bytearray" else None,
+            )
         return ApiResponse(
             status_code=response_data.status,
             data=return_data,
@@ -389,6 +843,55 @@ class ApiClient:
             raw_data=response_data.data,
         )
 
+    def _decode_json(self, data: bytes, response_type: str, decoder) -> Any:
+        """Decodes a JSON body according to the decode mode in effect."""
+        mode = current_decode_mode(self.configuration.decode_mode)
+        if mode == "validate":
+            # Parse and validate the raw body in a single pass
+            return decoder.validate_json(data)
+        check_decode_mode(mode)
+        with paused_gc():
+            if mode == "dict":
+                return pydantic_core.from_json(data)
+            return trusted_decoder(response_type).validate_json(data)
+
+    def decode_parsed(self, data: Any, response_type: str) -> Any:
+        """Decodes parsed JSON, e.g. rows read ahead by a paginator, the way
+        `response_deserialize` decodes a body according to the decode mode in
+        effect.
+
+        :param data: the parsed JSON.
+        :param response_type: the type of `data`, e.g. `"List[Device]"`.
+        :return: the decoded data.
+        """
+        mode = current_decode_mode(self.configuration.decode_mode)
+        check_decode_mode(mode)
+        if mode == "dict":
+            return data
+        if mode == "construct":
+            decoder = trusted_decoder(response_type)
+            if decoder is not None:
+                with paused_gc():
+                    return decoder.validate_python(data)
+        else:
+            decoder = response_decoder(response_type)
+            if decoder is not None:
+                return decoder.validate_python(data)
+        return self.__deserialize(data, response_type)
+
+    def decode_json(self, data: bytes, response_type: str) -> Any:
+        """Decodes a JSON body the way `response_deserialize` does, see
+        `decode_parsed`.
+
+        :param data: the raw body.
+        :param response_type: the type of the body, e.g. `"List[Device]"`.
+        :return: the decoded data.
+        """
+        decoder = response_decoder(response_type)
+        if decoder is None:
+            return self.decode_parsed(self.json_codec.loads(data), response_type)
+        return self._decode_json(data, response_type, decoder)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -444,11 +947,15 @@ class ApiClient:
         }
 
     def deserialize(
-        self, response_text: str, response_type: str, content_type: Optional[str]
+        self,
+        response_text: Union[str, bytes],
+        response_type: str,
+        content_type: Optional[str],
     ):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: body of the response, the JSON codecs also
+            decode the UTF-8 encoded bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -459,18 +966,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(
-            r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)",
-            content_type,
-            re.IGNORECASE,
-        ):
-            if response_text == "":
+        elif _JSON_CONTENT_TYPE_RE.match(content_type):
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = self.json_codec.loads(response_text)
         elif re.match(r"^text\/[a-z.+-]+\s*(;|$)", content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -570,7 +1073,7 @@ class ApiClient:
             if isinstance(v, (int, float)):
                 v = str(v)
             if isinstance(v, dict):
-                v = json.dumps(v)
+                v = self.json_codec.dumps(v).decode()
 
             if k in collection_formats:
                 collection_format = collection_formats[k]
@@ -683,8 +1186,9 @@ class ApiClient:
                 headers, queries, resource_path, method, body, request_auth
             )
         else:
+            configured_auth_settings = self.configuration.auth_settings()
             for auth in auth_settings:
-                auth_setting = self.configuration.auth_settings().get(auth)
+                auth_setting = configured_auth_settings.get(auth)
                 if auth_setting:
                     self._apply_auth_params(
                         headers, queries, resource_path, method, body, auth_setting
@@ -1,7 +1,7 @@
 """API response object."""
 
 from __future__ import annotations
-from typing import Optional, Generic, Mapping, TypeVar
+from typing import Any, Optional, Generic, Mapping, TypeVar
 from pydantic import Field, StrictInt, StrictBytes, BaseModel
 
 T = TypeVar("T")
@@ -18,3 +18,37 @@ class ApiResponse(BaseModel, Generic[T]):
     raw_data: StrictBytes = Field(description="Raw data (HTTP response body)")
 
     model_config = {"arbitrary_types_allowed": True}
+
+
+class LeanApiResponse(Generic[T]):
+    """
+    API response object returned when `Configuration.lean_responses` is on
+
+    The body is not kept once decoded: `raw_data` is None unless the response
+    data is the body itself, e.g. for `bytearray` responses. `headers` is the
+    header mapping of the HTTP response, not validated nor copied.
+    """
+
+    __slots__ = ("status_code", "headers", "data", "raw_data")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Mapping[str, str]],
+        data: T,
+        raw_data: Optional[bytes] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.data = data
+        self.raw_data = raw_data
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, LeanApiResponse):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return f"LeanApiResponse(status_code={self.status_code!r}, data={self.data!r})"
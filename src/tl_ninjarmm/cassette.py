@@ -0,0 +1,237 @@
+"""Recording and replaying of the HTTP exchanges of a client.
+
+With a `Cassette` set as `Configuration.cassette`, the transport
+(`RESTClientObject`, sync and asyncio) either records every request it sends
+and its response (`mode="record"`), or answers its requests with the
+recorded responses without any network (`mode="replay"`). Paginators,
+caches, rate limiters and decoders run on top of the cassette as they do on
+top of the network, which makes benchmarks and load tests on real traffic
+deterministic.
+
+A cassette is stored as gzip compressed JSON lines, one exchange per line
+with the method, URL and headers of the request, the status, headers and
+body of the response, and the time it took. `Authorization` and cookie
+headers are not recorded.
+
+The sync transport records a response body as the caller reads it, so that
+streamed responses (`tl_ninjarmm.streaming`) stay streamed while recording:
+the exchange is recorded once the body has been read to the end, and not at
+all if the response is closed before. The asyncio transport reads the whole
+body before returning the response.
+
+Replayed requests are matched by method, path and query, regardless of the
+host, and the identical requests get the successive responses recorded for
+them, the last one repeating. Each response is delayed by its recorded time
+multiplied by `latency_scale`, 0 replays without any delay. Replaying needs
+no credentials: give the client `offline_token` as `get_token`.
+"""
+
+import base64
+import datetime
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Mapping, Tuple
+from urllib.parse import urlsplit
+
+from tl_ninjarmm.exceptions import ApiException, ApiValueError
+
+# Headers holding credentials or describing the transfer rather than the
+# response, whose body is recorded decoded
+_UNRECORDED_HEADERS = frozenset(
+    {
+        "authorization",
+        "connection",
+        "content-encoding",
+        "content-length",
+        "cookie",
+        "keep-alive",
+        "set-cookie",
+        "transfer-encoding",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """A request and its response, as recorded."""
+
+    method: str
+    """HTTP method of the request"""
+    url: str
+    """URL of the request"""
+    request_headers: Dict[str, str]
+    """Headers of the request, without the credentials"""
+    status: int
+    """Status code of the response"""
+    headers: Dict[str, str]
+    """Headers of the response"""
+    body: bytes
+    """Body of the response, decoded from its content encoding"""
+    elapsed: float
+    """Seconds from sending the request to receiving the whole response"""
+
+    def to_json(self) -> Dict[str, Any]:
+        line: Dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "request_headers": self.request_headers,
+            "status": self.status,
+            "headers": self.headers,
+            "elapsed": round(self.elapsed, 6),
+        }
+        try:
+            line["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            line["body_base64"] = base64.b64encode(self.body).decode("ascii")
+        return line
+
+    @classmethod
+    def from_json(cls, line: Mapping[str, Any]) -> "Exchange":
+        if "body_base64" in line:
+            body = base64.b64decode(line["body_base64"])
+        else:
+            body = line["body"].encode("utf-8")
+        return cls(
+            method=line["method"],
+            url=line["url"],
+            request_headers=line["request_headers"],
+            status=line["status"],
+            headers=line["headers"],
+            body=body,
+            elapsed=line["elapsed"],
+        )
+
+
+def offline_token(skew: datetime.timedelta) -> Dict[str, Any]:
+    """A `get_token` for the clients replaying a cassette, which never expires."""
+    return {"access_token": "offline", "expires_at": time.time() + 10 * 365 * 86400}
+
+
+def recorded_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Returns the headers to record, without credentials nor transfer ones."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _UNRECORDED_HEADERS
+    }
+
+
+def _match_key(method: str, url: str) -> Tuple[str, str]:
+    parts = urlsplit(url)
+    return method, f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class Cassette:
+    """The recorded exchanges of a client.
+
+    :param path: file of the cassette, read when replaying and written by
+        `save` when recording.
+    :param mode: `"record"` to record the exchanges sent over the network,
+        `"replay"` to answer the requests with the recorded ones.
+    :param latency_scale: factor of the recorded time by which replayed
+        responses are delayed, 0 for no delay.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: Literal["record", "replay"] = "replay",
+        latency_scale: float = 1.0,
+    ) -> None:
+        if mode not in ("record", "replay"):
+            raise ApiValueError(f"Unknown cassette mode {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.exchanges: List[Exchange] = []
+        self._recorded: Dict[Tuple[str, str], List[Exchange]] = {}
+        self._replayed: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            for exchange in self.load(path):
+                self._add(exchange)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def load(path: str) -> List[Exchange]:
+        """Reads the exchanges of a cassette file."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return [Exchange.from_json(json.loads(line)) for line in file if line]
+
+    def save(self) -> None:
+        """Writes the recorded exchanges to `path`, atomically."""
+        with self._lock:
+            exchanges = list(self.exchanges)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cassette-")
+        try:
+            with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as file:
+                for exchange in exchanges:
+                    file.write(json.dumps(exchange.to_json(), separators=(",", ":")))
+                    file.write("\n")
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _add(self, exchange: Exchange) -> None:
+        self.exchanges.append(exchange)
+        key = _match_key(exchange.method, exchange.url)
+        self._recorded.setdefault(key, []).append(exchange)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        request_headers: Mapping[str, str],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        elapsed: float,
+    ) -> Exchange:
+        """Adds an exchange sent over the network to the cassette."""
+        exchange = Exchange(
+            method=method,
+            url=url,
+            request_headers=recorded_headers(request_headers),
+            status=status,
+            headers=recorded_headers(headers),
+            body=body,
+            elapsed=elapsed,
+        )
+        with self._lock:
+            self._add(exchange)
+        return exchange
+
+    def replay(self, method: str, url: str) -> Exchange:
+        """Returns the recorded exchange answering a request.
+
+        :raises ApiException: if no such request was recorded.
+        """
+        key = _match_key(method, url)
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if not recorded:
+                raise ApiException(
+                    status=0, reason=f"No recorded response for {method} {url}"
+                )
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+        return recorded[min(index, len(recorded) - 1)]
+
+    def delay(self, exchange: Exchange) -> float:
+        """Returns how long to wait before replaying `exchange`, in seconds."""
+        return exchange.elapsed * self.latency_scale
+
+    def rewind(self) -> None:
+        """Replays the recorded responses from the first ones again."""
+        with self._lock:
+            self._replayed.clear()
@@ -0,0 +1,122 @@
+"""Coalescing of identical concurrent reads.
+
+Dashboards often trigger the same read, e.g. `SystemApi.get_device`, many
+times within a few milliseconds. With `Configuration.coalesce_requests` on,
+`ApiClient.invoke` sends a single request for the identical `GET` calls in
+flight at the same time (same URL and headers, hence same credentials, and
+same decode mode) and hands its decoded response, or its error, to every one
+of them.
+
+The callers then share the same model objects, which they must not modify.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """Snapshot of the counters of a coalescer."""
+
+    calls: int
+    """Requests sent on behalf of one or more calls"""
+    coalesced: int
+    """Calls served by the request of another call"""
+    in_flight: int
+    """Requests currently awaited"""
+
+
+def request_key(
+    method: str, url: str, headers: Mapping[str, str], decode_mode: str
+) -> Tuple[Hashable, ...]:
+    """Returns what identical requests have in common."""
+    return (method, url, tuple(sorted(headers.items())), decode_mode)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs a single call at a time per key, for threads.
+
+    The thread arriving first runs the call, the threads arriving while it
+    runs wait for its outcome.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._flights: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def stats(self) -> CoalescingStats:
+        with self._lock:
+            return CoalescingStats(self.calls, self.coalesced, len(self._flights))
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Returns the result of `call`, or of the identical call in flight.
+
+        :param key: identifies identical calls, see `request_key`.
+        :param call: sends the request and decodes the response.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight(SingleFlight):
+    """asyncio variant of :class:`SingleFlight`.
+
+    The call runs in a task of its own, so cancelling the caller that started
+    it does not cancel it for the others.
+    """
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._land(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _land(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Retrieved even when all the callers were cancelled
+            task.exception()
@@ -0,0 +1,187 @@
+"""JSON codecs.
+
+`Configuration.json_codec` selects the library encoding and decoding JSON
+outside of the compiled response decoders: `ApiClient.deserialize`, the REST
+clients, query parameters, pagination, streaming and the models' `to_json` and
+`from_json`. The default, `"auto"`, uses the fastest library installed among
+orjson, msgspec and ujson and falls back to the standard library `json`.
+Codecs decode straight from the response `bytes`.
+
+The generic request path turns a model into a dict with `to_dict`, walks that
+dict again in `ApiClient.sanitize_for_serialization` and finally encodes it
+with `json.dumps` in the REST client. `encode_body` instead encodes the
+`to_dict` output of the models with the configured codec straight to compact
+JSON bytes that are sent as is, without walking it in Python.
+"""
+
+import functools
+import json
+from typing import Any, Optional, Union
+
+import pydantic_core
+
+from tl_ninjarmm.exceptions import ApiValueError
+
+
+class JsonCodec:
+    """Compact JSON encoding and decoding with the standard library `json`."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a JSON value to UTF-8 bytes."""
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document, raises a `ValueError` if it is invalid."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._orjson.dumps(value, option=self._options)
+        except TypeError:
+            # e.g. integers over 64 bits or `Decimal`s
+            return super().dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._encoder.encode(value)
+        except (TypeError, self._msgspec.EncodeError):
+            return super().dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec backed by ujson."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._ujson.dumps(
+                value, ensure_ascii=False, escape_forward_slashes=False
+            ).encode()
+        except (TypeError, OverflowError):
+            return super().dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS = {
+    codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, UjsonCodec, JsonCodec)
+}
+"""Codecs by name, in order of preference of `"auto"`"""
+
+
+@functools.lru_cache(maxsize=None)
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Returns the codec of a name.
+
+    :param name: `"auto"` or the name of a codec of `CODECS`.
+    :return: the codec, shared by all callers.
+    :raise ImportError: if the library of the codec is not installed.
+    """
+    if name == "auto":
+        for codec in CODECS.values():
+            try:
+                return codec()
+            except ImportError:
+                continue
+    if name not in CODECS:
+        raise ApiValueError(
+            f"Unknown JSON codec {name!r}, expected auto or one of {', '.join(CODECS)}"
+        )
+    return CODECS[name]()
+
+
+def resolve_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """Returns the codec a `Configuration.json_codec` value stands for."""
+    return codec if isinstance(codec, JsonCodec) else get_codec(codec)
+
+
+def default_codec() -> JsonCodec:
+    """Returns the codec of the default `Configuration`.
+
+    Used by the models, which have no client to take a configuration from.
+    """
+    from tl_ninjarmm.configuration import Configuration
+
+    return resolve_codec(Configuration.get_default().json_codec)
+
+
+def json_dumps(value: Any) -> str:
+    """Encodes a JSON value with the default codec, see `default_codec`."""
+    return default_codec().dumps(value).decode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decodes a JSON document with the default codec, see `default_codec`."""
+    return default_codec().loads(data)
+
+
+def _to_dict(value: Any) -> Any:
+    """Returns a body with its models replaced by their `to_dict` output."""
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if callable(to_dict) else value
+
+
+def encode_body(value: Any, codec: Optional[JsonCodec] = None) -> bytes:
+    """Encodes a request body to compact JSON.
+
+    Models are encoded as their `to_dict` output, so without their `None`
+    and readOnly fields, while `None` values of plain dicts are kept, as
+    `sanitize_for_serialization` does.
+
+    :param value: the body, a model, a list or dict of models or a JSON value.
+    :param codec: the codec of the client, `default_codec` if None.
+    :return: the UTF-8 encoded JSON.
+    """
+    value = _to_dict(value)
+    try:
+        return (codec or default_codec()).dumps(value)
+    except (TypeError, ValueError):
+        # Values the codec cannot encode, e.g. dates or enums for `json`
+        return pydantic_core.to_json(value)
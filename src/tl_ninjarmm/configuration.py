@@ -18,11 +18,30 @@ import logging
 from logging import FileHandler
 import multiprocessing
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+)
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+if TYPE_CHECKING:
+    from tl_ninjarmm.cassette import Cassette
+    from tl_ninjarmm.codec import JsonCodec
+    from tl_ninjarmm.hedging import HedgePolicy
+    from tl_ninjarmm.http_cache import CachePolicy
+    from tl_ninjarmm.metrics import MetricsRegistry
+    from tl_ninjarmm.middleware import Middleware
+    from tl_ninjarmm.retry import RetryPolicy
+    from tl_ninjarmm.token_store import TokenStore
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     "multipleOf",
@@ -341,8 +360,81 @@ class Configuration:
         self.retries = retries
         """Adding retries to override urllib3 default value 3
         """
-        # Enable client side validation
+        self.rate_limit: Optional[float] = None
+        """Requests per second allowed by the client side rate limiter.
+           None disables the limiter unless `endpoint_rate_limits` is set.
+           The rate adapts to the server: it halves on every 429 response
+           and grows back to this value on successful responses.
+        """
+        self.rate_limit_burst: Optional[float] = None
+        """How many requests the rate limiter sends at once, defaults to
+           `rate_limit`
+        """
+        self.endpoint_rate_limits: Dict[str, float] = {}
+        """Requests per second per URL path pattern (`fnmatch` syntax,
+           e.g. `/v2/queries/*`), applied on top of `rate_limit`
+        """
+        self.rate_limit_max_retries = 3
+        """How many times a throttled (429) request is sent again once the
+           `Retry-After` delay has passed, when the rate limiter is enabled.
+           Ignored when the `retry_policy` retries 429 responses.
+        """
+        self.retry_policy: Optional["RetryPolicy"] = None
+        """Retries and per endpoint circuit breakers around `call_api`, see
+           `tl_ninjarmm.retry.RetryPolicy`. None disables them. When it
+           retries 429 responses, the rate limiter does not.
+        """
+        self.coalesce_requests = False
+        """Send a single request for identical `GET` calls in flight at the
+           same time and share its decoded response, see
+           `tl_ninjarmm.coalescing`
+        """
+        self.cache_policy: Optional["CachePolicy"] = None
+        """Caching of the responses of the reference endpoints, see
+           `tl_ninjarmm.http_cache.CachePolicy`. None disables the cache.
+        """
+        self.hedge_policy: Optional["HedgePolicy"] = None
+        """Hedging of the `GET` requests slower than usual, see
+           `tl_ninjarmm.hedging.HedgePolicy`. None disables it.
+        """
+        self.metrics: Optional["MetricsRegistry"] = None
+        """Registry recording the latencies, statuses and sizes of the calls
+           of every operation, see `tl_ninjarmm.metrics`. None disables it.
+        """
+        self.middlewares: List["Middleware"] = []
+        """Hooks called around the requests of the generated operations, in
+           order, see `tl_ninjarmm.middleware`. Read by the clients when they
+           are created.
+        """
+        self.cassette: Optional["Cassette"] = None
+        """Records the HTTP exchanges of the clients, or replays recorded ones
+           without any network, see `tl_ninjarmm.cassette`. None disables it.
+        """
+        self.token_store: Optional["TokenStore"] = None
+        """OAuth2 token shared with the other processes of the host, see
+           `tl_ninjarmm.token_store`. None keeps the token in the client.
+        """
         self.client_side_validation = True
+        """Validates the arguments of the API methods against their annotations.
+           When off, the APIs created afterwards call their operations with
+           the arguments as is, skipping the pydantic `validate_call` overhead.
+        """
+        self.decode_mode: Literal["validate", "construct", "dict"] = "validate"
+        """How JSON responses are decoded. "validate" builds validated models,
+           "construct" builds models without validating the response and
+           "dict" returns the parsed JSON as is. Can be overridden for a block
+           of calls with `tl_ninjarmm.decoders.decoding`.
+        """
+        self.lean_responses = False
+        """Return a `LeanApiResponse` from the `*_with_http_info` methods, which
+           does not keep the response body once decoded nor copy the headers.
+        """
+        self.json_codec: Union[str, "JsonCodec"] = "auto"
+        """JSON library used outside of the compiled response decoders, see
+           `tl_ninjarmm.codec`: "auto", "orjson", "msgspec", "ujson", "json"
+           or a `JsonCodec`. "auto" picks the fastest one installed. Read by
+           the clients when they are created.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -361,10 +453,29 @@ class Configuration:
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ("logger", "logger_file_handler"):
+            if k not in (
+                "logger",
+                "logger_file_handler",
+                "token_store",
+                "json_codec",
+                "cache_policy",
+                "metrics",
+                "middlewares",
+                "cassette",
+            ):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # the token store is shared between processes, copies use it too
+        result.token_store = self.token_store
+        result.json_codec = self.json_codec
+        # as is the storage of the cached responses
+        result.cache_policy = self.cache_policy
+        # and the metrics registry and the middlewares, in a list of their own
+        result.metrics = self.metrics
+        result.middlewares = list(self.middlewares)
+        # a cassette records or replays the exchanges of all the copies
+        result.cassette = self.cassette
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -0,0 +1,257 @@
+"""Compiled decoders of the response types of the generated operations.
+
+The generated operations describe their responses with type strings such as
+`"List[Device]"`. `ApiClient.deserialize` parses those strings again on every
+response, decodes the body with `json.loads` and then builds the models with
+their generated `from_dict`, which builds every nested model with its own
+`from_dict` before validating the result once more.
+
+`response_decoder` turns a type string into a pydantic `TypeAdapter` once and
+caches it, so that a response body is parsed and validated in a single pass
+by pydantic-core, straight from the raw bytes.
+
+Models decoded this way only count the fields present in the response in
+`model_fields_set`, where `from_dict` marks every field as set. `to_dict` and
+`to_json` return the same output either way as they leave out `None` values.
+
+For trusted bulk reads `trusted_decoder` builds the models the way
+`model_construct` does, skipping validation and the enum `field_validator`s
+altogether, in a single pass of pydantic-core straight from the raw bytes.
+Validating is cheap next to allocating the models though: the trusted decoding
+mostly wins by pausing the garbage collector, which a large response otherwise
+sets off over and over. See `Configuration.decode_mode`.
+"""
+
+import contextlib
+import contextvars
+import datetime
+import functools
+import gc
+import re
+import types
+import typing
+from collections.abc import Callable, Iterator
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import CoreSchema, SchemaValidator, core_schema
+
+import tl_ninjarmm.models
+from tl_ninjarmm.exceptions import ApiValueError
+
+_LIST_RE = re.compile(r"List\[(.*)]$")
+_DICT_RE = re.compile(r"Dict\[([^,]*), (.*)]$")
+
+_NATIVE_TYPES = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "object": Any,
+}
+
+# Types `ApiClient.deserialize` decodes more leniently than pydantic does
+# (e.g. dates parsed with `dateutil`), they keep going through it.
+_LENIENT_TYPES = {"date", "datetime", "decimal"}
+
+
+def compile_type(type_name: str) -> Any:
+    """Returns the Python type a response type string stands for.
+
+    :param type_name: a response type, e.g. `"List[Device]"`.
+    :return: the type, e.g. `List[Device]`, or None if responses of this type
+        must be decoded by `ApiClient.deserialize`.
+    """
+    match = _LIST_RE.match(type_name)
+    if match:
+        item_type = compile_type(match.group(1))
+        return None if item_type is None else List[item_type]
+    match = _DICT_RE.match(type_name)
+    if match:
+        value_type = compile_type(match.group(2))
+        return None if value_type is None else Dict[str, value_type]
+    if type_name in _NATIVE_TYPES:
+        return _NATIVE_TYPES[type_name]
+    if type_name in _LENIENT_TYPES:
+        return None
+    return getattr(tl_ninjarmm.models, type_name, None)
+
+
+@functools.lru_cache(maxsize=None)
+def response_decoder(type_name: str) -> Optional[TypeAdapter]:
+    """Returns the cached `TypeAdapter` decoding responses of a type.
+
+    :param type_name: a response type, e.g. `"List[Device]"`.
+    :return: the adapter, or None if the type cannot be compiled.
+    """
+    compiled = compile_type(type_name)
+    return None if compiled is None else TypeAdapter(compiled)
+
+
+DECODE_MODES = ("validate", "construct", "dict")
+
+_decode_mode: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "tl_ninjarmm_decode_mode", default=None
+)
+
+
+def check_decode_mode(mode: str) -> None:
+    if mode not in DECODE_MODES:
+        raise ApiValueError(
+            f"Invalid decode mode {mode!r}, expected one of {', '.join(DECODE_MODES)}"
+        )
+
+
+@contextlib.contextmanager
+def decoding(mode: str) -> Iterator[None]:
+    """Overrides `Configuration.decode_mode` for the responses decoded within
+    the block, in the current thread or asyncio task.
+
+    >>> with decoding("construct"):
+    ...     devices = system_api.get_devices_detailed(page_size=10000)
+    """
+    check_decode_mode(mode)
+    token = _decode_mode.set(mode)
+    try:
+        yield
+    finally:
+        _decode_mode.reset(token)
+
+
+def current_decode_mode(default: str) -> str:
+    """Returns the decode mode set by `decoding`, `default` outside of it."""
+    return _decode_mode.get() or default
+
+
+def _type_schema(annotation: Any, definitions: dict[str, Any]) -> CoreSchema:
+    """Returns the core schema building a type from JSON without validating
+    it: models are built from their fields as they are, only the dates are
+    parsed.
+
+    :param definitions: the schemas of the models, by reference, completed
+        with the models `annotation` refers to.
+    """
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _type_schema(typing.get_args(annotation)[0], definitions)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return core_schema.any_schema()
+        return core_schema.nullable_schema(_type_schema(args[0], definitions))
+    if origin is list:
+        item = typing.get_args(annotation)[0]
+        return core_schema.list_schema(_type_schema(item, definitions))
+    if origin is dict:
+        value = typing.get_args(annotation)[1]
+        return core_schema.dict_schema(values_schema=_type_schema(value, definitions))
+    if annotation is datetime.datetime:
+        return core_schema.datetime_schema()
+    if annotation is datetime.date:
+        return core_schema.date_schema()
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        ref = f"{annotation.__module__}.{annotation.__qualname__}"
+        if ref not in definitions:
+            # Reserved first, so that recursive models refer to themselves
+            definitions[ref] = None
+            definitions[ref] = _model_schema(annotation, ref, definitions)
+        return core_schema.definition_reference_schema(ref)
+    return core_schema.any_schema()
+
+
+def _model_schema(
+    model: type[BaseModel], ref: str, definitions: dict[str, Any]
+) -> CoreSchema:
+    """Returns the core schema building a model the way `model_construct`
+    does: the fields missing from the JSON get their default, or None when
+    required, and are left out of `model_fields_set`.
+    """
+    fields = {}
+    for name, field in model.model_fields.items():
+        schema = _type_schema(field.annotation, definitions)
+        if field.default_factory is not None:
+            schema = core_schema.with_default_schema(
+                schema, default_factory=field.default_factory
+            )
+        else:
+            default = None if field.is_required() else field.default
+            schema = core_schema.with_default_schema(schema, default=default)
+        fields[name] = core_schema.model_field(
+            schema, validation_alias=field.alias or name
+        )
+    # Not a `model_schema`, pydantic-core would validate with the validator
+    # already built for the model instead
+    return core_schema.no_info_after_validator_function(
+        _model_factory(model), core_schema.model_fields_schema(fields), ref=ref
+    )
+
+
+def _model_factory(model: type[BaseModel]) -> Callable[[tuple], BaseModel]:
+    """Returns how to build a model from the `(fields, extra, fields_set)`
+    tuple of its `model_fields_schema`.
+    """
+    if model.__private_attributes__:
+
+        def construct(values: tuple) -> BaseModel:
+            return model.model_construct(values[2], **values[0])
+
+        return construct
+
+    new = model.__new__
+
+    def build(values: tuple) -> BaseModel:
+        instance = new(model)
+        _set_dict(instance, values[0])
+        _set_fields_set(instance, values[2])
+        _set_extra(instance, None)
+        _set_private(instance, None)
+        return instance
+
+    return build
+
+
+# The setters of the `BaseModel` slots, cheaper than `object.__setattr__`
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+@functools.lru_cache(maxsize=None)
+def trusted_decoder(type_name: str) -> Optional[SchemaValidator]:
+    """Returns the cached decoder of trusted responses of a type.
+
+    The decoder builds the models in a single pass of pydantic-core, from the
+    raw body with `validate_json` or from parsed JSON with `validate_python`,
+    without validating the fields nor running the enum `field_validator`s.
+    Decode with the garbage collector paused, see `paused_gc`.
+
+    :param type_name: a response type, e.g. `"List[Device]"`.
+    :return: the decoder, or None if the type cannot be compiled.
+    """
+    compiled = compile_type(type_name)
+    if compiled is None:
+        return None
+    definitions: dict[str, Any] = {}
+    schema = _type_schema(compiled, definitions)
+    if definitions:
+        schema = core_schema.definitions_schema(schema, list(definitions.values()))
+    return SchemaValidator(schema)
+
+
+@contextlib.contextmanager
+def paused_gc() -> Iterator[None]:
+    """Pauses the cyclic garbage collector within the block.
+
+    Decoding a large response allocates many containers that all outlive the
+    decoding, which sets off collections that have nothing to free. The
+    decoded JSON holds no reference cycles, reference counting frees it.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
@@ -209,6 +209,33 @@ class UnprocessableEntityException(ApiException):
     pass
 
 
+class CircuitOpenError(ApiException):
+    """Raised without sending a request while its endpoint's breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        super().__init__(
+            status=0,
+            reason="Circuit breaker open for {0}, retry in {1:.1f}s".format(
+                endpoint, retry_in
+            ),
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class CursorExpiredError(OpenApiException):
+    """Raised when a report cursor expired before its next page was requested."""
+
+    def __init__(self, cursor_name: Optional[str], expires: float) -> None:
+        self.cursor_name = cursor_name
+        self.expires = expires
+        super().__init__(
+            "Cursor {0} expired at {1}, restart the pagination".format(
+                cursor_name, expires
+            )
+        )
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
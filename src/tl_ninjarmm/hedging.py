@@ -0,0 +1,158 @@
+"""Hedged reads.
+
+The latency of reads such as `DevicesApi.get_device` has a long tail caused
+by the occasional slow backend. With a `HedgePolicy` set as
+`Configuration.hedge_policy`, the transport sends a duplicate of a `GET`
+request when the first attempt is still waiting after the `percentile` of the
+recent latencies of its endpoint, and uses whichever response arrives first.
+The other attempt is abandoned and its connection closed.
+
+Every endpoint (method plus path with its ids replaced by `{id}`) keeps a
+window of its latest latencies. Until it has `min_samples` of them, the
+hedge is sent after `initial_delay`.
+
+Hedges are paid for by a budget: every request adds `budget_ratio` tokens to
+it and every hedge takes one, so hedges stay below that fraction of the
+requests even when the server slows down as a whole.
+"""
+
+import bisect
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from tl_ninjarmm.retry import endpoint_key
+
+HEDGED_METHODS = frozenset({"GET"})
+
+
+@dataclass
+class HedgePolicy:
+    """Settings of the hedged reads of a client.
+
+    :param percentile: a hedge is sent once the first attempt waited longer
+        than this percentile of the latencies of its endpoint.
+    :param min_delay: the shortest wait before a hedge, in seconds.
+    :param initial_delay: the wait before a hedge while an endpoint has too
+        few latencies, in seconds.
+    :param min_samples: latencies needed before `percentile` is used.
+    :param window: latest latencies kept per endpoint.
+    :param budget_ratio: hedges allowed per request sent.
+    :param max_budget: hedges that can be sent in a row once the budget has
+        accumulated.
+    """
+
+    percentile: float = 95.0
+    min_delay: float = 0.01
+    initial_delay: float = 1.0
+    min_samples: int = 20
+    window: int = 500
+    budget_ratio: float = 0.05
+    max_budget: float = 10.0
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Snapshot of the counters of a `Hedger`."""
+
+    requests: int
+    """Hedgeable requests sent"""
+    hedges: int
+    """Duplicates sent"""
+    hedge_wins: int
+    """Duplicates that answered before the first attempt"""
+    budget: float
+    """Hedges that can be sent right away"""
+
+
+class LatencyWindow:
+    """The latest latencies of an endpoint, kept sorted for percentiles.
+
+    :param size: how many latencies are kept.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        if len(self._samples) == self._samples.maxlen:
+            oldest = self._samples[0]
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._samples.append(seconds)
+        bisect.insort(self._sorted, seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns the latency below which `percentile` % of them fall."""
+        if not self._sorted:
+            return None
+        index = round(percentile / 100 * (len(self._sorted) - 1))
+        return self._sorted[index]
+
+
+class Hedger:
+    """Decides when reads are hedged according to a `HedgePolicy`.
+
+    :param policy: the hedging settings.
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._budget = 0.0
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configuration(cls, configuration) -> Optional["Hedger"]:
+        """Builds the hedger of a client, None if hedging is disabled."""
+        if configuration.hedge_policy is None:
+            return None
+        return cls(configuration.hedge_policy)
+
+    def delay(self, method: str, url: str) -> Optional[float]:
+        """Returns how long to wait before hedging a request, None if it must
+        not be hedged. Counts the request towards the budget.
+        """
+        if method not in HEDGED_METHODS:
+            return None
+        policy = self.policy
+        with self._lock:
+            self.requests += 1
+            self._budget = min(policy.max_budget, self._budget + policy.budget_ratio)
+            window = self._windows.get(endpoint_key(method, url))
+            if window is None or len(window) < policy.min_samples:
+                return policy.initial_delay
+            return max(policy.min_delay, window.percentile(policy.percentile))
+
+    def record(self, method: str, url: str, seconds: float) -> None:
+        """Adds the latency of an attempt to its endpoint's window."""
+        key = endpoint_key(method, url)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = LatencyWindow(self.policy.window)
+            window.record(seconds)
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget, False if it is spent."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(self.requests, self.hedges, self.hedge_wins, self._budget)
@@ -0,0 +1,436 @@
+"""HTTP caching of the reference endpoints.
+
+Endpoints such as `SystemApi.get_organizations` or `get_node_roles` are read
+far more often than their data changes. With a `CachePolicy` set as
+`Configuration.cache_policy`, the transport (`RESTClientObject.request`, sync
+and asyncio) keeps the `GET` responses of the chosen operations, keyed by URL
+and by the credentials of the client: its configuration and the
+`Authorization` header sent, so that clients of different tenants sharing a
+backend, e.g. through `get_token`, never see each other's responses. Responses
+cached under a token are not served once the token is renewed.
+
+A cached response is served without any request while it is fresh: for the
+`max-age` of its `Cache-Control` header, or else for the TTL of its operation.
+Once stale it is revalidated with `If-None-Match` / `If-Modified-Since` when
+the server sent an `ETag` or `Last-Modified` header, a `304 Not Modified`
+response refreshing it without transferring the body again. For
+`stale_while_revalidate` seconds after it expired, the stale response is still
+served while a single background request refreshes it.
+
+Responses are stored in a `CacheBackend`: `MemoryCache`, an LRU bounded by the
+size of the bodies, or `DiskCache`, which the processes of a host can share.
+"""
+
+import abc
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from tl_ninjarmm.exceptions import ApiValueError
+
+REFERENCE_TTLS: Mapping[str, float] = {
+    "get_organizations": 300.0,
+    "get_locations": 300.0,
+    "get_policies": 300.0,
+    "get_node_roles": 300.0,
+    "get_user_roles": 300.0,
+    "get_groups": 300.0,
+    "get_automation_scripts": 300.0,
+    "get_device_global_custom_fields": 300.0,
+}
+"""Default TTLs, in seconds, of the reference endpoints"""
+
+# Headers describing the transfer rather than the response
+_UNSTORED_HEADERS = frozenset(
+    {
+        "age",
+        "connection",
+        "content-encoding",
+        "content-length",
+        "keep-alive",
+        "set-cookie",
+        "transfer-encoding",
+    }
+)
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"\\\{[^/]+?\\\}")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response kept by the cache."""
+
+    status: int
+    """HTTP status, always 200"""
+    headers: Dict[str, str]
+    """Response headers, with lower case names"""
+    body: bytes
+    """Decoded response body"""
+    stored_at: float
+    """`time.time()` when the response was received or last revalidated"""
+    ttl: float
+    """Seconds the response is fresh for"""
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the response was received or last revalidated."""
+        return (time.time() if now is None else now) - self.stored_at
+
+
+class CacheBackend(abc.ABC):
+    """Base class of the storages of cached responses."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Returns the response stored under `key`, None if there is none."""
+
+    @abc.abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Stores a response, replacing the one stored under `key`."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the response stored under `key`, if any."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all the stored responses."""
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe LRU storage bounded by the total size of the bodies.
+
+    :param max_bytes: the least recently used responses are evicted when the
+        bodies exceed this size. Larger responses are not stored at all.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._responses: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(response.body) > self.max_bytes:
+                return
+            self._responses[key] = response
+            self.size += len(response.body)
+            while self.size > self.max_bytes:
+                self._pop(next(iter(self._responses)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        response = self._responses.pop(key, None)
+        if response is not None:
+            self.size -= len(response.body)
+
+
+class DiskCache(CacheBackend):
+    """Stores every response in a file of a directory.
+
+    A file holds a JSON line describing the response followed by its body.
+    Files are replaced atomically, so processes sharing the directory never
+    read partial responses.
+
+    :param directory: where the responses are stored, created if missing.
+    :param max_bytes: when the files exceed this size, the least recently
+        used ones are removed. None does not bound the directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.response")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Recently used files are the last ones to be evicted
+            os.utime(path)
+            head, _, body = data.partition(b"\n")
+            meta = json.loads(head)
+            return CachedResponse(
+                status=meta["status"],
+                headers=meta["headers"],
+                body=body,
+                stored_at=meta["stored_at"],
+                ttl=meta["ttl"],
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        head = json.dumps(
+            {
+                "status": response.status,
+                "headers": response.headers,
+                "stored_at": response.stored_at,
+                "ttl": response.ttl,
+            }
+        ).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".response-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(head + b"\n" + response.body)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if self.max_bytes is not None:
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _entries(self) -> list:
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".response")]
+
+    def _evict(self) -> None:
+        files = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class CachePolicy:
+    """Settings of the HTTP cache of a client.
+
+    :param backend: where the responses are stored, shared by the clients
+        built from the configuration.
+    :param ttls: seconds the responses of an operation stay fresh, by
+        operation name. Only these `GET` operations are cached.
+    :param stale_while_revalidate: seconds an expired response is still
+        served for while it is refreshed in the background.
+    """
+
+    backend: CacheBackend = field(default_factory=MemoryCache)
+    ttls: Mapping[str, float] = field(default_factory=lambda: dict(REFERENCE_TTLS))
+    stale_while_revalidate: float = 60.0
+
+
+def auth_scope(configuration: Any) -> str:
+    """Identifies the credentials of a configuration.
+
+    Responses are only shared between clients of the same scope. The scope
+    is hashed before being used in cache keys.
+    """
+    token_scope = configuration.token_scope
+    if isinstance(token_scope, (list, tuple, set)):
+        token_scope = " ".join(sorted(map(str, token_scope)))
+    return json.dumps(
+        [
+            configuration.client_id,
+            token_scope,
+            sorted(configuration.api_key.items()),
+        ]
+    )
+
+
+def _path_pattern(path: str) -> "re.Pattern[str]":
+    return re.compile(_PLACEHOLDER_RE.sub("[^/]+", re.escape(path)) + "$")
+
+
+def _freshness(headers: Mapping[str, str], ttl: float) -> float:
+    cache_control = headers.get("Cache-Control") or ""
+    if "no-cache" in cache_control.lower():
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return float(match.group(1)) if match else ttl
+
+
+def _stored_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {
+        name.lower(): value
+        for name, value in headers.items()
+        if name.lower() not in _UNSTORED_HEADERS
+    }
+
+
+class HttpCache:
+    """Looks up and stores the responses of a client per a `CachePolicy`.
+
+    :param policy: the cached operations and the storage.
+    :param scope: the credentials of the client, see `auth_scope`.
+    """
+
+    def __init__(self, policy: CachePolicy, scope: str = "") -> None:
+        from tl_ninjarmm.api.operation_table import OPERATIONS
+
+        self.policy = policy
+        self.backend = policy.backend
+        self._scope = hashlib.sha256(scope.encode()).hexdigest()
+        self._rules = []
+        for name, ttl in policy.ttls.items():
+            operation = OPERATIONS.get(name)
+            if operation is None or operation.method != "GET":
+                raise ApiValueError(
+                    f"{name} is not a GET operation, its responses cannot be cached"
+                )
+            self._rules.append((_path_pattern(operation.path), float(ttl)))
+        self._revalidating: set = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configuration(cls, configuration) -> Optional["HttpCache"]:
+        """Builds the cache of a client, None if caching is disabled."""
+        if configuration.cache_policy is None:
+            return None
+        return cls(configuration.cache_policy, auth_scope(configuration))
+
+    def ttl(self, method: str, url: str) -> Optional[float]:
+        """Returns the TTL of the responses of a request, None if not cached."""
+        if method != "GET":
+            return None
+        path = urlsplit(url).path
+        for pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def key(self, url: str, headers: Optional[Mapping[str, str]] = None) -> str:
+        """Returns the backend key of a `GET` request.
+
+        :param headers: the headers of the request, whose `Authorization`
+            scopes the key.
+        """
+        authorization = ""
+        for name, value in (headers or {}).items():
+            if name.lower() == "authorization":
+                authorization = value
+        digest = hashlib.sha256(f"{self._scope} {authorization}".encode())
+        digest.update(f" GET {url}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self.backend.get(key)
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        return cached.age() < cached.ttl
+
+    def can_serve_stale(self, cached: CachedResponse) -> bool:
+        """Whether an expired response may be served while it is refreshed."""
+        return cached.age() < cached.ttl + self.policy.stale_while_revalidate
+
+    def conditional_headers(
+        self, headers: Mapping[str, str], cached: Optional[CachedResponse]
+    ) -> Dict[str, str]:
+        """Returns the headers of a request revalidating `cached`."""
+        headers = dict(headers)
+        if cached is not None:
+            if "etag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["etag"]
+            if "last-modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["last-modified"]
+        return headers
+
+    def store(
+        self,
+        key: str,
+        ttl: float,
+        cached: Optional[CachedResponse],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> Optional[CachedResponse]:
+        """Updates the cache with the response to a request.
+
+        :param cached: the response the request revalidated, if any.
+        :return: the response to serve, None to serve the received one as is
+            (neither a 200 nor a 304 revalidating `cached`).
+        """
+        now = time.time()
+        if status == 304 and cached is not None:
+            response = replace(
+                cached,
+                headers={**cached.headers, **_stored_headers(headers)},
+                stored_at=now,
+                ttl=_freshness(headers, ttl),
+            )
+        elif status == 200:
+            response = CachedResponse(
+                status=status,
+                headers=_stored_headers(headers),
+                body=body,
+                stored_at=now,
+                ttl=_freshness(headers, ttl),
+            )
+        else:
+            return None
+        if "no-store" not in (headers.get("Cache-Control") or "").lower():
+            self.backend.set(key, response)
+        return response
+
+    def served_headers(self, cached: CachedResponse) -> Dict[str, str]:
+        """Returns the headers of a response served from the cache."""
+        return {**cached.headers, "age": str(int(cached.age()))}
+
+    def claim_revalidation(self, key: str) -> bool:
+        """Returns whether the caller should refresh `key` in the background,
+        False if another request already is.
+        """
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def release_revalidation(self, key: str) -> None:
+        with self._lock:
+            self._revalidating.discard(key)
@@ -0,0 +1,294 @@
+"""Per-operation metrics of the generated calls.
+
+With a `MetricsRegistry` set as `Configuration.metrics`, `ApiClient.invoke`
+records for every call of a generated operation, keyed by its id such as
+`SystemApi.get_devices_detailed`:
+
+- the number of calls per status class (`2xx`, `4xx`, ... or `error` when
+  no response was received),
+- the bytes of the request bodies sent and of the response bodies received,
+- a latency histogram for each phase of the call: `token` (getting the OAuth2
+  token), `serialize` (building the request), `network` (sending it and
+  reading the response, retries, rate limiting, cache and hedging included)
+  and `decode` (deserializing the response).
+
+The registry lives in the process and can be read with `snapshot` or
+exported in the Prometheus text format with `to_prometheus`, e.g. from the
+handler of a `/metrics` endpoint. Recording a call costs a few microseconds.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from tl_ninjarmm.operations import Operation
+
+PHASES = ("token", "serialize", "network", "decode")
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds of the latency histograms, in seconds"""
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Snapshot of the latency histogram of a phase."""
+
+    count: int
+    """Calls that went through the phase"""
+    sum: float
+    """Total time spent in the phase, in seconds"""
+    buckets: Tuple[Tuple[float, int], ...]
+    """Upper bound and cumulative count of every bucket, `inf` last"""
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """Snapshot of the metrics of an operation."""
+
+    operation: str
+    """Operation id, e.g. `SystemApi.get_devices_detailed`"""
+    requests: int
+    """Calls of the operation"""
+    statuses: Dict[str, int]
+    """Calls per status class, e.g. `{"2xx": 10, "error": 1}`"""
+    bytes_out: int
+    """Bytes of the request bodies"""
+    bytes_in: int
+    """Bytes of the response bodies"""
+    phases: Dict[str, PhaseStats]
+    """Latencies of the phases of the calls, by phase name"""
+
+
+def operation_id(operation: Operation) -> str:
+    """Returns the id of an operation, e.g. `SystemApi.get_devices_detailed`."""
+    return f"{operation.api}.{operation.name}"
+
+
+def status_class(status: Optional[int]) -> str:
+    """Returns the class of a status code, `error` without a response."""
+    if status is None:
+        return "error"
+    return f"{status // 100}xx"
+
+
+class _OperationMetrics:
+    __slots__ = (
+        "operation",
+        "buckets",
+        "lock",
+        "statuses",
+        "bytes_out",
+        "bytes_in",
+        "counts",
+        "sums",
+    )
+
+    def __init__(self, operation: str, buckets: Sequence[float]) -> None:
+        self.operation = operation
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.statuses: Dict[int, int] = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+        # Per phase, the count of every bucket plus one for the larger values
+        self.counts: List[List[int]] = [[0] * (len(buckets) + 1) for _ in PHASES]
+        self.sums = [0.0] * len(PHASES)
+
+    def record(self, timer: "CallTimer") -> None:
+        # Counted by hundreds, 0 without a response, named by `snapshot`
+        hundreds = 0 if timer.status is None else timer.status // 100
+        buckets = self.buckets
+        laps = timer.laps
+        with self.lock:
+            self.statuses[hundreds] = self.statuses.get(hundreds, 0) + 1
+            self.bytes_out += timer.bytes_out
+            self.bytes_in += timer.bytes_in
+            for phase in range(timer.phase):
+                seconds = laps[phase]
+                self.counts[phase][bisect_left(buckets, seconds)] += 1
+                self.sums[phase] += seconds
+
+    def snapshot(self) -> OperationStats:
+        bounds = (*self.buckets, float("inf"))
+        with self.lock:
+            phases = {}
+            for phase, name in enumerate(PHASES):
+                cumulative, total = [], 0
+                for count in self.counts[phase]:
+                    total += count
+                    cumulative.append(total)
+                phases[name] = PhaseStats(
+                    total, self.sums[phase], tuple(zip(bounds, cumulative))
+                )
+            return OperationStats(
+                operation=self.operation,
+                requests=sum(self.statuses.values()),
+                statuses={
+                    status_class(hundreds * 100 or None): count
+                    for hundreds, count in self.statuses.items()
+                },
+                bytes_out=self.bytes_out,
+                bytes_in=self.bytes_in,
+                phases=phases,
+            )
+
+
+class CallTimer:
+    """Measures the phases of a call, see `MetricsRegistry.start`.
+
+    Every `lap` ends the current phase, in the order of `PHASES`. `stop`
+    ends the phase in progress and records the call, the phases that were
+    not reached, e.g. `decode` after a network error, are left out.
+    """
+
+    __slots__ = ("metrics", "laps", "phase", "last", "status", "bytes_out", "bytes_in")
+
+    def __init__(self, metrics: _OperationMetrics) -> None:
+        self.metrics = metrics
+        self.laps = [0.0, 0.0, 0.0, 0.0]
+        self.phase = 0
+        # Status code of the response, None if none was received
+        self.status: Optional[int] = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.last = time.perf_counter()
+
+    def lap(self) -> None:
+        now = time.perf_counter()
+        self.laps[self.phase] = now - self.last
+        self.phase += 1
+        self.last = now
+
+    def sent(self, body) -> None:
+        """Counts the bytes of a request body, as serialized."""
+        if isinstance(body, (bytes, bytearray, str)):
+            self.bytes_out = len(body)
+
+    def received(self, status: int, data: Optional[bytes]) -> None:
+        """Counts the status and the bytes of a response body."""
+        self.status = status
+        if data is not None:
+            self.bytes_in = len(data)
+
+    def stop(self) -> None:
+        if self.phase < len(PHASES):
+            self.lap()
+        self.metrics.record(self)
+
+
+class MetricsRegistry:
+    """The metrics of the calls of one or more clients.
+
+    :param buckets: upper bounds of the latency histograms, in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._operations: Dict[Operation, _OperationMetrics] = {}
+        self._lock = threading.Lock()
+
+    def start(self, operation: Operation) -> CallTimer:
+        """Starts measuring a call of `operation`, its token phase first."""
+        metrics = self._operations.get(operation)
+        if metrics is None:
+            with self._lock:
+                metrics = self._operations.get(operation)
+                if metrics is None:
+                    metrics = _OperationMetrics(operation_id(operation), self.buckets)
+                    self._operations[operation] = metrics
+        return CallTimer(metrics)
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        """Returns the metrics of the operations called so far, by id."""
+        with self._lock:
+            operations = list(self._operations.values())
+        stats = (metrics.snapshot() for metrics in operations)
+        return {operation.operation: operation for operation in stats}
+
+    def reset(self) -> None:
+        """Forgets the metrics recorded so far."""
+        with self._lock:
+            self._operations = {}
+
+    def to_prometheus(self, prefix: str = "tl_ninjarmm") -> str:
+        """Returns the metrics in the Prometheus text exposition format.
+
+        :param prefix: prefix of the metric names.
+        """
+        stats = sorted(self.snapshot().values(), key=lambda s: s.operation)
+        lines = [
+            f"# HELP {prefix}_requests_total Calls of the API operations.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for operation in stats:
+            for status, count in sorted(operation.statuses.items()):
+                labels = _labels(operation=operation.operation, status=status)
+                lines.append(f"{prefix}_requests_total{labels} {count}")
+        for name, attribute, help_text in (
+            ("sent_bytes_total", "bytes_out", "Bytes of the request bodies."),
+            ("received_bytes_total", "bytes_in", "Bytes of the response bodies."),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for operation in stats:
+                labels = _labels(operation=operation.operation)
+                value = getattr(operation, attribute)
+                lines.append(f"{prefix}_{name}{labels} {value}")
+        lines.append(
+            f"# HELP {prefix}_phase_seconds Latency of the phases of the calls."
+        )
+        lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+        for operation in stats:
+            for phase, histogram in operation.phases.items():
+                if not histogram.count:
+                    continue
+                for bound, count in histogram.buckets:
+                    labels = _labels(
+                        operation=operation.operation, phase=phase, le=_number(bound)
+                    )
+                    lines.append(f"{prefix}_phase_seconds_bucket{labels} {count}")
+                labels = _labels(operation=operation.operation, phase=phase)
+                lines.append(
+                    f"{prefix}_phase_seconds_sum{labels} {_number(histogram.sum)}"
+                )
+                lines.append(f"{prefix}_phase_seconds_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
@@ -0,0 +1,94 @@
+"""Hooks around the calls of the generated operations.
+
+The `Middleware` objects listed in `Configuration.middlewares` see every
+request sent by `ApiClient.invoke` and its outcome, e.g. for tracing,
+auditing or accounting, without replacing the transport:
+
+- `before_request` is called in the order of the list, before the request
+  is sent. It may modify the request of the `ApiCall`, or set its
+  `response` to answer the call without sending it, e.g. from a cache.
+- `after_response` is called in the reverse order once the response is
+  decoded, with the raw body in `call.response.data` and the decoded
+  response in `call.api_response`, which it may replace.
+- `on_error` is called in the reverse order when the request fails or the
+  response is an error, before the exception is raised to the caller.
+
+Clients without middlewares skip the hooks entirely. Calls coalesced with
+an identical one in flight (`Configuration.coalesce_requests`) share its
+hooks, and the hooks of the `*_without_preload_content` calls see the
+response before its body is read.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from tl_ninjarmm.operations import Operation
+
+
+@dataclass
+class ApiCall:
+    """A call of a generated operation, as seen by the middlewares."""
+
+    operation: Operation
+    """The operation called, from `OPERATIONS`"""
+    method: str
+    """HTTP method of the request"""
+    url: str
+    """URL of the request, query included"""
+    headers: Dict[str, str]
+    """Headers of the request"""
+    body: Any = None
+    """Body of the request, JSON bodies are already encoded to bytes"""
+    post_params: List[Any] = field(default_factory=list)
+    """Form parameters of the request"""
+    response: Any = None
+    """The `RESTResponse`, once received or set by a `before_request`"""
+    api_response: Any = None
+    """The decoded `ApiResponse`, once the response is deserialized"""
+    context: Dict[str, Any] = field(default_factory=dict)
+    """Scratch space for the middlewares, e.g. to keep a start time"""
+
+    @property
+    def operation_id(self) -> str:
+        """Id of the operation, e.g. `SystemApi.get_devices_detailed`."""
+        return f"{self.operation.api}.{self.operation.name}"
+
+
+class Middleware:
+    """Base class of the middlewares, its hooks do nothing.
+
+    Subclasses override the hooks they need. Hooks are called on the thread,
+    or event loop, of the call and must not block it for long.
+    """
+
+    def before_request(self, call: ApiCall) -> None:
+        """Called before the request of `call` is sent."""
+
+    def after_response(self, call: ApiCall) -> None:
+        """Called once the response of `call` is received and decoded."""
+
+    def on_error(self, call: ApiCall, error: BaseException) -> None:
+        """Called when `call` fails with `error`, before it is raised."""
+
+
+def run_before_request(middlewares: List[Middleware], call: ApiCall) -> None:
+    for middleware in middlewares:
+        middleware.before_request(call)
+
+
+def run_after_response(middlewares: List[Middleware], call: ApiCall) -> None:
+    for middleware in reversed(middlewares):
+        middleware.after_response(call)
+
+
+def run_on_error(
+    middlewares: List[Middleware], call: ApiCall, error: BaseException
+) -> None:
+    for middleware in reversed(middlewares):
+        middleware.on_error(call, error)
+
+
+def make_call(operation: Operation, request: tuple) -> ApiCall:
+    """Returns the `ApiCall` of a request built by `operation_serialize`."""
+    method, url, headers, body, post_params = request
+    return ApiCall(operation, method, url, headers, body, post_params)
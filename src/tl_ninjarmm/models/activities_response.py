@@ -15,7 +15,7 @@ Do not edit the class manually.
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
+from tl_ninjarmm.codec import json_dumps, json_loads
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
@@ -50,12 +50,12 @@ class ActivitiesResponse(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of ActivitiesResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
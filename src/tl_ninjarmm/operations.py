@@ -0,0 +1,71 @@
+"""Metadata of the generated API operations.
+
+Every operation of the generated APIs is described by an `Operation` in the
+generated `tl_ninjarmm.api.operation_table.OPERATIONS`, keyed by the name of
+its method. The three methods generated for an operation (`op`,
+`op_with_http_info` and `op_without_preload_content`) hand their arguments to
+`ApiClient.invoke`, which builds the request from the operation, sends it and
+decodes the response. `invoke` is thus the single place every generated call
+goes through.
+
+The generated methods validate their arguments with pydantic's
+`validate_call`. `bind_unvalidated` replaces them on an API object by the
+undecorated functions, for trusted callers to skip that per call overhead.
+"""
+
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, eq=False)
+class Operation:
+    """Request and response description of a generated operation."""
+
+    name: str
+    """Name of the generated method, e.g. `get_device`"""
+    api: str
+    """Name of the generated API class, e.g. `DevicesApi`"""
+    method: str
+    """HTTP method"""
+    path: str
+    """Path template, e.g. `/v2/device/{id}`"""
+    path_params: Tuple[Tuple[str, str], ...] = ()
+    """Placeholder in the path and argument filling it"""
+    query_params: Tuple[Tuple[str, str], ...] = ()
+    """Query parameter name and argument it is taken from"""
+    body_param: Optional[str] = None
+    """Argument sent as the request body"""
+    collection_formats: Dict[str, str] = field(default_factory=dict)
+    """Collection format of the list parameters"""
+    accept: Tuple[str, ...] = ()
+    """Content types of the responses, for the `Accept` header"""
+    content_types: Optional[Tuple[str, ...]] = None
+    """Content types of the request body, None if it has no body"""
+    auth_settings: Tuple[str, ...] = ()
+    """Authentication schemes of the operation"""
+    response_types: Dict[str, Optional[str]] = field(default_factory=dict)
+    """Response type of every status code, e.g. `{"200": "Device"}`"""
+
+
+@functools.lru_cache(maxsize=None)
+def _unvalidated_methods(api_class: type) -> Dict[str, Callable[..., Any]]:
+    return {
+        name: function.raw_function
+        for name, function in vars(api_class).items()
+        if hasattr(function, "raw_function")
+    }
+
+
+def bind_unvalidated(api: object) -> None:
+    """Binds the generated methods of an API without their `validate_call`.
+
+    The arguments are then passed to `ApiClient.invoke` as is, without being
+    checked or coerced to their annotated types. Used when
+    `Configuration.client_side_validation` is off.
+
+    :param api: the API object, e.g. a `DevicesApi`.
+    """
+    for name, function in _unvalidated_methods(type(api)).items():
+        setattr(api, name, function.__get__(api))
@@ -0,0 +1,571 @@
+"""Iterators over the paginated NinjaOne endpoints.
+
+The `QueriesApi` reports return a `Cursor` next to their `results`. The first
+request opens the cursor and every following request passes `cursor=<name>`
+to get the next page, until an empty page is returned.
+
+The `SystemApi` lists (`get_devices`, `get_organizations`, ...) are keyed by
+`after`: every following request passes the id of the last row of the previous
+page, until a short or empty page is returned.
+"""
+
+import asyncio
+import collections
+import contextvars
+import inspect
+import threading
+import time
+import typing
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.exceptions import ApiValueError, CursorExpiredError
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
+# Lets `response_deserialize` check the status code but keep the body as is
+_RAW_RESPONSE_TYPES = {"200": "bytearray"}
+
+ReportOperation = Callable[..., Any]
+AsyncReportOperation = Callable[..., Awaitable[Any]]
+
+
+def _check_cursor_operation(operation: Callable[..., Any]) -> None:
+    parameters = inspect.signature(operation).parameters
+    accepts_kwargs = any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+    if "cursor" not in parameters and not accepts_kwargs:
+        name = getattr(operation, "__name__", operation)
+        raise ApiValueError(f"{name} is not a cursor based operation")
+
+
+def _member(obj: Any, name: str) -> Any:
+    """Returns a member of a model, or of its JSON object when decoded as
+    "dict" (see `Configuration.decode_mode`)."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name)
+
+
+def _next_cursor(report: Any, page_size: int | None) -> Any:
+    """Returns the cursor to request the page after `report` with, if any.
+
+    :param report: a report holding `cursor` and `results`, as a model or as
+        its JSON object.
+    :param page_size: the page size that was requested, if any.
+    :return: the `Cursor`, or None when `report` was the last page.
+    """
+    results = _member(report, "results") or []
+    cursor = _member(report, "cursor")
+    if not results or cursor is None or _member(cursor, "name") is None:
+        return None
+    # A short page is the last one, no need to ask for an empty page
+    if page_size is not None and len(results) < page_size:
+        return None
+    return cursor
+
+
+def _check_after_operation(operation: Callable[..., Any]) -> None:
+    name = getattr(operation, "__name__", operation)
+    api = getattr(operation, "__self__", None)
+    parameters = inspect.signature(operation).parameters
+    if api is None or "after" not in parameters or "page_size" not in parameters:
+        raise ApiValueError(f"{name} is not an `after` keyed list operation")
+
+
+def _list_item_type(operation: Callable[..., Any]) -> type:
+    return_type = inspect.signature(operation).return_annotation
+    (item_type,) = typing.get_args(return_type)
+    return item_type
+
+
+def _next_after(rows: list, page_size: int | None) -> Any:
+    """Returns the `after` to request the page after `rows` with, if any."""
+    if not rows:
+        return None
+    if page_size is not None and len(rows) < page_size:
+        return None
+    return rows[-1].get("id")
+
+
+def _parse_rows(api_client: Any, body: bytes) -> list:
+    return api_client.json_codec.loads(body) if body else []
+
+
+def _decode_page(api_client: Any, body: bytes, response_type: str) -> list:
+    return api_client.decode_json(body, response_type) if body else []
+
+
+def _check_not_expired(cursor: Any) -> None:
+    expires = _member(cursor, "expires")
+    if expires is not None and time.time() >= expires:
+        raise CursorExpiredError(_member(cursor, "name"), expires)
+
+
+class CursorPaginator(Generic[T]):
+    """Lazily iterates over the rows of a cursor based report.
+
+    While the rows of a page are consumed, the next page is already fetched
+    and decoded on a background thread, so a scan is bounded by the network
+    time rather than by fetching and decoding the pages one after the other.
+    The pages are decoded as the operation decodes its responses, following
+    the `decoders.decoding` in effect where the paginator is iterated: with
+    the "dict" decode mode, reports and rows are JSON objects.
+
+    :param operation: the report operation, e.g. `QueriesApi.get_software`
+        of a bound API instance.
+    :param prefetch: fetch the next page on a background thread while the
+        current one is consumed.
+    :param params: keyword arguments passed to every call of `operation`,
+        e.g. `df` or `page_size`.
+    :raises CursorExpiredError: if the cursor expires before the next page
+        is requested.
+    """
+
+    def __init__(
+        self,
+        operation: ReportOperation,
+        *,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> None:
+        _check_cursor_operation(operation)
+        self.operation = operation
+        self.prefetch = prefetch
+        self.params = params
+
+    def _fetch(self, cursor: Any) -> Any:
+        if cursor is None:
+            return self.operation(**self.params)
+        _check_not_expired(cursor)
+        return self.operation(**{**self.params, "cursor": _member(cursor, "name")})
+
+    def pages(self) -> Iterator[Any]:
+        """Yields every page of the report, starting with the first one."""
+        page_size = self.params.get("page_size")
+        if not self.prefetch:
+            cursor = None
+            while True:
+                report = self._fetch(cursor)
+                yield report
+                cursor = _next_cursor(report, page_size)
+                if cursor is None:
+                    return
+
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tl-ninjarmm-paginator"
+        )
+        try:
+            future: Future = self._submit(executor, None)
+            while future is not None:
+                report = future.result()
+                cursor = _next_cursor(report, page_size)
+                future = self._submit(executor, cursor) if cursor is not None else None
+                yield report
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, executor: ThreadPoolExecutor, cursor: Any) -> Future:
+        # The page is decoded in the caller's context, e.g. its `decoding`
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._fetch, cursor)
+
+    def __iter__(self) -> Iterator[T]:
+        for report in self.pages():
+            yield from _member(report, "results") or []
+
+
+class AsyncCursorPaginator(Generic[T]):
+    """asyncio variant of :class:`CursorPaginator`.
+
+    The next page is requested in a separate task while the rows of the
+    current page are consumed.
+
+    :param operation: the report operation of an async API, e.g.
+        `AsyncQueriesApi.get_software` of a bound API instance.
+    :param prefetch: request the next page while the current one is consumed.
+    :param params: keyword arguments passed to every call of `operation`.
+    :raises CursorExpiredError: if the cursor expires before the next page
+        is requested.
+    """
+
+    def __init__(
+        self,
+        operation: AsyncReportOperation,
+        *,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> None:
+        _check_cursor_operation(operation)
+        self.operation = operation
+        self.prefetch = prefetch
+        self.params = params
+
+    async def _fetch(self, cursor: Any) -> Any:
+        if cursor is None:
+            return await self.operation(**self.params)
+        _check_not_expired(cursor)
+        return await self.operation(
+            **{**self.params, "cursor": _member(cursor, "name")}
+        )
+
+    async def pages(self) -> AsyncIterator[Any]:
+        """Yields every page of the report, starting with the first one."""
+        page_size = self.params.get("page_size")
+        next_page = asyncio.ensure_future(self._fetch(None))
+        try:
+            while next_page is not None:
+                report = await next_page
+                cursor = _next_cursor(report, page_size)
+                next_page = None
+                if cursor is not None:
+                    if self.prefetch:
+                        next_page = asyncio.ensure_future(self._fetch(cursor))
+                    else:
+                        next_page = self._fetch(cursor)
+                yield report
+        finally:
+            if isinstance(next_page, asyncio.Future):
+                next_page.cancel()
+            elif next_page is not None:
+                next_page.close()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for report in self.pages():
+            for row in _member(report, "results") or []:
+                yield row
+
+
+class _PageBuffer:
+    """Bounded hand-off of page bodies from the fetcher to the consumer."""
+
+    _DONE = object()
+
+    def __init__(self, max_pages: int, max_bytes: int | None) -> None:
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.pages: collections.deque = collections.deque()
+        self.buffered_bytes = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def _is_full(self) -> bool:
+        if len(self.pages) >= self.max_pages:
+            return True
+        return self.max_bytes is not None and self.buffered_bytes >= self.max_bytes
+
+    def wait_for_room(self) -> bool:
+        """Blocks until another page may be fetched, False once closed."""
+        with self.condition:
+            while not self.closed and self._is_full():
+                self.condition.wait()
+            return not self.closed
+
+    def put(self, item: Any, size: int = 0) -> None:
+        with self.condition:
+            self.pages.append((item, size))
+            self.buffered_bytes += size
+            self.condition.notify_all()
+
+    def get(self) -> Any:
+        with self.condition:
+            while not self.pages:
+                self.condition.wait()
+            item, size = self.pages.popleft()
+            self.buffered_bytes -= size
+            self.condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.pages.clear()
+            self.condition.notify_all()
+
+
+class AfterPaginator(Generic[T]):
+    """Pipelined iteration over the rows of an `after` keyed list operation.
+
+    A fetcher thread requests the pages. As soon as a page body is received
+    it is parsed with the client's JSON codec to find the id of its last row,
+    and the request for the next page is sent while the caller is still
+    decoding the previous pages. The pages are buffered as their raw bodies,
+    which the caller decodes the way the operation would: following
+    `Configuration.decode_mode` and `decoders.decoding`, with the compiled
+    decoder of the rows.
+
+    :param operation: the list operation of a bound `SystemApi`, e.g.
+        `SystemApi.get_devices_detailed`.
+    :param prefetch: how many pages may be fetched ahead of the one being
+        consumed. 0 fetches each page only once the previous one is consumed.
+    :param max_buffered_bytes: no page is requested ahead while the buffered
+        page bodies add up to this many bytes. None disables the cap.
+    :param params: keyword arguments passed to every call of `operation`,
+        e.g. `df` or `page_size`.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[..., list],
+        *,
+        prefetch: int = 2,
+        max_buffered_bytes: int | None = DEFAULT_MAX_BUFFERED_BYTES,
+        **params: Any,
+    ) -> None:
+        _check_after_operation(operation)
+        api = operation.__self__
+        self.api_client = api.api_client
+        self.operation = getattr(api, operation.__name__ + "_without_preload_content")
+        self.model = _list_item_type(operation)
+        self.response_type = f"List[{self.model.__name__}]"
+        self.prefetch = prefetch
+        self.max_buffered_bytes = max_buffered_bytes
+        self.params = params
+
+    def _fetch(self, after: Any) -> bytes:
+        params = self.params if after is None else {**self.params, "after": after}
+        response = rest.RESTResponse(self.operation(**params))
+        response.read()
+        return self.api_client.response_deserialize(
+            response_data=response, response_types_map=_RAW_RESPONSE_TYPES
+        ).data
+
+    def _run_fetcher(self, buffer: _PageBuffer) -> None:
+        page_size = self.params.get("page_size")
+        after = None
+        try:
+            while buffer.wait_for_room():
+                body = self._fetch(after)
+                buffer.put(body, len(body))
+                after = _next_after(_parse_rows(self.api_client, body), page_size)
+                if after is None:
+                    break
+        except Exception as e:
+            buffer.put(e)
+        buffer.put(_PageBuffer._DONE)
+
+    def pages(self) -> Iterator[list[T]]:
+        """Yields the decoded rows of every page, starting with the first one."""
+        if self.prefetch <= 0:
+            page_size = self.params.get("page_size")
+            after = None
+            while True:
+                rows = _parse_rows(self.api_client, self._fetch(after))
+                yield self.api_client.decode_parsed(rows, self.response_type)
+                after = _next_after(rows, page_size)
+                if after is None:
+                    return
+
+        buffer = _PageBuffer(self.prefetch, self.max_buffered_bytes)
+        fetcher = threading.Thread(
+            target=self._run_fetcher,
+            args=(buffer,),
+            name="tl-ninjarmm-paginator",
+            daemon=True,
+        )
+        fetcher.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is _PageBuffer._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield _decode_page(self.api_client, item, self.response_type)
+        finally:
+            buffer.close()
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page
+
+
+class AsyncAfterPaginator(Generic[T]):
+    """asyncio variant of :class:`AfterPaginator`.
+
+    The pages are requested by a separate task that runs ahead of the
+    consumer by up to `prefetch` pages.
+
+    :param operation: the list operation of a bound `AsyncSystemApi`.
+    :param prefetch: how many pages may be fetched ahead of the one being
+        consumed. 0 fetches each page only once the previous one is consumed.
+    :param max_buffered_bytes: no page is requested ahead while the buffered
+        page bodies add up to this many bytes. None disables the cap.
+    :param params: keyword arguments passed to every call of `operation`.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[..., Awaitable[list]],
+        *,
+        prefetch: int = 2,
+        max_buffered_bytes: int | None = DEFAULT_MAX_BUFFERED_BYTES,
+        **params: Any,
+    ) -> None:
+        _check_after_operation(operation)
+        api = operation.__self__
+        self.api_client = api.api_client
+        self.operation = getattr(api, operation.__name__ + "_without_preload_content")
+        self.model = _list_item_type(operation)
+        self.response_type = f"List[{self.model.__name__}]"
+        self.prefetch = prefetch
+        self.max_buffered_bytes = max_buffered_bytes
+        self.params = params
+
+    async def _fetch(self, after: Any) -> bytes:
+        from tl_ninjarmm.aio import rest as aio_rest
+
+        params = self.params if after is None else {**self.params, "after": after}
+        response = aio_rest.RESTResponse(await self.operation(**params))
+        await response.read()
+        return self.api_client.response_deserialize(
+            response_data=response, response_types_map=_RAW_RESPONSE_TYPES
+        ).data
+
+    async def pages(self) -> AsyncIterator[list[T]]:
+        """Yields the decoded rows of every page, starting with the first one."""
+        page_size = self.params.get("page_size")
+        if self.prefetch <= 0:
+            after = None
+            while True:
+                rows = _parse_rows(self.api_client, await self._fetch(after))
+                yield self.api_client.decode_parsed(rows, self.response_type)
+                after = _next_after(rows, page_size)
+                if after is None:
+                    return
+
+        pages: collections.deque = collections.deque()
+        buffered_bytes = 0
+        condition = asyncio.Condition()
+
+        def is_full() -> bool:
+            if len(pages) >= self.prefetch:
+                return True
+            limit = self.max_buffered_bytes
+            return limit is not None and buffered_bytes >= limit
+
+        async def put(item: Any, size: int = 0) -> None:
+            nonlocal buffered_bytes
+            async with condition:
+                pages.append((item, size))
+                buffered_bytes += size
+                condition.notify_all()
+
+        async def run_fetcher() -> None:
+            after = None
+            try:
+                while True:
+                    async with condition:
+                        await condition.wait_for(lambda: not is_full())
+                    body = await self._fetch(after)
+                    await put(body, len(body))
+                    rows = _parse_rows(self.api_client, body)
+                    after = _next_after(rows, page_size)
+                    if after is None:
+                        break
+            except Exception as e:
+                await put(e)
+            await put(_PageBuffer._DONE)
+
+        fetcher = asyncio.ensure_future(run_fetcher())
+        try:
+            while True:
+                async with condition:
+                    await condition.wait_for(lambda: bool(pages))
+                    item, size = pages.popleft()
+                    buffered_bytes -= size
+                    condition.notify_all()
+                if item is _PageBuffer._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield _decode_page(self.api_client, item, self.response_type)
+        finally:
+            fetcher.cancel()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for page in self.pages():
+            for row in page:
+                yield row
+
+
+def paginate(
+    operation: ReportOperation, *, prefetch: bool = True, **params: Any
+) -> CursorPaginator:
+    """Iterates over the rows of every page of a cursor based report.
+
+    >>> for software in paginate(queries_api.get_software, page_size=1000):
+    ...     ...
+
+    :param operation: the report operation of a bound `QueriesApi`.
+    :param prefetch: fetch the next page while the current one is consumed.
+    :param params: keyword arguments passed to every call of `operation`.
+    :return: an iterable over the `results` rows of all pages.
+    """
+    return CursorPaginator(operation, prefetch=prefetch, **params)
+
+
+def apaginate(
+    operation: AsyncReportOperation, *, prefetch: bool = True, **params: Any
+) -> AsyncCursorPaginator:
+    """asyncio variant of :func:`paginate`.
+
+    >>> async for software in apaginate(queries_api.get_software, page_size=1000):
+    ...     ...
+
+    :param operation: the report operation of a bound `AsyncQueriesApi`.
+    :param prefetch: fetch the next page while the current one is consumed.
+    :param params: keyword arguments passed to every call of `operation`.
+    :return: an async iterable over the `results` rows of all pages.
+    """
+    return AsyncCursorPaginator(operation, prefetch=prefetch, **params)
+
+
+def paginate_after(
+    operation: Callable[..., list],
+    *,
+    prefetch: int = 2,
+    max_buffered_bytes: int | None = DEFAULT_MAX_BUFFERED_BYTES,
+    **params: Any,
+) -> AfterPaginator:
+    """Iterates over the rows of every page of an `after` keyed list.
+
+    >>> for device in paginate_after(system_api.get_devices_detailed, page_size=1000):
+    ...     ...
+
+    :param operation: the list operation of a bound `SystemApi`.
+    :param prefetch: how many pages may be fetched ahead of the one being
+        consumed.
+    :param max_buffered_bytes: soft cap on the body bytes of buffered pages.
+    :param params: keyword arguments passed to every call of `operation`.
+    :return: an iterable over the rows of all pages.
+    """
+    return AfterPaginator(
+        operation, prefetch=prefetch, max_buffered_bytes=max_buffered_bytes, **params
+    )
+
+
+def apaginate_after(
+    operation: Callable[..., Awaitable[list]],
+    *,
+    prefetch: int = 2,
+    max_buffered_bytes: int | None = DEFAULT_MAX_BUFFERED_BYTES,
+    **params: Any,
+) -> AsyncAfterPaginator:
+    """asyncio variant of :func:`paginate_after`.
+
+    :param operation: the list operation of a bound `AsyncSystemApi`.
+    :param prefetch: how many pages may be fetched ahead of the one being
+        consumed.
+    :param max_buffered_bytes: soft cap on the body bytes of buffered pages.
+    :param params: keyword arguments passed to every call of `operation`.
+    :return: an async iterable over the rows of all pages.
+    """
+    return AsyncAfterPaginator(
+        operation, prefetch=prefetch, max_buffered_bytes=max_buffered_bytes, **params
+    )
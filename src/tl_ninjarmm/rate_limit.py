@@ -0,0 +1,192 @@
+"""Client side rate limiting for the NinjaOne API.
+
+Requests are paced by token buckets: one for the whole client and optionally
+one per endpoint pattern. The buckets adapt their rate to the server: every
+throttled (429) response halves the rate and honors `Retry-After`, every
+successful response grows it back towards the configured rate (AIMD).
+"""
+
+import email.utils
+import fnmatch
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+GLOBAL_BUCKET = "*"
+
+
+@dataclass(frozen=True)
+class RateLimitBudget:
+    """Snapshot of the state of a token bucket."""
+
+    rate: float
+    """Current requests per second"""
+    max_rate: float
+    """Configured requests per second the rate grows back to"""
+    tokens: float
+    """Requests that can be sent right away, negative when requests queue"""
+    paused_for: float
+    """Seconds left before requests are sent again after a `Retry-After`"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a `Retry-After` header into a number of seconds.
+
+    :param value: the header value, either seconds or an HTTP date.
+    :return: the seconds to wait, None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an AIMD adjusted rate.
+
+    :param rate: requests per second.
+    :param burst: how many requests can be sent at once, defaults to `rate`.
+    :param min_rate: the rate never shrinks below this.
+    :param increase: requests per second added after each success.
+    :param decrease: factor the rate is multiplied by after each 429.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        min_rate: float = 0.1,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ) -> None:
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self.min_rate = min(min_rate, self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = self.burst
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes a token, returns how many seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1.0
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # Drop the burst so requests resume at the reduced rate
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after is not None:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    def budget(self) -> RateLimitBudget:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return RateLimitBudget(
+                rate=self.rate,
+                max_rate=self.max_rate,
+                tokens=self.tokens,
+                paused_for=max(0.0, self.paused_until - now),
+            )
+
+
+class RateLimiter:
+    """Paces the requests of a client through its token buckets.
+
+    :param rate: requests per second for the whole client, None for no
+        global limit.
+    :param burst: how many requests the global bucket sends at once.
+    :param endpoint_rates: mapping of URL path patterns (`fnmatch` syntax,
+        e.g. `/v2/queries/*`) to requests per second. A request matching a
+        pattern goes through both that pattern's bucket and the global one.
+    :param max_retries: how many times a throttled request is sent again.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+    ) -> None:
+        self.max_retries = max_retries
+        self.buckets: Dict[str, TokenBucket] = {}
+        if rate is not None:
+            self.buckets[GLOBAL_BUCKET] = TokenBucket(rate, burst)
+        for pattern, endpoint_rate in (endpoint_rates or {}).items():
+            self.buckets[pattern] = TokenBucket(endpoint_rate)
+
+    @classmethod
+    def from_configuration(cls, configuration) -> Optional["RateLimiter"]:
+        """Builds the limiter of a client, None if rate limiting is disabled.
+
+        When the `retry_policy` of the client retries throttled requests, the
+        limiter leaves the retries to it and only adapts its rate, so that a
+        429 is not retried by both.
+        """
+        if configuration.rate_limit is None and not configuration.endpoint_rate_limits:
+            return None
+        max_retries = configuration.rate_limit_max_retries
+        policy = configuration.retry_policy
+        if policy is not None and 429 in policy.retry_statuses:
+            max_retries = 0
+        return cls(
+            rate=configuration.rate_limit,
+            burst=configuration.rate_limit_burst,
+            endpoint_rates=configuration.endpoint_rate_limits,
+            max_retries=max_retries,
+        )
+
+    def _buckets_for(self, url: str):
+        path = urlsplit(url).path
+        for pattern, bucket in self.buckets.items():
+            if pattern == GLOBAL_BUCKET or fnmatch.fnmatchcase(path, pattern):
+                yield bucket
+
+    def reserve(self, url: str) -> float:
+        """Takes a token for `url`, returns how many seconds to wait before sending."""
+        return max((bucket.reserve() for bucket in self._buckets_for(url)), default=0.0)
+
+    def on_response(self, url: str, status: int, retry_after: Optional[str]) -> None:
+        """Adapts the rate of the buckets of `url` to a response."""
+        if status == 429:
+            seconds = parse_retry_after(retry_after)
+            for bucket in self._buckets_for(url):
+                bucket.on_throttled(seconds)
+        else:
+            for bucket in self._buckets_for(url):
+                bucket.on_success()
+
+    def budget(self) -> Dict[str, RateLimitBudget]:
+        """Returns the current state of every bucket, keyed by endpoint pattern."""
+        return {pattern: bucket.budget() for pattern, bucket in self.buckets.items()}
@@ -12,14 +12,23 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
+import concurrent.futures
+import http.client
 import io
-import json
+import logging
 import re
 import ssl
+import threading
+import time
 
 import urllib3
 
+from tl_ninjarmm.cassette import recorded_headers
+from tl_ninjarmm.codec import resolve_codec
 from tl_ninjarmm.exceptions import ApiException, ApiValueError
+from tl_ninjarmm.hedging import Hedger
+from tl_ninjarmm.http_cache import HttpCache
+from tl_ninjarmm.rate_limit import RateLimiter
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -47,6 +56,11 @@ class RESTResponse(io.IOBase):
             self.data = self.response.data
         return self.data
 
+    def release(self):
+        """Discards the unread body and returns the connection to the pool."""
+        self.response.drain_conn()
+        self.response.release_conn()
+
     def getheaders(self):
         """Returns a dictionary of the response headers."""
         return self.response.headers
@@ -56,6 +70,57 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
+class _RecordingBody(io.RawIOBase):
+    """The body of a response recorded by a cassette, see `_transmit`.
+
+    The body is kept as it is read, and the exchange recorded once it has been
+    read to the end, with the time to the headers plus the time spent reading
+    it. A response closed before the end of its body is not recorded.
+
+    :param response: the urllib3 response read.
+    :param record: called with the body and the elapsed time.
+    :param elapsed: the time the response took to its headers.
+    """
+
+    def __init__(self, response, record, elapsed) -> None:
+        self._response = response
+        self._record = record
+        self._elapsed = elapsed
+        self._chunks = []
+        self._recorded = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        start = time.monotonic()
+        data = self._response.read(len(buffer))
+        self._elapsed += time.monotonic() - start
+        if not data:
+            if not self._recorded:
+                self._recorded = True
+                self._response.release_conn()
+                self._record(b"".join(self._chunks), self._elapsed)
+            return 0
+        self._chunks.append(data)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self._recorded and not self.closed:
+            # The rest of the body is never read, drop the connection
+            self._response.close()
+        super().close()
+
+
+def _discard_attempt(attempt):
+    """Closes the response of an abandoned attempt of a hedged request."""
+    if not attempt.cancelled() and attempt.exception() is None:
+        r = attempt.result()
+        r.close()
+        r.release_conn()
+
+
 class RESTClientObject:
     def __init__(self, configuration) -> None:
         # urllib3.PoolManager will pass all kw parameters to connectionpool
@@ -108,6 +173,18 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+        self.rate_limiter = RateLimiter.from_configuration(configuration)
+        self.json_codec = resolve_codec(configuration.json_codec)
+        self.cache = HttpCache.from_configuration(configuration)
+        self.hedger = Hedger.from_configuration(configuration)
+        self.cassette = configuration.cassette
+        # Both attempts of a hedged request wait on threads of this pool
+        self._hedge_workers = None
+        if self.hedger is not None:
+            self._hedge_workers = 2 * (configuration.connection_pool_maxsize or 10)
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
+
     def request(
         self,
         method,
@@ -151,6 +228,175 @@ class RESTClientObject:
                     connect=_request_timeout[0], read=_request_timeout[1]
                 )
 
+        if self.cache is not None:
+            ttl = self.cache.ttl(method, url)
+            if ttl is not None:
+                return RESTResponse(self._cached_send(url, headers, ttl, timeout))
+
+        return RESTResponse(
+            self._hedged_send(method, url, headers, body, post_params, timeout)
+        )
+
+    def _hedged_send(self, method, url, headers, body, post_params, timeout):
+        """Sends a request, hedged if it is a read and hedging is enabled, see
+        `tl_ninjarmm.hedging`.
+        """
+        delay = None if self.hedger is None else self.hedger.delay(method, url)
+        if delay is None:
+            return self._limited_send(method, url, headers, body, post_params, timeout)
+
+        executor = self._get_hedge_executor()
+        args = (method, url, headers, body, post_params, timeout)
+        attempts = [executor.submit(self._timed_send, *args)]
+        done, _ = concurrent.futures.wait(attempts, timeout=delay)
+        if not done and self.hedger.try_hedge():
+            attempts.append(executor.submit(self._timed_send, *args))
+
+        pending = set(attempts)
+        winner = None
+        while winner is None and pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            # The first attempt wins ties
+            for attempt in attempts:
+                if attempt in done and attempt.exception() is None:
+                    winner = attempt
+                    break
+        if winner is None:
+            # Every attempt failed, report the first one's error
+            return attempts[0].result()
+        if winner is not attempts[0]:
+            self.hedger.record_win()
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.add_done_callback(_discard_attempt)
+        return winner.result()
+
+    def _timed_send(self, method, url, headers, body, post_params, timeout):
+        start = time.monotonic()
+        r = self._limited_send(method, url, headers, body, post_params, timeout)
+        self.hedger.record(method, url, time.monotonic() - start)
+        return r
+
+    def _get_hedge_executor(self):
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._hedge_workers,
+                    thread_name_prefix="tl_ninjarmm-hedge",
+                )
+            return self._hedge_executor
+
+    def _limited_send(self, method, url, headers, body, post_params, timeout):
+        """Sends a request at the pace of the rate limiter, if any."""
+        if self.rate_limiter is None:
+            return self._transmit(
+                method, url, dict(headers), body, post_params, timeout
+            )
+
+        # A throttled request was not processed by the server, so it is safe
+        # to send it again whatever its method.
+        for attempt in range(self.rate_limiter.max_retries + 1):
+            wait = self.rate_limiter.reserve(url)
+            if wait > 0:
+                time.sleep(wait)
+            r = self._transmit(method, url, dict(headers), body, post_params, timeout)
+            self.rate_limiter.on_response(url, r.status, r.headers.get("Retry-After"))
+            if r.status != 429 or attempt == self.rate_limiter.max_retries:
+                break
+            r.drain_conn()
+            r.release_conn()
+        return r
+
+    def _cached_send(self, url, headers, ttl, timeout):
+        """Serves a `GET` request from the HTTP cache, see `tl_ninjarmm.http_cache`."""
+        key = self.cache.key(url, headers)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if self.cache.is_fresh(cached):
+                return self._cached_response(cached)
+            if self.cache.can_serve_stale(cached):
+                if self.cache.claim_revalidation(key):
+                    threading.Thread(
+                        target=self._revalidate_in_background,
+                        args=(key, ttl, cached, url, headers, timeout),
+                        daemon=True,
+                    ).start()
+                return self._cached_response(cached)
+        return self._revalidate(key, ttl, cached, url, headers, timeout)
+
+    def _revalidate(self, key, ttl, cached, url, headers, timeout):
+        headers = self.cache.conditional_headers(headers, cached)
+        r = self._hedged_send("GET", url, headers, None, {}, timeout)
+        if r.status not in (200, 304):
+            return r
+        body = r.data if r.status == 200 else b""
+        response = self.cache.store(key, ttl, cached, r.status, r.headers, body)
+        if response is None:
+            return r
+        r.release_conn()
+        return self._cached_response(response)
+
+    def _revalidate_in_background(self, key, ttl, cached, url, headers, timeout):
+        try:
+            self._revalidate(key, ttl, cached, url, headers, timeout)
+        except Exception:
+            # The stale response is served until a request succeeds
+            logging.getLogger("tl_ninjarmm").warning(
+                "Revalidation of %s failed", url, exc_info=True
+            )
+        finally:
+            self.cache.release_revalidation(key)
+
+    def _cached_response(self, cached):
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(cached.body),
+            headers=self.cache.served_headers(cached),
+            status=cached.status,
+            reason="OK",
+            preload_content=False,
+        )
+
+    def _transmit(self, method, url, headers, body, post_params, timeout):
+        """Sends a request, recording or replaying it with the cassette, if
+        any, see `tl_ninjarmm.cassette`.
+        """
+        if self.cassette is None:
+            return self._send(method, url, headers, body, post_params, timeout)
+        if self.cassette.replaying:
+            exchange = self.cassette.replay(method, url)
+            delay = self.cassette.delay(exchange)
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            start = time.monotonic()
+            r = self._send(method, url, headers, body, post_params, timeout)
+            cassette = self.cassette
+
+            def record(data, elapsed):
+                cassette.record(
+                    method, url, headers, r.status, r.headers, data, elapsed
+                )
+
+            # Recorded as the caller reads it, streamed bodies stay streamed
+            return urllib3.HTTPResponse(
+                body=_RecordingBody(r, record, time.monotonic() - start),
+                headers=recorded_headers(r.headers),
+                status=r.status,
+                reason=r.reason,
+                preload_content=False,
+            )
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(exchange.body),
+            headers=exchange.headers,
+            status=exchange.status,
+            reason=http.client.responses.get(exchange.status),
+            preload_content=False,
+        )
+
+    def _send(self, method, url, headers, body, post_params, timeout):
+        """Sends a single request, returns the urllib3 response."""
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
@@ -158,8 +404,11 @@ class RESTClientObject:
                 content_type = headers.get("Content-Type")
                 if not content_type or re.search("json", content_type, re.IGNORECASE):
                     request_body = None
-                    if body is not None:
-                        request_body = json.dumps(body)
+                    if isinstance(body, bytes):
+                        # Already encoded, see `tl_ninjarmm.codec.encode_body`
+                        request_body = body
+                    elif body is not None:
+                        request_body = self.json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -185,7 +434,9 @@ class RESTClientObject:
                     del headers["Content-Type"]
                     # Ensures that dict objects are serialized
                     post_params = [
-                        (a, json.dumps(b)) if isinstance(b, dict) else (a, b)
+                        (a, self.json_codec.dumps(b).decode())
+                        if isinstance(b, dict)
+                        else (a, b)
                         for a, b in post_params
                     ]
                     r = self.pool_manager.request(
@@ -241,4 +492,4 @@ class RESTClientObject:
             msg = "\n".join([type(e).__name__, str(e)])
             raise ApiException(status=0, reason=msg)
 
-        return RESTResponse(r)
+        return r
@@ -0,0 +1,255 @@
+"""Retries and circuit breaking around `ApiClient.call_api`.
+
+Whether a request may be retried depends on the HTTP method of its operation.
+The generated APIs use `GET` for reads, `PUT`/`DELETE` for idempotent writes
+and `POST`/`PATCH` for creations, partial updates and actions such as running
+a script, which must not be sent twice. Those are only retried when the server
+provably did not process them: the connection could not be established or the
+request was throttled (429).
+
+Every endpoint (method plus path with its ids replaced by `{id}`) has a
+circuit breaker. After `failure_threshold` consecutive server errors or
+transport failures, requests to that endpoint fail fast with
+`CircuitOpenError` for `reset_timeout` seconds, then a single probe request
+decides whether to close the breaker again.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+from tl_ninjarmm.exceptions import CircuitOpenError
+from tl_ninjarmm.rate_limit import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_ID_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+ErrorTypes = Tuple[Type[BaseException], ...]
+
+
+def is_idempotent(method: str) -> bool:
+    """Returns whether an operation with this HTTP method may be sent twice."""
+    return method.upper() in IDEMPOTENT_METHODS
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Returns the endpoint of a request, e.g. `GET /v2/device/{id}/disks`."""
+    path = _ID_SEGMENT_RE.sub("/{id}", urlsplit(url).path)
+    return f"{method.upper()} {path}"
+
+
+@dataclass
+class RetryPolicy:
+    """Settings of the retries and circuit breakers of a client.
+
+    :param max_attempts: how many times a request is sent at most.
+    :param base_delay: the smallest delay between two attempts, in seconds.
+    :param max_delay: the largest delay between two attempts, in seconds. A
+        response asking to `Retry-After` longer than this is not retried.
+    :param retry_statuses: response statuses worth another attempt.
+    :param failure_threshold: consecutive failures that open the breaker of
+        an endpoint.
+    :param reset_timeout: seconds an open breaker rejects requests for.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: a random delay up to three times the last one."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker of a single endpoint."""
+
+    def __init__(self, endpoint: str, failure_threshold: int, reset_timeout: float):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def before_request(self) -> None:
+        """Raises `CircuitOpenError` if the request must not be sent."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(self.endpoint, max(0.0, remaining))
+            # Let a single request through to probe the endpoint
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Lets another probe through after one ended without an outcome."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+class RetryEngine:
+    """Sends requests according to a `RetryPolicy`.
+
+    :param policy: the retry and circuit breaker settings.
+    :param transient_errors: transport errors worth another attempt for
+        idempotent requests.
+    :param connect_errors: transport errors raised before the request could
+        reach the server, worth another attempt for any request.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        transient_errors: ErrorTypes,
+        connect_errors: ErrorTypes,
+    ) -> None:
+        self.policy = policy
+        self.transient_errors = transient_errors
+        self.connect_errors = connect_errors
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(
+                    endpoint,
+                    CircuitBreaker(
+                        endpoint,
+                        self.policy.failure_threshold,
+                        self.policy.reset_timeout,
+                    ),
+                )
+        return breaker
+
+    def _is_connect_error(self, error: BaseException) -> bool:
+        # urllib3 wraps the underlying error once its own retries are spent
+        reason = getattr(error, "reason", None)
+        return isinstance(error, self.connect_errors) or isinstance(
+            reason, self.connect_errors
+        )
+
+    def _retry_delay_after_error(
+        self, method: str, error: BaseException, attempt: int, delay: float
+    ) -> Optional[float]:
+        if attempt >= self.policy.max_attempts:
+            return None
+        if not is_idempotent(method) and not self._is_connect_error(error):
+            return None
+        return self.policy.next_delay(delay)
+
+    def _retry_delay_after_response(
+        self, method: str, response: Any, attempt: int, delay: float
+    ) -> Optional[float]:
+        if attempt >= self.policy.max_attempts:
+            return None
+        if response.status not in self.policy.retry_statuses:
+            return None
+        if not is_idempotent(method) and response.status != 429:
+            return None
+        retry_after = parse_retry_after(response.getheader("Retry-After"))
+        if retry_after is not None and retry_after > self.policy.max_delay:
+            return None
+        return max(self.policy.next_delay(delay), retry_after or 0.0)
+
+    @staticmethod
+    def _record(breaker: CircuitBreaker, status: int) -> None:
+        if status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def call(self, method: str, url: str, send: Callable[[], Any]) -> Any:
+        """Sends a request with `send`, retrying it as the policy allows."""
+        breaker = self.breaker(endpoint_key(method, url))
+        delay = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_request()
+            try:
+                response = send()
+            except self.transient_errors as e:
+                breaker.record_failure()
+                delay = self._retry_delay_after_error(method, e, attempt, delay)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_probe()
+                raise
+            else:
+                self._record(breaker, response.status)
+                delay = self._retry_delay_after_response(
+                    method, response, attempt, delay
+                )
+                if delay is None:
+                    return response
+                response.release()
+            time.sleep(delay)
+
+    async def acall(
+        self, method: str, url: str, send: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """asyncio variant of :meth:`call`."""
+        breaker = self.breaker(endpoint_key(method, url))
+        delay = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_request()
+            try:
+                response = await send()
+            except self.transient_errors as e:
+                breaker.record_failure()
+                delay = self._retry_delay_after_error(method, e, attempt, delay)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_probe()
+                raise
+            else:
+                self._record(breaker, response.status)
+                delay = self._retry_delay_after_response(
+                    method, response, attempt, delay
+                )
+                if delay is None:
+                    return response
+                response.release()
+            await asyncio.sleep(delay)
@@ -0,0 +1,372 @@
+"""Streaming decoding of large list responses.
+
+The generated operations read the whole body, decode it to `str`, parse it
+with `json.loads` and build every model before returning. For the large
+lists (`SystemApi.get_devices_detailed`, the `QueriesApi` reports, ...) that
+holds several copies of the payload in memory at once.
+
+`stream_models` sends the request through the
+`<operation>_without_preload_content` variant instead and parses the body
+incrementally while it is read from the socket, yielding one model at a time.
+Only the record being parsed and the chunk being read are kept in memory.
+Every record is decoded the way the operation decodes its response: following
+`Configuration.decode_mode` and `decoders.decoding`.
+
+For reports, which wrap their rows in an object (`{"cursor": ..., "results":
+[...]}`), the rows of `results` are yielded and the other members of the
+object are available in `members` as they are parsed.
+"""
+
+import inspect
+import json
+import re
+import typing
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, Generic, TypeVar
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.exceptions import ApiException, ApiValueError
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = b" \t\r\n"
+_STRUCTURE_RE = re.compile(rb'[\[\]{}"]')
+_STRING_END_RE = re.compile(rb'["\\]')
+_SCALAR_END_RE = re.compile(rb"[\s,\]}]")
+_CHARSET_RE = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+
+# Parser states
+_ROOT = 0
+_ARRAY = 1
+_OBJECT = 2
+_COLON = 3
+_MEMBER = 4
+_DONE = 5
+
+
+class JsonArrayParser:
+    """Incremental parser of a JSON array, or of an array in a JSON object.
+
+    Feed the document with `feed` as it is received, every call returns the
+    array items completed by the new data.
+
+    :param member: the name of the array in the top level object, None when
+        the document is the array itself.
+    :param loads: decodes a complete JSON value from `bytes`, e.g. the
+        `loads` of the client's `tl_ninjarmm.codec.JsonCodec`.
+    """
+
+    def __init__(
+        self,
+        member: str | None = None,
+        loads: Callable[[bytes], Any] = json.loads,
+    ) -> None:
+        self.member = member
+        self.loads = loads
+        self.members: dict[str, Any] = {}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _ROOT
+        self._in_member_array = False
+        self._key: str | None = None
+        # Progress of the value being scanned, kept between calls to `feed`
+        self._scan_at: int | None = None
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Adds the next chunk of the document, returns the completed items."""
+        if self._pos:
+            del self._buffer[: self._pos]
+            if self._scan_at is not None:
+                self._scan_at -= self._pos
+            self._pos = 0
+        self._buffer += data
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        return items
+
+    def close(self) -> None:
+        """Raises `ValueError` if the document is incomplete."""
+        if self._state != _DONE:
+            raise ValueError("truncated JSON document")
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def _next_char(self) -> int | None:
+        """Skips whitespace, returns the next character without consuming it."""
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        return buffer[self._pos] if self._pos < len(buffer) else None
+
+    def _scan_value(self) -> bytes | None:
+        """Consumes the value at the current position, None if incomplete."""
+        buffer = self._buffer
+        start = self._pos
+        if self._scan_at is None:
+            if buffer[start] not in b'[{"':
+                match = _SCALAR_END_RE.search(buffer, start)
+                if match is None:
+                    return None
+                self._pos = match.start()
+                return bytes(buffer[start : self._pos])
+            self._scan_at = start
+            self._depth = 0
+            self._in_string = False
+
+        i = self._scan_at
+        while True:
+            if self._in_string:
+                match = _STRING_END_RE.search(buffer, i)
+                if match is None:
+                    self._scan_at = len(buffer)
+                    return None
+                if match[0] == b"\\" and match.end() == len(buffer):
+                    # Wait for the escaped character
+                    self._scan_at = match.start()
+                    return None
+                if match[0] == b"\\":
+                    i = match.end() + 1
+                    continue
+                self._in_string = False
+                i = match.end()
+            else:
+                match = _STRUCTURE_RE.search(buffer, i)
+                if match is None:
+                    self._scan_at = len(buffer)
+                    return None
+                char = match[0]
+                if char == b'"':
+                    self._in_string = True
+                elif char in b"[{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                i = match.end()
+            if self._depth == 0 and not self._in_string:
+                self._scan_at = None
+                self._pos = i
+                return bytes(buffer[start:i])
+
+    def _step(self, items: list[Any]) -> bool:
+        """Parses the next token, False when more data is needed."""
+        char = self._next_char()
+        if char is None:
+            return False
+        state = self._state
+
+        if state == _ROOT:
+            expected = ord("[") if self.member is None else ord("{")
+            if char != expected:
+                raise ValueError(
+                    f"expected {chr(expected)!r} at the start of the document"
+                )
+            self._pos += 1
+            self._state = _ARRAY if self.member is None else _OBJECT
+        elif state == _ARRAY:
+            if char == ord(","):
+                self._pos += 1
+            elif char == ord("]"):
+                self._pos += 1
+                self._state = _OBJECT if self._in_member_array else _DONE
+                self._in_member_array = False
+            else:
+                value = self._scan_value()
+                if value is None:
+                    return False
+                items.append(self.loads(value))
+        elif state == _OBJECT:
+            if char == ord(","):
+                self._pos += 1
+            elif char == ord("}"):
+                self._pos += 1
+                self._state = _DONE
+            else:
+                key = self._scan_value()
+                if key is None:
+                    return False
+                self._key = self.loads(key)
+                self._state = _COLON
+        elif state == _COLON:
+            if char != ord(":"):
+                raise ValueError(f"expected ':' after member {self._key!r}")
+            self._pos += 1
+            self._state = _MEMBER
+        elif state == _MEMBER:
+            if self._key == self.member and char == ord("["):
+                self._pos += 1
+                self._in_member_array = True
+                self._state = _ARRAY
+            else:
+                value = self._scan_value()
+                if value is None:
+                    return False
+                self.members[self._key] = self.loads(value)
+                self._state = _OBJECT
+        else:
+            raise ValueError("unexpected data after the end of the document")
+        return True
+
+
+def _item_model(operation: Callable[..., Any]) -> tuple[str | None, Any]:
+    """Returns the array member and item type of the list an operation returns."""
+    return_type = inspect.signature(operation).return_annotation
+    if typing.get_origin(return_type) is list:
+        (item_type,) = typing.get_args(return_type)
+        return None, item_type
+    fields = getattr(return_type, "model_fields", {})
+    if "results" in fields:
+        for arg in typing.get_args(fields["results"].annotation):
+            if typing.get_origin(arg) is list:
+                (item_type,) = typing.get_args(arg)
+                return "results", item_type
+    name = getattr(operation, "__name__", operation)
+    raise ApiValueError(f"{name} does not return a list")
+
+
+def _streaming_operation(operation: Callable[..., Any]) -> Callable[..., Any]:
+    api = getattr(operation, "__self__", None)
+    name = getattr(operation, "__name__", operation)
+    if api is None or not hasattr(api, f"{name}_without_preload_content"):
+        raise ApiValueError(f"{name} is not an operation of a bound API")
+    return getattr(api, f"{name}_without_preload_content")
+
+
+def _error_text(data: bytes, content_type: str | None) -> str:
+    """Decodes the body of an error response with the charset of its content
+    type, as `ApiClient.response_deserialize` does.
+    """
+    match = _CHARSET_RE.search(content_type or "")
+    try:
+        return data.decode(match.group(1) if match else "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset, the error must still be raised
+        return data.decode("utf-8", errors="replace")
+
+
+class ModelStream(Generic[T]):
+    """Iterates over the models of a list response while it is received.
+
+    :param operation: a list or report operation of a bound API, e.g.
+        `SystemApi.get_devices_detailed`.
+    :param chunk_size: how many bytes are read from the socket at once.
+    :param params: keyword arguments passed to `operation`.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[..., Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params: Any,
+    ) -> None:
+        self.operation = _streaming_operation(operation)
+        self.member, self.model = _item_model(operation)
+        self.api_client = operation.__self__.api_client
+        self.response_type = self.model.__name__
+        self.loads = self.api_client.json_codec.loads
+        self.parser = JsonArrayParser(self.member, self.loads)
+        self.chunk_size = chunk_size
+        self.params = params
+
+    @property
+    def members(self) -> dict[str, Any]:
+        """The other members of a report, e.g. its `cursor`, as parsed so far."""
+        return self.parser.members
+
+    def __iter__(self) -> Iterator[T]:
+        self.parser = JsonArrayParser(self.member, self.loads)
+        response = self.operation(**self.params)
+        if not 200 <= response.status <= 299:
+            error = rest.RESTResponse(response)
+            try:
+                body = _error_text(error.read(), error.getheader("content-type"))
+            finally:
+                response.release_conn()
+            raise ApiException.from_response(http_resp=error, body=body, data=None)
+        try:
+            for chunk in response.stream(self.chunk_size):
+                for item in self.parser.feed(chunk):
+                    yield self.api_client.decode_parsed(item, self.response_type)
+            self.parser.close()
+        finally:
+            if not self.parser.done:
+                # Do not read the rest of an abandoned body, drop the connection
+                response.close()
+            response.release_conn()
+
+
+class AsyncModelStream(Generic[T]):
+    """asyncio variant of :class:`ModelStream`.
+
+    :param operation: a list or report operation of a bound async API.
+    :param chunk_size: how many bytes are read from the socket at once.
+    :param params: keyword arguments passed to `operation`.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[..., Awaitable[Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params: Any,
+    ) -> None:
+        self.operation = _streaming_operation(operation)
+        self.member, self.model = _item_model(operation)
+        self.api_client = operation.__self__.api_client
+        self.response_type = self.model.__name__
+        self.loads = self.api_client.json_codec.loads
+        self.parser = JsonArrayParser(self.member, self.loads)
+        self.chunk_size = chunk_size
+        self.params = params
+
+    @property
+    def members(self) -> dict[str, Any]:
+        """The other members of a report, e.g. its `cursor`, as parsed so far."""
+        return self.parser.members
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        from tl_ninjarmm.aio import rest as aio_rest
+
+        self.parser = JsonArrayParser(self.member, self.loads)
+        response = await self.operation(**self.params)
+        if not 200 <= response.status <= 299:
+            error = aio_rest.RESTResponse(response)
+            try:
+                data = await error.read()
+            finally:
+                response.release()
+            body = _error_text(data, error.getheader("content-type"))
+            raise ApiException.from_response(http_resp=error, body=body, data=None)
+        try:
+            async for chunk in response.content.iter_chunked(self.chunk_size):
+                for item in self.parser.feed(chunk):
+                    yield self.api_client.decode_parsed(item, self.response_type)
+            self.parser.close()
+        finally:
+            if self.parser.done:
+                response.release()
+            else:
+                response.close()
+
+
+def stream_models(operation: Callable[..., Any], **params: Any) -> ModelStream[Any]:
+    """Returns an iterator over the models of a list response as it arrives.
+
+    >>> for device in stream_models(system_api.get_devices_detailed):
+    ...     print(device.id)
+    """
+    return ModelStream(operation, **params)
+
+
+def astream_models(
+    operation: Callable[..., Awaitable[Any]], **params: Any
+) -> AsyncModelStream[Any]:
+    """asyncio variant of :func:`stream_models`."""
+    return AsyncModelStream(operation, **params)
@@ -0,0 +1,7 @@
+"""
+Tools to benchmark and load test the client without a NinjaOne tenant.
+
+`tl_ninjarmm.testing.server` is a local stand-in of the NinjaOne API built
+from `openapi_spec.yaml`. Requires the optional `aiohttp` and `pyyaml`
+dependencies (`tl-ninjarmm[testing]`).
+"""
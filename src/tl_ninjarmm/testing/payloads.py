@@ -0,0 +1,724 @@
+"""Synthetic payloads matching the schemas of the OpenAPI spec.
+
+`PayloadGenerator` builds JSON values, e.g. a `Device` or a page of
+`SoftwareReport`, which the generated models accept. Values only depend on
+the seed of the generator and on the `key` they are generated for, so the
+same row is generated again identically, e.g. by every page of a list.
+
+Values look like the ones of a production fleet rather than uniformly random
+ones, so that decoding, memory and export benchmarks measure realistic data:
+
+- enums follow skewed distributions (`ENUM_WEIGHTS`, e.g. mostly Windows
+  workstations and successful activities), the enums without weights follow
+  a Zipf distribution in the order of the spec,
+- foreign keys such as `organizationId` or `deviceId` point into a fleet of
+  `fleet` organizations, locations, devices, ..., the small populations with
+  a Zipf skew, and the expanded `references` of a device are the generated
+  organization, location, policy and role it points to, shared by all the
+  devices pointing to them,
+- host names, IP and MAC addresses, emails, installed applications, sizes
+  and custom `fields` are made from property names, and some optional
+  properties, e.g. `maintenance`, are only present in a share of the rows.
+
+`rows` streams any number of rows of a component schema, e.g. 5M
+`DeviceApplication`, without holding them in memory, and `write_array`
+encodes them to a JSON array file.
+
+Schemas are compiled to builder functions on first use and `rows` seeds a
+random generator per block of rows rather than per row, which streams tens of
+thousands of `DeviceApplication` rows per second.
+"""
+
+import bisect
+import datetime
+import itertools
+import random
+import uuid
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tl_ninjarmm.codec import JsonCodec, resolve_codec
+from tl_ninjarmm.testing.spec import Schema, resolve
+
+Builder = Callable[[random.Random], Any]
+
+_INTEGER_RANGES = {
+    "int32": (0, 2**31 - 1),
+    "int64": (0, 2**63 - 1),
+}
+_EPOCH_RANGE = (1577836800, 1767225600)
+"""2020-01-01 to 2026-01-01, the range of the generated timestamps"""
+
+DEFAULT_FLEET: Dict[str, int] = {
+    "organizations": 50,
+    "locations": 250,
+    "devices": 100_000,
+    "policies": 40,
+    "roles": 30,
+    "users": 200,
+}
+"""Default size of the populations the generated foreign keys point into"""
+
+_ID_POOLS = {
+    "organizationId": "organizations",
+    "clientId": "organizations",
+    "locationId": "locations",
+    "deviceId": "devices",
+    "nodeId": "devices",
+    "parentDeviceId": "devices",
+    "policyId": "policies",
+    "rolePolicyId": "policies",
+    "parentPolicyId": "policies",
+    "nodeRoleId": "roles",
+    "userId": "users",
+}
+_ZIPF_POOL_LIMIT = 10_000
+"""Larger pools, e.g. devices, are drawn uniformly"""
+_CACHED_REFERENCES = 10_000
+
+ROWS_PER_SEED = 256
+"""Rows generated by `PayloadGenerator.rows` with the same random generator"""
+
+ENUM_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "nodeClass": {
+        "WINDOWS_WORKSTATION": 60,
+        "WINDOWS_SERVER": 14,
+        "MAC": 9,
+        "LINUX_SERVER": 4,
+        "LINUX_WORKSTATION": 2,
+        "VMWARE_VM_GUEST": 3,
+        "HYPERV_VMM_GUEST": 2,
+        "VMWARE_VM_HOST": 1,
+        "HYPERV_VMM_HOST": 1,
+        "NMS_SWITCH": 1,
+        "NMS_ROUTER": 0.5,
+        "NMS_FIREWALL": 0.5,
+        "NMS_PRINTER": 1,
+        "NMS_WAP": 0.5,
+        "CLOUD_MONITOR_TARGET": 0.3,
+        "ANDROID": 0.3,
+        "APPLE_IOS": 0.3,
+        "UNMANAGED_DEVICE": 0.1,
+    },
+    "approvalStatus": {"APPROVED": 97, "PENDING": 3},
+    "severity": {"NONE": 70, "MINOR": 15, "MODERATE": 8, "MAJOR": 5, "CRITICAL": 2},
+    "priority": {"NONE": 60, "LOW": 20, "MEDIUM": 15, "HIGH": 5},
+    "activityResult": {
+        "SUCCESS": 85,
+        "FAILURE": 10,
+        "UNCOMPLETED": 3,
+        "UNSUPPORTED": 2,
+    },
+    "activityType": {
+        "CONDITION": 25,
+        "ACTIONSET": 15,
+        "PATCH_MANAGEMENT": 15,
+        "SOFTWARE_PATCH_MANAGEMENT": 10,
+        "SYSTEM": 10,
+        "SCRIPTING": 8,
+        "ANTIVIRUS": 5,
+        "MONITOR": 4,
+        "REMOTE_TOOLS": 3,
+        "NINJA_REMOTE": 2,
+        "NINJA_BACKUP": 2,
+        "SECURITY": 1,
+    },
+    "status": {"PENDING": 10, "IN_MAINTENANCE": 85, "FAILED": 5},
+}
+"""Relative weights of the enum values, by property name, for the enums
+holding all the weighted values. The other values of such an enum are never
+generated."""
+
+_PRESENCE = {
+    "maintenance": 0.02,
+    "parentDeviceId": 0.05,
+    "assignedOwnerUid": 0.2,
+    "notes": 0.1,
+    "publicIP": 0.8,
+}
+"""Share of the generated objects holding these optional properties"""
+
+_BOOLEAN_RATIOS = {
+    "offline": 0.12,
+    "enabled": 0.95,
+    "administrator": 0.1,
+    "mustChangePw": 0.02,
+    "mfaConfigured": 0.8,
+    "custom": 0.3,
+}
+"""Share of true values of these boolean properties, half of the others"""
+
+_APPLICATIONS = (
+    ("Microsoft Edge", "Microsoft Corporation", "131.0"),
+    ("Google Chrome", "Google LLC", "131.0"),
+    (
+        "Microsoft Visual C++ 2015-2022 Redistributable (x64)",
+        "Microsoft Corporation",
+        "14.40",
+    ),
+    ("NinjaRMMAgent", "NinjaRMM LLC", "6.0"),
+    ("Microsoft 365 Apps for enterprise - en-us", "Microsoft Corporation", "16.0"),
+    ("Microsoft Teams", "Microsoft Corporation", "24.11"),
+    ("Adobe Acrobat Reader", "Adobe", "24.4"),
+    ("Mozilla Firefox (x64 en-US)", "Mozilla", "133.0"),
+    ("7-Zip 24.08 (x64)", "Igor Pavlov", "24.08"),
+    ("Zoom Workplace (64-bit)", "Zoom Video Communications, Inc.", "6.2"),
+    ("Microsoft OneDrive", "Microsoft Corporation", "24.201"),
+    ("Notepad++ (64-bit x64)", "Notepad++ Team", "8.7"),
+    ("Java 8 Update 431", "Oracle Corporation", "8.0"),
+    ("VLC media player", "VideoLAN", "3.0"),
+    ("Slack", "Slack Technologies Inc.", "4.41"),
+    ("Python 3.12.7 (64-bit)", "Python Software Foundation", "3.12"),
+    ("Cisco Secure Client - AnyConnect VPN", "Cisco Systems, Inc.", "5.1"),
+    ("Dell Command | Update", "Dell Inc.", "5.4"),
+    ("Git", "The Git Development Community", "2.47"),
+    ("Microsoft Update Health Tools", "Microsoft Corporation", "5.72"),
+)
+_CUSTOM_FIELDS = (
+    ("assetTag", "text", 0.6),
+    ("department", "department", 0.5),
+    ("warrantyExpires", "date", 0.4),
+    ("backupEnabled", "checkbox", 0.3),
+    ("patchWindow", "patchWindow", 0.3),
+    ("purchasePrice", "decimal", 0.2),
+    ("lastAuditScore", "integer", 0.1),
+    ("primaryContact", "email", 0.1),
+)
+"""Custom fields of a tenant, their kind and the share of objects filling them"""
+_DEPARTMENTS = ("Finance", "Sales", "Engineering", "Support", "HR", "Operations")
+_PATCH_WINDOWS = ("Tue 22:00", "Wed 02:00", "Sat 01:00", "Sun 03:00")
+_FIRST_NAMES = ("James", "Mary", "Wei", "Fatima", "Lucas", "Ana", "Noah", "Priya")
+_LAST_NAMES = ("Smith", "Garcia", "Chen", "Khan", "Müller", "Silva", "Brown", "Kim")
+_TAGS = ("vip", "critical", "remote", "kiosk", "lab", "byod", "legacy", "pci")
+_HOST_PREFIXES = ("DESKTOP", "LAPTOP", "WS", "SRV", "DC", "SQL", "FS", "MAC")
+
+
+def _none(rng: random.Random) -> None:
+    return None
+
+
+def _zipf_cum_weights(size: int) -> List[float]:
+    return list(itertools.accumulate(1 / rank for rank in range(1, size + 1)))
+
+
+def _draw(values: Tuple[Any, ...], cum_weights: List[float]) -> Builder:
+    total = cum_weights[-1]
+    last = len(values) - 1
+
+    def build(rng: random.Random) -> Any:
+        index = bisect.bisect(cum_weights, rng.random() * total)
+        return values[min(index, last)]
+
+    return build
+
+
+# `int(rng.random() * n)` rather than `rng.randrange(n)`, several times faster
+# and as good for synthetic data
+
+
+def _below(rng: random.Random, n: int) -> int:
+    return int(rng.random() * n)
+
+
+def _pick(rng: random.Random, values: Tuple[Any, ...]) -> Any:
+    return values[int(rng.random() * len(values))]
+
+
+def _host_name(rng: random.Random) -> str:
+    return f"{_pick(rng, _HOST_PREFIXES)}-{rng.getrandbits(36):09X}"
+
+
+def _ipv4(rng: random.Random) -> str:
+    octets = rng.getrandbits(24)
+    return f"10.{octets >> 16}.{(octets >> 8) & 255}.{octets & 255}"
+
+
+def _public_ipv4(rng: random.Random) -> str:
+    octets = rng.getrandbits(24)
+    first = 11 + _below(rng, 212)
+    return f"{first}.{octets >> 16}.{(octets >> 8) & 255}.{octets & 255}"
+
+
+def _mac(rng: random.Random) -> str:
+    return ":".join(f"{byte:02X}" for byte in rng.getrandbits(48).to_bytes(6, "big"))
+
+
+def _email(rng: random.Random) -> str:
+    first = _pick(rng, _FIRST_NAMES).lower()
+    last = _pick(rng, _LAST_NAMES).lower()
+    return f"{first}.{last}{_below(rng, 100)}@example.com"
+
+
+def _version(rng: random.Random) -> str:
+    return f"{1 + _below(rng, 29)}.{_below(rng, 10)}.{_below(rng, 10000)}"
+
+
+_STRINGS: Dict[str, Callable[[random.Random], str]] = {
+    "systemName": _host_name,
+    "netbiosName": _host_name,
+    "displayName": _host_name,
+    "dnsName": lambda rng: f"{_host_name(rng).lower()}.corp.example.com",
+    "ipAddresses": _ipv4,
+    "publicIP": _public_ipv4,
+    "macAddresses": _mac,
+    "email": _email,
+    "firstName": lambda rng: _pick(rng, _FIRST_NAMES),
+    "lastName": lambda rng: _pick(rng, _LAST_NAMES),
+    "phone": lambda rng: f"+1 555 {_below(rng, 10000000):07d}",
+    "tags": lambda rng: _pick(rng, _TAGS),
+    "version": _version,
+}
+"""Builders of the string properties, by property name"""
+
+_INTEGERS: Dict[str, Callable[[random.Random], int]] = {
+    # Sizes in bytes spread over orders of magnitude, 100 kB to 3 GB
+    "size": lambda rng: int(10 ** rng.uniform(5, 9.5)),
+}
+"""Builders of the integer properties, by property name"""
+
+
+def _custom_field(rng: random.Random, kind: str) -> Any:
+    if kind == "text":
+        return f"AT-{_below(rng, 100000):05d}"
+    if kind == "department":
+        return _pick(rng, _DEPARTMENTS)
+    if kind == "patchWindow":
+        return _pick(rng, _PATCH_WINDOWS)
+    if kind == "date":
+        return datetime.date.fromtimestamp(rng.uniform(*_EPOCH_RANGE)).isoformat()
+    if kind == "checkbox":
+        return rng.random() < 0.7
+    if kind == "decimal":
+        return round(rng.uniform(300, 4000), 2)
+    if kind == "integer":
+        return _below(rng, 101)
+    return _email(rng)
+
+
+def _custom_fields(rng: random.Random) -> Dict[str, Any]:
+    """Values of the custom fields filled for an object."""
+    return {
+        name: {"value": _custom_field(rng, kind)}
+        for name, kind, ratio in _CUSTOM_FIELDS
+        if rng.random() < ratio
+    }
+
+
+class PayloadGenerator:
+    """Builds JSON values matching the schemas of a spec.
+
+    :param spec: the OpenAPI spec, see `load_spec`.
+    :param seed: seed of the generated values.
+    :param max_items: longest generated arrays, unless a schema needs more.
+    :param max_depth: nested objects deeper than this are generated empty,
+        which ends recursive schemas.
+    :param fleet: sizes of the populations the foreign keys point into, on
+        top of `DEFAULT_FLEET`, e.g. `{"devices": 5000}`.
+    :param enum_weights: weights of the enum values by property name, on top
+        of `ENUM_WEIGHTS`.
+    """
+
+    def __init__(
+        self,
+        spec: Dict[str, Any],
+        seed: int = 0,
+        max_items: int = 3,
+        max_depth: int = 6,
+        fleet: Optional[Mapping[str, int]] = None,
+        enum_weights: Optional[Mapping[str, Mapping[str, float]]] = None,
+    ) -> None:
+        self.spec = spec
+        self.seed = seed
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.fleet = {**DEFAULT_FLEET, **(fleet or {})}
+        self.enum_weights = {**ENUM_WEIGHTS, **(enum_weights or {})}
+        # Builders by schema, property name, depth and component
+        self._builders: Dict[Tuple[Any, ...], Tuple[Schema, Builder]] = {}
+        self._pools: Dict[str, Builder] = {}
+        self._references: Dict[Tuple[str, Any], Any] = {}
+
+    def schema(self, name: str) -> Schema:
+        """Returns the component schema named `name`, e.g. `Device`."""
+        return self.spec["components"]["schemas"][name]
+
+    def rng(self, key: Hashable) -> random.Random:
+        """Returns the random generator of the values generated for `key`."""
+        return random.Random(f"{self.seed}:{key!r}")
+
+    def generate(
+        self, schema: Schema, key: Hashable = None, rng: Optional[random.Random] = None
+    ) -> Any:
+        """Returns a value matching `schema`.
+
+        :param schema: the schema, or a `$ref` to a component schema.
+        :param key: identifies the value, the same key gives the same value.
+        :param rng: the random generator to use instead of the one of `key`.
+        """
+        return self._builder(schema, "value", 0, None)(rng or self.rng(key))
+
+    def rows(self, name: str, count: int, start: int = 0) -> Iterator[Any]:
+        """Yields `count` values of the component schema `name`.
+
+        Rows are generated by blocks of `ROWS_PER_SEED` sharing a random
+        generator seeded with the seed and `(name, block)`, so that any range
+        of rows can be generated on its own, e.g. by several processes, and
+        is the same as in a generation of all the rows. Rows with an `id` get
+        the ids `start + 1` to `start + count`.
+
+        :param name: the component schema, e.g. `DeviceApplication`.
+        :param count: how many rows to yield.
+        :param start: index of the first row.
+        """
+        build = self._builder(
+            {"$ref": f"#/components/schemas/{name}"}, "value", 0, None
+        )
+        # Seeding a generator costs more than generating a small row
+        first = start - start % ROWS_PER_SEED
+        rng = self.rng((name, first // ROWS_PER_SEED))
+        for index in range(first, start + count):
+            if index % ROWS_PER_SEED == 0:
+                rng = self.rng((name, index // ROWS_PER_SEED))
+            row = build(rng)
+            if index < start:
+                continue
+            if isinstance(row, dict) and "id" in row:
+                row["id"] = index + 1
+            yield row
+
+    def _builder(self, schema: Schema, name: str, depth: int, owner) -> Builder:
+        ref = schema.get("$ref")
+        if ref is not None:
+            owner = ref.rsplit("/", 1)[-1]
+        key = (ref or id(schema), name, depth, owner)
+        cached = self._builders.get(key)
+        # Inline schemas are cached by id, which a discarded schema may reuse
+        if cached is None or (ref is None and cached[0] is not schema):
+            resolved = resolve(self.spec, schema)
+            build = self._build(resolved, name, depth, owner, ref is not None)
+            cached = self._builders[key] = (schema, build)
+        return cached[1]
+
+    def _build(
+        self, schema: Schema, name: str, depth: int, owner, component: bool
+    ) -> Builder:
+        if "allOf" in schema:
+            return self._object(self._merge(schema), depth, owner, component)
+        if "enum" in schema:
+            return self._enum(schema["enum"], name)
+        kind = schema.get("type")
+        if kind == "object" or "properties" in schema:
+            if name == "fields" and not schema.get("properties"):
+                return _custom_fields
+            return self._object(schema, depth, owner, component)
+        if kind == "array":
+            return self._array(schema, name, depth, owner)
+        if kind == "integer":
+            return self._integer(schema, name)
+        if kind == "number":
+            return self._number(schema)
+        if kind == "boolean":
+            ratio = _BOOLEAN_RATIOS.get(name, 0.5)
+            return lambda rng: rng.random() < ratio
+        if kind == "string":
+            return self._string(schema, name)
+        return lambda rng: None
+
+    def _merge(self, schema: Schema) -> Schema:
+        properties: Dict[str, Any] = {}
+        required = []
+        for part in schema["allOf"]:
+            part = resolve(self.spec, part)
+            if "allOf" in part:
+                part = self._merge(part)
+            properties.update(part.get("properties", {}))
+            required.extend(part.get("required", ()))
+        properties.update(schema.get("properties", {}))
+        return {"type": "object", "properties": properties, "required": required}
+
+    def _enum(self, values: List[Any], name: str) -> Builder:
+        weights = self.enum_weights.get(name)
+        # Weights are only applied to the enums they were written for
+        if weights is not None and weights.keys() <= set(values):
+            values = [value for value in values if weights.get(value)]
+            cum_weights = list(itertools.accumulate(weights[v] for v in values))
+        else:
+            cum_weights = _zipf_cum_weights(len(values))
+        return _draw(tuple(values), cum_weights)
+
+    def _object(self, schema: Schema, depth: int, owner, component: bool) -> Builder:
+        if depth >= self.max_depth:
+            return lambda rng: {}
+        required = set(schema.get("required", ()))
+        properties = [
+            (
+                name,
+                self._builder(property_schema, name, depth + 1, owner),
+                1.0 if name in required else _PRESENCE.get(name, 1.0),
+            )
+            for name, property_schema in schema.get("properties", {}).items()
+            if not property_schema.get("writeOnly")
+        ]
+        additional = schema.get("additionalProperties")
+        if additional and not properties:
+            item_schema = additional if isinstance(additional, dict) else {}
+            return self._map(item_schema, depth, owner)
+        fixup = _FIXUPS.get(owner) if component else None
+        if component and owner in _FILLED_BY_PARENT:
+            properties = [
+                (name, _none if name in _FILLED_BY_PARENT[owner] else build, presence)
+                for name, build, presence in properties
+            ]
+
+        def build(rng: random.Random) -> Dict[str, Any]:
+            value = {}
+            for name, build_property, presence in properties:
+                if presence == 1.0 or rng.random() < presence:
+                    value[name] = build_property(rng)
+            if fixup is not None:
+                fixup(self, value, rng)
+            return value
+
+        return build
+
+    def _map(self, item_schema: Schema, depth: int, owner) -> Builder:
+        keys = [f"key{i}" for i in range(self.max_items)]
+        builders = [
+            self._builder(item_schema, key, depth + 1, owner) if item_schema else None
+            for key in keys
+        ]
+
+        def build(rng: random.Random) -> Dict[str, Any]:
+            value = {}
+            for i in range(1 + _below(rng, self.max_items)):
+                value[keys[i]] = builders[i](rng) if builders[i] else f"value{i}"
+            return value
+
+        return build
+
+    def _array(self, schema: Schema, name: str, depth: int, owner) -> Builder:
+        low = schema.get("minItems", 0)
+        high = max(low, min(schema.get("maxItems", self.max_items), self.max_items))
+        if depth >= self.max_depth:
+            high = low
+        if high == 0:
+            return lambda rng: []
+        build_item = self._builder(schema.get("items", {}), name, depth + 1, owner)
+        unique_items = schema.get("uniqueItems")
+
+        def build(rng: random.Random) -> List[Any]:
+            values = [build_item(rng) for _ in range(low + _below(rng, high - low + 1))]
+            if unique_items:
+                unique = []
+                for value in values:
+                    if value not in unique:
+                        unique.append(value)
+                values = unique
+            return values
+
+        return build
+
+    def _integer(self, schema: Schema, name: str) -> Builder:
+        if name in _ID_POOLS and "minimum" not in schema:
+            return self._pool(_ID_POOLS[name])
+        if name in _INTEGERS and "minimum" not in schema:
+            return _INTEGERS[name]
+        low, high = _INTEGER_RANGES.get(schema.get("format"), (0, 2**31 - 1))
+        low = int(schema.get("minimum", low))
+        high = int(schema.get("maximum", min(high, low + 100000)))
+        return lambda rng: low + _below(rng, high - low + 1)
+
+    def _pool(self, pool: str) -> Builder:
+        """Returns the builder of the ids of `pool`, from 1 to its size."""
+        build = self._pools.get(pool)
+        if build is None:
+            size = self.fleet[pool]
+            if size > _ZIPF_POOL_LIMIT:
+                build = lambda rng: 1 + _below(rng, size)  # noqa: E731
+            else:
+                build = _draw(tuple(range(1, size + 1)), _zipf_cum_weights(size))
+            self._pools[pool] = build
+        return build
+
+    def _number(self, schema: Schema) -> Builder:
+        if "minimum" in schema or "maximum" in schema:
+            low = schema.get("minimum", 0)
+            high = schema.get("maximum", low + 1000)
+            return lambda rng: rng.uniform(low, high)
+        # Numbers are mostly timestamps in seconds in this API
+        return lambda rng: round(rng.uniform(*_EPOCH_RANGE), 3)
+
+    def _string(self, schema: Schema, name: str) -> Builder:
+        fmt = schema.get("format")
+        if fmt == "uuid":
+            return lambda rng: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        if fmt == "date-time":
+            return _date_time
+        if fmt == "date":
+            return lambda rng: datetime.date.fromtimestamp(
+                rng.uniform(*_EPOCH_RANGE)
+            ).isoformat()
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength")
+        named = _STRINGS.get(name)
+
+        def build(rng: random.Random) -> str:
+            value = named(rng) if named else f"{name}-{_below(rng, 100000)}"
+            if len(value) < min_length:
+                value = value.ljust(min_length, "x")
+            return value if max_length is None else value[:max_length]
+
+        return build
+
+    def _location(self, organization_id: int, rng: random.Random) -> int:
+        """Returns the id of a location of an organization."""
+        per_organization = max(
+            1, self.fleet["locations"] // self.fleet["organizations"]
+        )
+        return (
+            (organization_id - 1) * per_organization + 1 + _below(rng, per_organization)
+        )
+
+    def _reference(self, component: str, row_id: Any) -> Any:
+        """Returns the component `row_id` points to, the same for every row.
+
+        The references are cached and shared by the rows pointing to them.
+        """
+        value = self._references.get((component, row_id))
+        if value is None:
+            value = self.generate(
+                {"$ref": f"#/components/schemas/{component}"},
+                key=(component, row_id),
+            )
+            if isinstance(value, dict):
+                value["id"] = row_id
+            if len(self._references) < _CACHED_REFERENCES:
+                self._references[component, row_id] = value
+        return value
+
+
+def _date_time(rng: random.Random) -> str:
+    seconds = rng.uniform(*_EPOCH_RANGE)
+    moment = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+_REFERENCES = (
+    ("organization", "Organization", "organizationId"),
+    ("location", "Location", "locationId"),
+    ("policy", "Policy", "policyId"),
+    ("rolePolicy", "Policy", "rolePolicyId"),
+    ("role", "NodeRole", "nodeRoleId"),
+)
+"""Expanded references of a device, their schema and their foreign key"""
+
+_FILLED_BY_PARENT = {
+    "NodeReferences": frozenset(
+        [name for name, _, _ in _REFERENCES] + ["assignedOwner"]
+    ),
+}
+"""Properties of these component schemas set by the fixup of their parent"""
+
+_SERVER_CLASSES = frozenset(
+    {"WINDOWS_SERVER", "LINUX_SERVER", "MAC_SERVER", "VMWARE_VM_HOST"}
+)
+
+
+def _node(generator: PayloadGenerator, row: Dict[str, Any], rng: random.Random):
+    """Makes the names, foreign keys, times and references of a device agree."""
+    organization_id = row.get("organizationId")
+    if organization_id is not None and "locationId" in row:
+        row["locationId"] = generator._location(organization_id, rng)
+    if "systemName" in row:
+        prefix = "SRV" if row.get("nodeClass") in _SERVER_CLASSES else "DESKTOP"
+        name = f"{prefix}-{row['systemName'].rsplit('-', 1)[-1]}"
+        row["systemName"] = name
+        if "displayName" in row:
+            row["displayName"] = name
+        if "netbiosName" in row:
+            row["netbiosName"] = name[:15]
+        if "dnsName" in row:
+            row["dnsName"] = f"{name.lower()}.corp.example.com"
+    if "created" in row:
+        created = row["created"]
+        last_contact = rng.uniform(created, _EPOCH_RANGE[1])
+        if row.get("offline"):
+            last_contact -= rng.expovariate(1 / (7 * 86400))
+        last_contact = round(max(created, last_contact), 3)
+        if "lastContact" in row:
+            row["lastContact"] = last_contact
+        if "lastUpdate" in row:
+            row["lastUpdate"] = round(last_contact + rng.uniform(0, 300), 3)
+    references = row.get("references")
+    if isinstance(references, dict):
+        for name, component, foreign_key in _REFERENCES:
+            if row.get(foreign_key) is not None:
+                references[name] = generator._reference(component, row[foreign_key])
+            else:
+                references.pop(name, None)
+        if "assignedOwnerUid" in row:
+            user_id = 1 + _below(rng, generator.fleet["users"])
+            owner = generator._reference("User", user_id)
+            references["assignedOwner"] = owner
+            row["assignedOwnerUid"] = owner.get("uid", row["assignedOwnerUid"])
+        else:
+            references.pop("assignedOwner", None)
+
+
+def _application(generator: PayloadGenerator, row: Dict[str, Any], rng: random.Random):
+    """Picks an installed application from the popular ones."""
+    name, publisher, version = _draw_application(rng)
+    product_code = str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper()
+    row.update(
+        name=name,
+        publisher=publisher,
+        version=f"{version}.{_below(rng, 10000)}",
+        productCode="{" + product_code + "}",
+        location=f"C:\\Program Files\\{name.split(' (')[0]}\\",
+    )
+
+
+_draw_application = _draw(_APPLICATIONS, _zipf_cum_weights(len(_APPLICATIONS)))
+
+_FIXUPS: Dict[
+    str, Callable[[PayloadGenerator, Dict[str, Any], random.Random], None]
+] = {
+    "Device": _node,
+    "NodeWithDetailedReferences": _node,
+    "DeviceSearchMatch": _node,
+    "Application": _application,
+    "DeviceApplication": _application,
+}
+"""Adjustments of the generated objects of these component schemas"""
+
+
+def write_array(
+    rows: Iterable[Any], file: BinaryIO, codec: Union[str, JsonCodec] = "auto"
+) -> int:
+    """Writes `rows` to `file` as a JSON array, one row at a time.
+
+    :param rows: the rows, e.g. `PayloadGenerator.rows`.
+    :param file: a binary file.
+    :param codec: the JSON codec encoding the rows, see `tl_ninjarmm.codec`.
+    :return: the number of bytes written.
+    """
+    dumps = resolve_codec(codec).dumps
+    written = file.write(b"[")
+    separator = b""
+    for row in rows:
+        written += file.write(separator)
+        written += file.write(dumps(row))
+        separator = b","
+    return written + file.write(b"]")
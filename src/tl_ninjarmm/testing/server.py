@@ -0,0 +1,310 @@
+"""Local stand-in of the NinjaOne API, built from `openapi_spec.yaml`.
+
+The server answers every operation of the generated APIs with synthetic
+payloads matching the schemas of the spec (see `PayloadGenerator`), so that
+the client can be benchmarked and load tested end to end without a tenant:
+
+- the `after` keyed lists (`get_devices`, `get_organizations`, ...) hold
+  `ServerOptions.rows` rows with the ids 1 to `rows`, paged by `pageSize`,
+- the cursor based reports (`QueriesApi`) open a cursor on their first page
+  and serve the following pages for `cursor=<name>` until it expires,
+- every response can be delayed (`latency`, plus an exponentially
+  distributed `latency_jitter` giving a long tail) and a share of the
+  requests answered with `429 Too Many Requests` or a server error,
+- `POST /ws/oauth/token` hands out bearer tokens to any client credentials.
+
+Run it with `python -m tl_ninjarmm.testing.server openapi_spec.yaml`, or start
+the `aiohttp` application of `create_app` in a test. Requires the optional
+`aiohttp` and `pyyaml` dependencies (`tl-ninjarmm[testing]`).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from aiohttp import web
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "tl_ninjarmm.testing requires aiohttp, install it with `tl-ninjarmm[testing]`"
+    ) from e
+
+from tl_ninjarmm.testing.payloads import PayloadGenerator
+from tl_ninjarmm.testing.spec import (
+    GENERATED_TAGS,
+    SpecOperation,
+    load_spec,
+    resolve,
+    spec_operations,
+)
+
+TOKEN_PATH = "/ws/oauth/token"
+
+_PLACEHOLDER_RE = re.compile(r"\{[^/]+?\}")
+_CACHED_BODIES = 1024
+
+
+@dataclass
+class ServerOptions:
+    """Behavior of the stand-in server.
+
+    :param rows: rows of every `after` keyed list and cursor based report.
+    :param page_size: rows of a page when the request has no `pageSize`.
+    :param latency: delay of every response, in seconds.
+    :param latency_jitter: mean of an exponentially distributed extra delay
+        of every response, in seconds.
+    :param throttle_ratio: share of the requests answered with a 429.
+    :param retry_after: `Retry-After` of the 429 responses, in seconds,
+        rounded up to whole seconds as HTTP requires.
+    :param error_ratio: share of the requests answered with `error_status`.
+    :param error_status: status code of the injected server errors.
+    :param cursor_ttl: lifetime of the report cursors, in seconds.
+    :param seed: seed of the payloads and of the injected faults.
+    """
+
+    rows: int = 1000
+    page_size: int = 1000
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    throttle_ratio: float = 0.0
+    retry_after: float = 1.0
+    error_ratio: float = 0.0
+    error_status: int = 503
+    cursor_ttl: float = 300.0
+    seed: int = 0
+
+
+@dataclass
+class _Cursor:
+    name: str
+    offset: int
+    expires: float
+
+
+class StandInServer:
+    """The handlers of the stand-in server, see `create_app`.
+
+    :param spec: the OpenAPI spec, see `load_spec`.
+    :param options: behavior of the server.
+    """
+
+    def __init__(
+        self, spec: Dict[str, Any], options: Optional[ServerOptions] = None
+    ) -> None:
+        self.spec = spec
+        self.options = options or ServerOptions()
+        self.payloads = PayloadGenerator(spec, seed=self.options.seed)
+        self.operations = spec_operations(spec, GENERATED_TAGS)
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._faults = random.Random(self.options.seed)
+        self._cursors: Dict[str, _Cursor] = {}
+        # Encoded bodies of the pages served, which are generated again
+        # identically for the same request
+        self._bodies: Dict[Tuple[Any, ...], bytes] = {}
+
+    def routes(self) -> list:
+        """Returns the routes of the operations and of the token endpoint."""
+        # Static segments take precedence, e.g. `/v2/device/search` over
+        # `/v2/device/{id}`
+        operations = sorted(
+            self.operations,
+            key=lambda op: (len(_PLACEHOLDER_RE.findall(op.path)), op.path),
+        )
+        routes = [web.post(TOKEN_PATH, self.token)]
+        for operation in operations:
+            handler = self._handler(operation)
+            routes.append(web.route(operation.method, operation.path, handler))
+        return routes
+
+    async def token(self, request: "web.Request") -> "web.Response":
+        """Issues a token for any client credentials."""
+        form = await request.post()
+        return web.json_response(
+            {
+                "access_token": uuid.uuid4().hex,
+                "token_type": "bearer",
+                "expires_in": 3600,
+                "scope": form.get("scope", "monitoring"),
+            }
+        )
+
+    def _handler(self, operation: SpecOperation):
+        schema = operation.response_schema
+        resolved = resolve(self.spec, schema) if schema is not None else {}
+        if "after" in operation.query_params and resolved.get("type") == "array":
+            kind = "after"
+        elif {"cursor", "results"} <= set(resolved.get("properties", {})):
+            kind = "cursor"
+        else:
+            kind = "plain"
+
+        async def handler(request: "web.Request") -> "web.Response":
+            fault = await self._delay_and_fault()
+            if fault is not None:
+                return fault
+            if request.can_read_body:
+                await request.read()
+            if schema is None:
+                return web.Response(status=operation.status)
+            if kind == "after":
+                body = self._after_page(operation, resolved, request)
+            elif kind == "cursor":
+                body = self._cursor_page(operation, resolved, request)
+            else:
+                body = self._payload(operation, request)
+            return web.Response(
+                status=operation.status,
+                body=body,
+                content_type="application/json",
+            )
+
+        return handler
+
+    async def _delay_and_fault(self) -> Optional["web.Response"]:
+        options = self.options
+        self.requests += 1
+        delay = options.latency
+        if options.latency_jitter > 0:
+            delay += self._faults.expovariate(1 / options.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        draw = self._faults.random()
+        if draw < options.throttle_ratio:
+            self.throttled += 1
+            return web.json_response(
+                {"error": "Too many requests"},
+                status=429,
+                headers={"Retry-After": str(math.ceil(options.retry_after))},
+            )
+        if draw < options.throttle_ratio + options.error_ratio:
+            self.errors += 1
+            return web.json_response(
+                {"error": "Injected server error"}, status=options.error_status
+            )
+        return None
+
+    def _page_size(self, request: "web.Request") -> int:
+        page_size = request.query.get("pageSize")
+        return int(page_size) if page_size else self.options.page_size
+
+    def _rows(self, operation: SpecOperation, item_schema, start: int, stop: int):
+        rows = []
+        for row_id in range(start + 1, stop + 1):
+            row = self.payloads.generate(item_schema, key=(operation.path, row_id))
+            if isinstance(row, dict):
+                row["id"] = row_id
+            rows.append(row)
+        return rows
+
+    def _cached(self, key: Tuple[Any, ...], build) -> bytes:
+        body = self._bodies.get(key)
+        if body is None:
+            if len(self._bodies) >= _CACHED_BODIES:
+                self._bodies.clear()
+            body = self._bodies[key] = json.dumps(build()).encode()
+        return body
+
+    def _after_page(self, operation, schema, request) -> bytes:
+        after = int(request.query.get("after") or 0)
+        start = min(max(after, 0), self.options.rows)
+        stop = min(start + self._page_size(request), self.options.rows)
+        return self._cached(
+            (operation.path, start, stop),
+            lambda: self._rows(operation, schema["items"], start, stop),
+        )
+
+    def _cursor_page(self, operation, schema, request) -> bytes:
+        now = time.time()
+        name = request.query.get("cursor")
+        if name is None:
+            cursor = _Cursor(uuid.uuid4().hex, 0, now + self.options.cursor_ttl)
+        else:
+            cursor = self._cursors.get(name)
+            if cursor is None or cursor.expires <= now:
+                raise web.HTTPNotFound(
+                    text=json.dumps({"error": f"Unknown cursor {name}"}),
+                    content_type="application/json",
+                )
+        start = min(cursor.offset, self.options.rows)
+        stop = min(start + self._page_size(request), self.options.rows)
+        cursor.offset = stop
+        self._cursors[cursor.name] = cursor
+        item_schema = resolve(self.spec, schema["properties"]["results"])["items"]
+        rows = self._cached(
+            (operation.path, start, stop),
+            lambda: self._rows(operation, item_schema, start, stop),
+        )
+        head = {
+            "cursor": {
+                "name": cursor.name,
+                "offset": start,
+                "count": stop - start,
+                "expires": cursor.expires,
+            }
+        }
+        return json.dumps(head).encode()[:-1] + b',"results":' + rows + b"}"
+
+    def _payload(self, operation: SpecOperation, request: "web.Request") -> bytes:
+        def build():
+            payload = self.payloads.generate(
+                operation.response_schema, key=(operation.path, request.path)
+            )
+            row_id = request.match_info.get("id")
+            if isinstance(payload, dict) and "id" in payload and row_id:
+                if row_id.isdigit():
+                    payload["id"] = int(row_id)
+            return payload
+
+        return self._cached((operation.path, request.path_qs), build)
+
+
+SERVER = web.AppKey("server", StandInServer)
+"""Key of the `StandInServer` of an application made by `create_app`"""
+
+
+def create_app(
+    spec: Dict[str, Any], options: Optional[ServerOptions] = None
+) -> "web.Application":
+    """Returns the `aiohttp` application of the stand-in server.
+
+    The `StandInServer` serving it, with its request counters, is
+    `app[SERVER]`.
+
+    :param spec: the OpenAPI spec, see `load_spec`.
+    :param options: behavior of the server.
+    """
+    server = StandInServer(spec, options)
+    app = web.Application()
+    app[SERVER] = server
+    app.add_routes(server.routes())
+    return app
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("spec", help="Path of openapi_spec.yaml")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    defaults = ServerOptions()
+    for name, value in vars(defaults).items():
+        parser.add_argument(
+            "--" + name.replace("_", "-"), type=type(value), default=value
+        )
+    args = parser.parse_args(argv)
+    options = ServerOptions(**{name: getattr(args, name) for name in vars(defaults)})
+    web.run_app(
+        create_app(load_spec(args.spec), options), host=args.host, port=args.port
+    )
+
+
+if __name__ == "__main__":
+    main()
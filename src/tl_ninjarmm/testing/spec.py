@@ -0,0 +1,94 @@
+"""Reading of the OpenAPI spec the client is generated from."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "tl_ninjarmm.testing requires pyyaml, install it with `tl-ninjarmm[testing]`"
+    ) from e
+
+GENERATED_TAGS = ("system", "management", "devices", "queries")
+"""Tags of the operations of the generated APIs"""
+
+Schema = Dict[str, Any]
+
+
+def load_spec(path: str) -> Dict[str, Any]:
+    """Reads an OpenAPI spec, e.g. `openapi_spec.yaml`."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, encoding="utf-8") as file:
+        return yaml.load(file, Loader=loader)
+
+
+def resolve(spec: Dict[str, Any], schema: Schema) -> Schema:
+    """Follows the `$ref` of a schema, if any."""
+    while "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        schema = spec["components"]["schemas"][name]
+    return schema
+
+
+@dataclass(frozen=True)
+class SpecOperation:
+    """An operation of the spec, as served by the stand-in server."""
+
+    operation_id: str
+    """Id of the operation in the spec, e.g. `getDevices`"""
+    method: str
+    """HTTP method"""
+    path: str
+    """Path template, e.g. `/v2/device/{id}`"""
+    status: int
+    """Status code of its successful responses"""
+    response_schema: Optional[Schema]
+    """Schema of its successful responses, None without a body"""
+    query_params: Tuple[str, ...] = field(default=())
+    """Names of its query parameters"""
+
+
+def _success(responses: Dict[str, Any]) -> Tuple[int, Optional[Schema]]:
+    for code in sorted(code for code in responses if str(code).startswith("2")):
+        return int(code), _content_schema(responses[code])
+    if "default" in responses:
+        return 200, _content_schema(responses["default"])
+    return 204, None
+
+
+def _content_schema(response: Dict[str, Any]) -> Optional[Schema]:
+    for content in (response.get("content") or {}).values():
+        if "schema" in content:
+            return content["schema"]
+    return None
+
+
+def spec_operations(
+    spec: Dict[str, Any], tags: Iterable[str] = GENERATED_TAGS
+) -> List[SpecOperation]:
+    """Returns the operations of the spec having one of `tags`."""
+    tags = set(tags)
+    operations = []
+    for path, methods in spec["paths"].items():
+        for method, operation in methods.items():
+            if not isinstance(operation, dict) or not tags & set(
+                operation.get("tags", ())
+            ):
+                continue
+            status, schema = _success(operation.get("responses") or {})
+            operations.append(
+                SpecOperation(
+                    operation_id=operation["operationId"],
+                    method=method.upper(),
+                    path=path,
+                    status=status,
+                    response_schema=schema,
+                    query_params=tuple(
+                        parameter["name"]
+                        for parameter in operation.get("parameters", ())
+                        if parameter.get("in") == "query"
+                    ),
+                )
+            )
+    return operations
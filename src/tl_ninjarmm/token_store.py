@@ -0,0 +1,198 @@
+"""OAuth2 tokens shared between the processes of a host.
+
+Every worker process builds its own `ApiClient`, and without coordination each
+of them fetches its own token on startup and on every expiry. With a
+`TokenStore` set as `Configuration.token_store`, a client that needs a token
+first takes the store's inter-process lock and reuses the token found in the
+store if it is still valid; only when it is not does it call the token
+endpoint (or `get_token`) and save the result for the other processes.
+
+A store holds a single token, so clients using different credentials or
+scopes must use different stores.
+"""
+
+import abc
+import json
+import os
+import struct
+import sys
+import tempfile
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+Token = Dict[str, Any]
+
+# Python 3.13 can keep the resource tracker from destroying a shared memory
+# block when the process that created it exits, earlier versions need the
+# block to be unregistered
+_UNTRACKED = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+def _check_file_locking() -> None:
+    """Raises if the inter-process lock of the stores is not available."""
+    if fcntl is None and msvcrt is None:  # pragma: no cover
+        raise NotImplementedError(
+            "token stores require file locking, with fcntl or msvcrt"
+        )
+
+
+def _lock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    while True:  # pragma: no cover
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # msvcrt.locking gives up after 10 seconds, keep waiting
+            continue
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        _lock_file(fd)
+        try:
+            yield
+        finally:
+            if fcntl is None:  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _tracked_name(shm: shared_memory.SharedMemory) -> str:
+    """Returns the name under which the resource tracker knows a block."""
+    # POSIX blocks are registered by their name with a leading slash
+    return "/" + shm.name
+
+
+class TokenStore(abc.ABC):
+    """Base class of the shared token stores."""
+
+    @abc.abstractmethod
+    def lock(self):
+        """Returns a context manager holding the inter-process lock."""
+
+    @abc.abstractmethod
+    def load(self) -> Optional[Token]:
+        """Returns the stored token, None if there is none."""
+
+    @abc.abstractmethod
+    def save(self, token: Token) -> None:
+        """Replaces the stored token."""
+
+
+class FileTokenStore(TokenStore):
+    """Stores the token as JSON in a file readable only by its owner.
+
+    :param path: the token file. A `<path>.lock` file next to it serializes
+        refreshes between processes.
+    """
+
+    def __init__(self, path: str) -> None:
+        _check_file_locking()
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    def lock(self):
+        return _file_lock(self.lock_path)
+
+    def load(self) -> Optional[Token]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, token: Token) -> None:
+        # Write to a temporary file first so readers never see partial tokens
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(token, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class SharedMemoryTokenStore(TokenStore):
+    """Stores the token in a named shared memory block.
+
+    Reading the token does not touch the file system, which suits hosts
+    running many workers. The block outlives the processes using it until
+    `unlink` is called.
+
+    :param name: the name of the shared memory block.
+    :param size: the size of the block, in bytes, large enough for the JSON
+        encoded token.
+    """
+
+    _HEADER = struct.Struct("<I")
+
+    def __init__(self, name: str, size: int = 4096) -> None:
+        _check_file_locking()
+        self.name = name
+        self.size = size
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        with self.lock():
+            try:
+                self._shm = shared_memory.SharedMemory(
+                    name, create=True, size=size, **_UNTRACKED
+                )
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name, **_UNTRACKED)
+        # Keep the resource tracker from destroying the block when the
+        # process that created it exits
+        if not _UNTRACKED and os.name == "posix":
+            resource_tracker.unregister(_tracked_name(self._shm), "shared_memory")
+
+    def lock(self):
+        return _file_lock(self.lock_path)
+
+    def load(self) -> Optional[Token]:
+        (length,) = self._HEADER.unpack_from(self._shm.buf)
+        if length == 0:
+            return None
+        start = self._HEADER.size
+        try:
+            return json.loads(bytes(self._shm.buf[start : start + length]))
+        except ValueError:
+            return None
+
+    def save(self, token: Token) -> None:
+        data = json.dumps(token).encode("utf-8")
+        start = self._HEADER.size
+        if start + len(data) > self._shm.size:
+            raise ValueError(
+                f"token of {len(data)} bytes does not fit in shared memory "
+                f"block {self.name!r} of {self._shm.size} bytes"
+            )
+        self._shm.buf[start : start + len(data)] = data
+        self._HEADER.pack_into(self._shm.buf, 0, len(data))
+
+    def close(self) -> None:
+        """Detaches this process from the shared memory block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block."""
+        # unlink() unregisters the block from the resource tracker again
+        if not _UNTRACKED and os.name == "posix":
+            resource_tracker.register(_tracked_name(self._shm), "shared_memory")
+        self._shm.unlink()
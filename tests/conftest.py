@@ -11,6 +11,24 @@ from tl_ninjarmm.configuration import Configuration
 from tl_ninjarmm.api_client import ApiClient
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="run the wall-clock benchmarks marked with `benchmark`",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the wall-clock benchmarks, whose timings depend on the machine."""
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="wall-clock benchmark, run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def mock_config():
     """Mock configuration for testing."""
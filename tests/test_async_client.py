@@ -0,0 +1,158 @@
+"""
+Tests for the asyncio client.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+
+from tl_ninjarmm.aio import AsyncApiClient, AsyncDevicesApi  # noqa: E402
+from tl_ninjarmm.aio import rest as aio_rest  # noqa: E402
+from tl_ninjarmm.coalescing import AsyncSingleFlight  # noqa: E402
+from tl_ninjarmm.configuration import Configuration  # noqa: E402
+from tl_ninjarmm.exceptions import NotFoundException  # noqa: E402
+from tl_ninjarmm.models.device import Device  # noqa: E402
+
+
+def get_token(skew):
+    return {"access_token": "async_token", "expires_at": time.time() + 3600}
+
+
+async def run_with_server(handler, test):
+    """Serve `handler` on /v2/device/{id} and run `test` against it."""
+    app = web.Application()
+    app.router.add_get("/v2/device/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        config = Configuration(host=f"http://127.0.0.1:{port}")
+        async with AsyncApiClient(configuration=config, get_token=get_token) as client:
+            return await test(AsyncDevicesApi(api_client=client))
+    finally:
+        await runner.cleanup()
+
+
+class TestAsyncApiClientSetup:
+    """Test the transport the asyncio client builds."""
+
+    def test_only_the_aiohttp_transport_is_built(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.coalesce_requests = True
+
+        with patch("tl_ninjarmm.rest.urllib3.PoolManager") as pool_manager:
+            client = AsyncApiClient(configuration=config, get_token=get_token)
+
+        pool_manager.assert_not_called()
+        assert isinstance(client.rest_client, aio_rest.RESTClientObject)
+        assert isinstance(client.coalescer, AsyncSingleFlight)
+
+    def test_connection_limit_defaults_to_aiohttp_default(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.connection_pool_maxsize = None
+
+        client = AsyncApiClient(configuration=config, get_token=get_token)
+
+        assert client.rest_client.maxsize == 100
+
+
+class TestAsyncApiClient:
+    """Test the async API variants end to end over a local HTTP server."""
+
+    def test_get_device_returns_model(self):
+        seen_headers = []
+
+        async def handler(request):
+            seen_headers.append(request.headers.get("Authorization"))
+            body = {"id": int(request.match_info["id"]), "nodeClass": "WINDOWS_SERVER"}
+            return web.json_response(body)
+
+        async def test(devices_api):
+            return await devices_api.get_device(id=42)
+
+        device = asyncio.run(run_with_server(handler, test))
+
+        assert isinstance(device, Device)
+        assert device.id == 42
+        assert seen_headers == ["Bearer async_token"]
+
+    def test_with_http_info_and_concurrent_requests(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def test(devices_api):
+            return await asyncio.gather(
+                *(devices_api.get_device_with_http_info(id=i) for i in range(20))
+            )
+
+        responses = asyncio.run(run_with_server(handler, test))
+
+        assert [r.data.id for r in responses] == list(range(20))
+        assert all(r.status_code == 200 for r in responses)
+        assert json.loads(responses[0].raw_data) == {"id": 0}
+        # Requests overlap on the event loop instead of running one by one
+        assert max_in_flight > 1
+
+    def test_error_status_raises(self):
+        async def handler(request):
+            return web.json_response({"error": "missing"}, status=404)
+
+        async def test(devices_api):
+            with pytest.raises(NotFoundException):
+                await devices_api.get_device(id=1)
+
+        asyncio.run(run_with_server(handler, test))
+
+    def test_tokens_are_fetched_off_the_event_loop(self):
+        calls = 0
+        ticks = 0
+
+        def slow_get_token(skew):
+            nonlocal calls
+            calls += 1
+            time.sleep(0.2)
+            return get_token(skew)
+
+        async def handler(request):
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def test(devices_api):
+            devices_api.api_client.get_token = slow_get_token
+            devices_api.api_client._token = None
+            ticker = asyncio.create_task(tick())
+            try:
+                return await asyncio.gather(
+                    *(devices_api.get_device(id=i) for i in range(5))
+                )
+            finally:
+                ticker.cancel()
+
+        devices = asyncio.run(run_with_server(handler, test))
+
+        assert [device.id for device in devices] == list(range(5))
+        assert calls == 1
+        # The loop kept running while the token was fetched
+        assert ticks > 5
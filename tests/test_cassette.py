@@ -0,0 +1,255 @@
+"""
+Tests for the record/replay transport.
+"""
+
+import asyncio
+import gzip
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.cassette import Cassette, Exchange, offline_token
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import ApiException, ApiValueError
+from tl_ninjarmm.models.organization import Organization
+
+HOST = "https://test.ninjarmm.com"
+ORGANIZATIONS_URL = f"{HOST}/v2/organizations"
+
+
+def make_response(body, status=200, headers=None):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        preload_content=False,
+    )
+
+
+def exchange(url=ORGANIZATIONS_URL, body=b"[]", elapsed=0.0):
+    return Exchange(
+        method="GET",
+        url=url,
+        request_headers={},
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=body,
+        elapsed=elapsed,
+    )
+
+
+def write_cassette(path, *exchanges):
+    recorder = Cassette(str(path), mode="record")
+    recorder.exchanges.extend(exchanges)
+    recorder.save()
+
+
+def replay_client(path, latency_scale=0.0):
+    config = Configuration(host="http://replay.invalid")
+    config.cassette = Cassette(str(path), latency_scale=latency_scale)
+    client = rest.RESTClientObject(config)
+    client.pool_manager = Mock()
+    client.pool_manager.request.side_effect = AssertionError("No network")
+    return client
+
+
+class TestExchange:
+    """Test the storage of the exchanges."""
+
+    def test_json_round_trip(self):
+        text = exchange(body='[{"name": "é"}]'.encode())
+        binary = exchange(body=b"\xff\x00")
+
+        assert Exchange.from_json(text.to_json()) == text
+        assert Exchange.from_json(binary.to_json()) == binary
+        assert "body_base64" in binary.to_json()
+
+    def test_cassettes_are_compressed_json_lines(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        write_cassette(path, exchange(), exchange(f"{HOST}/v2/locations"))
+
+        with gzip.open(path, "rt") as file:
+            lines = [json.loads(line) for line in file]
+
+        assert [line["url"] for line in lines] == [
+            ORGANIZATIONS_URL,
+            f"{HOST}/v2/locations",
+        ]
+        assert Cassette(str(path)).exchanges == [
+            exchange(),
+            exchange(f"{HOST}/v2/locations"),
+        ]
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ApiValueError, match="Unknown cassette mode"):
+            Cassette(str(tmp_path / "cassette"), mode="rewrite")
+
+
+class TestRecording:
+    """Test recording the exchanges of the sync transport."""
+
+    def test_exchanges_are_recorded(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        config = Configuration(host=HOST)
+        config.cassette = Cassette(str(path), mode="record")
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        client.pool_manager.request.return_value = make_response(
+            b'[{"id": 1}]', headers={"Set-Cookie": "session=1", "ETag": '"v1"'}
+        )
+
+        response = client.request(
+            "GET", ORGANIZATIONS_URL, headers={"Authorization": "Bearer secret"}
+        )
+        assert response.read() == b'[{"id": 1}]'
+        config.cassette.save()
+
+        (recorded,) = Cassette(str(path)).exchanges
+        assert recorded.method == "GET"
+        assert recorded.url == ORGANIZATIONS_URL
+        assert recorded.request_headers == {}
+        assert recorded.headers == {"Content-Type": "application/json", "ETag": '"v1"'}
+        assert recorded.body == b'[{"id": 1}]'
+        assert recorded.elapsed >= 0
+
+    def test_streamed_bodies_are_recorded_as_they_are_read(self, tmp_path):
+        config = Configuration(host=HOST)
+        config.cassette = Cassette(str(tmp_path / "cassette"), mode="record")
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        upstream = make_response(b"0123456789")
+        client.pool_manager.request.return_value = upstream
+
+        response = client.request("GET", ORGANIZATIONS_URL).response
+
+        # Nothing read ahead of the caller
+        assert upstream.tell() == 0
+        assert response.read(4) == b"0123"
+        assert upstream.tell() == 4
+        assert config.cassette.exchanges == []
+        assert response.read() == b"456789"
+        (recorded,) = config.cassette.exchanges
+        assert recorded.body == b"0123456789"
+
+    def test_bodies_closed_before_the_end_are_not_recorded(self, tmp_path):
+        config = Configuration(host=HOST)
+        config.cassette = Cassette(str(tmp_path / "cassette"), mode="record")
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        upstream = make_response(b"0123456789")
+        client.pool_manager.request.return_value = upstream
+
+        response = client.request("GET", ORGANIZATIONS_URL).response
+        assert response.read(4) == b"0123"
+        response.close()
+
+        assert config.cassette.exchanges == []
+        assert upstream.closed
+
+
+class TestReplay:
+    """Test replaying the recorded exchanges without network."""
+
+    def test_client_calls_are_replayed_offline(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        write_cassette(path, exchange(body=b'[{"id": 1, "name": "acme"}]'))
+        config = Configuration(host="http://replay.invalid")
+        config.cassette = Cassette(str(path), latency_scale=0)
+        client = ApiClient(configuration=config, get_token=offline_token)
+
+        organizations = SystemApi(client).get_organizations()
+
+        assert organizations == [Organization(id=1, name="acme")]
+
+    def test_identical_requests_get_the_successive_responses(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        write_cassette(path, exchange(body=b"[1]"), exchange(body=b"[2]"))
+        client = replay_client(path)
+
+        bodies = [
+            client.request("GET", f"{HOST}/v2/organizations").read() for _ in range(3)
+        ]
+
+        assert bodies == [b"[1]", b"[2]", b"[2]"]
+        client.cassette.rewind()
+        assert client.request("GET", ORGANIZATIONS_URL).read() == b"[1]"
+
+    def test_requests_are_matched_by_path_and_query(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        write_cassette(
+            path,
+            exchange(body=b"[1]"),
+            exchange(f"{ORGANIZATIONS_URL}?pageSize=10", body=b"[2]"),
+        )
+        client = replay_client(path)
+
+        assert client.request("GET", "http://other/v2/organizations").read() == b"[1]"
+        assert (
+            client.request("GET", "http://other/v2/organizations?pageSize=10").read()
+            == b"[2]"
+        )
+        with pytest.raises(ApiException, match="No recorded response for POST"):
+            client.request("POST", ORGANIZATIONS_URL)
+
+    def test_latencies_are_scaled(self, tmp_path):
+        path = tmp_path / "cassette.jsonl.gz"
+        write_cassette(path, exchange(elapsed=0.2))
+
+        with patch("tl_ninjarmm.rest.time.sleep") as sleep:
+            replay_client(path, latency_scale=0.5).request("GET", ORGANIZATIONS_URL)
+
+        sleep.assert_called_once_with(pytest.approx(0.1))
+
+
+class TestAsyncCassette:
+    """Test recording from a local HTTP server then replaying without it."""
+
+    def test_record_then_replay(self, tmp_path):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncSystemApi
+
+        path = str(tmp_path / "cassette.jsonl.gz")
+
+        async def handler(request):
+            return web.json_response([{"id": 1, "name": "acme"}])
+
+        async def record():
+            app = web.Application()
+            app.router.add_get("/v2/organizations", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            config.cassette = Cassette(path, mode="record")
+            try:
+                async with AsyncApiClient(
+                    configuration=config, get_token=offline_token
+                ) as client:
+                    result = await AsyncSystemApi(client).get_organizations()
+            finally:
+                await runner.cleanup()
+            config.cassette.save()
+            return result
+
+        async def replay():
+            config = Configuration(host="http://127.0.0.1:9")
+            config.cassette = Cassette(path, latency_scale=0)
+            async with AsyncApiClient(
+                configuration=config, get_token=offline_token
+            ) as client:
+                return await AsyncSystemApi(client).get_organizations()
+
+        recorded = asyncio.run(record())
+        replayed = asyncio.run(replay())
+
+        assert recorded == replayed == [Organization(id=1, name="acme")]
@@ -0,0 +1,260 @@
+"""
+Tests for the coalescing of identical concurrent reads.
+"""
+
+import asyncio
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.devices_api import DevicesApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.coalescing import (
+    AsyncSingleFlight,
+    CoalescingStats,
+    SingleFlight,
+    request_key,
+)
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import NotFoundException
+
+
+def get_token(skew):
+    return {"access_token": "t", "expires_at": time.time() + 3600}
+
+
+def make_response(body, status=200):
+    return rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+def run_concurrently(count, call):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(lambda _: call(), range(count)))
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Test sharing the outcome of a call between threads."""
+
+    def test_concurrent_calls_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(1)
+            release.wait(5)
+            return object()
+
+        def caller():
+            return flight.do("key", call)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(caller)]
+            wait_until(lambda: calls)
+            futures += [executor.submit(caller) for _ in range(7)]
+            wait_until(lambda: flight.coalesced == 7)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == CoalescingStats(calls=1, coalesced=7, in_flight=0)
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def call():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(flight.do, "key", call)
+            started.wait(5)
+            second = executor.submit(flight.do, "key", call)
+            wait_until(lambda: flight.coalesced == 1)
+            release.set()
+            for future in (first, second):
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+        assert flight.stats().in_flight == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.stats() == CoalescingStats(calls=2, coalesced=0, in_flight=0)
+
+    def test_keys_include_headers_and_decode_mode(self):
+        key = request_key("GET", "/v2/device/1", {"Authorization": "a"}, "validate")
+
+        assert key == request_key(
+            "GET", "/v2/device/1", {"Authorization": "a"}, "validate"
+        )
+        assert key != request_key(
+            "GET", "/v2/device/1", {"Authorization": "b"}, "validate"
+        )
+        assert key != request_key("GET", "/v2/device/1", {"Authorization": "a"}, "dict")
+
+
+class TestApiClientCoalescing:
+    """Test coalescing the generated calls of a client."""
+
+    @pytest.fixture
+    def client(self):
+        configuration = Configuration(host="https://test.ninjarmm.com")
+        configuration.coalesce_requests = True
+        client = ApiClient(configuration=configuration, get_token=get_token)
+        client.rest_client = Mock()
+        return client
+
+    def test_identical_reads_share_one_request(self, client):
+        arrived = threading.Barrier(8, timeout=5)
+        sent = []
+
+        def request(*args, **kwargs):
+            sent.append(args)
+            time.sleep(0.2)
+            return make_response(b'{"id": 1}')
+
+        client.rest_client.request.side_effect = request
+        api = DevicesApi(client)
+
+        def get_device():
+            arrived.wait()
+            return api.get_device(id=1)
+
+        devices = run_concurrently(8, get_device)
+
+        assert len(sent) < 8
+        assert all(device.id == 1 for device in devices)
+        stats = client.coalescer.stats()
+        assert stats.calls == len(sent)
+        assert stats.calls + stats.coalesced == 8
+
+    def test_different_reads_are_sent(self, client):
+        client.rest_client.request.side_effect = [
+            make_response(b'{"id": 1}'),
+            make_response(b'{"id": 2}'),
+        ]
+        api = DevicesApi(client)
+
+        api.get_device(id=1)
+        api.get_device(id=2)
+
+        assert client.rest_client.request.call_count == 2
+
+    def test_errors_are_raised(self, client):
+        client.rest_client.request.return_value = make_response(b"{}", status=404)
+
+        with pytest.raises(NotFoundException):
+            DevicesApi(client).get_device(id=1)
+
+    def test_disabled_by_default(self):
+        client = ApiClient(configuration=Configuration(), get_token=get_token)
+
+        assert client.coalescer is None
+
+
+class TestAsyncSingleFlight:
+    """Test sharing the outcome of a call between tasks."""
+
+    def test_concurrent_calls_share_one_call(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def run():
+            return await asyncio.gather(*(flight.do("key", call) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == CoalescingStats(calls=1, coalesced=4, in_flight=0)
+
+    def test_cancelling_the_first_caller_keeps_the_call(self):
+        flight = AsyncSingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(flight.do("key", call))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(flight.do("key", call))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "done"
+
+    def test_async_client_coalesces_reads(self):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncDevicesApi
+
+        hits = []
+
+        async def handler(request):
+            hits.append(request.match_info["id"])
+            await asyncio.sleep(0.05)
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v2/device/{id}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            config.coalesce_requests = True
+            try:
+                async with AsyncApiClient(
+                    configuration=config, get_token=get_token
+                ) as client:
+                    api = AsyncDevicesApi(client)
+                    devices = await asyncio.gather(
+                        *(api.get_device(id=1) for _ in range(10)),
+                        api.get_device(id=2),
+                    )
+                    return devices, client.coalescer.stats()
+            finally:
+                await runner.cleanup()
+
+        devices, stats = asyncio.run(run())
+
+        assert [device.id for device in devices] == [1] * 10 + [2]
+        assert sorted(hits) == ["1", "2"]
+        assert stats == CoalescingStats(calls=2, coalesced=9, in_flight=0)
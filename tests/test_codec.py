@@ -0,0 +1,255 @@
+"""
+Tests for the pluggable JSON codecs.
+"""
+
+import copy
+import datetime
+import decimal
+import io
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.codec import (
+    CODECS,
+    JsonCodec,
+    encode_body,
+    get_codec,
+    json_dumps,
+    json_loads,
+    resolve_codec,
+)
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import ApiValueError
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.generate_installer_request_dto import (
+    GenerateInstallerRequestDto,
+)
+from tl_ninjarmm.streaming import JsonArrayParser
+
+DOCUMENT = {
+    "id": 1,
+    "name": "unicode é ✓",
+    "values": [1, 2.5, -3e2, True, None],
+    "nested": {"empty": {}, "list": []},
+}
+
+
+class RecordingCodec(JsonCodec):
+    """Standard library codec recording what it decodes."""
+
+    def __init__(self):
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def installed_codecs():
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+
+@pytest.fixture
+def default_configuration():
+    previous = Configuration._default
+    configuration = Configuration()
+    Configuration.set_default(configuration)
+    yield configuration
+    Configuration.set_default(previous)
+
+
+class TestCodecs:
+    """Test the codecs and their selection."""
+
+    @pytest.mark.parametrize("codec", installed_codecs(), ids=lambda c: c.name)
+    def test_round_trip(self, codec):
+        encoded = codec.dumps(DOCUMENT)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == DOCUMENT
+        assert codec.loads(encoded) == DOCUMENT
+        assert codec.loads(encoded.decode()) == DOCUMENT
+
+    @pytest.mark.parametrize("codec", installed_codecs(), ids=lambda c: c.name)
+    def test_invalid_documents_raise_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b'{"id": ')
+
+    @pytest.mark.parametrize("codec", installed_codecs(), ids=lambda c: c.name)
+    def test_unsupported_values_fall_back_to_json(self, codec):
+        assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+
+    def test_auto_prefers_orjson(self):
+        pytest.importorskip("orjson")
+
+        assert get_codec().name == "orjson"
+
+    def test_codecs_are_shared(self):
+        assert get_codec("json") is get_codec("json")
+
+    def test_unknown_codec(self):
+        with pytest.raises(ApiValueError, match="Unknown JSON codec 'yaml'"):
+            get_codec("yaml")
+
+    def test_codec_instances_are_used_as_is(self):
+        codec = RecordingCodec()
+
+        assert resolve_codec(codec) is codec
+        assert resolve_codec("json") is get_codec("json")
+
+
+class TestEncodeBody:
+    """Test encoding the request bodies."""
+
+    def test_models_are_encoded_as_to_dict(self):
+        request = GenerateInstallerRequestDto(
+            organization_id=1, installer_type="WINDOWS_MSI", usage_limit=5
+        )
+
+        body = encode_body(request, JsonCodec())
+
+        # usageLimit is readOnly, left out by to_dict
+        assert json.loads(body) == json.loads(json.dumps(request.to_dict()))
+        assert b"usageLimit" not in body
+        assert json.loads(encode_body([request, {"a": None}], JsonCodec())) == [
+            request.to_dict(),
+            {"a": None},
+        ]
+
+    def test_configured_codec(self):
+        class DumpingCodec(JsonCodec):
+            def __init__(self):
+                self.dumped = []
+
+            def dumps(self, value):
+                self.dumped.append(value)
+                return super().dumps(value)
+
+        codec = DumpingCodec()
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.json_codec = codec
+        client = ApiClient(
+            configuration=config,
+            get_token=lambda skew: {
+                "access_token": "t",
+                "expires_at": time.time() + 3600,
+            },
+        )
+
+        _, _, _, body, _ = client.operation_serialize(
+            OPERATIONS["get_installer"],
+            {
+                "generate_installer_request_dto": GenerateInstallerRequestDto(
+                    organization_id=1, usage_limit=5
+                )
+            },
+        )
+
+        assert codec.dumped == [{"organizationId": 1}]
+        assert body == b'{"organizationId":1}'
+
+    def test_values_the_codec_cannot_encode(self):
+        body = encode_body({"at": datetime.date(2024, 1, 2)}, JsonCodec())
+
+        assert json.loads(body) == {"at": "2024-01-02"}
+
+
+class TestConfiguration:
+    """Test selecting the codec of the clients."""
+
+    def test_clients_use_the_configured_codec(self):
+        codec = RecordingCodec()
+        configuration = Configuration(host="https://test.ninjarmm.com")
+        configuration.json_codec = codec
+
+        client = ApiClient(
+            configuration=configuration,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+
+        assert client.json_codec is codec
+        assert client.rest_client.json_codec is codec
+
+    def test_codec_is_shared_by_copies(self):
+        configuration = Configuration()
+        configuration.json_codec = RecordingCodec()
+
+        assert copy.deepcopy(configuration).json_codec is configuration.json_codec
+
+    def test_models_use_the_default_configuration(self, default_configuration):
+        default_configuration.json_codec = RecordingCodec()
+
+        device = Device.from_json('{"id": 1, "displayName": "host"}')
+
+        assert device == Device(id=1, display_name="host")
+        assert default_configuration.json_codec.decoded == [
+            '{"id": 1, "displayName": "host"}'
+        ]
+        assert json_loads(json_dumps(device.to_dict())) == device.to_dict()
+        assert device.to_json() == '{"id":1,"displayName":"host"}'
+
+
+class TestDecoding:
+    """Test that responses are decoded by the client's codec."""
+
+    @pytest.fixture
+    def client(self):
+        configuration = Configuration(host="https://test.ninjarmm.com")
+        configuration.json_codec = RecordingCodec()
+        client = ApiClient(
+            configuration=configuration,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        client.rest_client = Mock()
+        return client
+
+    def test_json_responses_are_decoded_from_bytes(self, client):
+        body = b'["1.5", "2.25"]'
+        response = rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(body),
+                status=200,
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                preload_content=False,
+            )
+        )
+        response.read()
+
+        # Not compiled, see `tl_ninjarmm.decoders.compile_type`
+        data = client.response_deserialize(response, {"200": "List[decimal]"}).data
+
+        assert data == [decimal.Decimal("1.5"), decimal.Decimal("2.25")]
+        assert client.json_codec.decoded == [body]
+
+    def test_deserialize_accepts_bytes(self, client):
+        data = client.deserialize(b"[1, 2]", "List[int]", "application/json")
+
+        assert data == [1, 2]
+
+    def test_empty_bodies(self, client):
+        assert client.deserialize(b"", "object", "application/json") == ""
+
+    def test_dict_query_values_are_encoded(self, client):
+        query = client.parameters_to_url_query([("filter", {"a": "é"})], {})
+
+        assert query == "filter=%7B%22a%22%3A%22%C3%A9%22%7D"
+
+    def test_streaming_parser_uses_the_codec(self):
+        codec = RecordingCodec()
+        parser = JsonArrayParser(loads=codec.loads)
+
+        assert parser.feed(b'[{"id": 1}, 2]') == [{"id": 1}, 2]
+        assert codec.decoded == [b'{"id": 1}', b"2"]
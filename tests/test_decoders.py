@@ -0,0 +1,201 @@
+"""
+Tests for the compiled response decoders.
+"""
+
+import gc
+import io
+import json
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.decoders import (
+    compile_type,
+    current_decode_mode,
+    decoding,
+    response_decoder,
+)
+from tl_ninjarmm.exceptions import ApiValueError, NotFoundException
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.software_report import SoftwareReport
+
+
+def make_response(body, status=200, content_type="application/json"):
+    response = rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": content_type},
+            preload_content=False,
+        )
+    )
+    response.read()
+    return response
+
+
+@pytest.fixture
+def client():
+    return ApiClient(
+        configuration=Configuration(host="https://test.ninjarmm.com"),
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+    )
+
+
+class TestCompileType:
+    """Test the conversion of response type strings."""
+
+    @pytest.mark.parametrize(
+        "type_name, expected",
+        [
+            ("Device", Device),
+            ("List[Device]", List[Device]),
+            ("List[int]", List[int]),
+            ("Dict[str, object]", Dict[str, Any]),
+        ],
+    )
+    def test_compiles(self, type_name, expected):
+        assert compile_type(type_name) == expected
+
+    @pytest.mark.parametrize("type_name", ["datetime", "List[date]", "Unknown"])
+    def test_left_to_deserialize(self, type_name):
+        assert compile_type(type_name) is None
+        assert response_decoder(type_name) is None
+
+    def test_decoder_is_cached(self):
+        assert response_decoder("List[Device]") is response_decoder("List[Device]")
+
+
+class TestResponseDeserialize:
+    """Test that `response_deserialize` uses the compiled decoders."""
+
+    def test_decodes_nested_models(self, client):
+        body = {
+            "cursor": {"name": "c", "offset": 0, "count": 1},
+            "results": [{"name": "app", "deviceId": 1}],
+        }
+        response = make_response(json.dumps(body).encode())
+
+        with patch.object(client, "deserialize") as deserialize:
+            report = client.response_deserialize(response, {"200": "SoftwareReport"})
+
+        deserialize.assert_not_called()
+        assert isinstance(report.data, SoftwareReport)
+        assert report.data.to_dict() == SoftwareReport.from_dict(body).to_dict()
+
+    def test_text_responses_use_deserialize(self, client):
+        response = make_response(b"plain", content_type="text/plain")
+
+        assert client.response_deserialize(response, {"200": "str"}).data == "plain"
+
+    def test_other_charsets_use_deserialize(self, client):
+        body = json.dumps([{"displayName": "café"}], ensure_ascii=False).encode(
+            "latin-1"
+        )
+        response = make_response(body, content_type="application/json; charset=latin-1")
+
+        devices = client.response_deserialize(response, {"200": "List[Device]"}).data
+
+        assert devices[0].display_name == "café"
+
+    def test_error_responses_keep_their_body(self, client):
+        response = make_response(b'{"error": "missing"}', status=404)
+
+        with pytest.raises(NotFoundException) as exc_info:
+            client.response_deserialize(response, {"200": "Device"})
+        assert exc_info.value.body == '{"error": "missing"}'
+
+
+class TestDecodeModes:
+    """Test the trusted decode modes."""
+
+    BODY = [
+        {
+            "id": 1,
+            "nodeClass": "NOT_YET_IN_THE_SPEC",
+            "maintenance": {"status": "PENDING", "start": 1},
+            "notes": [{"text": "note"}],
+            "tags": ["prod"],
+        }
+    ]
+
+    def test_validate_mode_is_the_default(self, client):
+        response = make_response(json.dumps(self.BODY).encode())
+
+        with pytest.raises(ValueError, match="must be one of enum values"):
+            client.response_deserialize(response, {"200": "List[Device]"})
+
+    def test_construct_mode_builds_models_without_validation(self, client):
+        client.configuration.decode_mode = "construct"
+        response = make_response(json.dumps(self.BODY).encode())
+
+        (device,) = client.response_deserialize(response, {"200": "List[Device]"}).data
+
+        assert isinstance(device, Device)
+        assert device.node_class == "NOT_YET_IN_THE_SPEC"
+        assert device.maintenance.status == "PENDING"
+        assert device.notes[0].text == "note"
+        assert device.display_name is None
+        assert device.model_fields_set == {
+            "id",
+            "node_class",
+            "maintenance",
+            "notes",
+            "tags",
+        }
+        assert device.to_dict() == self.BODY[0]
+
+    def test_construct_mode_matches_validated_models(self, client):
+        body = {
+            "cursor": {"name": "c", "offset": 0, "count": 1},
+            "results": [{"name": "app", "deviceId": 1, "installDate": None}],
+        }
+        response = make_response(json.dumps(body).encode())
+
+        validated = client.response_deserialize(response, {"200": "SoftwareReport"})
+        with decoding("construct"):
+            trusted = client.response_deserialize(response, {"200": "SoftwareReport"})
+
+        assert trusted.data.to_dict() == validated.data.to_dict()
+
+    def test_construct_mode_pauses_the_garbage_collector(self, client):
+        client.configuration.decode_mode = "construct"
+        response = make_response(json.dumps(self.BODY).encode())
+
+        with patch("tl_ninjarmm.decoders.gc") as mock_gc:
+            mock_gc.isenabled.return_value = True
+            client.response_deserialize(response, {"200": "List[Device]"})
+        mock_gc.disable.assert_called_once_with()
+        mock_gc.enable.assert_called_once_with()
+
+        # Left disabled when it was
+        gc.disable()
+        try:
+            client.response_deserialize(response, {"200": "List[Device]"})
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_dict_mode_returns_parsed_json(self, client):
+        response = make_response(json.dumps(self.BODY).encode())
+
+        with decoding("dict"):
+            data = client.response_deserialize(response, {"200": "List[Device]"}).data
+
+        assert data == self.BODY
+
+    def test_decoding_restores_previous_mode(self, client):
+        client.configuration.decode_mode = "construct"
+        with decoding("dict"):
+            assert current_decode_mode("construct") == "dict"
+        assert current_decode_mode("construct") == "construct"
+
+    def test_invalid_mode(self):
+        with pytest.raises(ApiValueError, match="Invalid decode mode"):
+            with decoding("fast"):
+                pass
@@ -0,0 +1,232 @@
+"""
+Tests for the hedged reads.
+"""
+
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.hedging import HedgePolicy, Hedger, LatencyWindow
+
+HOST = "https://test.ninjarmm.com"
+DEVICE_URL = f"{HOST}/v2/device/1"
+
+
+def make_response(body):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=200,
+        headers={"Content-Type": "application/json"},
+        preload_content=False,
+    )
+
+
+class SlowResponse:
+    """Returned by the mocked pool manager after a delay."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def __call__(self, delays, bodies):
+        def request(*args, **kwargs):
+            with self.lock:
+                index = self.calls
+                self.calls += 1
+            time.sleep(delays[index])
+            if isinstance(bodies[index], Exception):
+                raise bodies[index]
+            return make_response(bodies[index])
+
+        return request
+
+
+@pytest.fixture
+def client():
+    config = Configuration(host=HOST)
+    config.hedge_policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+    client = rest.RESTClientObject(config)
+    client.pool_manager = Mock()
+    return client
+
+
+class TestLatencyWindow:
+    """Test the percentiles of the latest latencies."""
+
+    def test_percentile(self):
+        window = LatencyWindow(100)
+        for i in range(100, 0, -1):
+            window.record(i / 1000)
+
+        assert window.percentile(50) == pytest.approx(0.050, abs=0.001)
+        assert window.percentile(95) == pytest.approx(0.095, abs=0.001)
+        assert window.percentile(100) == 0.1
+
+    def test_oldest_latencies_are_dropped(self):
+        window = LatencyWindow(3)
+        for seconds in (9.0, 1.0, 2.0, 3.0):
+            window.record(seconds)
+
+        assert len(window) == 3
+        assert window.percentile(100) == 3.0
+
+    def test_empty(self):
+        assert LatencyWindow(3).percentile(95) is None
+
+
+class TestHedger:
+    """Test when requests are hedged."""
+
+    def test_only_reads_are_hedged(self):
+        hedger = Hedger(HedgePolicy())
+
+        assert hedger.delay("POST", DEVICE_URL) is None
+        assert hedger.delay("GET", DEVICE_URL) == 1.0
+
+    def test_delay_follows_the_endpoint_latencies(self):
+        hedger = Hedger(HedgePolicy(min_samples=10, min_delay=0.01, percentile=90))
+        for i in range(1, 11):
+            hedger.record("GET", f"{HOST}/v2/device/{i}", i / 10)
+
+        assert hedger.delay("GET", DEVICE_URL) == pytest.approx(0.9)
+        # Other endpoints have no latencies yet
+        assert hedger.delay("GET", f"{HOST}/v2/device/1/disks") == 1.0
+
+    def test_delay_has_a_floor(self):
+        hedger = Hedger(HedgePolicy(min_samples=1, min_delay=0.2))
+        hedger.record("GET", DEVICE_URL, 0.001)
+
+        assert hedger.delay("GET", DEVICE_URL) == 0.2
+
+    def test_budget(self):
+        hedger = Hedger(HedgePolicy(budget_ratio=0.5, max_budget=1))
+
+        hedger.delay("GET", DEVICE_URL)
+        assert not hedger.try_hedge()
+        for _ in range(5):
+            hedger.delay("GET", DEVICE_URL)
+        assert hedger.try_hedge()
+        assert not hedger.try_hedge()
+        assert hedger.stats().hedges == 1
+
+
+class TestHedgedTransport:
+    """Test the hedged requests of the sync transport."""
+
+    def test_slow_reads_are_hedged(self, client):
+        responses = SlowResponse()
+        client.pool_manager.request.side_effect = responses(
+            [0.5, 0], [b"slow", b"fast"]
+        )
+
+        start = time.monotonic()
+        response = client.request("GET", DEVICE_URL)
+
+        assert response.read() == b"fast"
+        assert time.monotonic() - start < 0.4
+        assert client.hedger.stats().hedge_wins == 1
+        assert client.pool_manager.request.call_count == 2
+
+    def test_fast_reads_are_not_hedged(self, client):
+        client.pool_manager.request.return_value = make_response(b"fast")
+
+        assert client.request("GET", DEVICE_URL).read() == b"fast"
+        assert client.pool_manager.request.call_count == 1
+        assert client.hedger.stats().hedges == 0
+
+    def test_writes_are_not_hedged(self, client):
+        client.pool_manager.request.side_effect = SlowResponse()([0.1], [b"{}"])
+
+        client.request("DELETE", DEVICE_URL)
+
+        assert client.pool_manager.request.call_count == 1
+        assert client.hedger.stats().requests == 0
+
+    def test_spent_budget(self, client):
+        client.hedger.policy.budget_ratio = 0
+        client.pool_manager.request.side_effect = SlowResponse()([0.1], [b"slow"])
+
+        assert client.request("GET", DEVICE_URL).read() == b"slow"
+        assert client.pool_manager.request.call_count == 1
+
+    def test_failed_attempt_waits_for_the_other(self, client):
+        client.pool_manager.request.side_effect = SlowResponse()(
+            [0.1, 0.2], [urllib3.exceptions.ProtocolError("reset"), b"hedge"]
+        )
+
+        assert client.request("GET", DEVICE_URL).read() == b"hedge"
+
+    def test_errors_of_every_attempt(self, client):
+        client.pool_manager.request.side_effect = SlowResponse()(
+            [0.1, 0], [ValueError("first"), ValueError("second")]
+        )
+
+        with pytest.raises(ValueError, match="first"):
+            client.request("GET", DEVICE_URL)
+
+    def test_default_pool_size(self):
+        config = Configuration(host=HOST)
+        config.connection_pool_maxsize = None
+        config.hedge_policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        client.pool_manager.request.side_effect = SlowResponse()(
+            [0.5, 0], [b"slow", b"fast"]
+        )
+
+        assert client.request("GET", DEVICE_URL).read() == b"fast"
+
+    def test_default_pool_size_without_hedging(self):
+        config = Configuration(host=HOST)
+        config.connection_pool_maxsize = None
+
+        assert rest.RESTClientObject(config).hedger is None
+
+
+class TestAsyncHedgedTransport:
+    """Test the hedged requests of the asyncio transport."""
+
+    def test_slow_reads_are_hedged(self):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import rest as aio_rest
+
+        delays = [1.0, 0]
+
+        async def handler(request):
+            await asyncio.sleep(delays.pop(0))
+            return web.json_response({"id": 1})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v2/device/{id}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            config.hedge_policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+            client = aio_rest.RESTClientObject(config)
+            try:
+                start = time.monotonic()
+                response = await client.request("GET", f"{config.host}/v2/device/1")
+                body = await response.read()
+                return body, time.monotonic() - start, client.hedger.stats()
+            finally:
+                await client.close()
+                await runner.cleanup()
+
+        body, elapsed, stats = asyncio.run(run())
+
+        assert body == b'{"id": 1}'
+        assert elapsed < 0.8
+        assert stats.hedges == stats.hedge_wins == 1
@@ -0,0 +1,378 @@
+"""
+Tests for the HTTP cache of the reference endpoints.
+"""
+
+import asyncio
+import io
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import ApiValueError
+from tl_ninjarmm.http_cache import (
+    CacheBackend,
+    CachedResponse,
+    CachePolicy,
+    DiskCache,
+    HttpCache,
+    MemoryCache,
+)
+from tl_ninjarmm.models.organization import Organization
+
+HOST = "https://test.ninjarmm.com"
+ORGANIZATIONS_URL = f"{HOST}/v2/organizations"
+BODY = json.dumps([{"id": 1, "name": "acme"}]).encode()
+BASE_TIME = 1000000.0
+
+
+def make_response(status=200, body=BODY, headers=None):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        preload_content=False,
+    )
+
+
+def cached_response(body=b"x", stored_at=BASE_TIME, ttl=60.0):
+    return CachedResponse(
+        status=200, headers={}, body=body, stored_at=stored_at, ttl=ttl
+    )
+
+
+@pytest.fixture
+def mock_time():
+    with patch("tl_ninjarmm.http_cache.time.time") as mock_time:
+        mock_time.return_value = BASE_TIME
+        yield mock_time
+
+
+@pytest.fixture
+def config():
+    config = Configuration(host=HOST, client_id="id", token_scope="monitoring")
+    config.cache_policy = CachePolicy(
+        ttls={"get_organizations": 60, "get_device": 60},
+        stale_while_revalidate=30,
+    )
+    return config
+
+
+@pytest.fixture
+def client(config):
+    client = rest.RESTClientObject(config)
+    client.pool_manager = Mock()
+    return client
+
+
+def wait_for_revalidations(client):
+    deadline = time.monotonic() + 5
+    while client.cache._revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestCacheBackend:
+    """Test the base class of the storages."""
+
+    def test_methods_are_abstract(self):
+        with pytest.raises(TypeError):
+            CacheBackend()
+
+
+class TestMemoryCache:
+    """Test the size bounded LRU storage."""
+
+    def test_least_recently_used_responses_are_evicted(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", cached_response(b"1234"))
+        cache.set("b", cached_response(b"1234"))
+        cache.get("a")
+
+        cache.set("c", cached_response(b"1234"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size == 8
+
+    def test_responses_larger_than_the_cache_are_not_stored(self):
+        cache = MemoryCache(max_bytes=3)
+
+        cache.set("a", cached_response(b"1234"))
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestDiskCache:
+    """Test the file storage."""
+
+    def test_responses_are_shared_through_the_directory(self, tmp_path):
+        response = CachedResponse(
+            status=200,
+            headers={"etag": '"v1"'},
+            body=b'{"id":\n1}',
+            stored_at=BASE_TIME,
+            ttl=60.0,
+        )
+        DiskCache(str(tmp_path)).set("key", response)
+
+        assert DiskCache(str(tmp_path)).get("key") == response
+
+    def test_delete_and_clear(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        cache.set("a", cached_response())
+        cache.set("b", cached_response())
+
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+        cache.clear()
+        assert cache.get("b") is None
+
+    def test_least_recently_used_files_are_evicted(self, tmp_path):
+        # Every file holds about 160 bytes, two fit in the directory
+        cache = DiskCache(str(tmp_path), max_bytes=400)
+        cache.set("a", cached_response(b"x" * 100))
+        time.sleep(0.05)
+        cache.set("b", cached_response(b"x" * 100))
+        time.sleep(0.05)
+        cache.get("a")
+        time.sleep(0.05)
+
+        cache.set("c", cached_response(b"x" * 100))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestHttpCache:
+    """Test the matching of the cached operations."""
+
+    def test_ttl_of_the_cached_operations(self, config):
+        cache = HttpCache(config.cache_policy)
+
+        assert cache.ttl("GET", ORGANIZATIONS_URL + "?pageSize=10") == 60
+        assert cache.ttl("GET", f"{HOST}/v2/device/7") == 60
+        assert cache.ttl("GET", f"{HOST}/v2/device/7/disks") is None
+        assert cache.ttl("GET", f"{HOST}/v2/organizations-detailed") is None
+        assert cache.ttl("POST", ORGANIZATIONS_URL) is None
+
+    def test_only_get_operations_can_be_cached(self):
+        with pytest.raises(ApiValueError, match="create_organization is not a GET"):
+            HttpCache(CachePolicy(ttls={"create_organization": 60}))
+
+    def test_keys_depend_on_the_credentials(self, config):
+        other = Configuration(host=HOST, client_id="other", token_scope="monitoring")
+        other.cache_policy = config.cache_policy
+
+        key = HttpCache.from_configuration(config).key(ORGANIZATIONS_URL)
+
+        assert key == HttpCache.from_configuration(config).key(ORGANIZATIONS_URL)
+        assert key != HttpCache.from_configuration(other).key(ORGANIZATIONS_URL)
+
+    def test_keys_depend_on_the_authorization_header(self, config):
+        cache = HttpCache.from_configuration(config)
+
+        key = cache.key(ORGANIZATIONS_URL, {"Authorization": "Bearer a"})
+
+        assert key == cache.key(ORGANIZATIONS_URL, {"authorization": "Bearer a"})
+        assert key != cache.key(ORGANIZATIONS_URL, {"Authorization": "Bearer b"})
+        assert key != cache.key(ORGANIZATIONS_URL)
+
+    def test_disabled_by_default(self):
+        assert HttpCache.from_configuration(Configuration()) is None
+
+
+class TestCachingTransport:
+    """Test serving requests from the cache in the sync transport."""
+
+    def test_fresh_responses_are_served_from_the_cache(self, client, mock_time):
+        client.pool_manager.request.return_value = make_response()
+
+        first = client.request("GET", ORGANIZATIONS_URL)
+        mock_time.return_value = BASE_TIME + 59
+        second = client.request("GET", ORGANIZATIONS_URL)
+
+        assert first.read() == second.read() == BODY
+        assert client.pool_manager.request.call_count == 1
+        assert second.getheader("Age") == "59"
+        assert second.getheader("Content-Type") == "application/json"
+
+    def test_other_requests_are_not_cached(self, client, mock_time):
+        client.pool_manager.request.side_effect = lambda *a, **kw: make_response()
+
+        client.request("GET", f"{HOST}/v2/device/1/disks")
+        client.request("GET", f"{HOST}/v2/device/1/disks")
+
+        assert client.pool_manager.request.call_count == 2
+
+    def test_expired_responses_are_revalidated(self, client, mock_time):
+        client.pool_manager.request.side_effect = [
+            make_response(headers={"ETag": '"v1"', "Last-Modified": "yesterday"}),
+            make_response(304, b"", {"ETag": '"v1"'}),
+        ]
+        client.request("GET", ORGANIZATIONS_URL)
+
+        mock_time.return_value = BASE_TIME + 100
+        response = client.request("GET", ORGANIZATIONS_URL)
+
+        headers = client.pool_manager.request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "yesterday"
+        assert response.status == 200
+        assert response.read() == BODY
+        # The 304 made the response fresh again
+        client.request("GET", ORGANIZATIONS_URL)
+        assert client.pool_manager.request.call_count == 2
+
+    def test_stale_responses_are_served_while_revalidating(self, client, mock_time):
+        updated = json.dumps([{"id": 1, "name": "renamed"}]).encode()
+        client.pool_manager.request.side_effect = [
+            make_response(),
+            make_response(body=updated),
+        ]
+        client.request("GET", ORGANIZATIONS_URL)
+
+        mock_time.return_value = BASE_TIME + 70
+        stale = client.request("GET", ORGANIZATIONS_URL)
+        wait_for_revalidations(client)
+
+        assert stale.read() == BODY
+        assert client.pool_manager.request.call_count == 2
+        assert client.request("GET", ORGANIZATIONS_URL).read() == updated
+
+    def test_max_age_overrides_the_ttl(self, client, mock_time):
+        client.pool_manager.request.side_effect = lambda *a, **kw: make_response(
+            headers={"Cache-Control": "max-age=5"}
+        )
+        client.request("GET", ORGANIZATIONS_URL)
+
+        mock_time.return_value = BASE_TIME + 40
+        client.request("GET", ORGANIZATIONS_URL)
+
+        assert client.pool_manager.request.call_count == 2
+
+    def test_no_store_and_errors_are_not_cached(self, client, mock_time):
+        client.pool_manager.request.side_effect = [
+            make_response(headers={"Cache-Control": "no-store"}),
+            make_response(500, b"{}"),
+            make_response(),
+        ]
+
+        assert client.request("GET", ORGANIZATIONS_URL).read() == BODY
+        assert client.request("GET", ORGANIZATIONS_URL).status == 500
+        assert client.request("GET", ORGANIZATIONS_URL).read() == BODY
+        assert client.pool_manager.request.call_count == 3
+
+    def test_cached_responses_can_be_streamed(self, client, mock_time):
+        client.pool_manager.request.return_value = make_response()
+        client.request("GET", ORGANIZATIONS_URL)
+
+        response = client.request("GET", ORGANIZATIONS_URL)
+
+        assert b"".join(response.response.stream(4)) == BODY
+
+
+class TestApiClientCache:
+    """Test the cache through the generated APIs."""
+
+    def test_reference_endpoint_is_requested_once(self, config):
+        client = ApiClient(
+            configuration=config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        client.rest_client.pool_manager = Mock()
+        client.rest_client.pool_manager.request.return_value = make_response()
+        api = SystemApi(client)
+
+        first = api.get_organizations()
+        second = api.get_organizations()
+
+        assert first == second == [Organization(id=1, name="acme")]
+        assert client.rest_client.pool_manager.request.call_count == 1
+
+    def test_tenants_sharing_a_backend_are_isolated(self, config):
+        """Test that `get_token` clients of two tenants share no responses."""
+
+        def tenant_client(token, body):
+            configuration = Configuration(host=HOST)
+            configuration.cache_policy = config.cache_policy
+            client = ApiClient(
+                configuration=configuration,
+                get_token=lambda skew: {
+                    "access_token": token,
+                    "expires_at": time.time() + 3600,
+                },
+            )
+            client.rest_client.pool_manager = Mock()
+            client.rest_client.pool_manager.request.side_effect = (
+                lambda *args, **kwargs: make_response(body=body)
+            )
+            return client
+
+        first = tenant_client("tenant-a", b'[{"id": 1, "name": "a"}]')
+        second = tenant_client("tenant-b", b'[{"id": 2, "name": "b"}]')
+
+        assert SystemApi(first).get_organizations() == [Organization(id=1, name="a")]
+        assert SystemApi(second).get_organizations() == [Organization(id=2, name="b")]
+        assert SystemApi(first).get_organizations() == [Organization(id=1, name="a")]
+        assert first.rest_client.pool_manager.request.call_count == 1
+        assert second.rest_client.pool_manager.request.call_count == 1
+
+
+class TestAsyncCachingTransport:
+    """Test the cache of the asyncio transport over a local HTTP server."""
+
+    def test_revalidation_with_etag(self, config):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncSystemApi
+
+        conditional = []
+
+        async def handler(request):
+            conditional.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.json_response(
+                [{"id": 1, "name": "acme"}], headers={"ETag": '"v1"'}
+            )
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v2/organizations", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config.host = f"http://127.0.0.1:{port}"
+            config.cache_policy.ttls = {"get_organizations": 0}
+            config.cache_policy.stale_while_revalidate = 0
+            try:
+                async with AsyncApiClient(
+                    configuration=config,
+                    get_token=lambda skew: {
+                        "access_token": "t",
+                        "expires_at": time.time() + 3600,
+                    },
+                ) as client:
+                    api = AsyncSystemApi(client)
+                    return [await api.get_organizations() for _ in range(2)]
+            finally:
+                await runner.cleanup()
+
+        first, second = asyncio.run(run())
+
+        assert first == second == [Organization(id=1, name="acme")]
+        assert conditional == [None, '"v1"']
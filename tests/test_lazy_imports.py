@@ -0,0 +1,42 @@
+"""
+Tests for the lazy exports of the package `__init__` modules.
+"""
+
+import pytest
+
+import tl_ninjarmm
+import tl_ninjarmm.api
+import tl_ninjarmm.models
+from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm.models.device import Device
+
+
+class TestLazyExports:
+    """Test the PEP 562 exports of the packages."""
+
+    def test_exports_resolve_to_their_classes(self):
+        assert tl_ninjarmm.Device is Device
+        assert tl_ninjarmm.models.Device is Device
+        assert tl_ninjarmm.SystemApi is tl_ninjarmm.api.SystemApi is SystemApi
+
+    def test_resolved_exports_are_cached(self):
+        assert tl_ninjarmm.models.Device is Device
+        assert vars(tl_ninjarmm.models)["Device"] is Device
+
+    def test_from_import(self):
+        from tl_ninjarmm import ApiException
+        from tl_ninjarmm.exceptions import ApiException as expected
+
+        assert ApiException is expected
+
+    def test_every_export_resolves(self):
+        for name in tl_ninjarmm.__all__:
+            assert getattr(tl_ninjarmm, name).__name__ == name
+
+    def test_dir_lists_exports(self):
+        assert set(tl_ninjarmm.__all__) <= set(dir(tl_ninjarmm))
+        assert "Device" in dir(tl_ninjarmm.models)
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            tl_ninjarmm.models.__getattr__("Unknown")
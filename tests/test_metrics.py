@@ -0,0 +1,253 @@
+"""
+Tests for the per-operation metrics.
+"""
+
+import asyncio
+import copy
+import io
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.devices_api import DevicesApi
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import NotFoundException
+from tl_ninjarmm.metrics import MetricsRegistry, operation_id, status_class
+
+
+def get_token(skew):
+    return {"access_token": "t", "expires_at": time.time() + 3600}
+
+
+def make_response(body, status=200):
+    return rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+class FakeClock:
+    """Replaces `time.perf_counter`, every call advances it by the next of `steps`."""
+
+    def __init__(self, *steps):
+        self.now = 0.0
+        self.steps = list(steps)
+
+    def __call__(self):
+        now = self.now
+        if self.steps:
+            self.now += self.steps.pop(0)
+        return now
+
+
+class TestMetricsRegistry:
+    """Test recording the calls of an operation."""
+
+    def test_phases_statuses_and_bytes(self):
+        registry = MetricsRegistry(buckets=(0.01, 0.1, 1.0))
+        with patch(
+            "tl_ninjarmm.metrics.time.perf_counter", FakeClock(0.001, 0.002, 0.5, 0.05)
+        ):
+            timer = registry.start(OPERATIONS["get_device"])
+            for _ in range(3):
+                timer.lap()
+            timer.sent(b"{}")
+            timer.received(200, b'{"id": 1}')
+            timer.stop()
+
+        stats = registry.snapshot()["DevicesApi.get_device"]
+
+        assert stats.requests == 1
+        assert stats.statuses == {"2xx": 1}
+        assert (stats.bytes_out, stats.bytes_in) == (2, 9)
+        assert stats.phases["token"].sum == pytest.approx(0.001)
+        assert stats.phases["network"].sum == pytest.approx(0.5)
+        assert stats.phases["network"].buckets == (
+            (0.01, 0),
+            (0.1, 0),
+            (1.0, 1),
+            (float("inf"), 1),
+        )
+        assert stats.phases["decode"].buckets[1] == (0.1, 1)
+
+    def test_unreached_phases_are_left_out(self):
+        registry = MetricsRegistry()
+        timer = registry.start(OPERATIONS["get_device"])
+        timer.lap()
+        timer.lap()
+        timer.stop()
+
+        stats = registry.snapshot()["DevicesApi.get_device"]
+
+        assert stats.statuses == {"error": 1}
+        assert stats.phases["network"].count == 1
+        assert stats.phases["decode"].count == 0
+        assert stats.phases["decode"].mean is None
+
+    def test_status_classes(self):
+        assert status_class(204) == "2xx"
+        assert status_class(429) == "4xx"
+        assert status_class(None) == "error"
+
+    def test_operation_ids(self):
+        assert operation_id(OPERATIONS["get_devices_detailed"]) == (
+            "SystemApi.get_devices_detailed"
+        )
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.start(OPERATIONS["get_device"]).stop()
+
+        registry.reset()
+
+        assert registry.snapshot() == {}
+
+
+class TestPrometheusExporter:
+    """Test the Prometheus text format."""
+
+    def test_exposition(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        with patch("tl_ninjarmm.metrics.time.perf_counter", FakeClock(0, 0, 0.25, 0)):
+            timer = registry.start(OPERATIONS["get_device"])
+            timer.lap()
+            timer.lap()
+            timer.sent("ab")
+            timer.lap()
+            timer.received(404, b"{}")
+            timer.stop()
+
+        text = registry.to_prometheus()
+
+        operation = 'operation="DevicesApi.get_device"'
+        assert "# TYPE tl_ninjarmm_requests_total counter\n" in text
+        assert f'tl_ninjarmm_requests_total{{{operation},status="4xx"}} 1\n' in text
+        assert f"tl_ninjarmm_sent_bytes_total{{{operation}}} 2\n" in text
+        assert f"tl_ninjarmm_received_bytes_total{{{operation}}} 2\n" in text
+        assert "# TYPE tl_ninjarmm_phase_seconds histogram\n" in text
+        network = f'{operation},phase="network"'
+        assert f'tl_ninjarmm_phase_seconds_bucket{{{network},le="0.1"}} 0\n' in text
+        assert f'tl_ninjarmm_phase_seconds_bucket{{{network},le="1.0"}} 1\n' in text
+        assert f'tl_ninjarmm_phase_seconds_bucket{{{network},le="+Inf"}} 1\n' in text
+        assert f"tl_ninjarmm_phase_seconds_sum{{{network}}} 0.25\n" in text
+        assert f"tl_ninjarmm_phase_seconds_count{{{network}}} 1\n" in text
+
+    def test_empty_registry(self):
+        text = MetricsRegistry().to_prometheus(prefix="ninja")
+
+        assert text.startswith("# HELP ninja_requests_total")
+        assert "{" not in text
+
+
+class TestApiClientMetrics:
+    """Test the metrics recorded by the generated calls."""
+
+    @pytest.fixture
+    def client(self):
+        configuration = Configuration(host="https://test.ninjarmm.com")
+        configuration.metrics = MetricsRegistry()
+        client = ApiClient(configuration=configuration, get_token=get_token)
+        client.rest_client = Mock()
+        return client
+
+    def test_calls_are_recorded(self, client):
+        client.rest_client.request.return_value = make_response(b'{"id": 1}')
+
+        DevicesApi(client).get_device(id=1)
+
+        stats = client.metrics.snapshot()["DevicesApi.get_device"]
+        assert stats.statuses == {"2xx": 1}
+        assert stats.bytes_in == 9
+        assert stats.bytes_out == 0
+        assert all(phase.count == 1 for phase in stats.phases.values())
+
+    def test_request_bodies_are_counted(self, client):
+        client.rest_client.request.return_value = make_response(b"{}", status=204)
+
+        DevicesApi(client).update_node_attribute_values(
+            id=1, request_body={"field": {"value": 1}}
+        )
+
+        stats = client.metrics.snapshot()["DevicesApi.update_node_attribute_values"]
+        assert stats.statuses == {"2xx": 1}
+        assert stats.bytes_out == len(b'{"field":{"value":1}}')
+
+    def test_error_responses_are_recorded(self, client):
+        client.rest_client.request.return_value = make_response(b"{}", status=404)
+
+        with pytest.raises(NotFoundException):
+            DevicesApi(client).get_device(id=1)
+
+        stats = client.metrics.snapshot()["DevicesApi.get_device"]
+        assert stats.statuses == {"4xx": 1}
+        assert stats.phases["decode"].count == 1
+
+    def test_network_errors_are_recorded(self, client):
+        client.rest_client.request.side_effect = urllib3.exceptions.ProtocolError()
+
+        with pytest.raises(urllib3.exceptions.ProtocolError):
+            DevicesApi(client).get_device(id=1)
+
+        stats = client.metrics.snapshot()["DevicesApi.get_device"]
+        assert stats.statuses == {"error": 1}
+        assert stats.phases["network"].count == 1
+        assert stats.phases["decode"].count == 0
+
+    def test_disabled_by_default(self):
+        client = ApiClient(configuration=Configuration(), get_token=get_token)
+
+        assert client.metrics is None
+
+    def test_registry_is_shared_by_configuration_copies(self):
+        configuration = Configuration()
+        configuration.metrics = MetricsRegistry()
+
+        assert copy.deepcopy(configuration).metrics is configuration.metrics
+
+
+class TestAsyncApiClientMetrics:
+    """Test the metrics of the asyncio client over a local HTTP server."""
+
+    def test_calls_are_recorded(self):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncDevicesApi
+
+        async def handler(request):
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v2/device/{id}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            config.metrics = MetricsRegistry()
+            try:
+                async with AsyncApiClient(
+                    configuration=config, get_token=get_token
+                ) as client:
+                    api = AsyncDevicesApi(client)
+                    await asyncio.gather(*(api.get_device(id=i) for i in range(3)))
+                    return config.metrics.snapshot()
+            finally:
+                await runner.cleanup()
+
+        stats = asyncio.run(run())["DevicesApi.get_device"]
+
+        assert stats.statuses == {"2xx": 3}
+        assert stats.bytes_in == 3 * len(b'{"id": 0}')
+        assert stats.phases["decode"].count == 3
@@ -0,0 +1,221 @@
+"""
+Tests for the middleware hooks.
+"""
+
+import asyncio
+import io
+import time
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.devices_api import DevicesApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import NotFoundException
+from tl_ninjarmm.middleware import Middleware
+
+
+def get_token(skew):
+    return {"access_token": "t", "expires_at": time.time() + 3600}
+
+
+def make_response(body, status=200):
+    return rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+class Recorder(Middleware):
+    """Records the hooks called, in `events`."""
+
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+
+    def before_request(self, call):
+        self.events.append((self.name, "before", call.operation_id, call.url))
+
+    def after_response(self, call):
+        data = call.api_response.data if call.api_response is not None else None
+        self.events.append((self.name, "after", call.response.data, data))
+
+    def on_error(self, call, error):
+        self.events.append((self.name, "error", type(error).__name__))
+
+
+class ResponseCache(Middleware):
+    """Answers the calls it has seen before."""
+
+    def __init__(self):
+        self.responses = {}
+
+    def before_request(self, call):
+        call.response = self.responses.get(call.url)
+
+    def after_response(self, call):
+        self.responses[call.url] = call.response
+
+
+@pytest.fixture
+def client():
+    configuration = Configuration(host="https://test.ninjarmm.com")
+    client = ApiClient(configuration=configuration, get_token=get_token)
+    client.rest_client = Mock()
+    return client
+
+
+def with_middlewares(client, *middlewares):
+    client.middlewares = list(middlewares)
+    return client
+
+
+class TestMiddleware:
+    """Test the hooks around the calls of the sync client."""
+
+    def test_hooks_are_called_in_order(self, client):
+        events = []
+        with_middlewares(client, Recorder("outer", events), Recorder("inner", events))
+        client.rest_client.request.return_value = make_response(b'{"id": 1}')
+
+        device = DevicesApi(client).get_device(id=1)
+
+        url = "https://test.ninjarmm.com/v2/device/1"
+        assert events == [
+            ("outer", "before", "DevicesApi.get_device", url),
+            ("inner", "before", "DevicesApi.get_device", url),
+            ("inner", "after", b'{"id": 1}', device),
+            ("outer", "after", b'{"id": 1}', device),
+        ]
+
+    def test_requests_can_be_modified(self, client):
+        class Tracing(Middleware):
+            def before_request(self, call):
+                call.headers["traceparent"] = "00-1-2-01"
+
+        with_middlewares(client, Tracing())
+        client.rest_client.request.return_value = make_response(b'{"id": 1}')
+
+        DevicesApi(client).get_device(id=1)
+
+        headers = client.rest_client.request.call_args.kwargs["headers"]
+        assert headers["traceparent"] == "00-1-2-01"
+
+    def test_responses_can_be_served_by_a_middleware(self, client):
+        with_middlewares(client, ResponseCache())
+        client.rest_client.request.return_value = make_response(b'{"id": 1}')
+        api = DevicesApi(client)
+
+        first = api.get_device(id=1)
+        second = api.get_device(id=1)
+
+        assert first == second
+        assert client.rest_client.request.call_count == 1
+
+    def test_decoded_responses_can_be_changed(self, client):
+        class Redact(Middleware):
+            def after_response(self, call):
+                call.api_response.data.system_name = "redacted"
+
+        with_middlewares(client, Redact())
+        client.rest_client.request.return_value = make_response(
+            b'{"id": 1, "systemName": "host"}'
+        )
+
+        assert DevicesApi(client).get_device(id=1).system_name == "redacted"
+
+    def test_errors_are_seen_by_the_middlewares(self, client):
+        events = []
+        with_middlewares(client, Recorder("outer", events), Recorder("inner", events))
+        client.rest_client.request.return_value = make_response(b"{}", status=404)
+
+        with pytest.raises(NotFoundException):
+            DevicesApi(client).get_device(id=1)
+
+        assert events[2:] == [
+            ("inner", "error", "NotFoundException"),
+            ("outer", "error", "NotFoundException"),
+        ]
+
+    def test_network_errors_are_seen_by_the_middlewares(self, client):
+        events = []
+        with_middlewares(client, Recorder("only", events))
+        client.rest_client.request.side_effect = urllib3.exceptions.ProtocolError()
+
+        with pytest.raises(urllib3.exceptions.ProtocolError):
+            DevicesApi(client).get_device(id=1)
+
+        assert events[-1] == ("only", "error", "ProtocolError")
+
+    def test_unread_responses(self, client):
+        events = []
+        with_middlewares(client, Recorder("only", events))
+        client.rest_client.request.return_value = make_response(b'{"id": 1}')
+
+        response = DevicesApi(client).get_device_without_preload_content(id=1)
+
+        assert response.read() == b'{"id": 1}'
+        assert events[-1] == ("only", "after", None, None)
+
+    def test_middlewares_are_read_from_the_configuration(self):
+        configuration = Configuration()
+        middleware = Middleware()
+        configuration.middlewares.append(middleware)
+
+        client = ApiClient(configuration=configuration, get_token=get_token)
+
+        assert client.middlewares == [middleware]
+        assert (
+            ApiClient(configuration=Configuration(), get_token=get_token).middlewares
+            == []
+        )
+
+
+class TestAsyncMiddleware:
+    """Test the hooks of the asyncio client over a local HTTP server."""
+
+    def test_hooks_and_cached_responses(self):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncDevicesApi
+
+        hits = []
+        events = []
+
+        async def handler(request):
+            hits.append(request.match_info["id"])
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/v2/device/{id}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            config.middlewares = [Recorder("outer", events), ResponseCache()]
+            try:
+                async with AsyncApiClient(
+                    configuration=config, get_token=get_token
+                ) as client:
+                    api = AsyncDevicesApi(client)
+                    return [await api.get_device(id=1) for _ in range(2)]
+            finally:
+                await runner.cleanup()
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        assert hits == ["1"]
+        assert [event[1] for event in events] == ["before", "after"] * 2
+        assert events[-1][2] == b'{"id": 1}'
@@ -0,0 +1,242 @@
+"""
+Tests for the local stand-in server generated from the OpenAPI spec.
+"""
+
+import asyncio
+import pathlib
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("yaml")
+
+from aiohttp import web  # noqa: E402
+
+from tl_ninjarmm.api.devices_api import DevicesApi  # noqa: E402
+from tl_ninjarmm.api.queries_api import QueriesApi  # noqa: E402
+from tl_ninjarmm.api.system_api import SystemApi  # noqa: E402
+from tl_ninjarmm.api.operation_table import OPERATIONS  # noqa: E402
+from tl_ninjarmm.api_client import ApiClient  # noqa: E402
+from tl_ninjarmm.configuration import Configuration  # noqa: E402
+from tl_ninjarmm.exceptions import NotFoundException, ServiceException  # noqa: E402
+from tl_ninjarmm.pagination import paginate, paginate_after  # noqa: E402
+from tl_ninjarmm.retry import RetryPolicy  # noqa: E402
+from tl_ninjarmm.testing.payloads import PayloadGenerator  # noqa: E402
+from tl_ninjarmm.testing.server import (  # noqa: E402
+    SERVER,
+    ServerOptions,
+    TOKEN_PATH,
+    StandInServer,
+    create_app,
+)
+from tl_ninjarmm.testing.spec import (  # noqa: E402
+    GENERATED_TAGS,
+    load_spec,
+    spec_operations,
+)
+
+SPEC_PATH = pathlib.Path(__file__).parent.parent / "openapi_spec.yaml"
+
+
+def get_token(skew):
+    return {"access_token": "t", "expires_at": time.time() + 3600}
+
+
+@pytest.fixture(scope="module")
+def spec():
+    return load_spec(str(SPEC_PATH))
+
+
+class RunningServer:
+    """Serves an application on a background event loop."""
+
+    def __init__(self, app):
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        self.runner = web.AppRunner(self.app)
+        asyncio.run_coroutine_threadsafe(self.runner.setup(), self.loop).result()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        asyncio.run_coroutine_threadsafe(site.start(), self.loop).result()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        return self
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    @property
+    def server(self) -> StandInServer:
+        return self.app[SERVER]
+
+
+def client_of(running, **settings):
+    config = Configuration(host=running.url)
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return ApiClient(configuration=config, get_token=get_token)
+
+
+class TestSpec:
+    """Test reading the operations of the spec."""
+
+    def test_operations_match_the_generated_apis(self, spec):
+        operations = spec_operations(spec, GENERATED_TAGS)
+
+        assert {(op.method, op.path) for op in operations} == {
+            (op.method, op.path) for op in OPERATIONS.values()
+        }
+
+    def test_every_operation_has_a_route(self, spec):
+        app = create_app(spec)
+
+        routes = [
+            route
+            for route in app.router.routes()
+            if route.method != "HEAD" and route.resource is not None
+        ]
+
+        assert len(routes) == len(OPERATIONS) + 1
+        assert TOKEN_PATH in {route.resource.canonical for route in routes}
+
+
+class TestPayloads:
+    """Test the synthetic payloads."""
+
+    def test_payloads_are_deterministic(self, spec):
+        device = {"$ref": "#/components/schemas/Device"}
+
+        first = PayloadGenerator(spec, seed=1).generate(device, key=1)
+        again = PayloadGenerator(spec, seed=1).generate(device, key=1)
+        other = PayloadGenerator(spec, seed=2).generate(device, key=1)
+
+        assert first == again
+        assert first != other
+
+
+class TestStandInServer:
+    """Test the generated client against the stand-in server."""
+
+    def test_token_endpoint(self, spec, monkeypatch):
+        monkeypatch.setenv("OAUTHLIB_INSECURE_TRANSPORT", "1")
+        with RunningServer(create_app(spec)) as running:
+            config = Configuration(
+                host=running.url, client_id="id", client_secret="secret"
+            )
+            client = ApiClient(configuration=config)
+
+            device = DevicesApi(client).get_device(id=7)
+
+        assert config.access_token
+        assert device.id == 7
+
+    def test_after_keyed_lists_are_paged(self, spec):
+        app = create_app(spec, ServerOptions(rows=250))
+        with RunningServer(app) as running:
+            api = SystemApi(client_of(running))
+
+            devices = list(paginate_after(api.get_devices, page_size=100))
+
+        assert [device.id for device in devices] == list(range(1, 251))
+        assert running.server.requests == 3
+
+    def test_cursor_reports_are_paged(self, spec):
+        app = create_app(spec, ServerOptions(rows=250))
+        with RunningServer(app) as running:
+            api = QueriesApi(client_of(running))
+
+            software = list(paginate(api.get_software, page_size=100))
+
+        assert len(software) == 250
+        assert running.server.requests == 3
+
+    def test_same_rows_on_every_request(self, spec):
+        with RunningServer(create_app(spec, ServerOptions(rows=10))) as running:
+            api = SystemApi(client_of(running))
+
+            first = api.get_devices(page_size=5, after=5)
+            second = api.get_devices(page_size=5, after=5)
+
+        assert first == second
+        assert [device.id for device in first] == [6, 7, 8, 9, 10]
+
+    def test_expired_cursors_are_not_found(self, spec):
+        app = create_app(spec, ServerOptions(rows=10, cursor_ttl=0))
+        with RunningServer(app) as running:
+            api = QueriesApi(client_of(running))
+            report = api.get_software(page_size=5)
+
+            with pytest.raises(NotFoundException):
+                api.get_software(page_size=5, cursor=report.cursor.name)
+
+    def test_throttled_requests_are_retried(self, spec):
+        options = ServerOptions(throttle_ratio=0.5, retry_after=0, seed=3)
+        with RunningServer(create_app(spec, options)) as running:
+            api = DevicesApi(client_of(running, rate_limit_max_retries=20))
+
+            devices = [api.get_device(id=i) for i in range(1, 21)]
+
+        assert [device.id for device in devices] == list(range(1, 21))
+        assert running.server.throttled > 0
+
+    def test_server_errors(self, spec):
+        options = ServerOptions(error_ratio=1.0)
+        with RunningServer(create_app(spec, options)) as running:
+            api = DevicesApi(client_of(running))
+
+            with pytest.raises(ServiceException):
+                api.get_device(id=1)
+
+            retried = DevicesApi(
+                client_of(
+                    running,
+                    retry_policy=RetryPolicy(max_attempts=2, base_delay=0, max_delay=0),
+                )
+            )
+            with pytest.raises(ServiceException):
+                retried.get_device(id=1)
+
+        assert running.server.errors == 3
+
+    def test_latency(self, spec):
+        options = ServerOptions(latency=0.05)
+        with RunningServer(create_app(spec, options)) as running:
+            api = DevicesApi(client_of(running))
+
+            start = time.monotonic()
+            api.get_device(id=1)
+            elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.05
+
+    def test_async_client(self, spec):
+        from tl_ninjarmm.aio import AsyncApiClient, AsyncSystemApi
+
+        async def run():
+            runner = web.AppRunner(create_app(spec, ServerOptions(rows=20)))
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            config = Configuration(host=f"http://127.0.0.1:{port}")
+            try:
+                async with AsyncApiClient(
+                    configuration=config, get_token=get_token
+                ) as client:
+                    api = AsyncSystemApi(client)
+                    return await asyncio.gather(
+                        *(api.get_organizations(page_size=5, after=i) for i in (0, 5))
+                    )
+            finally:
+                await runner.cleanup()
+
+        first, second = asyncio.run(run())
+
+        assert [o.id for o in first + second] == list(range(1, 11))
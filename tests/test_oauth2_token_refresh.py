@@ -2,6 +2,9 @@
 Unit tests for OAuth2 token refresh functionality.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -185,6 +188,109 @@ class TestTokenRefresh:
             assert client.configuration.access_token is None
 
 
+class StopAfterWaits:
+    """Stands for the renewal stop event, set once `count` waits are over."""
+
+    def __init__(self, count):
+        self.count = count
+        self.timeouts = []
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+        return len(self.timeouts) > self.count
+
+
+class TestTokenRenewal:
+    """Test the background token renewal."""
+
+    def test_renews_token_before_requests_need_it(self, mock_config):
+        """Test that the renewer replaces a token about to expire."""
+        renewed = threading.Event()
+        tokens = iter(
+            [
+                {"access_token": "first_token", "expires_at": time.time() + 90},
+                {"access_token": "second_token", "expires_at": time.time() + 3600},
+            ]
+        )
+
+        def get_token(skew):
+            token = next(tokens)
+            if token["access_token"] == "second_token":
+                renewed.set()
+            return token
+
+        client = ApiClient(configuration=mock_config, get_token=get_token)
+        client._refresh_token_if_needed()
+        assert client.configuration.access_token == "first_token"
+        # Not expired yet as far as requests are concerned
+        assert not client._needs_refresh()
+
+        with client:
+            client.start_token_renewal()
+            assert renewed.wait(timeout=5)
+
+        assert client._renewal_thread is None
+        assert client.configuration.access_token == "second_token"
+
+    def test_renewal_waits_until_token_is_due(self, mock_config):
+        """Test that the renewer does not fetch fresh tokens again."""
+        get_token = Mock(
+            return_value={"access_token": "token", "expires_at": time.time() + 3600}
+        )
+        client = ApiClient(configuration=mock_config, get_token=get_token)
+        client._refresh_token_if_needed()
+
+        client.start_token_renewal()
+        time.sleep(0.05)
+        client.stop_token_renewal()
+
+        get_token.assert_called_once()
+
+    def test_failed_renewal_is_retried(self, mock_config):
+        """Test that a failing token endpoint does not stop the renewer."""
+        get_token = Mock(
+            side_effect=[
+                Exception("token endpoint unavailable"),
+                {"access_token": "token", "expires_at": time.time() + 3600},
+            ]
+        )
+        client = ApiClient(configuration=mock_config, get_token=get_token)
+
+        with patch.object(ApiClient, "_TOKEN_RENEWAL_RETRY", 0.01):
+            client.start_token_renewal()
+            deadline = time.time() + 5
+            while client._token is None and time.time() < deadline:
+                time.sleep(0.01)
+            client.stop_token_renewal()
+
+        assert client.configuration.access_token == "token"
+        assert get_token.call_count == 2
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            {"access_token": "token", "expires_in": 100},
+            {"access_token": "token"},
+        ],
+        ids=["short-lived", "no-expiry"],
+    )
+    def test_tokens_due_for_renewal_are_not_fetched_in_a_loop(self, mock_config, token):
+        """Test that renewals returning due tokens back off."""
+        if "expires_in" in token:
+            token = {**token, "expires_at": time.time() + token["expires_in"]}
+        get_token = Mock(return_value=token)
+        client = ApiClient(configuration=mock_config, get_token=get_token)
+        client._renewal_stop = StopAfterWaits(6)
+
+        # Run in this thread, the fake stop event ends it after 6 renewals
+        client._renew_tokens()
+
+        assert get_token.call_count == 6
+        # Fetched at once, then after a backoff doubling up to the maximum
+        assert client._renewal_stop.timeouts == [0.0, 5, 10, 20, 40, 60, 60]
+        assert client.configuration.access_token == "token"
+
+
 class TestErrorHandling:
     """Test error handling scenarios."""
 
@@ -0,0 +1,230 @@
+"""
+Tests for the operation table driving the generated API methods.
+"""
+
+import inspect
+import io
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api import DevicesApi, ManagementApi, QueriesApi, SystemApi
+from tl_ninjarmm.api.operation_table import OPERATIONS
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.api_response import ApiResponse, LeanApiResponse
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.device_mutable_properties import DeviceMutableProperties
+
+API_CLASSES = [DevicesApi, ManagementApi, QueriesApi, SystemApi]
+
+
+def make_response(body, status=200):
+    return rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+    )
+
+
+@pytest.fixture
+def client():
+    client = ApiClient(
+        configuration=Configuration(host="https://test.ninjarmm.com"),
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+    )
+    client.rest_client = Mock()
+    return client
+
+
+class TestOperationTable:
+    """Test that the table describes every generated operation."""
+
+    def test_every_public_method_has_an_operation(self):
+        names = {
+            name.removesuffix("_with_http_info").removesuffix(
+                "_without_preload_content"
+            )
+            for api_class in API_CLASSES
+            for name, _ in inspect.getmembers(api_class, inspect.isfunction)
+            if not name.startswith("_")
+        }
+
+        assert names == set(OPERATIONS)
+
+    def test_operation_arguments_exist(self):
+        for api_class in API_CLASSES:
+            for name, method in inspect.getmembers(api_class, inspect.isfunction):
+                operation = OPERATIONS.get(name)
+                if operation is None:
+                    continue
+                arguments = set(inspect.signature(method).parameters)
+                used = {arg for _, arg in operation.path_params}
+                used.update(arg for _, arg in operation.query_params)
+                if operation.body_param is not None:
+                    used.add(operation.body_param)
+                assert used <= arguments, name
+
+
+class TestInvoke:
+    """Test the three call styles of the generated methods."""
+
+    BODY = json.dumps({"id": 1, "displayName": "host"}).encode()
+
+    def test_data(self, client):
+        client.rest_client.request.return_value = make_response(self.BODY)
+
+        device = DevicesApi(client).get_device(id=1)
+
+        assert device == Device(id=1, display_name="host")
+        method, url = client.rest_client.request.call_args.args
+        assert (method, url) == ("GET", "https://test.ninjarmm.com/v2/device/1")
+
+    def test_http_info(self, client):
+        client.rest_client.request.return_value = make_response(self.BODY)
+
+        response = DevicesApi(client).get_device_with_http_info(id=1)
+
+        assert isinstance(response, ApiResponse)
+        assert response.status_code == 200
+        assert response.data.display_name == "host"
+
+    def test_without_preload_content(self, client):
+        raw = make_response(self.BODY)
+        client.rest_client.request.return_value = raw
+
+        response = DevicesApi(client).get_device_without_preload_content(id=1)
+
+        assert response is raw.response
+        assert response.read() == self.BODY
+
+    def test_query_and_body_params(self, client):
+        client.rest_client.request.return_value = make_response(b"{}")
+
+        ManagementApi(client).create_end_user_with_http_info(
+            send_invitation=True, create_end_user_request=None
+        )
+
+        call = client.rest_client.request.call_args
+        method, url = call.args
+        assert method == "POST"
+        assert url == "https://test.ninjarmm.com/v2/user/end-users?sendInvitation=true"
+        assert call.kwargs["headers"]["Content-Type"] == "application/json"
+        assert call.kwargs["body"] is None
+
+    def test_caller_headers_are_not_modified(self, client):
+        client.rest_client.request.return_value = make_response(self.BODY)
+        client.set_default_header("X-Client", "tests")
+        headers = {"X-Request": "1"}
+
+        DevicesApi(client).get_device(id=1, _headers=headers)
+
+        assert headers == {"X-Request": "1"}
+        sent = client.rest_client.request.call_args.kwargs["headers"]
+        assert sent["X-Request"] == "1"
+        assert sent["X-Client"] == "tests"
+        assert sent["Accept"] == "application/json"
+
+    def test_path_and_query_values_are_quoted(self, client):
+        client.rest_client.request.return_value = make_response(b"[]")
+
+        QueriesApi(client).get_software_without_preload_content(
+            df="class=WINDOWS SERVER"
+        )
+
+        _, url = client.rest_client.request.call_args.args
+        assert url.endswith("/v2/queries/software?df=class%3DWINDOWS%20SERVER")
+
+    def test_json_bodies_are_encoded_once(self, client):
+        client.rest_client.request.return_value = make_response(b"")
+
+        ManagementApi(client).update_device_with_http_info(
+            id=1,
+            device_mutable_properties=DeviceMutableProperties(
+                display_name="host", user_data={"owner": None}
+            ),
+        )
+
+        body = client.rest_client.request.call_args.kwargs["body"]
+        assert body == b'{"displayName":"host","userData":{"owner":null}}'
+
+    def test_other_content_types_keep_the_body(self, client):
+        client.rest_client.request.return_value = make_response(b"")
+
+        ManagementApi(client).update_device_with_http_info(
+            id=1,
+            device_mutable_properties=DeviceMutableProperties(display_name="host"),
+            _content_type="text/plain",
+        )
+
+        body = client.rest_client.request.call_args.kwargs["body"]
+        assert body == {"displayName": "host"}
+
+
+class TestLeanResponses:
+    """Test the responses of `Configuration.lean_responses`."""
+
+    BODY = json.dumps({"id": 1, "displayName": "host"}).encode()
+
+    def test_body_is_not_kept(self, client):
+        client.configuration.lean_responses = True
+        raw = make_response(self.BODY)
+        client.rest_client.request.return_value = raw
+
+        response = DevicesApi(client).get_device_with_http_info(id=1)
+
+        assert isinstance(response, LeanApiResponse)
+        assert response.status_code == 200
+        assert response.data == Device(id=1, display_name="host")
+        assert response.raw_data is None
+        assert response.headers is raw.response.headers
+
+    def test_plain_methods_are_unchanged(self, client):
+        client.configuration.lean_responses = True
+        client.rest_client.request.return_value = make_response(self.BODY)
+
+        assert DevicesApi(client).get_device(id=1) == Device(id=1, display_name="host")
+
+    def test_bytearray_responses_keep_the_body(self, client):
+        client.configuration.lean_responses = True
+        response_data = make_response(self.BODY)
+        response_data.read()
+
+        response = client.response_deserialize(response_data, {"200": "bytearray"})
+
+        assert response.data is response.raw_data is response_data.data
+
+
+class TestClientSideValidation:
+    """Test turning off the argument validation of the generated methods."""
+
+    def test_arguments_are_validated_by_default(self, client):
+        with pytest.raises(ValueError, match="Input should be a valid integer"):
+            DevicesApi(client).get_device(id="1")
+
+    def test_unvalidated_methods(self, client):
+        client.client_side_validation = False
+        client.rest_client.request.return_value = make_response(b"{}")
+        api = DevicesApi(client)
+
+        response = api.get_device_with_http_info(id="1")
+
+        assert api.get_device.__func__ is DevicesApi.get_device.raw_function
+        assert response.status_code == 200
+        _, url = client.rest_client.request.call_args.args
+        assert url == "https://test.ninjarmm.com/v2/device/1"
+
+    def test_other_apis_keep_validating(self, client):
+        client.client_side_validation = False
+        DevicesApi(client)
+        client.client_side_validation = True
+
+        with pytest.raises(ValueError, match="Input should be a valid integer"):
+            DevicesApi(client).get_device(id="1")
@@ -0,0 +1,343 @@
+"""
+Tests for the report pagination helpers.
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.queries_api import QueriesApi
+from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.decoders import decoding
+from tl_ninjarmm.exceptions import (
+    ApiValueError,
+    CursorExpiredError,
+    ServiceException,
+)
+from tl_ninjarmm.models.cursor import Cursor
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.device_application import DeviceApplication
+from tl_ninjarmm.models.software_report import SoftwareReport
+from tl_ninjarmm.pagination import apaginate, paginate, paginate_after
+
+
+def make_report(names, expires=None):
+    return SoftwareReport(
+        cursor=Cursor(
+            name="cursor-1",
+            offset=0,
+            count=len(names),
+            expires=expires or time.time() + 60,
+        ),
+        results=[DeviceApplication(name=name) for name in names],
+    )
+
+
+class FakeReport:
+    """Serves fixed pages and records the cursor of every call."""
+
+    def __init__(self, pages, expires=None):
+        self.pages = pages
+        self.expires = expires
+        self.calls = []
+
+    def get_software(self, df=None, cursor=None, page_size=None):
+        self.calls.append(cursor)
+        index = len(self.calls) - 1
+        names = self.pages[index] if index < len(self.pages) else []
+        return make_report(names, self.expires)
+
+
+class TestPaginate:
+    """Test the sync cursor paginator."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iterates_rows_across_pages(self, prefetch):
+        report = FakeReport([["a", "b"], ["c", "d"], ["e"]])
+
+        rows = list(paginate(report.get_software, prefetch=prefetch, page_size=2))
+
+        assert [row.name for row in rows] == ["a", "b", "c", "d", "e"]
+        # The short last page ends the scan without asking for an empty page
+        assert report.calls == [None, "cursor-1", "cursor-1"]
+
+    def test_stops_on_empty_page_without_page_size(self):
+        report = FakeReport([["a"], ["b"]])
+
+        rows = list(paginate(report.get_software, df="class=WINDOWS_SERVER"))
+
+        assert [row.name for row in rows] == ["a", "b"]
+        assert report.calls == [None, "cursor-1", "cursor-1"]
+
+    def test_prefetches_next_page_while_consuming(self):
+        second_page_requested = threading.Event()
+
+        class SlowConsumerReport(FakeReport):
+            def get_software(self, **kwargs):
+                if kwargs.get("cursor") is not None:
+                    second_page_requested.set()
+                return super().get_software(**kwargs)
+
+        report = SlowConsumerReport([["a"], ["b"]])
+        rows = iter(paginate(report.get_software, page_size=1))
+
+        assert next(rows).name == "a"
+        # The next page is requested before the consumer asks for it
+        assert second_page_requested.wait(timeout=1)
+        assert [row.name for row in rows] == ["b"]
+
+    def test_expired_cursor_raises(self):
+        report = FakeReport([["a"], ["b"]], expires=time.time() - 1)
+
+        with pytest.raises(CursorExpiredError):
+            list(paginate(report.get_software, page_size=1))
+
+    def test_rejects_operation_without_cursor(self):
+        def get_device(id):
+            return None
+
+        with pytest.raises(ApiValueError):
+            paginate(get_device)
+
+
+class FakeSoftwareTransport:
+    """Stands in for `RESTClientObject`, serving the pages of a software report."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        cursor = parse_qs(urlparse(url).query).get("cursor", [None])[0]
+        self.cursors.append(cursor)
+        index = len(self.cursors) - 1
+        names = self.pages[index] if index < len(self.pages) else []
+        report = {
+            "cursor": {"name": "cursor-1", "expires": time.time() + 60},
+            "results": [{"name": name} for name in names],
+        }
+        return rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(json.dumps(report).encode()),
+                status=200,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            )
+        )
+
+
+def make_queries_api(transport):
+    config = Configuration(host="https://test.ninjarmm.com")
+    client = ApiClient(
+        configuration=config,
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time() + 3600},
+    )
+    client.rest_client = transport
+    return QueriesApi(api_client=client)
+
+
+class TestPaginateDecodeModes:
+    """Test the cursor paginator over the decode modes of the client."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_models(self, prefetch):
+        transport = FakeSoftwareTransport([["a", "b"], ["c"]])
+        queries_api = make_queries_api(transport)
+
+        rows = list(paginate(queries_api.get_software, prefetch=prefetch, page_size=2))
+
+        assert all(isinstance(row, DeviceApplication) for row in rows)
+        assert [row.name for row in rows] == ["a", "b", "c"]
+        assert transport.cursors == [None, "cursor-1"]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_decoding_dict(self, prefetch):
+        transport = FakeSoftwareTransport([["a", "b"], ["c"]])
+        queries_api = make_queries_api(transport)
+
+        with decoding("dict"):
+            rows = list(
+                paginate(queries_api.get_software, prefetch=prefetch, page_size=2)
+            )
+
+        assert rows == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        assert transport.cursors == [None, "cursor-1"]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_configured_dict_mode(self, prefetch):
+        transport = FakeSoftwareTransport([["a"], ["b"]])
+        queries_api = make_queries_api(transport)
+        queries_api.api_client.configuration.decode_mode = "dict"
+
+        pages = list(paginate(queries_api.get_software, prefetch=prefetch).pages())
+
+        assert [page["results"] for page in pages] == [
+            [{"name": "a"}],
+            [{"name": "b"}],
+            [],
+        ]
+
+
+class TestAsyncPaginate:
+    """Test the asyncio cursor paginator."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iterates_rows_across_pages(self, prefetch):
+        report = FakeReport([["a", "b"], ["c"]])
+
+        async def get_software(**kwargs):
+            return report.get_software(**kwargs)
+
+        async def collect():
+            paginator = apaginate(get_software, prefetch=prefetch, page_size=2)
+            return [row.name async for row in paginator]
+
+        assert asyncio.run(collect()) == ["a", "b", "c"]
+        assert report.calls == [None, "cursor-1"]
+
+
+class FakeDevicesTransport:
+    """Stands in for `RESTClientObject`, serving `after` keyed device pages."""
+
+    def __init__(self, device_ids, status=200):
+        self.device_ids = device_ids
+        self.status = status
+        self.urls = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.urls.append(url)
+        query = parse_qs(urlparse(url).query)
+        after = int(query["after"][0]) if "after" in query else None
+        page_size = int(query["pageSize"][0])
+        remaining = [i for i in self.device_ids if after is None or i > after]
+        body = json.dumps(
+            [{"id": i, "nodeClass": "WINDOWS_SERVER"} for i in remaining[:page_size]]
+        ).encode()
+        return rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(body),
+                status=self.status,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            )
+        )
+
+
+def make_system_api(transport):
+    config = Configuration(host="https://test.ninjarmm.com")
+    client = ApiClient(
+        configuration=config,
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time() + 3600},
+    )
+    client.rest_client = transport
+    return SystemApi(api_client=client)
+
+
+class TestPaginateAfter:
+    """Test the pipelined `after` keyed paginator."""
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_iterates_rows_across_pages(self, prefetch):
+        transport = FakeDevicesTransport(list(range(1, 8)))
+        system_api = make_system_api(transport)
+
+        devices = list(
+            paginate_after(
+                system_api.get_devices_detailed, prefetch=prefetch, page_size=3
+            )
+        )
+
+        assert all(isinstance(device, Device) for device in devices)
+        assert [device.id for device in devices] == list(range(1, 8))
+        afters = [parse_qs(urlparse(url).query).get("after") for url in transport.urls]
+        assert afters == [None, ["3"], ["6"]]
+
+    def test_prefetch_depth_bounds_pages_ahead(self):
+        transport = FakeDevicesTransport(list(range(1, 101)))
+        system_api = make_system_api(transport)
+
+        devices = iter(paginate_after(system_api.get_devices, prefetch=2, page_size=10))
+        next(devices)
+        time.sleep(0.1)
+
+        # The consumed page plus at most two pages fetched ahead
+        assert len(transport.urls) <= 3
+        assert len(list(devices)) == 99
+
+    def test_memory_cap_stops_fetching_ahead(self):
+        transport = FakeDevicesTransport(list(range(1, 101)))
+        system_api = make_system_api(transport)
+
+        devices = iter(
+            paginate_after(
+                system_api.get_devices, prefetch=5, max_buffered_bytes=1, page_size=10
+            )
+        )
+        next(devices)
+        time.sleep(0.1)
+
+        assert len(transport.urls) <= 2
+        assert len(list(devices)) == 99
+
+    def test_memory_cap_counts_buffered_bodies(self):
+        transport = FakeDevicesTransport(list(range(1, 101)))
+        system_api = make_system_api(transport)
+        page = [{"id": i, "nodeClass": "WINDOWS_SERVER"} for i in range(11, 21)]
+
+        devices = iter(
+            paginate_after(
+                system_api.get_devices,
+                prefetch=5,
+                max_buffered_bytes=2 * len(json.dumps(page)),
+                page_size=10,
+            )
+        )
+        next(devices)
+        time.sleep(0.1)
+
+        # The consumed page plus the two pages filling the cap
+        assert len(transport.urls) == 3
+        assert len(list(devices)) == 99
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_rows_follow_the_decode_mode(self, prefetch):
+        system_api = make_system_api(FakeDevicesTransport(list(range(1, 5))))
+
+        with decoding("dict"):
+            rows = list(
+                paginate_after(system_api.get_devices, prefetch=prefetch, page_size=3)
+            )
+
+        assert rows == [{"id": i, "nodeClass": "WINDOWS_SERVER"} for i in range(1, 5)]
+
+    def test_rows_use_the_trusted_decoder(self):
+        system_api = make_system_api(FakeDevicesTransport([1]))
+        system_api.api_client.configuration.decode_mode = "construct"
+
+        (device,) = paginate_after(system_api.get_devices_detailed, page_size=3)
+
+        assert isinstance(device, Device)
+        assert device.model_fields_set == {"id", "node_class"}
+        # Not validated, the enum is left as the string received
+        assert device.node_class == "WINDOWS_SERVER"
+
+    def test_error_status_raises(self):
+        system_api = make_system_api(FakeDevicesTransport([1], status=500))
+
+        with pytest.raises(ServiceException):
+            list(paginate_after(system_api.get_devices, page_size=10))
+
+    def test_rejects_operation_without_after(self):
+        system_api = make_system_api(FakeDevicesTransport([]))
+
+        with pytest.raises(ApiValueError):
+            paginate_after(system_api.get_end_users1)
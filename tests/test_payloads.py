@@ -0,0 +1,154 @@
+"""
+Tests for the synthetic payload generator.
+"""
+
+import collections
+import io
+import json
+import pathlib
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from tl_ninjarmm.models.activity import Activity  # noqa: E402
+from tl_ninjarmm.models.device import Device  # noqa: E402
+from tl_ninjarmm.models.device_application import DeviceApplication  # noqa: E402
+from tl_ninjarmm.testing.payloads import (  # noqa: E402
+    ROWS_PER_SEED,
+    PayloadGenerator,
+    write_array,
+)
+from tl_ninjarmm.testing.spec import load_spec  # noqa: E402
+
+SPEC_PATH = pathlib.Path(__file__).parent.parent / "openapi_spec.yaml"
+
+
+@pytest.fixture(scope="module")
+def spec():
+    return load_spec(str(SPEC_PATH))
+
+
+@pytest.fixture
+def generator(spec):
+    return PayloadGenerator(spec, seed=7, fleet={"devices": 500})
+
+
+class TestRows:
+    """Test streaming the rows of a component schema."""
+
+    def test_rows_are_reproducible(self, spec, generator):
+        rows = list(generator.rows("Device", 50))
+        again = PayloadGenerator(spec, seed=7, fleet={"devices": 500})
+        other = PayloadGenerator(spec, seed=8, fleet={"devices": 500})
+
+        assert list(again.rows("Device", 50)) == rows
+        assert list(other.rows("Device", 50)) != rows
+        assert [row["id"] for row in rows] == list(range(1, 51))
+
+    def test_ranges_of_rows_match_the_whole(self, generator):
+        rows = list(generator.rows("Activity", 2 * ROWS_PER_SEED + 10))
+
+        start = ROWS_PER_SEED - 5
+        part = list(generator.rows("Activity", 20, start=start))
+
+        assert part == rows[start : start + 20]
+
+    @pytest.mark.parametrize(
+        "name, model",
+        [
+            ("Device", Device),
+            ("DeviceApplication", DeviceApplication),
+            ("Activity", Activity),
+        ],
+    )
+    def test_rows_are_valid(self, generator, name, model):
+        for row in generator.rows(name, 300):
+            model.from_dict(row)
+
+
+class TestRealism:
+    """Test that the rows look like the ones of a production fleet."""
+
+    def test_enums_are_skewed(self, generator):
+        devices = list(generator.rows("Device", 2000))
+        classes = collections.Counter(row["nodeClass"] for row in devices)
+        approvals = collections.Counter(row["approvalStatus"] for row in devices)
+
+        assert classes.most_common(1)[0][0] == "WINDOWS_WORKSTATION"
+        assert 0.5 < classes["WINDOWS_WORKSTATION"] / 2000 < 0.7
+        assert "NMS_IPSLA" not in classes
+        assert approvals["APPROVED"] > 0.9 * 2000
+
+    def test_enum_weights_can_be_overridden(self, spec):
+        generator = PayloadGenerator(spec, enum_weights={"severity": {"CRITICAL": 1}})
+
+        severities = {row["severity"] for row in generator.rows("Activity", 100)}
+
+        assert severities == {"CRITICAL"}
+
+    def test_foreign_keys_point_into_the_fleet(self, generator):
+        rows = list(generator.rows("DeviceApplication", 1000))
+
+        assert all(1 <= row["deviceId"] <= 500 for row in rows)
+
+    def test_device_references_agree_with_the_device(self, generator):
+        devices = list(generator.rows("Device", 200))
+
+        organizations = {}
+        for device in devices:
+            references = device["references"]
+            assert references["organization"]["id"] == device["organizationId"]
+            assert references["location"]["id"] == device["locationId"]
+            assert references["role"]["id"] == device["nodeRoleId"]
+            assert device["lastContact"] >= device["created"]
+            assert device["dnsName"].startswith(device["systemName"].lower())
+            organization = references["organization"]
+            assert organizations.setdefault(organization["id"], organization) == (
+                organization
+            )
+        # Organizations hold several locations each
+        assert all(
+            (device["locationId"] - 1) // 5 + 1 == device["organizationId"]
+            for device in devices
+        )
+
+    def test_custom_fields(self, generator):
+        fields = [row["fields"] for row in generator.rows("Device", 500)]
+
+        assert all(
+            isinstance(value, dict) and set(value) == {"value"}
+            for row_fields in fields
+            for value in row_fields.values()
+        )
+        share = sum("assetTag" in row_fields for row_fields in fields) / 500
+        assert 0.5 < share < 0.7
+
+    def test_applications(self, generator):
+        applications = list(generator.rows("DeviceApplication", 1000))
+        names = collections.Counter(row["name"] for row in applications)
+
+        assert names.most_common(1)[0][0] == "Microsoft Edge"
+        edge = next(row for row in applications if row["name"] == "Microsoft Edge")
+        assert edge["publisher"] == "Microsoft Corporation"
+        assert edge["version"].startswith("131.0.")
+
+
+class TestWriteArray:
+    """Test encoding rows to a JSON array file."""
+
+    def test_rows_are_written_as_a_json_array(self, generator):
+        rows = list(generator.rows("Activity", 100))
+        file = io.BytesIO()
+
+        written = write_array(iter(rows), file, codec="json")
+
+        assert written == len(file.getvalue())
+        assert json.loads(file.getvalue()) == rows
+
+    def test_no_rows(self):
+        file = io.BytesIO()
+
+        write_array([], file)
+
+        assert file.getvalue() == b"[]"
@@ -2,11 +2,29 @@
 Performance tests for OAuth2 token refresh functionality.
 """
 
+import gc
+import io
+import json
+import pathlib
+import subprocess
+import sys
+import threading
 import time
+import tracemalloc
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from unittest.mock import Mock, patch
 
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.devices_api import DevicesApi
+from tl_ninjarmm.api.operation_table import OPERATIONS
 from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.codec import JsonCodec, OrjsonCodec, encode_body
+from tl_ninjarmm.decoders import decoding
+from tl_ninjarmm.metrics import MetricsRegistry
+from tl_ninjarmm.models.device_mutable_properties import DeviceMutableProperties
 
 
 class TestTokenRefreshPerformance:
@@ -42,46 +60,43 @@ class TestTokenRefreshPerformance:
             )
 
     def test_token_refresh_under_load(self, mock_config):
-        """Test token refresh performance under load."""
+        """Test that concurrent requests on an expired token share one refresh."""
         with (
             patch("tl_ninjarmm.api_client.OAuth2Session") as mock_oauth,
         ):
-            # Create a mock session that simulates token refresh
+            fetches = []
+
+            def fetch_token(**kwargs):
+                fetches.append(kwargs)
+                # Simulate the latency of the token endpoint
+                time.sleep(0.05)
+                return {
+                    "access_token": "refreshed_token",
+                    "expires_in": 3600,
+                    "expires_at": time.time() + 3600,
+                }
+
             mock_session = Mock()
-            mock_session.fetch_token.return_value = {
-                "access_token": "initial_token",
-                "expires_in": 3600,
-                "expires_at": time.time() + 3600,
-            }
+            mock_session.fetch_token.side_effect = fetch_token
             mock_oauth.return_value = mock_session
 
             client = ApiClient(configuration=mock_config)
+            client._token = {"access_token": "expired_token", "expires_at": 0}
 
-            # Simulate multiple token refreshes under load
-            start_time = time.time()
+            threads = 64
+            barrier = threading.Barrier(threads)
 
-            def refresh_token(token_id):
-                """Refresh token in a thread-safe manner."""
-                # Set token to None to force refresh
-                client._token = None
+            def make_request(request_id):
+                barrier.wait()
                 client._refresh_token_if_needed()
-                return token_id
+                return client.configuration.access_token
 
-            # Perform 100 token refreshes concurrently
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = [executor.submit(refresh_token, i) for i in range(100)]
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                futures = [executor.submit(make_request, i) for i in range(threads)]
                 results = [future.result() for future in as_completed(futures)]
 
-            end_time = time.time()
-            total_time = end_time - start_time
-
-            # Verify all refreshes completed
-            assert len(results) == 100
-
-            # Verify performance is acceptable (100 refreshes in < 1 second)
-            assert total_time < 1.0, (
-                f"100 token refreshes took {total_time:.3f}s, expected < 1.0s"
-            )
+            assert len(fetches) == 1
+            assert results == ["refreshed_token"] * threads
 
     def test_token_refresh_memory_safety(self, mock_config):
         """Test that token refresh doesn't cause memory leaks by checking object references."""
@@ -277,3 +292,503 @@ class TestStressTesting:
 
             # Verify all calls used rest_client
             assert mock_rest_client.request.call_count == 500
+
+
+def make_devices_payload(count):
+    """Builds a `get_devices_detailed` like body of `count` devices."""
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "uid": f"uid-{i}",
+                "organizationId": 1,
+                "locationId": 2,
+                "nodeClass": "WINDOWS_SERVER",
+                "approvalStatus": "APPROVED",
+                "offline": False,
+                "displayName": f"host-{i}",
+                "systemName": f"HOST-{i}",
+                "created": 1700000000.5,
+                "lastContact": 1700000100.5,
+                "tags": ["prod", "web"],
+                "fields": {"assetTag": {"value": i}},
+                "userData": {"owner": "ops"},
+                "maintenance": {"status": "PENDING", "start": 1, "end": 2},
+                "ipAddresses": ["10.0.0.1"],
+                "notes": [{"text": "note"}],
+            }
+            for i in range(count)
+        ]
+    ).encode()
+
+
+def best_time(func, repeat=3):
+    """Returns the fastest of `repeat` runs of `func`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+class TestDecodePerformance:
+    """Benchmark decoding of large list responses."""
+
+    TYPES_MAP = {"200": "List[Device]"}
+
+    @pytest.fixture
+    def devices_response(self):
+        body = make_devices_payload(10000)
+        response = rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(body),
+                status=200,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            )
+        )
+        response.read()
+        return response
+
+    @pytest.fixture
+    def client(self, mock_config):
+        return ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+
+    def legacy_time(self, client, response):
+        text = response.data.decode()
+        return best_time(
+            lambda: client.deserialize(text, "List[Device]", "application/json")
+        )
+
+    def test_compiled_decoder_on_10k_devices(self, client, devices_response):
+        """Test that the compiled decoders beat `deserialize` on 10k devices."""
+        legacy_time = self.legacy_time(client, devices_response)
+        compiled_time = best_time(
+            lambda: client.response_deserialize(devices_response, self.TYPES_MAP)
+        )
+
+        print(
+            f"10k devices: deserialize {legacy_time:.3f}s, "
+            f"compiled {compiled_time:.3f}s ({legacy_time / compiled_time:.1f}x)"
+        )
+        legacy = client.deserialize(
+            devices_response.data.decode(), "List[Device]", "application/json"
+        )
+        compiled = client.response_deserialize(devices_response, self.TYPES_MAP).data
+        assert [d.to_dict() for d in compiled] == [d.to_dict() for d in legacy]
+        assert compiled_time < legacy_time
+
+    def test_trusted_decode_modes_on_10k_devices(self, client, devices_response):
+        """Benchmark the decode modes on 10k devices."""
+        legacy_time = self.legacy_time(client, devices_response)
+        timings = {}
+        for mode in ("validate", "construct", "dict"):
+            with decoding(mode):
+                timings[mode] = best_time(
+                    lambda: client.response_deserialize(
+                        devices_response, self.TYPES_MAP
+                    ),
+                    repeat=5,
+                )
+
+        print(
+            f"10k devices: deserialize {legacy_time:.3f}s, "
+            + ", ".join(f"{mode} {t:.3f}s" for mode, t in timings.items())
+        )
+        assert timings["dict"] < timings["construct"] < timings["validate"]
+        assert timings["validate"] < legacy_time
+
+
+@pytest.mark.benchmark
+class TestValidationOverhead:
+    """Benchmark the per call overhead of the argument validation."""
+
+    CALLS = 20000
+
+    def call_time(self, client):
+        api = DevicesApi(client)
+        return best_time(
+            lambda: [
+                api.get_device_active_jobs(id=i, lang="en") for i in range(self.CALLS)
+            ]
+        )
+
+    def test_unvalidated_calls_are_cheaper(self, mock_config):
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        client.invoke = lambda *args, **kwargs: None
+
+        validated_time = self.call_time(client)
+        client.client_side_validation = False
+        unvalidated_time = self.call_time(client)
+
+        print(
+            f"get_device_active_jobs overhead: validated "
+            f"{validated_time / self.CALLS * 1e6:.2f}us, unvalidated "
+            f"{unvalidated_time / self.CALLS * 1e6:.2f}us per call"
+        )
+        assert unvalidated_time * 2 < validated_time
+
+
+@pytest.mark.benchmark
+class TestRequestBuildPerformance:
+    """Benchmark building the requests of the generated operations."""
+
+    CALLS = 100000
+
+    def test_100k_get_device_serializations(self, mock_config):
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {
+                "access_token": "t",
+                "expires_at": time.time() + 3600,
+            },
+        )
+        operation = OPERATIONS["get_device"]
+
+        def param_serialize():
+            # What the generated `_get_device_serialize` used to do
+            for i in range(self.CALLS):
+                client.param_serialize(
+                    method="GET",
+                    resource_path="/v2/device/{id}",
+                    path_params={"id": i},
+                    query_params=[],
+                    header_params={
+                        "Accept": client.select_header_accept(["application/json"])
+                    },
+                    body=None,
+                    post_params=[],
+                    files={},
+                    auth_settings=["sessionKey", "oauth2"],
+                    collection_formats={},
+                )
+
+        def operation_serialize():
+            for i in range(self.CALLS):
+                client.operation_serialize(operation, {"id": i})
+
+        legacy_time = best_time(param_serialize, repeat=1)
+        template_time = best_time(operation_serialize, repeat=1)
+
+        print(
+            f"100k get_device requests: param_serialize {legacy_time:.3f}s, "
+            f"operation_serialize {template_time:.3f}s "
+            f"({legacy_time / template_time:.1f}x)"
+        )
+        assert client.operation_serialize(operation, {"id": 1}) == (
+            client.param_serialize(
+                "GET",
+                "/v2/device/{id}",
+                path_params={"id": 1},
+                header_params={"Accept": "application/json"},
+                auth_settings=["sessionKey", "oauth2"],
+            )[:4]
+            + ([],)
+        )
+        assert template_time * 2 < legacy_time
+
+    def test_encode_5k_device_updates(self, mock_config):
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        updates = [
+            DeviceMutableProperties(
+                display_name=f"host-{i}",
+                user_data={f"field{n}": f"value-{i}-{n}" for n in range(20)},
+            )
+            for i in range(5000)
+        ]
+
+        def sanitize_and_dump():
+            for update in updates:
+                json.dumps(client.sanitize_for_serialization(update)).encode()
+
+        def encode():
+            for update in updates:
+                encode_body(update)
+
+        legacy_time = best_time(sanitize_and_dump)
+        encode_time = best_time(encode)
+
+        print(
+            f"5k device updates: to_dict + sanitize + json.dumps "
+            f"{legacy_time:.3f}s, encode_body {encode_time:.3f}s "
+            f"({legacy_time / encode_time:.1f}x)"
+        )
+        assert encode_time * 2 < legacy_time
+
+
+class TestLeanResponseMemory:
+    """Measure the memory held by `*_with_http_info` results."""
+
+    def retained(self, client, body):
+        """Returns the bytes held by 10 decoded responses of `body`."""
+        responses = []
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for _ in range(10):
+                response = rest.RESTResponse(
+                    urllib3.HTTPResponse(
+                        # A copy, as a body received from the network
+                        body=io.BytesIO(bytearray(body)),
+                        status=200,
+                        headers={"Content-Type": "application/json"},
+                        preload_content=False,
+                    )
+                )
+                response.read()
+                responses.append(
+                    client.response_deserialize(response, {"200": "List[Device]"})
+                )
+                del response
+            gc.collect()
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    def test_lean_responses_hold_less(self, mock_config):
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        body = make_devices_payload(2000)
+
+        with decoding("dict"):
+            full = self.retained(client, body)
+            mock_config.lean_responses = True
+            lean = self.retained(client, body)
+
+        print(
+            f"10 pages of 2k devices as dicts: ApiResponse {full / 2**20:.1f}MiB, "
+            f"LeanApiResponse {lean / 2**20:.1f}MiB"
+        )
+        assert full - lean >= 10 * len(body) * 0.9
+
+
+@pytest.mark.benchmark
+class TestMetricsOverhead:
+    """Benchmark recording the metrics of a call."""
+
+    CALLS = 100000
+
+    def test_recording_is_cheap_next_to_a_call(self, mock_config):
+        """Test that the metrics cost a fraction of a call without them."""
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        client.rest_client = Mock()
+        client.rest_client.request.side_effect = lambda *args, **kwargs: (
+            rest.RESTResponse(
+                urllib3.HTTPResponse(
+                    body=io.BytesIO(b'{"id": 1}'),
+                    status=200,
+                    headers={"Content-Type": "application/json"},
+                    preload_content=False,
+                )
+            )
+        )
+        api = DevicesApi(client)
+        calls = self.CALLS // 100
+        call_time = best_time(lambda: [api.get_device(id=1) for _ in range(calls)])
+        per_request = call_time / calls
+
+        registry = MetricsRegistry()
+        operation = OPERATIONS["get_device"]
+        body = b'{"id": 1}'
+
+        def record():
+            for _ in range(self.CALLS):
+                timer = registry.start(operation)
+                timer.lap()
+                timer.lap()
+                timer.sent(None)
+                timer.lap()
+                timer.received(200, body)
+                timer.stop()
+
+        per_call = best_time(record) / self.CALLS
+
+        print(
+            f"metrics of a call: {per_call * 1e6:.2f}us, "
+            f"call without metrics: {per_request * 1e6:.2f}us"
+        )
+        assert registry.snapshot()["DevicesApi.get_device"].requests == 3 * self.CALLS
+        assert per_call * 2 < per_request
+
+
+@pytest.mark.benchmark
+class TestCodecPerformance:
+    """Benchmark the JSON codecs on a large custom fields report."""
+
+    def test_orjson_decodes_custom_fields_faster(self):
+        pytest.importorskip("orjson")
+        body = json.dumps(
+            {
+                "cursor": {"name": "c", "offset": 0, "count": 20000},
+                "results": [
+                    {
+                        "deviceId": i,
+                        "fields": {
+                            f"field{n}": {"value": f"value-{i}-{n}", "updated": 1.5}
+                            for n in range(10)
+                        },
+                    }
+                    for i in range(20000)
+                ],
+            }
+        ).encode()
+        stdlib, orjson = JsonCodec(), OrjsonCodec()
+
+        stdlib_time = best_time(lambda: stdlib.loads(body.decode()))
+        orjson_time = best_time(lambda: orjson.loads(body))
+
+        print(
+            f"20k rows custom fields report: json {stdlib_time:.3f}s, "
+            f"orjson {orjson_time:.3f}s ({stdlib_time / orjson_time:.1f}x)"
+        )
+        assert orjson.loads(body) == stdlib.loads(body)
+        assert orjson_time < stdlib_time
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Payloads of a synthetic fleet of 5k devices."""
+    pytest.importorskip("yaml")
+    from tl_ninjarmm.testing.payloads import PayloadGenerator
+    from tl_ninjarmm.testing.spec import load_spec
+
+    spec_path = pathlib.Path(__file__).parent.parent / "openapi_spec.yaml"
+    return PayloadGenerator(load_spec(str(spec_path)), fleet={"devices": 5000})
+
+
+class TestSyntheticFleetPerformance:
+    """Benchmark on a synthetic fleet generated from the OpenAPI spec."""
+
+    @pytest.mark.benchmark
+    def test_compiled_decoder_on_5k_synthetic_devices(self, mock_config, generator):
+        from tl_ninjarmm.testing.payloads import write_array
+
+        file = io.BytesIO()
+        start_time = time.perf_counter()
+        write_array(generator.rows("Device", 5000), file)
+        generate_time = time.perf_counter() - start_time
+        body = file.getvalue()
+        response = rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(body),
+                status=200,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            )
+        )
+        response.read()
+        client = ApiClient(
+            configuration=mock_config,
+            get_token=lambda skew: {"access_token": "t", "expires_at": time.time()},
+        )
+        types_map = {"200": "List[Device]"}
+
+        legacy_time = best_time(
+            lambda: client.deserialize(
+                body.decode(), "List[Device]", "application/json"
+            ),
+            repeat=1,
+        )
+        compiled_time = best_time(
+            lambda: client.response_deserialize(response, types_map), repeat=1
+        )
+
+        print(
+            f"5k synthetic devices ({len(body) / 2**20:.1f}MiB, generated in "
+            f"{generate_time:.2f}s): deserialize {legacy_time:.3f}s, "
+            f"compiled {compiled_time:.3f}s ({legacy_time / compiled_time:.1f}x)"
+        )
+        devices = client.response_deserialize(response, types_map).data
+        assert len(devices) == 5000
+        assert devices[0].references.organization.id == devices[0].organization_id
+        assert compiled_time < legacy_time
+
+    def test_rows_are_exported_in_constant_memory(self, tmp_path, generator):
+        from tl_ninjarmm.testing.payloads import write_array
+
+        path = tmp_path / "applications.json"
+        rows = generator.rows("DeviceApplication", 20000)
+        next(generator.rows("DeviceApplication", 1))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with open(path, "wb") as file:
+                written = write_array(rows, file)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        print(
+            f"20k DeviceApplication rows: {written / 2**20:.1f}MiB written, "
+            f"peak {peak / 2**20:.2f}MiB traced"
+        )
+        assert path.stat().st_size == written
+        assert peak * 10 < written
+
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start_time = time.perf_counter()
+import tl_ninjarmm
+{extra}
+elapsed = time.perf_counter() - start_time
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def time_import(extra=""):
+    """Imports `tl_ninjarmm` in a fresh interpreter.
+
+    :return: the import time in seconds and the names of the loaded modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(extra=extra)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    output = json.loads(result.stdout)
+    return output["elapsed"], output["modules"]
+
+
+class TestImportPerformance:
+    """Benchmark the startup time of `import tl_ninjarmm`."""
+
+    EAGER = "[getattr(tl_ninjarmm, name) for name in tl_ninjarmm.__all__]"
+
+    def test_import_loads_no_api_or_model(self):
+        """Test that the APIs and models are only loaded on first access."""
+        _, modules = time_import()
+
+        loaded = [name for name in modules if name.startswith("tl_ninjarmm.")]
+        assert loaded == ["tl_ninjarmm._lazy"]
+        assert "pydantic" not in modules
+
+    @pytest.mark.benchmark
+    def test_lazy_import_beats_eager_import(self):
+        """Test that the lazy import is much faster than loading everything."""
+        lazy_time = min(time_import()[0] for _ in range(3))
+        eager_time = min(time_import(self.EAGER)[0] for _ in range(3))
+
+        print(
+            f"import tl_ninjarmm: lazy {lazy_time * 1000:.1f}ms, "
+            f"eager {eager_time * 1000:.1f}ms ({eager_time / lazy_time:.0f}x)"
+        )
+        assert lazy_time * 10 < eager_time
@@ -0,0 +1,178 @@
+"""
+Tests for the client side rate limiter.
+"""
+
+import email.utils
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.rate_limit import (
+    GLOBAL_BUCKET,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from tl_ninjarmm.retry import RetryPolicy
+
+BASE_TIME = 1000.0
+
+
+@pytest.fixture
+def mock_monotonic():
+    with patch("tl_ninjarmm.rate_limit.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = BASE_TIME
+        yield mock_monotonic
+
+
+def make_response(status, retry_after=None):
+    response = Mock()
+    response.status = status
+    response.reason = "Too Many Requests" if status == 429 else "OK"
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return response
+
+
+class TestTokenBucket:
+    """Test the token bucket pacing and AIMD adjustments."""
+
+    def test_reserve_waits_once_burst_is_spent(self, mock_monotonic):
+        bucket = TokenBucket(rate=2, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+
+        mock_monotonic.return_value = BASE_TIME + 1
+        assert bucket.budget().tokens == pytest.approx(1)
+
+    def test_throttled_halves_rate_and_honors_retry_after(self, mock_monotonic):
+        bucket = TokenBucket(rate=10)
+
+        bucket.on_throttled(retry_after=3)
+
+        budget = bucket.budget()
+        assert budget.rate == 5
+        assert budget.paused_for == 3
+        assert bucket.reserve() == pytest.approx(3)
+
+    def test_success_grows_rate_back_to_max(self, mock_monotonic):
+        bucket = TokenBucket(rate=1, min_rate=0.25, increase=0.1)
+        for _ in range(5):
+            bucket.on_throttled()
+        assert bucket.rate == 0.25
+
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.rate == 1
+
+
+class TestParseRetryAfter:
+    """Test parsing of the `Retry-After` header."""
+
+    def test_seconds(self):
+        assert parse_retry_after("5") == 5.0
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 28 <= parse_retry_after(value) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRateLimiter:
+    """Test the client level limiter."""
+
+    def test_disabled_by_default(self):
+        assert RateLimiter.from_configuration(Configuration()) is None
+
+    def test_endpoint_patterns_apply_on_top_of_global_rate(self, mock_monotonic):
+        config = Configuration()
+        config.rate_limit = 10
+        config.endpoint_rate_limits = {"/v2/queries/*": 1}
+        limiter = RateLimiter.from_configuration(config)
+
+        limiter.on_response("https://x/v2/queries/software?cursor=a", 429, None)
+
+        budget = limiter.budget()
+        assert budget[GLOBAL_BUCKET].rate == 5
+        assert budget["/v2/queries/*"].rate == 0.5
+
+        limiter.on_response("https://x/v2/devices", 429, None)
+        assert limiter.budget()["/v2/queries/*"].rate == 0.5
+
+
+class TestRESTClientRateLimiting:
+    """Test the rate limiter wired into the transport."""
+
+    def test_throttled_request_is_sent_again(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.rate_limit = 100
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        client.pool_manager.request.side_effect = [
+            make_response(429, retry_after="0"),
+            make_response(200),
+        ]
+
+        response = client.request("POST", "https://test.ninjarmm.com/v2/x", body={})
+
+        assert response.status == 200
+        assert client.pool_manager.request.call_count == 2
+        assert client.rate_limiter.budget()[GLOBAL_BUCKET].rate < 100
+
+    def test_gives_up_after_max_retries(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.rate_limit = 100
+        config.rate_limit_max_retries = 1
+        client = rest.RESTClientObject(config)
+        client.pool_manager = Mock()
+        client.pool_manager.request.return_value = make_response(429, "0")
+
+        response = client.request("GET", "https://test.ninjarmm.com/v2/devices")
+
+        assert response.status == 429
+        assert client.pool_manager.request.call_count == 2
+
+    def test_retry_policy_owns_throttled_retries(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.rate_limit = 100
+        config.retry_policy = RetryPolicy(max_attempts=4, base_delay=0, max_delay=0)
+        client = ApiClient(
+            configuration=config,
+            get_token=lambda skew: {
+                "access_token": "t",
+                "expires_at": time.time() + 3600,
+            },
+        )
+        client.rest_client.pool_manager = Mock()
+        client.rest_client.pool_manager.request.return_value = make_response(429, "0")
+
+        response = client.call_api("GET", "https://test.ninjarmm.com/v2/devices")
+
+        assert response.status == 429
+        assert client.rest_client.pool_manager.request.call_count == 4
+        assert client.rest_client.rate_limiter.budget()[GLOBAL_BUCKET].rate < 100
+
+    def test_limiter_retries_statuses_the_policy_leaves(self):
+        config = Configuration(host="https://test.ninjarmm.com")
+        config.rate_limit = 100
+        config.retry_policy = RetryPolicy(retry_statuses=frozenset({503}))
+
+        assert RateLimiter.from_configuration(config).max_retries == 3
+
+    def test_no_retry_without_limiter(self):
+        client = rest.RESTClientObject(Configuration(host="https://test.ninjarmm.com"))
+        client.pool_manager = Mock()
+        client.pool_manager.request.return_value = make_response(429, "0")
+
+        response = client.request("GET", "https://test.ninjarmm.com/v2/devices")
+
+        assert response.status == 429
+        assert client.pool_manager.request.call_count == 1
@@ -0,0 +1,173 @@
+"""
+Tests for the retry policy and circuit breakers around call_api.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import urllib3
+
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.exceptions import CircuitOpenError
+from tl_ninjarmm.retry import RetryPolicy, endpoint_key
+
+URL = "https://test.ninjarmm.com/v2/device/42"
+
+
+def make_response(status, retry_after=None):
+    response = Mock()
+    response.status = status
+    response.getheader.return_value = retry_after
+    return response
+
+
+def make_client(policy=None):
+    config = Configuration(host="https://test.ninjarmm.com")
+    config.retry_policy = policy or RetryPolicy(base_delay=0.001, max_delay=0.01)
+    client = ApiClient(
+        configuration=config,
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time() + 3600},
+    )
+    client.rest_client = Mock()
+    return client
+
+
+def connect_error():
+    reason = urllib3.exceptions.NewConnectionError(None, "connection refused")
+    return urllib3.exceptions.MaxRetryError(None, URL, reason)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("tl_ninjarmm.retry.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestRetryPolicy:
+    """Test the delay and endpoint helpers."""
+
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+        delay = 0.0
+        for _ in range(50):
+            next_delay = policy.next_delay(delay)
+            assert 0.1 <= next_delay <= min(2.0, max(0.1, delay * 3))
+            delay = next_delay
+
+    def test_endpoint_key_replaces_ids(self):
+        assert (
+            endpoint_key("get", "https://x/v2/device/42/disks?x=1")
+            == "GET /v2/device/{id}/disks"
+        )
+
+
+class TestRetries:
+    """Test which requests are retried."""
+
+    def test_idempotent_request_retried_on_server_error(self):
+        client = make_client()
+        client.rest_client.request.side_effect = [
+            make_response(503),
+            make_response(502),
+            make_response(200),
+        ]
+
+        response = client.call_api("GET", URL)
+
+        assert response.status == 200
+        assert client.rest_client.request.call_count == 3
+
+    def test_gives_up_after_max_attempts(self):
+        client = make_client(RetryPolicy(max_attempts=2, base_delay=0.001))
+        client.rest_client.request.return_value = make_response(500)
+
+        response = client.call_api("DELETE", URL)
+
+        assert response.status == 500
+        assert client.rest_client.request.call_count == 2
+
+    def test_non_idempotent_request_not_retried_on_server_error(self):
+        client = make_client()
+        client.rest_client.request.return_value = make_response(503)
+
+        response = client.call_api("POST", URL, body={})
+
+        assert response.status == 503
+        assert client.rest_client.request.call_count == 1
+
+    def test_non_idempotent_request_retried_when_throttled(self, no_sleep):
+        client = make_client(RetryPolicy(base_delay=0.001, max_delay=5))
+        client.rest_client.request.side_effect = [
+            make_response(429, retry_after="2"),
+            make_response(204),
+        ]
+
+        response = client.call_api("POST", URL, body={})
+
+        assert response.status == 204
+        no_sleep.assert_called_once_with(2.0)
+
+    def test_non_idempotent_request_retried_on_connect_error(self):
+        client = make_client()
+        client.rest_client.request.side_effect = [connect_error(), make_response(200)]
+
+        assert client.call_api("PATCH", URL, body={}).status == 200
+
+    def test_non_idempotent_request_not_retried_on_read_timeout(self):
+        client = make_client()
+        client.rest_client.request.side_effect = urllib3.exceptions.ReadTimeoutError(
+            None, URL, "read timed out"
+        )
+
+        with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+            client.call_api("POST", URL, body={})
+        assert client.rest_client.request.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Test the per endpoint circuit breakers."""
+
+    def test_breaker_opens_and_sheds_load(self):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=3, reset_timeout=60)
+        client = make_client(policy)
+        client.rest_client.request.return_value = make_response(503)
+
+        for _ in range(3):
+            client.call_api("GET", URL)
+
+        with pytest.raises(CircuitOpenError):
+            client.call_api("GET", "https://test.ninjarmm.com/v2/device/7")
+        assert client.rest_client.request.call_count == 3
+
+        # Other endpoints are not affected
+        client.rest_client.request.return_value = make_response(200)
+        assert client.call_api("GET", "https://x/v2/organizations").status == 200
+
+    def test_half_open_probe_closes_breaker(self):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=60)
+        client = make_client(policy)
+        client.rest_client.request.return_value = make_response(500)
+        client.call_api("GET", URL)
+        breaker = client.retry_engine.breaker(endpoint_key("GET", URL))
+        assert breaker.state == "open"
+
+        breaker.opened_at -= 60
+        assert breaker.state == "half-open"
+        client.rest_client.request.return_value = make_response(200)
+
+        assert client.call_api("GET", URL).status == 200
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens_breaker(self):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=60)
+        client = make_client(policy)
+        client.rest_client.request.return_value = make_response(500)
+        client.call_api("GET", URL)
+        breaker = client.retry_engine.breaker(endpoint_key("GET", URL))
+        breaker.opened_at -= 60
+
+        client.call_api("GET", URL)
+
+        assert breaker.state == "open"
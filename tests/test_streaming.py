@@ -0,0 +1,220 @@
+"""
+Tests for the streaming decoding of list responses.
+"""
+
+import asyncio
+import io
+import json
+import time
+
+import pytest
+import urllib3
+
+from tl_ninjarmm import rest
+from tl_ninjarmm.api.queries_api import QueriesApi
+from tl_ninjarmm.api.system_api import SystemApi
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm.decoders import decoding
+from tl_ninjarmm.exceptions import ApiValueError, NotFoundException, ServiceException
+from tl_ninjarmm.models.device import Device
+from tl_ninjarmm.models.node_attributes_detailed import NodeAttributesDetailed
+from tl_ninjarmm.streaming import JsonArrayParser, stream_models
+
+TRICKY_ITEMS = [
+    {"id": 1, "name": 'quote " and backslash \\', "tags": ["[", "]", "{", "}"]},
+    {"id": 2, "name": "unicode é ✓  ", "nested": {"a": [1, 2.5, -3e2]}},
+    {"id": 3, "name": "\\", "ok": True, "missing": None},
+    7,
+    "plain",
+    [],
+]
+
+
+def feed_in_chunks(parser, document, size):
+    items = []
+    for i in range(0, len(document), size):
+        items.extend(parser.feed(document[i : i + size]))
+    parser.close()
+    return items
+
+
+class TestJsonArrayParser:
+    """Test the incremental parser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+    def test_top_level_array(self, chunk_size):
+        document = json.dumps(TRICKY_ITEMS, ensure_ascii=False, indent=1).encode()
+
+        items = feed_in_chunks(JsonArrayParser(), document, chunk_size)
+
+        assert items == TRICKY_ITEMS
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_member_array(self, chunk_size):
+        report = {
+            "cursor": {"name": "abc", "offset": 0, "count": 3},
+            "results": TRICKY_ITEMS,
+            "extra": [1, {"results": []}],
+        }
+        document = json.dumps(report).encode()
+        parser = JsonArrayParser("results")
+
+        items = feed_in_chunks(parser, document, chunk_size)
+
+        assert items == TRICKY_ITEMS
+        assert parser.members == {
+            "cursor": report["cursor"],
+            "extra": [1, {"results": []}],
+        }
+
+    def test_truncated_document(self):
+        parser = JsonArrayParser()
+        assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+
+        with pytest.raises(ValueError, match="truncated"):
+            parser.close()
+
+    def test_unexpected_document(self):
+        with pytest.raises(ValueError, match="start of the document"):
+            JsonArrayParser().feed(b'{"id": 1}')
+
+
+class FakeStreamTransport:
+    """Stands in for `RESTClientObject`, serving a fixed body."""
+
+    def __init__(self, body, status=200, content_type="application/json"):
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+        self.responses = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        response = urllib3.HTTPResponse(
+            body=io.BytesIO(self.body),
+            status=self.status,
+            headers={"Content-Type": self.content_type},
+            preload_content=False,
+        )
+        self.responses.append(response)
+        return rest.RESTResponse(response)
+
+
+def make_client(transport):
+    config = Configuration(host="https://test.ninjarmm.com")
+    client = ApiClient(
+        configuration=config,
+        get_token=lambda skew: {"access_token": "t", "expires_at": time.time() + 3600},
+    )
+    client.rest_client = transport
+    return client
+
+
+class TestStreamModels:
+    """Test streaming the models of generated operations."""
+
+    def test_streams_list_response(self):
+        devices = [{"id": i, "nodeClass": "WINDOWS_SERVER"} for i in range(50)]
+        transport = FakeStreamTransport(json.dumps(devices).encode())
+        api = SystemApi(api_client=make_client(transport))
+
+        stream = stream_models(api.get_devices_detailed, page_size=50, chunk_size=16)
+        rows = list(stream)
+
+        assert all(isinstance(row, Device) for row in rows)
+        assert [row.id for row in rows] == list(range(50))
+
+    def test_streams_report_results(self):
+        report = {
+            "cursor": {"name": "next", "offset": 0, "count": 2, "expires": 1},
+            "results": [{"deviceId": 1}, {"deviceId": 2}],
+        }
+        transport = FakeStreamTransport(json.dumps(report).encode())
+        api = QueriesApi(api_client=make_client(transport))
+
+        stream = stream_models(api.get_custom_fields_detailed_report, chunk_size=8)
+        rows = list(stream)
+
+        assert all(isinstance(row, NodeAttributesDetailed) for row in rows)
+        assert [row.device_id for row in rows] == [1, 2]
+        assert stream.members["cursor"]["name"] == "next"
+
+    def test_records_follow_the_decode_mode(self):
+        devices = [{"id": i, "nodeClass": "WINDOWS_SERVER"} for i in range(5)]
+        transport = FakeStreamTransport(json.dumps(devices).encode())
+        api = SystemApi(api_client=make_client(transport))
+
+        with decoding("dict"):
+            rows = list(stream_models(api.get_devices_detailed, chunk_size=16))
+
+        assert rows == devices
+
+    def test_error_status_raises(self):
+        transport = FakeStreamTransport(b'{"errorMessage": "nope"}', status=404)
+        api = SystemApi(api_client=make_client(transport))
+
+        with pytest.raises(NotFoundException) as exc_info:
+            list(stream_models(api.get_devices_detailed))
+        assert exc_info.value.body == '{"errorMessage": "nope"}'
+
+    def test_error_body_is_decoded_with_its_charset(self):
+        transport = FakeStreamTransport(
+            '{"errorMessage": "refusé"}'.encode("latin-1"),
+            status=500,
+            content_type="application/json; charset=ISO-8859-1",
+        )
+        api = SystemApi(api_client=make_client(transport))
+
+        with pytest.raises(ServiceException) as exc_info:
+            list(stream_models(api.get_devices_detailed))
+        assert exc_info.value.body == '{"errorMessage": "refusé"}'
+
+    def test_rejects_operation_without_list(self):
+        api = SystemApi(api_client=make_client(FakeStreamTransport(b"{}")))
+
+        with pytest.raises(ApiValueError, match="does not return a list"):
+            stream_models(api.get_contact_by_id)
+
+
+def test_async_stream_models():
+    """Test streaming a chunked response with the asyncio client."""
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    from tl_ninjarmm.aio import AsyncApiClient, AsyncSystemApi
+    from tl_ninjarmm.streaming import astream_models
+
+    async def handler(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        body = json.dumps([{"id": i} for i in range(100)]).encode()
+        for i in range(0, len(body), 100):
+            await response.write(body[i : i + 100])
+        await response.write_eof()
+        return response
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/v2/devices-detailed", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        config = Configuration(host=f"http://127.0.0.1:{port}")
+        try:
+            async with AsyncApiClient(
+                config,
+                get_token=lambda skew: {
+                    "access_token": "t",
+                    "expires_at": time.time() + 60,
+                },
+            ) as client:
+                api = AsyncSystemApi(api_client=client)
+                return [d async for d in astream_models(api.get_devices_detailed)]
+        finally:
+            await runner.cleanup()
+
+    rows = asyncio.run(run())
+
+    assert [row.id for row in rows] == list(range(100))
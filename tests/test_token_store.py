@@ -0,0 +1,146 @@
+"""
+Tests for the tokens shared between processes.
+"""
+
+import multiprocessing
+import os
+import time
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from tl_ninjarmm.api_client import ApiClient
+from tl_ninjarmm.configuration import Configuration
+from tl_ninjarmm import token_store
+from tl_ninjarmm.token_store import (
+    FileTokenStore,
+    SharedMemoryTokenStore,
+    TokenStore,
+)
+
+
+def make_token(access_token="shared_token", expires_in=3600):
+    return {"access_token": access_token, "expires_at": time.time() + expires_in}
+
+
+def make_config(store):
+    config = Configuration(host="https://test.ninjarmm.com")
+    config.token_store = store
+    return config
+
+
+@pytest.fixture
+def shm_store():
+    store = SharedMemoryTokenStore(f"tl-ninjarmm-test-{uuid.uuid4().hex[:12]}")
+    yield store
+    store.unlink()
+    store.close()
+
+
+class TestTokenStore:
+    """Test the base class of the stores."""
+
+    def test_methods_are_abstract(self):
+        with pytest.raises(TypeError):
+            TokenStore()
+
+    def test_stores_require_file_locking(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(token_store, "fcntl", None)
+        monkeypatch.setattr(token_store, "msvcrt", None)
+
+        with pytest.raises(NotImplementedError, match="file locking"):
+            FileTokenStore(str(tmp_path / "token.json"))
+
+
+class TestFileTokenStore:
+    """Test the file backed store."""
+
+    def test_round_trip(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "token.json"))
+        assert store.load() is None
+
+        token = make_token()
+        with store.lock():
+            store.save(token)
+
+        assert FileTokenStore(str(tmp_path / "token.json")).load() == token
+        assert os.stat(tmp_path / "token.json").st_mode & 0o077 == 0
+
+
+class TestSharedMemoryTokenStore:
+    """Test the shared memory store."""
+
+    def test_round_trip(self, shm_store):
+        assert shm_store.load() is None
+
+        token = make_token()
+        shm_store.save(token)
+
+        other = SharedMemoryTokenStore(shm_store.name)
+        assert other.load() == token
+        other.close()
+
+    def test_token_too_large(self, shm_store):
+        with pytest.raises(ValueError, match="does not fit"):
+            shm_store.save(make_token("x" * shm_store.size))
+
+
+class TestApiClientTokenStore:
+    """Test that clients reuse the stored token."""
+
+    def test_client_reuses_stored_token(self, shm_store):
+        first = Mock(return_value=make_token())
+        second = Mock(return_value=make_token("other_token"))
+
+        ApiClient(make_config(shm_store), get_token=first)._refresh_token_if_needed()
+        client = ApiClient(make_config(shm_store), get_token=second)
+        client._refresh_token_if_needed()
+
+        first.assert_called_once()
+        second.assert_not_called()
+        assert client.configuration.access_token == "shared_token"
+
+    def test_expiring_stored_token_is_replaced(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "token.json"))
+        store.save(make_token("old_token", expires_in=30))
+        get_token = Mock(return_value=make_token("new_token"))
+
+        client = ApiClient(make_config(store), get_token=get_token)
+        client._refresh_token_if_needed()
+
+        get_token.assert_called_once()
+        assert client.configuration.access_token == "new_token"
+        assert store.load()["access_token"] == "new_token"
+
+
+def _worker(token_path, fetch_log):
+    def get_token(skew):
+        with open(fetch_log, "a") as f:
+            f.write("fetch\n")
+        time.sleep(0.05)
+        return make_token()
+
+    client = ApiClient(make_config(FileTokenStore(token_path)), get_token=get_token)
+    client._refresh_token_if_needed()
+    assert client.configuration.access_token == "shared_token"
+
+
+def test_one_fetch_across_processes(tmp_path):
+    """Test that concurrent worker processes share a single token fetch."""
+    fetch_log = tmp_path / "fetches"
+    fetch_log.touch()
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_worker, args=(str(tmp_path / "token.json"), str(fetch_log))
+        )
+        for _ in range(8)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert [process.exitcode for process in processes] == [0] * 8
+    assert fetch_log.read_text().count("fetch") == 1